@@ -15,11 +15,13 @@ class Samplestrategy(BaseStrategy):
             df,
             symbol,
             startup_candle_count,
+            strategy_config=None,
     ):
         super().__init__(
             df=df,
             symbol=symbol,
             startup_candle_count=startup_candle_count,
+            strategy_config=strategy_config,
         )
 
     @informative("M30")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import talib.abstract as ta
 
@@ -7,6 +8,14 @@ from core.reporting.core.context import ContextSpec
 from core.reporting.core.metrics import ExpectancyMetric, MaxDrawdownMetric
 from core.strategy.base import BaseStrategy
 from core.strategy.informatives import informative
+from core.strategy.levels import (
+    LevelArrays,
+    min_distance_sl,
+    r_multiple_tp,
+    structural_sl,
+    swing_trail,
+    wider_sl,
+)
 
 
 class Samplestrategyreport(BaseStrategy):
@@ -16,11 +25,13 @@ class Samplestrategyreport(BaseStrategy):
             df,
             symbol,
             startup_candle_count,
+            strategy_config=None,
     ):
         super().__init__(
             df=df,
             symbol=symbol,
             startup_candle_count=startup_candle_count,
+            strategy_config=strategy_config,
         )
 
     strategy_config = {
@@ -34,8 +45,16 @@ class Samplestrategyreport(BaseStrategy):
         "SWING_LOOKBACK": 5,
 
         "ALLOW_TP2_WITH_TRAILING": False,
+
+        "SL_ATR_BUFFER": 0.5,
+        "SL_MIN_ATR": 1,
+        "TP1_R": 1,
+        "TP2_R": 2,
     }
 
+    # indicators / informatives read no config -> shared by all configs
+    feature_params = ()
+
     @informative('M30')
     def populate_indicators_M30(self, df: pd.DataFrame):
 
@@ -157,30 +176,15 @@ class Samplestrategyreport(BaseStrategy):
         )
 
         df["signal_entry"] = None
+        self.df = df
 
-        idx = df.index[long_mask_rma_33]
-        df.loc[idx, "signal_entry"] = [{"direction": "long", "tag": "LONG SETUP 1"}] * len(idx)
-
-        idx = df.index[long_mask_rma_144]
-        df.loc[idx, "signal_entry"] = [{"direction": "long", "tag": "LONG SETUP 2"}] * len(idx)
-
-        idx = df.index[short_mask]
-        df.loc[idx, "signal_entry"] = [{"direction": "short", "tag": "SHORT SETUP 1"}] * len(idx)
-
-        idx = df.index[short_mask_2]
-        df.loc[idx, "signal_entry"] = [{"direction": "short", "tag": "SHORT SETUP 2"}] * len(idx)
-
+        self.set_entry_signals(long_mask_rma_33, direction="long", tag="LONG SETUP 1")
+        self.set_entry_signals(long_mask_rma_144, direction="long", tag="LONG SETUP 2")
+        self.set_entry_signals(short_mask, direction="short", tag="SHORT SETUP 1")
+        self.set_entry_signals(short_mask_2, direction="short", tag="SHORT SETUP 2")
 
         # --- 🔹 7. Poziomy SL/TP ---
-        has_signals = df["signal_entry"].apply(bool)
-        df.loc[has_signals, "levels"] = df.loc[has_signals].apply(
-            lambda row: self.calculate_levels(row["signal_entry"], row),
-            axis=1
-        )
-
-
-
-        self.df = df
+        self.apply_levels()
 
 
 
@@ -188,101 +192,62 @@ class Samplestrategyreport(BaseStrategy):
         self.df["signal_exit"] = None
         self.df["custom_stop_loss"] = None
 
-    def compute_sl(
-            self,
-            *,
-            row,
-            direction,
-            min_atr_mult=0.5,
-            min_pct=0.001,
-    ):
-        """
-        Zwraca:
-        - sl_level
-        - sl_source: 'struct' | 'min'
-        """
-
-        close = row["close"]
-        atr = row["atr"]
-
-        # =========================
-        # SL STRUKTURALNY
-        # =========================
-
-        if direction == "long":
-            sl_structural = min(row["low_15"], row["low_5"]) - atr * 0.5
-        else:
-            sl_structural = max(row["high_15"], row["high_5"]) + atr * 0.5
-
-        # =========================
-        # MINIMALNY SL
-        # =========================
-
-        min_sl_atr = atr * min_atr_mult
-        min_sl_pct = close * min_pct
-        min_distance = max(min_sl_atr, min_sl_pct)
-
-        if direction == "long":
-            sl_min = close - min_distance
-
-            if sl_structural < sl_min:
-                return sl_structural, "struct"
-            else:
-                return sl_min, "min"
-
-        else:
-            sl_min = close + min_distance
-
-            if sl_structural > sl_min:
-                return sl_structural, "struct"
-            else:
-                return sl_min, "min"
+        df = self.df
+        if self.strategy_config.get("TRAIL_MODE") == "swing":
+            trail_long, trail_short = swing_trail(
+                low=df["low"].to_numpy(),
+                high=df["high"].to_numpy(),
+                lookback=int(self.strategy_config.get("SWING_LOOKBACK", 5)),
+            )
+        else:  # ribbon
+            trail_long = df["sl_long"].to_numpy()
+            trail_short = df["sl_short"].to_numpy()
 
-    def calculate_levels(self, signals, row):
+        self.set_trailing_stops(long=trail_long, short=trail_short)
 
-        if not isinstance(signals, dict):
-            return None
+    def compute_levels_vectorized(self, df, mask):
+        """
+        SL: wider of structural (5/15-bar swing +/- 0.5 ATR) and minimal
+        (max(1 ATR, 0.1% of close)) stop.
+        TP1/TP2: 1R / 2R from entry.
+        """
 
-        direction = signals["direction"]
-        close = row["close"]
+        direction = df["signal_direction"].to_numpy()
+        close = df["close"].to_numpy()
+        atr = df["atr"].to_numpy()
 
-        sl, sl_source = self.compute_sl(
-            row=row,
-            direction=direction,
-            min_atr_mult=1,
-            min_pct=0.001
+        sl_structural = structural_sl(
+            direction,
+            swing_low=np.minimum(df["low_15"].to_numpy(), df["low_5"].to_numpy()),
+            swing_high=np.maximum(df["high_15"].to_numpy(), df["high_5"].to_numpy()),
+            atr=atr,
+            atr_buffer=self.strategy_config["SL_ATR_BUFFER"],
         )
-
-        risk = abs(close - sl)
+        sl_min = min_distance_sl(
+            direction,
+            close=close,
+            atr=atr,
+            min_atr_mult=self.strategy_config["SL_MIN_ATR"],
+            min_pct=0.001,
+        )
+        sl, is_struct = wider_sl(direction, sl_structural, sl_min)
+        sl_source = np.where(is_struct, "struct", "min").astype(object)
 
         # ============================
         # MICROSTRUCTURE-AWARE TP
         # ============================
 
-        tp1_mult = 1
-        tp2_mult = 2
-
-        if direction == "long":
-            tp1_level = close + risk * tp1_mult
-            tp2_level = close + risk * tp2_mult
-        else:
-            tp1_level = close - risk * tp1_mult
-            tp2_level = close - risk * tp2_mult
-
-        return {
-            "SL": {
-                "level": sl,
-                "tag": f"{sl_source}"
-            },
-            "TP1": {
-                "level": tp1_level,
-                "tag": f"RR 1:{tp1_mult} from {sl_source}"
-            },
-            "TP2": {
-                "level": tp2_level,
-                "tag": f"RR 1:{tp2_mult} from {sl_source}"
-            },
-        }
+        tp1_mult = self.strategy_config["TP1_R"]
+        tp2_mult = self.strategy_config["TP2_R"]
+
+        return LevelArrays(
+            sl=sl,
+            tp1=r_multiple_tp(direction, entry=close, sl=sl, multiple=tp1_mult),
+            tp2=r_multiple_tp(direction, entry=close, sl=sl, multiple=tp2_mult),
+            sl_tag=sl_source,
+            tp1_tag=f"RR 1:{tp1_mult} from " + sl_source,
+            tp2_tag=f"RR 1:{tp2_mult} from " + sl_source,
+        )
 
     def build_report_spec(self):
 
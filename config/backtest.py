@@ -20,7 +20,7 @@ TIMERANGE = {
     "end":   "2025-12-29",
 }
 
-BACKTEST_MODE = "single"  # "single" | "split"
+BACKTEST_MODE = "single"  # "single" | "split" | "walk_forward"
 
 BACKTEST_WINDOWS = {
     "OPT":   ("2025-12-01", "2025-12-15"),
@@ -28,6 +28,19 @@ BACKTEST_WINDOWS = {
     "FINAL": ("2025-12-24", "2025-12-31"),
 }
 
+# "train" windows are in-sample: reported, but not in the stitched
+# out-of-sample curve. Windows not listed are "test".
+BACKTEST_WINDOW_ROLES = {
+    "OPT": "train",
+}
+
+# Rolling folds for BACKTEST_MODE = "walk_forward" (pandas Timedelta strings)
+WALK_FORWARD = {
+    "train": "60D",
+    "test": "14D",
+    "step": None,  # None -> test
+}
+
 # Metadata only (for reports / README)
 MISSING_DATA_HANDLING = "Forward-fill OHLC gaps"
 
@@ -114,6 +127,9 @@ PERSIST_REPORT = True
 # Fail if no trades (research safety)
 REPORT_FAIL_ON_EMPTY = True
 
+# Per-symbol reports + summary on a process pool (None = os.cpu_count(), 1 = serial)
+REPORT_WORKERS = None
+
 # ==================================================
 # RUNTIME / DEBUG
 # ==================================================
@@ -132,8 +148,35 @@ LOGGER_CONFIG = LoggerConfig(
 
 PROFILING = True
 
+# "staged": data -> strategies -> backtests, each stage over all symbols
+# "fused":  one worker per symbol runs data -> strategy -> backtest -> report
+# "streaming": fused, symbols admitted under STREAM_MEMORY_BUDGET_MB
+PIPELINE_MODE = "staged"
+FUSED_WORKER_REPORTS = True
+
+# Streaming: worker estimate = STREAM_BASE_MB + base-TF bars / 1000 * STREAM_MB_PER_1K_BARS
+# (per-bar rate is raised from measured worker peaks during the run)
+STREAM_MEMORY_BUDGET_MB = 4096
+STREAM_BASE_MB = 300
+STREAM_MB_PER_1K_BARS = 1.5
+
 USE_MULTIPROCESSING_STRATEGIES = False
 USE_MULTIPROCESSING_BACKTESTS = True
 
 MAX_WORKERS_STRATEGIES = None     # None = os.cpu_count()
-MAX_WORKERS_BACKTESTS = None
\ No newline at end of file
+MAX_WORKERS_BACKTESTS = None
+MAX_WORKERS_OPTIMIZE = None       # None = os.cpu_count()
+
+# Pool scheduling: longest task first, cost = bars * seconds/bar of previous runs
+SCHEDULER_TIMINGS_PATH = "results/scheduler/timings.json"
+# fused mode: split oversized symbols into time chunks. Trades match the
+# unsplit run: a chunk blocked by a trade open across its boundary, or
+# with a trade longer than the tail, is re-run serially on merge.
+SCHEDULER_SPLIT_SYMBOLS = False
+SCHEDULER_MAX_CHUNKS = 8
+SCHEDULER_CHUNK_TAIL = "2D"       # data loaded past a chunk end so open trades can close
+
+# Staged mode: strategy runs and trades cached by hash of data, code and config
+STAGE_CACHE = True
+STAGE_CACHE_PATH = "results/cache"
+STAGE_CACHE_MAX_MB = 2048          # least recently used entries evicted above this
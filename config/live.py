@@ -20,13 +20,59 @@ DRY_RUN = True
 
 TICK_INTERVAL_SEC = 1.0
 
+# exits on: "candles" (last closed candle close, once per bar)
+#         | "ticks" (opt-in: bid/ask every poll, longs exit at bid, shorts at ask;
+#                    unchanged ticks skipped)
+MARKET_STATE_SOURCE = "candles"
+TICK_HEARTBEAT_SEC = 60              # ticks only: re-emit an unchanged tick (time-based exits, broker sync)
+
+# account / symbol info cache (sizing, volume normalization, order checks);
+# the account is also refreshed after every fill
+METADATA_ACCOUNT_TTL_SEC = 60
+METADATA_SYMBOL_TTL_SEC = 300
+
+# "sync":  poll -> exits -> strategy inline, then sleep
+# "async": polling, exit handling and strategy evaluation as separate tasks
+#          (opt-in until validated against the sync loop)
+LIVE_ENGINE = "sync"
+
+# Trade state persistence: "json" (active/closed files) | "sqlite" (WAL, in-memory index, opt-in)
+# sqlite imports existing JSON state once and renames the files to *.json.imported
+TRADE_REPO_BACKEND = "json"
+
+# ==================================================
+# LATENCY
+# ==================================================
+
+LATENCY_TRACKING = True
+LATENCY_LOG_PATH = "live_state/latency.jsonl"   # one JSON line per (symbol, stage) per export
+LATENCY_EXPORT_INTERVAL_SEC = 60
+
+# alert when a stage's p99 exceeds this fraction of the bar duration
+LATENCY_ALERT_BAR_FRACTION = {
+    "candle_to_plan": 0.05,
+    "candle_to_order": 0.10,
+    "exits": 0.02,
+}
+
+# ==================================================
+# SHADOW (live vs backtest plan check on every candle)
+# ==================================================
+
+SHADOW_COMPARE = False
+SHADOW_WINDOW = 64                  # rows of the live frame re-planned by the backtest path
+SHADOW_SETTLE_BARS = 2              # re-check each live plan this many bars later (repainting)
+SHADOW_LOG_PATH = "live_state/shadow_mismatches.jsonl"
+
 # ==================================================
 # STRATEGY
 # ==================================================
 
 STRATEGY_CLASS = "Samplestrategyreport"
 
+# one symbol (str) or several (list): several run in one multi-symbol engine
 SYMBOLS = "BTCUSD"
+LIVE_STRATEGY_WORKERS = None   # strategy evaluation pool; None = min(symbols, cpu count)
 
 TIMEFRAME = "M1"
 
@@ -39,4 +85,15 @@ EXIT_EXECUTION = {
     "TP1": "ENGINE",   # ENGINE | BROKER | DISABLED
     "TP2": "BROKER",   # ENGINE | BROKER | DISABLED
     "BE_ON_TP1": True, # move SL to BE when TP1 is reached
-}
\ No newline at end of file
+}
+# ==================================================
+# REPLAY (simulated broker, live_replay_run.py)
+# ==================================================
+
+REPLAY_START = "2025-01-06"          # session start; earlier bars are warmup history
+REPLAY_END = "2025-01-10"
+REPLAY_WARMUP_DAYS = 3
+REPLAY_SPEED = None                  # simulated seconds per wall second; None = max speed
+REPLAY_FILL_LATENCY_SEC = 0.0        # blocking order_send round-trip
+REPLAY_SLIPPAGE_POINTS = 0.0         # adverse, per fill
+REPLAY_MARKET_DATA_PATH = "market_data"
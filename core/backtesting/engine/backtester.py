@@ -1,6 +1,7 @@
 import pandas as pd
 from typing import Optional
 
+from core.backtesting.engine.execution_batch import has_managed_plans, run_execution_batch
 from core.backtesting.engine.execution_loop import run_execution_loop
 from core.domain.cost.cost_engine import TradeCostEngine
 from core.backtesting.execution_policy import ExecutionPolicy
@@ -29,9 +30,14 @@ class Backtester:
         *,
         execution_policy: Optional[ExecutionPolicy] = None,
         cost_engine: Optional[TradeCostEngine] = None,
+        execution_mode: str = "batch",
     ):
+        if execution_mode not in ("batch", "loop"):
+            raise ValueError(f"Unknown execution_mode: {execution_mode}")
+
         self.execution_policy = execution_policy or ExecutionPolicy()
         self.cost_engine = cost_engine or TradeCostEngine(self.execution_policy)
+        self.execution_mode = execution_mode
 
     # ==================================================
     # MAIN API
@@ -82,6 +88,23 @@ class Backtester:
 
         instrument_ctx = build_instrument_ctx(symbol)
 
+        if self.execution_mode == "batch":
+            trades = run_execution_batch(
+                df=df,
+                symbol=symbol,
+                plans=plans,
+                instrument_ctx=instrument_ctx,
+            )
+            if trades.empty:
+                return pd.DataFrame()
+
+            self.cost_engine.apply_frame(trades, df=df, ctx=instrument_ctx)
+            return trades
+
+        # reference path (per-trade Python, fixed exits only)
+        if has_managed_plans(plans):
+            raise ValueError("Managed exit plans require execution_mode='batch'")
+
         trades = run_execution_loop(
             df=df,
             symbol=symbol,
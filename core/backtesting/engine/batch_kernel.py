@@ -0,0 +1,152 @@
+import numpy as np
+from numba import njit
+
+from core.backtesting.exit.first_touch import simulate_exit_indexed_numba
+from core.backtesting.exit.simulate_exit_managed_numba import simulate_exit_managed_numba
+
+
+TRADE_RECORD_DTYPE = np.dtype([
+    ("entry_pos", np.int64),
+    ("exit_pos", np.int64),
+    ("tp1_pos", np.int64),
+    ("direction", np.int8),
+    ("tag", np.int32),
+    ("exit_code", np.int8),
+    ("tp1_executed", np.bool_),
+    ("entry_price", np.float64),
+    ("exit_price", np.float64),
+    ("tp1_price", np.float64),
+    ("sl", np.float64),
+    ("tp1", np.float64),
+    ("tp2", np.float64),
+])
+
+INT64_MIN = np.iinfo(np.int64).min
+
+
+@njit
+def simulate_entries_batch(
+    plan_valid,         # bool[n]
+    plan_dir,           # int8[n]  1 long / -1 short / 0 none
+    plan_tag,           # int32[n] entry tag codes (0..n_tags-1)
+    n_tags,
+    plan_sl,
+    plan_tp1,
+    plan_tp2,
+    plan_managed,       # bool[n]  managed exits (trailing / signal exit)
+    plan_trail_from,    # int8[n]  TRAIL_* code
+    plan_be_on_tp1,     # bool[n]
+    trail_long,         # float[n] per-bar SL candidates (NaN = none)
+    trail_short,
+    exit_tag_arr,       # int32[n] entry tag code to close (-1 = none)
+    high_arr,
+    low_arr,
+    close_arr,
+    high_tree,          # build_max_tree(high)
+    neg_low_tree,       # build_max_tree(-low)
+    time_arr,           # int64[n] (ns)
+    slippage_abs,
+    out,                # TRADE_RECORD_DTYPE[>= valid plans]
+):
+    """
+    Simulate every valid plan in one pass.
+
+    Semantics mirror run_execution_loop:
+    - longs first, then shorts, in bar order
+    - per direction, an entry is skipped while the previous trade
+      with the same entry tag is still open (last_exit_by_tag rule)
+
+    Fixed exits are resolved via the first-touch index (see first_touch.py),
+    managed exits bar by bar (see simulate_exit_managed_numba.py).
+
+    Returns number of records written to `out`.
+    """
+    n = len(close_arr)
+    k = 0
+
+    for d in (1, -1):
+        last_exit_by_tag = np.full(n_tags, INT64_MIN, dtype=np.int64)
+
+        for entry_pos in range(n):
+            if not plan_valid[entry_pos]:
+                continue
+            if plan_dir[entry_pos] != d:
+                continue
+
+            tag = plan_tag[entry_pos]
+            if last_exit_by_tag[tag] > time_arr[entry_pos]:
+                continue
+
+            sl = plan_sl[entry_pos]
+            tp1 = plan_tp1[entry_pos]
+            tp2 = plan_tp2[entry_pos]
+
+            entry_price = close_arr[entry_pos] + slippage_abs * d
+
+            if plan_managed[entry_pos]:
+                (
+                    exit_pos,
+                    exit_price,
+                    exit_code,
+                    tp1_executed,
+                    tp1_price,
+                    tp1_pos,
+                ) = simulate_exit_managed_numba(
+                    d,
+                    entry_pos,
+                    entry_price,
+                    tag,
+                    sl,
+                    tp1,
+                    tp2,
+                    high_arr,
+                    low_arr,
+                    close_arr,
+                    trail_long if d == 1 else trail_short,
+                    exit_tag_arr,
+                    plan_trail_from[entry_pos],
+                    plan_be_on_tp1[entry_pos],
+                    slippage_abs,
+                )
+            else:
+                (
+                    exit_pos,
+                    exit_price,
+                    exit_code,
+                    tp1_executed,
+                    tp1_price,
+                    tp1_pos,
+                ) = simulate_exit_indexed_numba(
+                    d,
+                    entry_pos,
+                    entry_price,
+                    sl,
+                    tp1,
+                    tp2,
+                    high_arr,
+                    low_arr,
+                    close_arr,
+                    high_tree,
+                    neg_low_tree,
+                    slippage_abs,
+                )
+
+            rec = out[k]
+            rec["entry_pos"] = entry_pos
+            rec["exit_pos"] = exit_pos
+            rec["tp1_pos"] = tp1_pos
+            rec["direction"] = d
+            rec["tag"] = tag
+            rec["exit_code"] = exit_code
+            rec["tp1_executed"] = tp1_executed
+            rec["entry_price"] = entry_price
+            rec["exit_price"] = exit_price
+            rec["tp1_price"] = tp1_price
+            rec["sl"] = sl
+            rec["tp1"] = tp1
+            rec["tp2"] = tp2
+            k += 1
+
+            last_exit_by_tag[tag] = time_arr[exit_pos]
+
+    return k
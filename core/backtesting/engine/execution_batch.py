@@ -0,0 +1,287 @@
+import numpy as np
+import pandas as pd
+
+from config.backtest import INITIAL_BALANCE, MAX_RISK_PER_TRADE
+from core.backtesting.engine.batch_kernel import TRADE_RECORD_DTYPE, simulate_entries_batch
+from core.backtesting.exit.first_touch import build_max_tree
+from core.backtesting.exit.simulate_exit_managed_numba import TRAIL_FROM_CODES
+from core.domain.cost.instrument_ctx import InstrumentCtx
+from core.domain.execution.execution_mapping import (
+    EXIT_EOD,
+    EXIT_MANAGED,
+    EXIT_SL,
+    EXIT_TP1_BE,
+    EXIT_TP2,
+    EXIT_TRAIL,
+)
+from core.domain.trade.trade_buffer import TradeBuffer
+from core.domain.trade.trade_exit import TradeExitReason
+from core.strategy.signals import (
+    EXIT_SIGNAL_LABEL,
+    EXIT_SIGNAL_TAG,
+    TRAIL_SL_LONG,
+    TRAIL_SL_SHORT,
+    categorical_to_str,
+    ensure_management_columns,
+)
+
+
+_EXIT_REASONS = {
+    EXIT_SL: TradeExitReason.SL.value,
+    EXIT_TP1_BE: TradeExitReason.BE.value,
+    EXIT_TP2: TradeExitReason.TP2.value,
+    EXIT_TRAIL: TradeExitReason.TRAIL.value,
+    EXIT_MANAGED: TradeExitReason.MANAGED_EXIT.value,
+    EXIT_EOD: TradeExitReason.TIMEOUT.value,
+}
+
+
+def direction_codes(plan_dir) -> np.ndarray:
+    plan_dir = np.asarray(plan_dir, dtype=object)
+    out = np.zeros(len(plan_dir), dtype=np.int8)
+    out[plan_dir == "long"] = 1
+    out[plan_dir == "short"] = -1
+    return out
+
+
+def _managed_plan_arrays(plans: pd.DataFrame):
+    """
+    Managed flags per plan. Plans without management columns are fixed.
+    """
+    n = len(plans)
+
+    if "plan_exit_mode" in plans.columns:
+        managed = (plans["plan_exit_mode"].to_numpy(dtype=object) == "managed")
+    else:
+        managed = np.zeros(n, dtype=bool)
+
+    trail_from = np.zeros(n, dtype=np.int8)
+    if "plan_trail_from" in plans.columns:
+        raw = plans["plan_trail_from"].to_numpy(dtype=object)
+        for key, code in TRAIL_FROM_CODES.items():
+            if key is not None:
+                trail_from[raw == key] = code
+
+    if "plan_be_on_tp1" in plans.columns:
+        be_on_tp1 = plans["plan_be_on_tp1"].to_numpy(dtype=bool)
+    else:
+        be_on_tp1 = np.ones(n, dtype=bool)
+
+    return managed.astype(bool), trail_from, be_on_tp1
+
+
+def has_managed_plans(plans: pd.DataFrame) -> bool:
+    if "plan_exit_mode" not in plans.columns:
+        return False
+    return bool((plans["plan_exit_mode"].to_numpy(dtype=object) == "managed").any())
+
+
+def _position_sizes(
+    *,
+    entry_price: np.ndarray,
+    sl: np.ndarray,
+    instrument_ctx: InstrumentCtx,
+) -> np.ndarray:
+    """
+    Vectorized core.domain.risk.sizing.position_size (percent risk).
+    Rounding stays Python round() to keep parity with the scalar path.
+    """
+    pip_distance = np.abs(entry_price - sl) / instrument_ctx.point_size
+    risk_amount = MAX_RISK_PER_TRADE * INITIAL_BALANCE
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = risk_amount / (pip_distance * instrument_ctx.pip_value)
+
+    raw = np.where(entry_price == sl, 0.0, raw)
+    return np.array([round(float(s), 3) for s in raw], dtype=np.float64)
+
+
+def _exit_level_tags(
+    *,
+    exit_code: np.ndarray,
+    sl_tag: np.ndarray,
+    tp1_tag: np.ndarray,
+    tp2_tag: np.ndarray,
+) -> np.ndarray:
+    out = np.full(len(exit_code), None, dtype=object)
+
+    for code, tags in ((EXIT_SL, sl_tag), (EXIT_TP2, tp2_tag), (EXIT_TP1_BE, tp1_tag)):
+        m = exit_code == code
+        out[m] = tags[m]
+
+    out[exit_code == EXIT_TRAIL] = TradeExitReason.TRAIL.value
+    return out
+
+
+def simulate_batch(
+    *,
+    df: pd.DataFrame,
+    plans: pd.DataFrame,
+    instrument_ctx: InstrumentCtx,
+) -> np.ndarray:
+    """
+    Run the numba kernel over every plan.
+    Returns TRADE_RECORD_DTYPE records (kernel order: longs, then shorts).
+    """
+    time_arr = df["time"].dt.tz_localize(None).values.astype("datetime64[ns]").view(np.int64)
+    high_arr = df["high"].to_numpy(dtype=np.float64)
+    low_arr = df["low"].to_numpy(dtype=np.float64)
+    close_arr = df["close"].to_numpy(dtype=np.float64)
+
+    plan_valid = plans["plan_valid"].to_numpy(dtype=bool)
+    plan_dir = direction_codes(plans["plan_direction"].values)
+
+    tag_codes, tag_index = pd.factorize(plans["plan_entry_tag"].astype(str), sort=False)
+    tag_codes = tag_codes.astype(np.int32)
+    n_tags = int(tag_codes.max()) + 1 if len(tag_codes) else 0
+
+    managed, trail_from, be_on_tp1 = _managed_plan_arrays(plans)
+    n = len(df)
+
+    if managed.any():
+        mgmt = ensure_management_columns(df)
+        trail_long = mgmt[TRAIL_SL_LONG].to_numpy(dtype=np.float64)
+        trail_short = mgmt[TRAIL_SL_SHORT].to_numpy(dtype=np.float64)
+        exit_tags = mgmt[EXIT_SIGNAL_TAG].astype(object).where(mgmt[EXIT_SIGNAL_TAG].notna(), None)
+        exit_tag_arr = pd.Index(tag_index).get_indexer(exit_tags.to_numpy(dtype=object)).astype(np.int32)
+    else:
+        trail_long = np.full(n, np.nan)
+        trail_short = trail_long
+        exit_tag_arr = np.full(n, -1, dtype=np.int32)
+
+    out = np.empty(int(plan_valid.sum()), dtype=TRADE_RECORD_DTYPE)
+
+    k = simulate_entries_batch(
+        plan_valid,
+        plan_dir,
+        tag_codes,
+        max(n_tags, 1),
+        plans["plan_sl"].to_numpy(dtype=np.float64),
+        plans["plan_tp1"].to_numpy(dtype=np.float64),
+        plans["plan_tp2"].to_numpy(dtype=np.float64),
+        managed,
+        trail_from,
+        be_on_tp1,
+        trail_long,
+        trail_short,
+        exit_tag_arr,
+        high_arr,
+        low_arr,
+        close_arr,
+        build_max_tree(high_arr),
+        build_max_tree(-low_arr),
+        time_arr,
+        float(instrument_ctx.slippage_abs),
+        out,
+    )
+
+    return out[:k]
+
+
+def run_execution_batch(
+    *,
+    df: pd.DataFrame,
+    symbol: str,
+    plans: pd.DataFrame,
+    instrument_ctx: InstrumentCtx,
+) -> pd.DataFrame:
+    """
+    Batch counterpart of run_execution_loop.
+
+    Exits are simulated in one numba call; sizing, PnL, returns and
+    tags are computed column-wise. Output columns and values match
+    Trade.to_dict() rows produced by the loop (same order).
+    """
+    rec = simulate_batch(df=df, plans=plans, instrument_ctx=instrument_ctx)
+
+    if len(rec) == 0:
+        return TradeBuffer(capacity=1).to_frame()
+
+    point = instrument_ctx.point_size
+    pip = instrument_ctx.pip_value
+
+    times = df["time"].dt.tz_localize(None).values
+    entry_pos = rec["entry_pos"]
+    exit_pos = rec["exit_pos"]
+    tp1_exec = rec["tp1_executed"]
+
+    dir_sign = rec["direction"].astype(np.float64)
+    entry_price = rec["entry_price"]
+    exit_price = rec["exit_price"]
+    sl = rec["sl"]
+    tp1 = rec["tp1"]
+
+    size = _position_sizes(entry_price=entry_price, sl=sl, instrument_ctx=instrument_ctx)
+
+    # ---------------- PnL (same operation order as Trade._compute_pnl)
+    diff_exit = (exit_price - entry_price) * dir_sign
+    diff_tp1 = (rec["tp1_price"] - entry_price) * dir_sign
+
+    pnl_full = diff_exit / point * pip * size
+    pnl_split = (
+        diff_tp1 / point * pip * size * 0.5
+        + diff_exit / point * pip * size * 0.5
+    )
+    pnl = np.where(tp1_exec, pnl_split, pnl_full)
+
+    tp1_pnl = np.where(
+        tp1_exec,
+        (tp1 - entry_price) * dir_sign / point * pip * size * 0.5,
+        0.0,
+    )
+
+    risk_usd = np.abs(entry_price - sl) / point * pip * size
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(risk_usd > 0, pnl / risk_usd, 0.0)
+
+    entry_time = times[entry_pos]
+    exit_time = times[exit_pos]
+    tp1_time = np.where(
+        tp1_exec,
+        times[np.maximum(rec["tp1_pos"], 0)],
+        np.datetime64("NaT"),
+    ).astype(times.dtype)
+
+    duration = (exit_time - entry_time) / np.timedelta64(1, "s")
+
+    # ---------------- tags
+    entry_tags = plans["plan_entry_tag"].to_numpy().astype(str).astype(object)[entry_pos]
+    exit_code = rec["exit_code"]
+
+    exit_tag = np.full(len(rec), TradeExitReason.UNKNOWN.value, dtype=object)
+    for code, reason in _EXIT_REASONS.items():
+        exit_tag[exit_code == code] = reason
+
+    exit_level_tag = _exit_level_tags(
+        exit_code=exit_code,
+        sl_tag=plans["plan_sl_tag"].to_numpy().astype(str).astype(object)[entry_pos],
+        tp1_tag=plans["plan_tp1_tag"].to_numpy().astype(str).astype(object)[entry_pos],
+        tp2_tag=plans["plan_tp2_tag"].to_numpy().astype(str).astype(object)[entry_pos],
+    )
+
+    managed_exit = exit_code == EXIT_MANAGED
+    if managed_exit.any():
+        labels = categorical_to_str(ensure_management_columns(df)[EXIT_SIGNAL_LABEL], fill="")
+        picked = labels[exit_pos[managed_exit]]
+        exit_level_tag[managed_exit] = np.where(picked == "", None, picked)
+
+    buffer = TradeBuffer(capacity=len(rec))
+    buffer.extend(
+        symbol=symbol,
+        direction=rec["direction"],
+        entry_time=entry_time,
+        exit_time=exit_time,
+        entry_price=entry_price,
+        exit_price=exit_price,
+        position_size=size,
+        pnl_usd=pnl,
+        returns=returns,
+        entry_tag=entry_tags,
+        exit_tag=exit_tag,
+        exit_level_tag=exit_level_tag,
+        tp1_price=np.where(tp1_exec, rec["tp1_price"], np.nan),
+        tp1_time=tp1_time,
+        tp1_pnl=tp1_pnl,
+        duration=duration,
+    )
+    return buffer.to_frame()
@@ -0,0 +1,227 @@
+import numpy as np
+from numba import njit, prange
+
+from core.backtesting.exit.first_touch import simulate_exit_indexed_numba
+from core.backtesting.exit.simulate_exit_numba import EXIT_SL, EXIT_TP1_BE
+from core.domain.cost.time_utils import NS_PER_DAY
+
+
+# combo parameter columns
+P_SL_MULT = 0
+P_TP1_MULT = 1
+P_TP2_MULT = 2
+P_TP1_RATIO = 3
+P_SLIPPAGE = 4
+N_PARAMS = 5
+
+# metric columns
+M_TRADES = 0
+M_WINS = 1
+M_PNL = 2
+M_PNL_NET = 3
+M_R_SUM = 4
+M_GROSS_PROFIT = 5
+M_GROSS_LOSS = 6
+M_MAX_DD = 7
+N_METRICS = 8
+
+INT64_MIN = np.iinfo(np.int64).min
+
+# financing columns (per direction: 0 long, 1 short)
+F_USD_PER_LOT = 0
+F_NOTIONAL_RATE = 1
+N_FINANCING = 2
+
+
+@njit
+def _scale(level, close, mult):
+    # mult == 1 returns the plan level bit-for-bit
+    return level + (level - close) * (mult - 1.0)
+
+
+@njit
+def _rollovers(entry_ns, exit_ns, offset_ns, triple_residue):
+    # count_rollovers_vec for one trade
+    if exit_ns <= entry_ns:
+        return 0, 0
+    k_entry = (entry_ns - offset_ns) // NS_PER_DAY
+    k_exit = (exit_ns - offset_ns) // NS_PER_DAY
+    n_triple = (k_exit - triple_residue) // 7 - (k_entry - triple_residue) // 7
+    return k_exit - k_entry, n_triple
+
+
+@njit(parallel=True)
+def simulate_grid(
+    entry_pos,          # int64[m] valid plan bar positions (ascending)
+    entry_dir,          # int8[m]
+    entry_tag,          # int32[m]
+    n_tags,
+    plan_sl,            # float[m]
+    plan_tp1,
+    plan_tp2,
+    high_arr,
+    low_arr,
+    close_arr,
+    high_tree,
+    neg_low_tree,
+    time_arr,           # int64[n] (ns)
+    params,             # float[k, N_PARAMS]
+    point_size,
+    pip_value,
+    half_spread,
+    risk_amount,
+    financing,          # float[2, N_FINANCING] rates by direction (zeros: off)
+    contract_size,
+    rollover_offset_ns,
+    triple_residue,     # (triple weekday - epoch weekday) % 7
+    triple_extra,       # FX_TRIPLE_MULTIPLIER - 1 (0 when no triple)
+):
+    """
+    Simulate every parameter combination over the same entries.
+
+    Per combo the fixed-exit semantics of simulate_entries_batch apply
+    (longs then shorts, last_exit_by_tag rule); only exit geometry,
+    TP1 split and slippage change. Combos run in parallel (prange).
+    Net PnL carries the same costs as TradeCostEngine: spread, slippage
+    and rollover financing (attach_financing_costs_frame).
+
+    Returns float[k, N_METRICS].
+    """
+    k = params.shape[0]
+    m = len(entry_pos)
+    out = np.zeros((k, N_METRICS), dtype=np.float64)
+
+    for c in prange(k):
+        sl_mult = params[c, P_SL_MULT]
+        tp1_mult = params[c, P_TP1_MULT]
+        tp2_mult = params[c, P_TP2_MULT]
+        ratio = params[c, P_TP1_RATIO]
+        slip = params[c, P_SLIPPAGE]
+
+        pnl_buf = np.empty(m, dtype=np.float64)
+        exit_buf = np.empty(m, dtype=np.int64)
+        t = 0
+
+        wins = 0
+        pnl_sum = 0.0
+        net_sum = 0.0
+        r_sum = 0.0
+        gross_profit = 0.0
+        gross_loss = 0.0
+
+        for d in (1, -1):
+            last_exit_by_tag = np.full(n_tags, INT64_MIN, dtype=np.int64)
+
+            for j in range(m):
+                if entry_dir[j] != d:
+                    continue
+
+                pos = entry_pos[j]
+                tag = entry_tag[j]
+                if last_exit_by_tag[tag] > time_arr[pos]:
+                    continue
+
+                close = close_arr[pos]
+                sl = _scale(plan_sl[j], close, sl_mult)
+                tp1 = _scale(plan_tp1[j], close, tp1_mult)
+                tp2 = _scale(plan_tp2[j], close, tp2_mult)
+
+                entry_price = close + slip * d
+
+                (
+                    exit_pos,
+                    exit_price,
+                    exit_code,
+                    tp1_executed,
+                    tp1_price,
+                    tp1_pos,
+                ) = simulate_exit_indexed_numba(
+                    d,
+                    pos,
+                    entry_price,
+                    sl,
+                    tp1,
+                    tp2,
+                    high_arr,
+                    low_arr,
+                    close_arr,
+                    high_tree,
+                    neg_low_tree,
+                    slip,
+                )
+
+                pip_distance = abs(entry_price - sl) / point_size
+                size = 0.0
+                if pip_distance > 0:
+                    size = round(risk_amount / (pip_distance * pip_value), 3)
+
+                usd_per_price = size / point_size * pip_value
+
+                if tp1_executed:
+                    pnl = (
+                        (tp1_price - entry_price) * d * usd_per_price * ratio
+                        + (exit_price - entry_price) * d * usd_per_price * (1.0 - ratio)
+                    )
+                    exit_frac = 1.0 - ratio
+                else:
+                    pnl = (exit_price - entry_price) * d * usd_per_price
+                    exit_frac = 1.0
+
+                # cost overlay (TradeCostEngine):
+                # spread on every fill, slippage on market fills, financing
+                costs = 2.0 * half_spread * usd_per_price + slip * usd_per_price
+                if exit_code == EXIT_SL or exit_code == EXIT_TP1_BE:
+                    costs += slip * usd_per_price * exit_frac
+
+                side = 0 if d == 1 else 1
+                unit = size * (
+                    financing[side, F_USD_PER_LOT]
+                    + entry_price * contract_size * financing[side, F_NOTIONAL_RATE]
+                )
+                if unit != 0.0:
+                    n_roll, n_triple = _rollovers(
+                        time_arr[pos], time_arr[exit_pos], rollover_offset_ns, triple_residue
+                    )
+                    costs += unit * (n_roll + triple_extra * n_triple)
+
+                risk_usd = abs(entry_price - sl) * usd_per_price
+                if risk_usd > 0:
+                    r_sum += pnl / risk_usd
+
+                pnl_sum += pnl
+                net_sum += pnl - costs
+                if pnl > 0:
+                    wins += 1
+                    gross_profit += pnl
+                else:
+                    gross_loss -= pnl
+
+                pnl_buf[t] = pnl
+                exit_buf[t] = exit_pos
+                t += 1
+
+                last_exit_by_tag[tag] = time_arr[exit_pos]
+
+        # drawdown on the exit-ordered equity curve
+        order = np.argsort(exit_buf[:t], kind="mergesort")
+        equity = 0.0
+        peak = 0.0
+        max_dd = 0.0
+        for q in range(t):
+            equity += pnl_buf[order[q]]
+            if equity > peak:
+                peak = equity
+            dd = peak - equity
+            if dd > max_dd:
+                max_dd = dd
+
+        out[c, M_TRADES] = t
+        out[c, M_WINS] = wins
+        out[c, M_PNL] = pnl_sum
+        out[c, M_PNL_NET] = net_sum
+        out[c, M_R_SUM] = r_sum
+        out[c, M_GROSS_PROFIT] = gross_profit
+        out[c, M_GROSS_LOSS] = gross_loss
+        out[c, M_MAX_DD] = max_dd
+
+    return out
@@ -0,0 +1,24 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(
+    max_workers: int,
+    *,
+    initializer=None,
+    initargs: tuple = (),
+    max_tasks_per_child: int | None = None,
+) -> ProcessPoolExecutor:
+    """
+    Process pool for backtest work.
+
+    Workers are spawned, not forked: forking after numba's threading
+    layer has started can hang.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+        max_tasks_per_child=max_tasks_per_child,
+    )
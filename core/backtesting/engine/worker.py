@@ -1,10 +1,17 @@
 
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+
 import pandas as pd
 
+from config.report_config import ReportConfig, StdoutMode
 from core.backtesting.engine.backtester import Backtester
 from core.backtesting.strategy_runner import strategy_orchestration
 from core.logging.config import LoggerConfig
 from core.logging.run_logger import RunLogger
+from core.reporting.runner import ReportRunner
+from core.reporting.summary_runner import SummaryReportRunner
 
 
 def run_backtest_worker(
@@ -46,3 +53,55 @@ def run_strategy_worker(
         logger=logger,
     )
     return result
+
+
+def run_report_worker(
+    *,
+    trades: pd.DataFrame,
+    df_context: pd.DataFrame,
+    report_spec,
+    metadata,
+    config: SimpleNamespace,
+    run_path: Path,
+) -> float:
+    """
+    Per-symbol report (sections, parquet/JSON, dashboard) for ONE run.
+    Multiprocessing-safe: df_context may be a context_projection.
+    Returns its duration in seconds.
+    """
+    t0 = perf_counter()
+    ReportRunner(
+        trades=trades,
+        df_context=df_context,
+        report_spec=report_spec,
+        metadata=metadata,
+        config=config,
+        report_config=ReportConfig(
+            stdout_mode=StdoutMode.OFF,
+            generate_dashboard=True,
+            persist_report=True,
+        ),
+        run_path=run_path,
+    ).run()
+    return perf_counter() - t0
+
+
+def run_summary_worker(
+    *,
+    runs: list[SimpleNamespace],
+    trades_by_run: list[pd.DataFrame],
+    config: SimpleNamespace,
+    run_path: Path,
+) -> float:
+    """
+    Portfolio summary report. runs: (symbol, strategy_id) per trades frame.
+    Returns its duration in seconds.
+    """
+    t0 = perf_counter()
+    SummaryReportRunner(
+        strategy_runs=runs,
+        trades_by_run=trades_by_run,
+        config=config,
+        run_path=run_path,
+    ).run()
+    return perf_counter() - t0
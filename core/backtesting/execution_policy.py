@@ -26,7 +26,7 @@ class ExecutionPolicy:
             return EXEC_MARKET
 
         r = (exit_reason or "").upper()
-        if r in ("SL", "BE", "EOD"):
+        if r in ("SL", "BE", "EOD", "TRAIL", "MANAGED_EXIT"):
             return EXEC_MARKET
         if r in ("TP2",):
             return EXEC_LIMIT
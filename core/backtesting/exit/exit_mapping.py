@@ -4,6 +4,8 @@ from core.backtesting.exit.simulate_exit_numba import (
     EXIT_TP1_BE,
     EXIT_TP2,
     EXIT_EOD,
+    EXIT_MANAGED,
+    EXIT_TRAIL,
 )
 
 
@@ -14,6 +16,10 @@ def map_exit_code_to_reason(exit_code: int) -> TradeExitReason:
         return TradeExitReason.BE
     if exit_code == EXIT_TP2:
         return TradeExitReason.TP2
+    if exit_code == EXIT_TRAIL:
+        return TradeExitReason.TRAIL
+    if exit_code == EXIT_MANAGED:
+        return TradeExitReason.MANAGED_EXIT
     if exit_code == EXIT_EOD:
         return TradeExitReason.TIMEOUT
 
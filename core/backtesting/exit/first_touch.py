@@ -0,0 +1,212 @@
+import numpy as np
+from numba import njit
+
+from core.backtesting.exit.simulate_exit_numba import (
+    EXIT_EOD,
+    EXIT_SL,
+    EXIT_TP1_BE,
+    EXIT_TP2,
+)
+
+
+# ==========================================================
+# Segment tree (max) for first-touch queries
+# ==========================================================
+
+@njit
+def build_max_tree(values):
+    """
+    Iterative segment tree over `values`.
+
+    Layout: leaves at [p, p + n), internal node i = max(2i, 2i + 1),
+    padding leaves = -inf. p is the smallest power of two >= n.
+    Memory: 2p floats.
+    """
+    n = len(values)
+    p = 1
+    while p < n:
+        p *= 2
+
+    tree = np.full(2 * p, -np.inf, dtype=np.float64)
+    for i in range(n):
+        tree[p + i] = values[i]
+    for i in range(p - 1, 0, -1):
+        a = tree[2 * i]
+        b = tree[2 * i + 1]
+        tree[i] = a if a >= b else b
+
+    return tree
+
+
+@njit
+def first_ge(tree, start, x):
+    """
+    First position j >= start with values[j] >= x, or -1.
+    O(log N). NaN thresholds never match.
+    """
+    p = len(tree) // 2
+    if start >= p:
+        return -1
+    if start < 0:
+        start = 0
+
+    i = start + p
+    while True:
+        if tree[i] >= x:
+            while i < p:
+                i = 2 * i
+                if not tree[i] >= x:
+                    i += 1
+            return i - p
+
+        # climb while right child, then step to the right sibling
+        while i & 1:
+            i >>= 1
+        if i == 0:
+            return -1
+        i += 1
+
+
+class FirstTouchIndex:
+    """
+    Precomputed high/low index for first-touch queries.
+
+    - first_high_ge(start, x): first bar >= start with high >= x
+    - first_low_le(start, y):  first bar >= start with low  <= y
+      (max tree over -low)
+    """
+
+    def __init__(self, high_arr, low_arr):
+        high = np.ascontiguousarray(high_arr, dtype=np.float64)
+        low = np.ascontiguousarray(low_arr, dtype=np.float64)
+
+        self.n = len(high)
+        self.high_tree = build_max_tree(high)
+        self.neg_low_tree = build_max_tree(-low)
+
+    def first_high_ge(self, start: int, x: float) -> int:
+        j = first_ge(self.high_tree, start, x)
+        return j if j < self.n else -1
+
+    def first_low_le(self, start: int, y: float) -> int:
+        j = first_ge(self.neg_low_tree, start, -y)
+        return j if j < self.n else -1
+
+
+# ==========================================================
+# Event-driven exit simulation
+# ==========================================================
+
+@njit
+def _first_touch(high_tree, neg_low_tree, start, level, up):
+    """
+    up=True  -> first bar with high >= level
+    up=False -> first bar with low  <= level
+    """
+    if up:
+        return first_ge(high_tree, start, level)
+    return first_ge(neg_low_tree, start, -level)
+
+
+@njit
+def _earliest(a, b, c):
+    best = -1
+    for v in (a, b, c):
+        if v >= 0 and (best < 0 or v < best):
+            best = v
+    return best
+
+
+@njit
+def simulate_exit_indexed_numba(
+    direction,          # 1 = long, -1 = short
+    entry_pos,
+    entry_price,
+    sl_level,
+    tp1_level,
+    tp2_level,
+    high_arr,
+    low_arr,
+    close_arr,
+    high_tree,
+    neg_low_tree,
+    slippage_abs,
+):
+    """
+    Same contract and results as simulate_exit_pos_numba, but jumps
+    straight to the next event bar instead of scanning every bar:
+
+      phase 1: first of TP1 / SL / TP2 touch after entry
+      phase 2: (TP1 done) first of BE / TP2 touch after the TP1 bar
+
+    Bars between events are skipped, so cost is O(log N) per trade.
+    """
+    n = len(close_arr)
+    long_side = direction == 1
+
+    tp1_executed = False
+    tp1_price = 0.0
+    tp1_pos = -1
+
+    start = entry_pos + 1
+    if start >= n:
+        return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
+
+    # -------------------------------------------------
+    # PHASE 1: original SL
+    # -------------------------------------------------
+    a = _first_touch(high_tree, neg_low_tree, start, tp1_level, long_side)
+    b = _first_touch(high_tree, neg_low_tree, start, sl_level, not long_side)
+    c = _first_touch(high_tree, neg_low_tree, start, tp2_level, long_side)
+
+    i = _earliest(a, b, c)
+    if i < 0 or i >= n:
+        return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
+
+    high = high_arr[i]
+    low = low_arr[i]
+
+    if long_side:
+        if high >= tp1_level:
+            tp1_executed = True
+            tp1_price = tp1_level
+            tp1_pos = i
+        if low <= sl_level:
+            code = EXIT_TP1_BE if tp1_executed else EXIT_SL
+            return i, sl_level - slippage_abs, code, tp1_executed, tp1_price, tp1_pos
+        if high >= tp2_level:
+            return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
+    else:
+        if low <= tp1_level:
+            tp1_executed = True
+            tp1_price = tp1_level
+            tp1_pos = i
+        if high >= sl_level:
+            code = EXIT_TP1_BE if tp1_executed else EXIT_SL
+            return i, sl_level + slippage_abs, code, tp1_executed, tp1_price, tp1_pos
+        if low <= tp2_level:
+            return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
+
+    # -------------------------------------------------
+    # PHASE 2: SL at break-even (from the bar after TP1)
+    # -------------------------------------------------
+    start = i + 1
+    if start >= n:
+        return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
+
+    be = entry_price
+    b = _first_touch(high_tree, neg_low_tree, start, be, not long_side)
+    c = _first_touch(high_tree, neg_low_tree, start, tp2_level, long_side)
+
+    i = _earliest(b, c, -1)
+    if i < 0 or i >= n:
+        return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
+
+    if long_side:
+        if low_arr[i] <= be:
+            return i, be - slippage_abs, EXIT_TP1_BE, tp1_executed, tp1_price, tp1_pos
+        return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
+
+    if high_arr[i] >= be:
+        return i, be + slippage_abs, EXIT_TP1_BE, tp1_executed, tp1_price, tp1_pos
+    return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
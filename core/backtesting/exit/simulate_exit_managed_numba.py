@@ -0,0 +1,132 @@
+from numba import njit
+
+from core.backtesting.exit.simulate_exit_numba import (
+    EXIT_EOD,
+    EXIT_MANAGED,
+    EXIT_SL,
+    EXIT_TP1_BE,
+    EXIT_TP2,
+    EXIT_TRAIL,
+)
+
+
+TRAIL_NONE = 0
+TRAIL_FROM_ENTRY = 1
+TRAIL_FROM_TP1 = 2
+
+TRAIL_FROM_CODES = {
+    None: TRAIL_NONE,
+    "entry": TRAIL_FROM_ENTRY,
+    "tp1": TRAIL_FROM_TP1,
+}
+
+
+@njit
+def simulate_exit_managed_numba(
+    direction,          # 1 = long, -1 = short
+    entry_pos,
+    entry_price,
+    entry_tag,          # int entry tag code
+    sl_level,
+    tp1_level,          # NaN = TP1 disabled
+    tp2_level,          # NaN = no TP2 (ManagedExitPlan)
+    high_arr,
+    low_arr,
+    close_arr,
+    trail_arr,          # per-bar SL candidates for this direction (NaN = none)
+    exit_tag_arr,       # per-bar entry tag code to close (-1 = none)
+    trail_from,         # TRAIL_NONE / TRAIL_FROM_ENTRY / TRAIL_FROM_TP1
+    be_on_tp1,
+    slippage_abs,
+):
+    """
+    Managed exits, PositionManager semantics on bar data.
+
+    Intrabar (same order as the fixed simulator):
+      TP1 partial -> SL (initial / BE / trailed) -> TP2 (if any)
+    At bar close (signals are known only once the bar is closed):
+      signal_exit for this entry tag -> close at market
+      BE after TP1, then trailing SL (only moves in trade's favour)
+
+    Returns the simulate_exit_pos_numba tuple:
+        exit_pos, exit_price, exit_code, tp1_executed, tp1_price, tp1_pos
+    """
+    tp1_executed = False
+    tp1_price = 0.0
+    tp1_pos = -1
+
+    sl = sl_level
+    trailed = False
+    n = len(close_arr)
+
+    for i in range(entry_pos + 1, n):
+        high = high_arr[i]
+        low = low_arr[i]
+
+        # -------------------------------------------------
+        # INTRABAR: TP1 / SL / TP2
+        # -------------------------------------------------
+        if direction == 1:
+            if (not tp1_executed) and high >= tp1_level:
+                tp1_executed = True
+                tp1_price = tp1_level
+                tp1_pos = i
+
+            if low <= sl:
+                if trailed:
+                    exit_code = EXIT_TRAIL
+                elif tp1_executed:
+                    exit_code = EXIT_TP1_BE
+                else:
+                    exit_code = EXIT_SL
+                return i, sl - slippage_abs, exit_code, tp1_executed, tp1_price, tp1_pos
+
+            if high >= tp2_level:
+                return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
+        else:
+            if (not tp1_executed) and low <= tp1_level:
+                tp1_executed = True
+                tp1_price = tp1_level
+                tp1_pos = i
+
+            if high >= sl:
+                if trailed:
+                    exit_code = EXIT_TRAIL
+                elif tp1_executed:
+                    exit_code = EXIT_TP1_BE
+                else:
+                    exit_code = EXIT_SL
+                return i, sl + slippage_abs, exit_code, tp1_executed, tp1_price, tp1_pos
+
+            if low <= tp2_level:
+                return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
+
+        # -------------------------------------------------
+        # BAR CLOSE: signal exit
+        # -------------------------------------------------
+        if exit_tag_arr[i] == entry_tag:
+            price = close_arr[i] - slippage_abs * direction
+            return i, price, EXIT_MANAGED, tp1_executed, tp1_price, tp1_pos
+
+        # -------------------------------------------------
+        # BAR CLOSE: SL management for the next bar
+        # -------------------------------------------------
+        if tp1_executed and be_on_tp1:
+            if direction == 1 and sl < entry_price:
+                sl = entry_price
+            elif direction == -1 and sl > entry_price:
+                sl = entry_price
+
+        if trail_from == TRAIL_FROM_ENTRY or (trail_from == TRAIL_FROM_TP1 and tp1_executed):
+            candidate = trail_arr[i]
+            if direction == 1 and candidate > sl:
+                sl = candidate
+                trailed = True
+            elif direction == -1 and candidate < sl:
+                sl = candidate
+                trailed = True
+
+    # -------------------------------------------------
+    # END OF DATA
+    # -------------------------------------------------
+    return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
@@ -5,11 +5,13 @@ EXIT_NONE = 0
 EXIT_SL = 1
 EXIT_TP1_BE = 2
 EXIT_TP2 = 3
+EXIT_TRAIL = 4
+EXIT_MANAGED = 5
 EXIT_EOD = 9
 
 
 @njit
-def simulate_exit_numba(
+def simulate_exit_pos_numba(
     direction,          # 1 = long, -1 = short
     entry_pos,
     entry_price,
@@ -19,22 +21,22 @@ def simulate_exit_numba(
     high_arr,
     low_arr,
     close_arr,
-    time_arr,
     slippage_abs,
 ):
     """
+    Bar-position variant of simulate_exit_numba.
+
     Returns:
+        exit_pos: int
         exit_price: float
-        exit_time: datetime
         exit_code: int
         tp1_executed: bool
         tp1_price: float
-        tp1_time: datetime
+        tp1_pos: int (-1 when TP1 not executed)
     """
-    exit_code = EXIT_NONE
     tp1_executed = False
     tp1_price = 0.0
-    tp1_time = time_arr[0]
+    tp1_pos = -1
 
     sl = sl_level
     n = len(close_arr)
@@ -42,7 +44,6 @@ def simulate_exit_numba(
     for i in range(entry_pos + 1, n):
         high = high_arr[i]
         low = low_arr[i]
-        t = time_arr[i]
 
         # -------------------------------------------------
         # MOVE SL TO BE AFTER TP1
@@ -54,7 +55,7 @@ def simulate_exit_numba(
             if (not tp1_executed) and high >= tp1_level:
                 tp1_executed = True
                 tp1_price = tp1_level
-                tp1_time = t
+                tp1_pos = i
 
             # SL HIT
             if low <= sl:
@@ -62,35 +63,75 @@ def simulate_exit_numba(
                     exit_code = EXIT_TP1_BE
                 else:
                     exit_code = EXIT_SL
-                exit_price = sl - slippage_abs
-                return exit_price, t, exit_code, tp1_executed, tp1_price, tp1_time
+                return i, sl - slippage_abs, exit_code, tp1_executed, tp1_price, tp1_pos
 
             if high >= tp2_level:
-                exit_code = EXIT_TP2
-                exit_price = tp2_level
-                return exit_price, t, exit_code, tp1_executed, tp1_price, tp1_time
+                return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
 
         else:
             if (not tp1_executed) and low <= tp1_level:
                 tp1_executed = True
                 tp1_price = tp1_level
-                tp1_time = t
+                tp1_pos = i
 
             if high >= sl:
                 if tp1_executed:
                     exit_code = EXIT_TP1_BE
                 else:
                     exit_code = EXIT_SL
-                exit_price = sl + slippage_abs
-                return exit_price, t, exit_code, tp1_executed, tp1_price, tp1_time
+                return i, sl + slippage_abs, exit_code, tp1_executed, tp1_price, tp1_pos
 
             if low <= tp2_level:
-                exit_code = EXIT_TP2
-                exit_price = tp2_level
-                return exit_price, t, exit_code, tp1_executed, tp1_price, tp1_time
+                return i, tp2_level, EXIT_TP2, tp1_executed, tp1_price, tp1_pos
 
     # -------------------------------------------------
     # END OF DATA
     # -------------------------------------------------
-    exit_code = EXIT_EOD
-    return close_arr[-1], time_arr[-1], exit_code, tp1_executed, tp1_price, tp1_time
+    return n - 1, close_arr[-1], EXIT_EOD, tp1_executed, tp1_price, tp1_pos
+
+
+@njit
+def simulate_exit_numba(
+    direction,          # 1 = long, -1 = short
+    entry_pos,
+    entry_price,
+    sl_level,
+    tp1_level,
+    tp2_level,
+    high_arr,
+    low_arr,
+    close_arr,
+    time_arr,
+    slippage_abs,
+):
+    """
+    Returns:
+        exit_price: float
+        exit_time: datetime
+        exit_code: int
+        tp1_executed: bool
+        tp1_price: float
+        tp1_time: datetime
+    """
+    (
+        exit_pos,
+        exit_price,
+        exit_code,
+        tp1_executed,
+        tp1_price,
+        tp1_pos,
+    ) = simulate_exit_pos_numba(
+        direction,
+        entry_pos,
+        entry_price,
+        sl_level,
+        tp1_level,
+        tp2_level,
+        high_arr,
+        low_arr,
+        close_arr,
+        slippage_abs,
+    )
+
+    tp1_time = time_arr[tp1_pos] if tp1_executed else time_arr[0]
+    return exit_price, time_arr[exit_pos], exit_code, tp1_executed, tp1_price, tp1_time
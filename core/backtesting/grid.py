@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from config.backtest import INITIAL_BALANCE, MAX_RISK_PER_TRADE
+from config.instrument_meta import (
+    FINANCING_ENABLED,
+    FINANCING_MODEL,
+    FINANCING_RATES_PER_DAY,
+    FINANCING_USD_PER_LOT_DAY,
+    FX_ROLLOVER_HOUR_UTC,
+    FX_ROLLOVER_MINUTE_UTC,
+    FX_TRIPLE_MULTIPLIER,
+    FX_TRIPLE_ROLLOVER_WEEKDAY,
+)
+from core.backtesting.engine.execution_batch import direction_codes
+from core.backtesting.engine.grid_kernel import (
+    M_GROSS_LOSS,
+    M_GROSS_PROFIT,
+    M_MAX_DD,
+    M_PNL,
+    M_PNL_NET,
+    M_R_SUM,
+    M_TRADES,
+    M_WINS,
+    F_NOTIONAL_RATE,
+    F_USD_PER_LOT,
+    N_FINANCING,
+    N_PARAMS,
+    simulate_grid,
+)
+from core.backtesting.exit.first_touch import build_max_tree
+from core.domain.cost.instrument_ctx import InstrumentCtx, build_instrument_ctx
+from core.domain.cost.time_utils import EPOCH_WEEKDAY
+
+
+GRID_PARAM_COLUMNS = ("sl_mult", "tp1_mult", "tp2_mult", "tp1_ratio", "slippage_abs")
+
+
+@dataclass(frozen=True)
+class ExitGrid:
+    """
+    Exit / cost parameters swept over one set of signals.
+
+    - sl_mult, tp1_mult, tp2_mult: scale the plan's distance from the
+      signal close (1.0 = plan levels as built by the strategy)
+    - tp1_ratio: fraction closed at TP1 (engine default 0.5)
+    - slippage_abs: absolute slippage; None -> instrument default
+    """
+
+    sl_mult: Sequence[float] = (1.0,)
+    tp1_mult: Sequence[float] = (1.0,)
+    tp2_mult: Sequence[float] = (1.0,)
+    tp1_ratio: Sequence[float] = (0.5,)
+    slippage_abs: Sequence[float] | None = None
+
+    def combinations(self, default_slippage: float) -> np.ndarray:
+        slippage = self.slippage_abs if self.slippage_abs is not None else (default_slippage,)
+        combos = list(itertools.product(
+            self.sl_mult,
+            self.tp1_mult,
+            self.tp2_mult,
+            self.tp1_ratio,
+            slippage,
+        ))
+        return np.asarray(combos, dtype=np.float64).reshape(-1, N_PARAMS)
+
+    def __len__(self) -> int:
+        n_slip = 1 if self.slippage_abs is None else len(self.slippage_abs)
+        return (
+            len(self.sl_mult) * len(self.tp1_mult) * len(self.tp2_mult)
+            * len(self.tp1_ratio) * n_slip
+        )
+
+
+def run_exit_grid(
+    *,
+    signals_df: pd.DataFrame,
+    trade_plans: pd.DataFrame,
+    grid: ExitGrid,
+    instrument_ctx: InstrumentCtx | None = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every ExitGrid combination over one symbol's signals/plans.
+
+    OHLC arrays, first-touch index and entry positions are built once;
+    the numba kernel runs combinations in parallel. pnl_net_usd carries
+    spread, slippage and financing like the backtester's trades.
+
+    Only fixed-exit plans can be swept: managed plans (trailing / signal
+    exit) raise ValueError instead of being run on SL/TP geometry alone.
+
+    Returns one row per combination: parameters + metrics.
+    """
+    if "plan_exit_mode" in trade_plans.columns:
+        managed = trade_plans["plan_valid"].astype(bool) & (trade_plans["plan_exit_mode"] == "managed")
+        if managed.any():
+            raise ValueError(
+                f"Exit grid supports fixed-exit plans only, got {int(managed.sum())} managed plans"
+            )
+
+    symbol = signals_df["symbol"].iloc[0]
+    ctx = instrument_ctx or build_instrument_ctx(symbol)
+
+    params = grid.combinations(ctx.slippage_abs)
+
+    high = signals_df["high"].to_numpy(dtype=np.float64)
+    low = signals_df["low"].to_numpy(dtype=np.float64)
+    close = signals_df["close"].to_numpy(dtype=np.float64)
+    time_ns = (
+        signals_df["time"].dt.tz_localize(None).values
+        .astype("datetime64[ns]").view(np.int64)
+    )
+
+    valid = trade_plans["plan_valid"].to_numpy(dtype=bool)
+    pos = np.flatnonzero(valid).astype(np.int64)
+
+    tag_codes, _ = pd.factorize(trade_plans["plan_entry_tag"].astype(str), sort=False)
+    tag_codes = tag_codes.astype(np.int32)
+
+    metrics = simulate_grid(
+        pos,
+        direction_codes(trade_plans["plan_direction"].values)[pos],
+        tag_codes[pos],
+        max(int(tag_codes.max()) + 1 if len(tag_codes) else 1, 1),
+        trade_plans["plan_sl"].to_numpy(dtype=np.float64)[pos],
+        trade_plans["plan_tp1"].to_numpy(dtype=np.float64)[pos],
+        trade_plans["plan_tp2"].to_numpy(dtype=np.float64)[pos],
+        high,
+        low,
+        close,
+        build_max_tree(high),
+        build_max_tree(-low),
+        time_ns,
+        params,
+        float(ctx.point_size),
+        float(ctx.pip_value),
+        float(ctx.half_spread),
+        float(MAX_RISK_PER_TRADE * INITIAL_BALANCE),
+        _financing_rates(ctx),
+        float(ctx.contract_size),
+        (FX_ROLLOVER_HOUR_UTC * 3600 + FX_ROLLOVER_MINUTE_UTC * 60) * 10**9,
+        (FX_TRIPLE_ROLLOVER_WEEKDAY - EPOCH_WEEKDAY) % 7,
+        max(FX_TRIPLE_MULTIPLIER - 1, 0),
+    )
+
+    return _metrics_table(symbol, params, metrics)
+
+
+def run_exit_grid_for_result(result, grid: ExitGrid) -> pd.DataFrame:
+    """
+    Grid over a StrategyRunResult (signals/plans from one strategy run).
+    """
+    table = run_exit_grid(
+        signals_df=result.df_signals,
+        trade_plans=result.trade_plans,
+        grid=grid,
+    )
+    table.insert(0, "strategy_id", result.strategy_id)
+    return table
+
+
+def _financing_rates(ctx: InstrumentCtx) -> np.ndarray:
+    """
+    Kernel financing table (rows long/short), mirroring
+    _unit_cost_per_rollover: one rollover costs
+    size * (usd_per_lot + entry_price * contract_size * notional_rate).
+    """
+    rates = np.zeros((2, N_FINANCING), dtype=np.float64)
+    if not FINANCING_ENABLED:
+        return rates
+
+    if FINANCING_MODEL == "usd_per_lot_day":
+        column, by_side = F_USD_PER_LOT, FINANCING_USD_PER_LOT_DAY.get(ctx.symbol) or {}
+    elif FINANCING_MODEL == "notional_rate":
+        column, by_side = F_NOTIONAL_RATE, FINANCING_RATES_PER_DAY.get(ctx.symbol) or {}
+    else:
+        return rates
+
+    rates[0, column] = float(by_side.get("long", 0.0))
+    rates[1, column] = float(by_side.get("short", 0.0))
+    return rates
+
+
+def _metrics_table(symbol: str, params: np.ndarray, metrics: np.ndarray) -> pd.DataFrame:
+    trades = metrics[:, M_TRADES]
+    safe_trades = np.where(trades > 0, trades, 1.0)
+    gross_loss = metrics[:, M_GROSS_LOSS]
+
+    table = pd.DataFrame(params, columns=list(GRID_PARAM_COLUMNS))
+    table.insert(0, "symbol", symbol)
+
+    table["trades"] = trades.astype(np.int64)
+    table["win_rate"] = np.where(trades > 0, metrics[:, M_WINS] / safe_trades, 0.0)
+    table["pnl_usd"] = metrics[:, M_PNL]
+    table["pnl_net_usd"] = metrics[:, M_PNL_NET]
+    table["expectancy_r"] = np.where(trades > 0, metrics[:, M_R_SUM] / safe_trades, 0.0)
+    table["profit_factor"] = np.where(
+        gross_loss > 0,
+        metrics[:, M_GROSS_PROFIT] / np.where(gross_loss > 0, gross_loss, 1.0),
+        np.inf,
+    )
+    table["max_drawdown_usd"] = metrics[:, M_MAX_DD]
+
+    return table
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pandas as pd
+
+
+def data_token(data_by_tf: dict[str, pd.DataFrame]) -> tuple:
+    """
+    Cheap identity of a symbol's market data (per TF: rows + time span).
+    """
+    token = []
+    for tf in sorted(data_by_tf):
+        df = data_by_tf[tf]
+        if df.empty:
+            token.append((tf, 0, None, None))
+        else:
+            token.append((tf, len(df), str(df["time"].iloc[0]), str(df["time"].iloc[-1])))
+    return tuple(token)
+
+
+class FeatureCache:
+    """
+    In-process LRU of feature frames (compute_features output).
+
+    Key: (strategy class, symbol, data token, feature key). Frames are
+    returned as-is; run_on_features copies before mutating.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max(int(max_entries), 1)
+        self._frames: OrderedDict[Hashable, pd.DataFrame] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        frame = compute()
+        self._frames[key] = frame
+        while len(self._frames) > self.max_entries:
+            self._frames.popitem(last=False)
+        return frame
+
+    def clear(self) -> None:
+        self._frames.clear()
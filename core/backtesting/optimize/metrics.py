@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# columns a worker ships back per (config, symbol): enough for metrics
+TRADE_SUMMARY_COLUMNS = ("exit_time", "pnl_usd", "pnl_net_usd", "returns")
+
+METRIC_COLUMNS = (
+    "trades",
+    "win_rate",
+    "pnl_usd",
+    "pnl_net_usd",
+    "expectancy_r",
+    "profit_factor",
+    "max_drawdown_usd",
+)
+
+
+def summarize_trades(trades: pd.DataFrame) -> dict[str, float]:
+    """
+    Optimization metrics of one config (all symbols pooled).
+
+    win = pnl_usd > 0; drawdown on the exit-time ordered pnl_net_usd
+    equity curve.
+    """
+    n = len(trades)
+    if n == 0:
+        return {
+            "trades": 0,
+            "win_rate": 0.0,
+            "pnl_usd": 0.0,
+            "pnl_net_usd": 0.0,
+            "expectancy_r": 0.0,
+            "profit_factor": np.nan,
+            "max_drawdown_usd": 0.0,
+        }
+
+    pnl = trades["pnl_usd"].to_numpy(dtype=np.float64)
+    net = trades["pnl_net_usd"].to_numpy(dtype=np.float64)
+
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl <= 0].sum()
+
+    order = np.argsort(trades["exit_time"].to_numpy(), kind="mergesort")
+    equity = np.cumsum(net[order])
+    peak = np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:]
+
+    return {
+        "trades": n,
+        "win_rate": float((pnl > 0).mean()),
+        "pnl_usd": float(pnl.sum()),
+        "pnl_net_usd": float(net.sum()),
+        "expectancy_r": float(trades["returns"].mean()),
+        "profit_factor": float(gross_profit / gross_loss) if gross_loss > 0 else np.inf,
+        "max_drawdown_usd": float((peak - equity).max()),
+    }
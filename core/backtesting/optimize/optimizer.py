@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Iterator
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+
+from core.backtesting.engine.pool import process_pool
+from core.backtesting.optimize.features import data_token
+from core.backtesting.optimize.metrics import (
+    METRIC_COLUMNS,
+    TRADE_SUMMARY_COLUMNS,
+    summarize_trades,
+)
+from core.backtesting.optimize.space import ParamSpace
+from core.backtesting.optimize.worker import init_config_worker, run_config_batch_worker
+from core.backtesting.strategy_runner import init_strategy
+from core.logging.null_logger import NullLogger
+from core.utils.timeframe import tf_to_minutes
+
+
+@dataclass(frozen=True)
+class OptimizationResult:
+    """
+    One optimization run: a table with one row per strategy_id.
+    """
+
+    run_id: str
+    strategy_name: str
+    method: str
+    metric: str
+    maximize: bool
+    table: pd.DataFrame
+    n_evaluations: int
+    elapsed_s: float
+
+    @property
+    def configs_per_minute(self) -> float:
+        if self.elapsed_s <= 0:
+            return float("inf")
+        return self.n_evaluations / self.elapsed_s * 60.0
+
+    def best(self, n: int = 10) -> pd.DataFrame:
+        return self.table.head(n)
+
+
+class StrategyOptimizer:
+    """
+    Sweeps strategy_config of one strategy class over many configs.
+
+    - configs are grouped by feature key (BaseStrategy.feature_params):
+      informatives + indicators run once per (symbol, group) and are
+      reused by every config of the group
+    - (symbol, group, chunk) tasks run on a process pool; the market
+      data is handed to each worker once (pool initializer), tasks only
+      carry its key, and each worker keeps an LRU of feature frames
+      across tasks and halving rounds
+    - metrics pool trades of all symbols per strategy_id
+    """
+
+    def __init__(
+        self,
+        *,
+        strategy_cls,
+        data: dict[str, dict[str, pd.DataFrame]],
+        startup_candle_count: int,
+        metric: str = "pnl_net_usd",
+        maximize: bool = True,
+        max_workers: int | None = None,
+        logger=None,
+    ):
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if not data:
+            raise ValueError("StrategyOptimizer needs market data")
+
+        self.strategy_cls = strategy_cls
+        self.data = data
+        self.startup_candle_count = startup_candle_count
+        self.metric = metric
+        self.maximize = maximize
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.logger = logger or NullLogger()
+
+        self._data_keys = {symbol: data_token(d) for symbol, d in data.items()}
+
+    # ==================================================
+    # Search methods
+    # ==================================================
+
+    def grid(self, space: ParamSpace) -> OptimizationResult:
+        return self._search("grid", lambda evaluate: evaluate(space.grid(), 1.0))
+
+    def random(self, space: ParamSpace, n: int, seed: int | None = None) -> OptimizationResult:
+        return self._search("random", lambda evaluate: evaluate(space.sample(n, seed), 1.0))
+
+    def successive_halving(
+        self,
+        space: ParamSpace,
+        *,
+        n: int | None = None,
+        eta: int = 3,
+        min_fraction: float = 1 / 9,
+        seed: int | None = None,
+    ) -> OptimizationResult:
+        """
+        Evaluate n configs on the leading min_fraction of the bars, keep
+        the best 1/eta, grow the budget by eta, repeat up to full data.
+
+        Each row of the result holds the largest budget its config
+        reached (column budget_fraction); the table is ranked by that
+        budget first, so eliminated configs follow the survivors.
+        """
+        if eta < 2:
+            raise ValueError("eta must be >= 2")
+        if not 0 < min_fraction <= 1:
+            raise ValueError("min_fraction must be in (0, 1]")
+
+        configs = space.grid() if n is None else space.sample(n, seed)
+
+        fractions = []
+        fraction = min_fraction
+        while fraction < 1.0:
+            fractions.append(fraction)
+            fraction *= eta
+        fractions.append(1.0)
+
+        ids = [self._probe(c).get_strategy_id() for c in configs]
+
+        def search(evaluate):
+            survivors = list(zip(ids, configs))
+            tables = []
+            for fraction in fractions:
+                table = evaluate([c for _, c in survivors], fraction)
+                tables.append(table)
+                if fraction >= 1.0:
+                    break
+
+                keep = max(1, math.ceil(len(table) / eta))
+                top = set(self._rank(table)["strategy_id"].head(keep))
+                survivors = [(i, c) for i, c in survivors if i in top]
+
+            return (
+                pd.concat(tables, ignore_index=True)
+                .drop_duplicates("strategy_id", keep="last")
+            )
+
+        return self._search("successive_halving", search)
+
+    # ==================================================
+    # Evaluation
+    # ==================================================
+
+    def _search(self, method: str, search) -> OptimizationResult:
+        t0 = perf_counter()
+        n_evaluations = 0
+
+        with self._executor() as executor:
+
+            def evaluate(configs: list[dict], fraction: float) -> pd.DataFrame:
+                nonlocal n_evaluations
+                table = self._evaluate(configs, fraction, executor)
+                n_evaluations += len(table)
+                return table
+
+            table = search(evaluate)
+
+        elapsed = perf_counter() - t0
+        result = OptimizationResult(
+            run_id=f"opt_{uuid4().hex[:8]}",
+            strategy_name=self.strategy_cls.__name__,
+            method=method,
+            metric=self.metric,
+            maximize=self.maximize,
+            table=self._rank(table).reset_index(drop=True),
+            n_evaluations=n_evaluations,
+            elapsed_s=elapsed,
+        )
+
+        self.logger.log(
+            f"{method} | configs={len(result.table)} evaluations={n_evaluations} "
+            f"elapsed={elapsed:.2f}s configs/min={result.configs_per_minute:,.1f}"
+        )
+        return result
+
+    def _evaluate(self, configs: list[dict], fraction: float, executor) -> pd.DataFrame:
+        # dedupe by strategy_id, group by feature key
+        by_id: dict[str, dict] = {}
+        groups: dict[str, list[tuple[str, dict]]] = defaultdict(list)
+        for config in configs:
+            probe = self._probe(config)
+            strategy_id = probe.get_strategy_id()
+            if strategy_id in by_id:
+                continue
+            by_id[strategy_id] = config
+            groups[probe.get_feature_key()].append((strategy_id, config))
+
+        tasks = []
+        for symbol in self.data:
+            for feature_key, group in groups.items():
+                for chunk in self._chunks(group, len(self.data) * len(groups)):
+                    tasks.append(dict(
+                        symbol=symbol,
+                        data_key=self._data_keys[symbol],
+                        strategy_cls=self.strategy_cls,
+                        startup_candle_count=self.startup_candle_count,
+                        feature_key=feature_key,
+                        configs=chunk,
+                        fraction=fraction,
+                    ))
+
+        trades_by_id: dict[str, list[pd.DataFrame]] = defaultdict(list)
+        if executor is None:
+            results = (
+                run_config_batch_worker(**task, data_by_tf=self.data[task["symbol"]])
+                for task in tasks
+            )
+        else:
+            futures = [executor.submit(run_config_batch_worker, **task) for task in tasks]
+            results = (f.result() for f in as_completed(futures))
+
+        for batch in results:
+            for strategy_id, trades in batch:
+                trades_by_id[strategy_id].append(trades)
+
+        rows = []
+        for strategy_id, config in by_id.items():
+            frames = [t for t in trades_by_id[strategy_id] if not t.empty]
+            trades = (
+                pd.concat(frames, ignore_index=True)
+                if frames
+                else pd.DataFrame(columns=list(TRADE_SUMMARY_COLUMNS))
+            )
+            rows.append({
+                "strategy_id": strategy_id,
+                **config,
+                "config": json.dumps(config, sort_keys=True, default=str),
+                "budget_fraction": fraction,
+                **summarize_trades(trades),
+            })
+
+        return pd.DataFrame(rows)
+
+    def _chunks(self, group: list, n_tasks: int) -> list[list]:
+        # spread a group over idle workers when groups < workers
+        n_chunks = max(1, min(len(group), math.ceil(self.max_workers / max(n_tasks, 1))))
+        return [
+            [group[i] for i in idx]
+            for idx in np.array_split(np.arange(len(group)), n_chunks)
+        ]
+
+    def _rank(self, table: pd.DataFrame) -> pd.DataFrame:
+        # larger budget first: a score on fewer bars never outranks a
+        # config that survived to more data (successive halving)
+        return table.sort_values(
+            ["budget_fraction", self.metric],
+            ascending=[False, not self.maximize],
+            na_position="last",
+            kind="mergesort",
+        )
+
+    def _probe(self, config: dict[str, Any]):
+        """
+        Strategy instance on a base frame: only for strategy_id / feature key.
+        """
+        data_by_tf = next(iter(self.data.values()))
+        base_tf = min(data_by_tf.keys(), key=tf_to_minutes)
+        return init_strategy(
+            self.strategy_cls,
+            df=data_by_tf[base_tf],
+            symbol=next(iter(self.data)),
+            startup_candle_count=self.startup_candle_count,
+            strategy_config=config,
+        )
+
+    @contextmanager
+    def _executor(self) -> Iterator[ProcessPoolExecutor | None]:
+        if self.max_workers == 1:
+            yield None
+            return
+        data = {(symbol, self._data_keys[symbol]): d for symbol, d in self.data.items()}
+        with process_pool(
+            self.max_workers,
+            initializer=init_config_worker,
+            initargs=(data,),
+        ) as executor:
+            yield executor
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any, Sequence
+
+import numpy as np
+
+
+class ParamSpace:
+    """
+    Discrete search space over strategy_config keys.
+
+    ParamSpace({"TP1_R": [1, 1.5], "TRAIL_MODE": ["ribbon", "swing"]})
+    """
+
+    def __init__(self, params: dict[str, Sequence[Any]]):
+        if not params:
+            raise ValueError("ParamSpace needs at least one parameter")
+        for key, values in params.items():
+            if len(values) == 0:
+                raise ValueError(f"ParamSpace: no values for {key}")
+
+        self.params = {k: list(v) for k, v in params.items()}
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self.params)
+
+    def __len__(self) -> int:
+        n = 1
+        for values in self.params.values():
+            n *= len(values)
+        return n
+
+    def grid(self) -> list[dict[str, Any]]:
+        """
+        Full cartesian product (key order preserved).
+        """
+        return [
+            dict(zip(self.keys, combo))
+            for combo in itertools.product(*self.params.values())
+        ]
+
+    def sample(self, n: int, seed: int | None = None) -> list[dict[str, Any]]:
+        """
+        n distinct configs drawn uniformly; whole grid if n >= len(self).
+        """
+        total = len(self)
+        if n >= total:
+            return self.grid()
+
+        rng = np.random.default_rng(seed)
+        sizes = [len(v) for v in self.params.values()]
+
+        # flat index -> mixed-radix digits, no grid materialization
+        flat = rng.choice(total, size=n, replace=False)
+        configs = []
+        for idx in flat:
+            config = {}
+            for key, size in zip(reversed(self.keys), reversed(sizes)):
+                idx, digit = divmod(int(idx), size)
+                config[key] = self.params[key][digit]
+            configs.append({k: config[k] for k in self.keys})
+        return configs
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from core.backtesting.optimize.optimizer import OptimizationResult
+
+
+class OptimizationStore:
+    """
+    File-based registry of optimization runs.
+
+    <base>/<run_id>/results.parquet  one row per strategy_id
+    <base>/<run_id>/metadata.json
+    """
+
+    def __init__(self, base_path: str | Path = "results/optimizations"):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+
+    def run_path(self, run_id: str) -> Path:
+        return self.base_path / run_id
+
+    def save(self, result: OptimizationResult) -> Path:
+        path = self.run_path(result.run_id)
+        path.mkdir(parents=True, exist_ok=True)
+
+        result.table.to_parquet(path / "results.parquet", index=False)
+
+        meta = {
+            "run_id": result.run_id,
+            "strategy_name": result.strategy_name,
+            "method": result.method,
+            "metric": result.metric,
+            "maximize": result.maximize,
+            "n_evaluations": result.n_evaluations,
+            "elapsed_s": result.elapsed_s,
+            "configs_per_minute": result.configs_per_minute,
+        }
+        with open(path / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+        return path
+
+    def load(self, run_id: str) -> OptimizationResult:
+        path = self.run_path(run_id)
+        if not path.exists():
+            raise FileNotFoundError(run_id)
+
+        with open(path / "metadata.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta.pop("configs_per_minute", None)
+
+        return OptimizationResult(
+            table=pd.read_parquet(path / "results.parquet"),
+            **meta,
+        )
+
+    def query(self, run_id: str, expr: str) -> pd.DataFrame:
+        """
+        Filter a run's table, e.g. query(run_id, "trades >= 50 and profit_factor > 1.2").
+        """
+        table = pd.read_parquet(self.run_path(run_id) / "results.parquet")
+        return table.query(expr)
+
+    def list_runs(self) -> list[str]:
+        return sorted(
+            p.name for p in self.base_path.iterdir()
+            if p.is_dir()
+        )
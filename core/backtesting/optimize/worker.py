@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import math
+
+import pandas as pd
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.optimize.features import FeatureCache
+from core.backtesting.optimize.metrics import TRADE_SUMMARY_COLUMNS
+from core.backtesting.strategy_runner import compute_features, run_on_features
+
+
+# per-process: survives across tasks submitted to the same pool worker
+_FEATURE_CACHE = FeatureCache()
+
+# per-process market data, set once by the pool initializer
+_WORKER_DATA: dict[tuple, dict[str, pd.DataFrame]] = {}
+
+
+def init_config_worker(data: dict[tuple, dict[str, pd.DataFrame]]) -> None:
+    """
+    Pool initializer: market data by (symbol, data_key), shipped to each
+    worker once instead of with every task.
+    """
+    _WORKER_DATA.clear()
+    _WORKER_DATA.update(data)
+
+
+def slice_budget(df: pd.DataFrame, fraction: float, startup_candle_count: int) -> pd.DataFrame:
+    """
+    Leading `fraction` of the post-startup bars (startup rows kept).
+    """
+    if fraction >= 1.0:
+        return df
+    n_eval = max(len(df) - startup_candle_count, 0)
+    keep = startup_candle_count + max(1, math.ceil(n_eval * fraction))
+    return df.iloc[:keep]
+
+
+def run_config_batch_worker(
+    *,
+    symbol: str,
+    data_key: tuple,
+    strategy_cls,
+    startup_candle_count: int,
+    feature_key: str,
+    configs: list[tuple[str, dict]],
+    fraction: float = 1.0,
+    data_by_tf: dict[str, pd.DataFrame] | None = None,
+) -> list[tuple[str, pd.DataFrame]]:
+    """
+    Backtest configs sharing one feature key on ONE symbol.
+
+    Features are computed once (or taken from the process cache) and
+    reused by every config. Returns (strategy_id, trade summary) pairs.
+    In a pool, data_by_tf is omitted and taken from the worker's data
+    (init_config_worker). Multiprocessing-safe.
+    """
+    if data_by_tf is None:
+        data_by_tf = _WORKER_DATA[(symbol, data_key)]
+
+    cache_key = (
+        f"{strategy_cls.__module__}.{strategy_cls.__qualname__}",
+        symbol,
+        data_key,
+        feature_key,
+    )
+    df_features = _FEATURE_CACHE.get_or_compute(
+        cache_key,
+        lambda: compute_features(
+            symbol=symbol,
+            data_by_tf=data_by_tf,
+            strategy_cls=strategy_cls,
+            startup_candle_count=startup_candle_count,
+            strategy_config=configs[0][1],
+        ),
+    )
+    df_features = slice_budget(df_features, fraction, startup_candle_count)
+
+    out = []
+    for strategy_id, config in configs:
+        run = run_on_features(
+            symbol=symbol,
+            df_features=df_features,
+            strategy_cls=strategy_cls,
+            startup_candle_count=startup_candle_count,
+            strategy_config=config,
+        )
+        trades = Backtester().run(
+            signals_df=run.df_signals,
+            trade_plans=run.trade_plans,
+        )
+        if trades.empty:
+            trades = pd.DataFrame(columns=list(TRADE_SUMMARY_COLUMNS))
+        out.append((strategy_id, trades.loc[:, list(TRADE_SUMMARY_COLUMNS)]))
+
+    return out
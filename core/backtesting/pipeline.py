@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+
+from config.report_config import ReportConfig, StdoutMode
+from core.backtesting.backend_factory import create_backtest_backend
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.scheduler import ScheduledTask
+from core.backtesting.strategy_runner import strategy_orchestration
+from core.data_provider import BacktestStrategyDataProvider, CsvMarketDataCache
+from core.logging.config import LoggerConfig
+from core.logging.run_logger import RunLogger
+from core.reporting.core.contex_enricher import context_projection
+from core.domain.trade.trade_exit import TradeExitReason
+from core.reporting.runner import ReportRunner
+from core.utils.timeframe import tf_to_minutes
+
+
+@dataclass(frozen=True)
+class DataSpec:
+    """
+    Picklable recipe for loading one symbol's data inside a worker.
+    """
+
+    backend: str
+    market_data_path: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    timeframes: tuple[str, ...]
+    startup_candle_count: int
+
+    @classmethod
+    def from_config(cls, cfg, strategy_cls) -> "DataSpec":
+        return cls(
+            backend=cfg.BACKTEST_DATA_BACKEND,
+            market_data_path=cfg.MARKET_DATA_PATH,
+            start=pd.Timestamp(cfg.TIMERANGE["start"], tz="UTC"),
+            end=pd.Timestamp(cfg.TIMERANGE["end"], tz="UTC"),
+            timeframes=(cfg.TIMEFRAME, *strategy_cls.get_required_informatives()),
+            startup_candle_count=cfg.STARTUP_CANDLE_COUNT,
+        )
+
+    def provider(self, logger) -> BacktestStrategyDataProvider:
+        return BacktestStrategyDataProvider(
+            backend=create_backtest_backend(self.backend),
+            cache=CsvMarketDataCache(self.market_data_path),
+            backtest_start=self.start,
+            backtest_end=self.end,
+            required_timeframes=list(self.timeframes),
+            startup_candle_count=self.startup_candle_count,
+            logger=logger,
+        )
+
+
+def estimate_bars(data_spec: DataSpec) -> int:
+    minutes = (data_spec.end - data_spec.start) / pd.Timedelta(minutes=1)
+    return int(minutes / tf_to_minutes(data_spec.timeframes[0]))
+
+
+def config_snapshot(cfg) -> SimpleNamespace:
+    """
+    Picklable copy of a config module (UPPER_CASE attributes).
+    """
+    return SimpleNamespace(**{
+        k: getattr(cfg, k) for k in dir(cfg) if k.isupper()
+    })
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """
+    Per-symbol report written by the worker itself.
+    """
+
+    metadata: Any
+    config: SimpleNamespace
+    run_path: Path
+
+
+@dataclass(frozen=True)
+class SymbolRunResult:
+    """
+    What a fused worker sends back: trades + what reporting needs.
+
+    df_context is a projection (time + report context columns, entry
+    candles only), not the full strategy frame.
+    """
+
+    symbol: str
+    strategy_id: str
+    strategy_name: str
+
+    trades: pd.DataFrame
+    df_context: pd.DataFrame
+
+    report_spec: Any
+    report_written: bool
+    timing: dict[str, float]
+
+
+def merge_symbol_results(results: list[SymbolRunResult]) -> SymbolRunResult:
+    """
+    Combine time chunks of one symbol into a single result.
+    """
+    if len(results) == 1:
+        return results[0]
+
+    first = results[0]
+
+    frames = [r.trades for r in results if not r.trades.empty]
+    trades = (
+        pd.concat(frames, ignore_index=True)
+        .sort_values("exit_time", kind="mergesort")
+        .reset_index(drop=True)
+        if frames
+        else pd.DataFrame()
+    )
+    df_context = (
+        pd.concat([r.df_context for r in results], ignore_index=True)
+        .drop_duplicates("time")
+        .sort_values("time", kind="mergesort")
+        .reset_index(drop=True)
+    )
+
+    timing: dict[str, float] = {}
+    for r in results:
+        for k, v in r.timing.items():
+            timing[k] = timing.get(k, 0.0) + v
+
+    return SymbolRunResult(
+        symbol=first.symbol,
+        strategy_id=first.strategy_id,
+        strategy_name=first.strategy_name,
+        trades=trades,
+        df_context=df_context,
+        report_spec=first.report_spec,
+        report_written=False,
+        timing=timing,
+    )
+
+
+def _as_column_time(ts, column: pd.Series) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    ts = ts.tz_convert("UTC")
+    return ts if column.dt.tz is not None else ts.tz_localize(None)
+
+
+def restrict_entries(
+    df_signals: pd.DataFrame,
+    trade_plans: pd.DataFrame,
+    *,
+    entry_start=None,
+    entry_end=None,
+    blocked_until: dict[tuple[str, str], pd.Timestamp] | None = None,
+) -> pd.DataFrame:
+    """
+    trade_plans with plan_valid cleared outside [entry_start, entry_end)
+    and, per (direction, entry tag), before blocked_until.
+
+    blocked_until carries the engine's re-entry rule across time chunks:
+    an entry is skipped while the previous trade of its direction and
+    tag is open, which is the same as the entry having no plan.
+    """
+    time = df_signals["time"]
+    valid = trade_plans["plan_valid"].to_numpy(dtype=bool).copy()
+
+    if entry_start is not None:
+        valid &= (time >= _as_column_time(entry_start, time)).to_numpy()
+    if entry_end is not None:
+        valid &= (time < _as_column_time(entry_end, time)).to_numpy()
+
+    direction = trade_plans["plan_direction"].astype(str).to_numpy()
+    tag = trade_plans["plan_entry_tag"].astype(str).to_numpy()
+    for (d, t), until in (blocked_until or {}).items():
+        valid &= ~(
+            (direction == d)
+            & (tag == t)
+            & (time < _as_column_time(until, time)).to_numpy()
+        )
+
+    out = trade_plans.copy()
+    out["plan_valid"] = valid
+    return out
+
+
+def open_until(
+    trades: pd.DataFrame,
+    carry: dict[tuple[str, str], pd.Timestamp] | None = None,
+) -> dict[tuple[str, str], pd.Timestamp]:
+    """
+    Last exit per (direction, entry tag): the blocked_until state after
+    these trades (merged into carry).
+    """
+    out = dict(carry or {})
+    if trades.empty:
+        return out
+    last = trades.groupby(["direction", "entry_tag"])["exit_time"].max()
+    for key, exit_time in last.items():
+        key = (str(key[0]), str(key[1]))
+        out[key] = max(out[key], exit_time) if key in out else exit_time
+    return out
+
+
+def run_symbol_pipeline_worker(
+    *,
+    symbol: str,
+    strategy_cls,
+    startup_candle_count: int,
+    data_spec: DataSpec | None = None,
+    data_by_tf: dict[str, pd.DataFrame] | None = None,
+    report_job: ReportJob | None = None,
+    entry_start: pd.Timestamp | None = None,
+    entry_end: pd.Timestamp | None = None,
+    blocked_until: dict[tuple[str, str], pd.Timestamp] | None = None,
+) -> SymbolRunResult:
+    """
+    data -> strategy -> backtest (-> report) for ONE symbol in one process.
+
+    Frames never travel back to the parent; only trades and the context
+    projection do. Time chunks of a split symbol only enter in
+    [entry_start, entry_end); blocked_until is the re-entry state left
+    by the chunks before (see restrict_entries).
+    Multiprocessing-safe.
+    """
+    if (data_spec is None) == (data_by_tf is None):
+        raise ValueError("Pass exactly one of data_spec / data_by_tf")
+
+    logger = RunLogger(
+        name=f"PipelineWorker[{symbol}]",
+        cfg=LoggerConfig(stdout=False, file=False, timing=True),
+        prefix=f"🧩 PIPELINE[{symbol}] |",
+    )
+
+    if data_by_tf is None:
+        with logger.section("data"):
+            data_by_tf = data_spec.provider(logger).fetch(symbol)
+
+    with logger.section("strategy"):
+        run = strategy_orchestration(
+            symbol=symbol,
+            data_by_tf=data_by_tf,
+            strategy_cls=strategy_cls,
+            startup_candle_count=startup_candle_count,
+            logger=logger,
+        )
+    del data_by_tf
+
+    with logger.section("backtest"):
+        trade_plans = run.trade_plans
+        if entry_start is not None or entry_end is not None or blocked_until:
+            trade_plans = restrict_entries(
+                run.df_signals,
+                trade_plans,
+                entry_start=entry_start,
+                entry_end=entry_end,
+                blocked_until=blocked_until,
+            )
+        trades = Backtester().run(
+            signals_df=run.df_signals,
+            trade_plans=trade_plans,
+        )
+
+    report_written = False
+    if report_job is not None and not trades.empty:
+        with logger.section("report"):
+            ReportRunner(
+                trades=trades,
+                df_context=run.df_context,
+                report_spec=run.report_spec,
+                metadata=report_job.metadata,
+                config=report_job.config,
+                report_config=ReportConfig(
+                    stdout_mode=StdoutMode.OFF,
+                    generate_dashboard=True,
+                    persist_report=True,
+                ),
+                run_path=report_job.run_path,
+            ).run()
+        report_written = True
+
+    contexts = run.report_spec.contexts if run.report_spec is not None else []
+    df_context = context_projection(
+        run.df_context,
+        contexts,
+        entry_times=trades["entry_time"] if not trades.empty else None,
+    )
+
+    return SymbolRunResult(
+        symbol=symbol,
+        strategy_id=run.strategy_id,
+        strategy_name=run.strategy_name,
+        trades=trades,
+        df_context=df_context,
+        report_spec=run.report_spec,
+        report_written=report_written,
+        timing=logger.get_timings(),
+    )
+
+
+# ==================================================
+# Time chunks
+# ==================================================
+
+def split_time_chunks(task: ScheduledTask, n: int, *, tail) -> list[ScheduledTask]:
+    """
+    n time chunks of a fused symbol task. Each chunk loads startup
+    candles before its start (warmup overlap) and `tail` after its end
+    so trades entered near the boundary can close; it only enters in
+    [start, end). merge_time_chunks makes the merged trades equal the
+    unsplit run.
+    """
+    spec = task.kwargs["data_spec"]
+    tail = pd.Timedelta(tail)
+    bounds = pd.date_range(spec.start, spec.end, periods=n + 1)
+
+    chunks = []
+    for i, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        chunk_spec = replace(spec, start=start, end=min(end + tail, spec.end))
+        chunks.append(ScheduledTask(
+            key=f"{task.key}#{i}",
+            symbol=task.symbol,
+            bars=estimate_bars(chunk_spec),
+            kwargs={
+                **task.kwargs,
+                "data_spec": chunk_spec,
+                "report_job": None,
+                "entry_start": start if i > 0 else None,
+                "entry_end": end if i < n - 1 else None,
+            },
+        ))
+    return chunks
+
+
+def merge_time_chunks(
+    chunks: list[ScheduledTask],
+    results: dict[str, SymbolRunResult],
+    *,
+    end: pd.Timestamp,
+    logger=None,
+) -> SymbolRunResult:
+    """
+    Chunk results of one symbol -> the unsplit result.
+
+    Chunks run independently, so two things can differ from one run:
+    - a trade still open at a chunk's boundary blocks re-entries of its
+      direction / tag in the next chunk, which that chunk did not know
+    - a trade outliving the chunk tail is closed at the chunk's data
+      end (TIMEOUT)
+    Chunks are walked in time order carrying the re-entry state
+    (open_until); a chunk with a trade that state blocks, or with a
+    TIMEOUT before `end` (the symbol's data end), is re-run here with
+    the state and, when cut, data up to `end`.
+    """
+    carry: dict[tuple[str, str], pd.Timestamp] = {}
+    merged = []
+    for task in chunks:
+        result = results[task.key]
+        trades = result.trades
+
+        cut = (
+            task.kwargs["data_spec"].end < end
+            and not trades.empty
+            and (trades["exit_tag"] == TradeExitReason.TIMEOUT.value).any()
+        )
+        if cut or _blocked(trades, carry):
+            if logger is not None:
+                logger.log(f"{task.key:<12} | re-run with carried state (cut={cut})")
+            kwargs = {**task.kwargs, "blocked_until": carry}
+            if cut:
+                kwargs["data_spec"] = replace(kwargs["data_spec"], end=end)
+            result = run_symbol_pipeline_worker(**kwargs)
+
+        carry = open_until(result.trades, carry)
+        merged.append(result)
+
+    return merge_symbol_results(merged)
+
+
+def _blocked(trades: pd.DataFrame, blocked_until: dict[tuple[str, str], pd.Timestamp]) -> bool:
+    if trades.empty or not blocked_until:
+        return False
+    until = pd.Series(
+        [
+            blocked_until.get((str(d), str(t)), pd.NaT)
+            for d, t in zip(trades["direction"], trades["entry_tag"])
+        ],
+        index=trades.index,
+        dtype=trades["exit_time"].dtype,
+    )
+    return bool((trades["entry_time"] < until).any())
@@ -1,26 +1,56 @@
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import as_completed
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pandas as pd
 
-from config.report_config import ReportConfig, StdoutMode
-from core.backtesting.backend_factory import create_backtest_backend
 from core.backtesting.engine.backtester import Backtester
-from core.backtesting.engine.worker import run_backtest_worker, run_strategy_worker
+from core.backtesting.engine.pool import process_pool
+from core.backtesting.engine.worker import (
+    run_backtest_worker,
+    run_report_worker,
+    run_strategy_worker,
+    run_summary_worker,
+)
 from core.backtesting.results_logic.metadata import BacktestMetadata
 from core.backtesting.results_logic.result import BacktestResult
 from core.backtesting.results_logic.store import ResultStore
+from core.backtesting.pipeline import (
+    DataSpec,
+    ReportJob,
+    config_snapshot,
+    estimate_bars,
+    merge_time_chunks,
+    run_symbol_pipeline_worker,
+    split_time_chunks,
+)
+from core.backtesting.scheduler import CostScheduler, ScheduledTask, TimingStore
+from core.backtesting.stage_cache import (
+    StageCache,
+    backtest_stage_key,
+    strategy_stage_key,
+)
+from core.backtesting.streaming import (
+    MemoryBudget,
+    StreamingExecutor,
+    run_symbol_streaming_worker,
+)
 from core.backtesting.strategy_runner import strategy_orchestration
-from core.data_provider import BacktestStrategyDataProvider, CsvMarketDataCache
+from core.backtesting.walk_forward import (
+    WalkForwardExecutor,
+    rolling_windows,
+    windows_from_config,
+)
 from core.live_trading.strategy_loader import load_strategy_class
 from core.logging.profiling import profiling
 from core.logging.run_logger import RunLogger
-from core.reporting.runner import ReportRunner
-from core.reporting.summary_runner import SummaryReportRunner
+from core.reporting.core.contex_enricher import context_projection
+from core.utils.timeframe import tf_to_minutes
 
 
 class BacktestRunner:
@@ -45,6 +75,20 @@ class BacktestRunner:
 
         self.signals_df: pd.DataFrame | None = None
         self.trades_df: pd.DataFrame | None = None
+        self.window_result = None
+
+        self.run_id = f"bt_{uuid4().hex[:8]}"
+
+        self.stage_cache = (
+            StageCache(
+                self.cfg.STAGE_CACHE_PATH,
+                max_bytes=int(self.cfg.STAGE_CACHE_MAX_MB * 1024**2),
+            )
+            if self.cfg.STAGE_CACHE
+            else None
+        )
+        self._strategy_keys: dict[str, str] = {}
+        self._fused_chunks: dict[str, list[ScheduledTask]] = {}
 
         self.log_run = RunLogger(
             "Run",
@@ -80,24 +124,10 @@ class BacktestRunner:
         self.log_data.log("start")
 
         strategy_cls = load_strategy_class(self.cfg.STRATEGY_CLASS)
-        informative_tfs = strategy_cls.get_required_informatives()
-        base_tf = self.cfg.TIMEFRAME
-        all_tfs = [base_tf] + informative_tfs
-
-        backend = create_backtest_backend(self.cfg.BACKTEST_DATA_BACKEND)
-
-        start = pd.Timestamp(self.cfg.TIMERANGE["start"], tz="UTC")
-        end = pd.Timestamp(self.cfg.TIMERANGE["end"], tz="UTC")
+        data_spec = DataSpec.from_config(self.cfg, strategy_cls)
+        all_tfs = data_spec.timeframes
 
-        self.provider = BacktestStrategyDataProvider(
-            backend=backend,
-            cache=CsvMarketDataCache(self.cfg.MARKET_DATA_PATH),
-            backtest_start=start,
-            backtest_end=end,
-            required_timeframes=all_tfs,
-            startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
-            logger=self.log_data,
-        )
+        self.provider = data_spec.provider(self.log_data)
 
         all_data: dict[str, dict[str, pd.DataFrame]] = {}
 
@@ -115,6 +145,11 @@ class BacktestRunner:
     # ==================================================
 
     def run_strategies(self, all_data):
+        if self.stage_cache is not None:
+            return self.run_strategies_cached(all_data)
+        return self._run_strategies(all_data)
+
+    def _run_strategies(self, all_data):
         if self.cfg.USE_MULTIPROCESSING_STRATEGIES:
             return self.run_strategies_parallel(all_data)
         else:
@@ -165,20 +200,28 @@ class BacktestRunner:
         strategy_cls = load_strategy_class(self.cfg.STRATEGY_CLASS)
         self.strategy_runs = []
 
+        tasks = [
+            ScheduledTask(
+                key=symbol,
+                symbol=symbol,
+                bars=len(data_by_tf[min(data_by_tf, key=tf_to_minutes)]),
+                kwargs=dict(
+                    symbol=symbol,
+                    data_by_tf=data_by_tf,
+                    strategy_cls=strategy_cls,
+                    startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
+                ),
+            )
+            for symbol, data_by_tf in all_data.items()
+        ]
+
         with self.log_strategy.time("parallel_execution"):
-            with ProcessPoolExecutor() as executor:
-                futures = [
-                    executor.submit(
-                        run_strategy_worker,
-                        symbol=symbol,
-                        data_by_tf=data_by_tf,
-                        strategy_cls=strategy_cls,
-                        startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
-                    )
-                    for symbol, data_by_tf in all_data.items()
-                ]
-                for f in as_completed(futures):
-                    self.strategy_runs.append(f.result())
+            results, report = self._scheduler(
+                "strategy", self.cfg.MAX_WORKERS_STRATEGIES
+            ).run(run_strategy_worker, tasks)
+
+        self.strategy_runs = [results[t.key] for t in tasks]
+        self._log_schedule(self.log_strategy, report)
 
         with self.log_strategy.time("aggregate"):
             self.signals_df = (
@@ -190,23 +233,76 @@ class BacktestRunner:
         self.log_strategy.log("finished parallel")
         return self.signals_df
 
+    def run_strategies_cached(self, all_data) -> pd.DataFrame:
+        """
+        Strategy stage through the stage cache: only symbols whose data,
+        strategy code or config changed are recomputed.
+        """
+        strategy_cls = load_strategy_class(self.cfg.STRATEGY_CLASS)
+
+        cached = {}
+        with self.log_strategy.time("cache_lookup"):
+            for symbol, data_by_tf in all_data.items():
+                key = strategy_stage_key(
+                    symbol=symbol,
+                    data_by_tf=data_by_tf,
+                    strategy_cls=strategy_cls,
+                    startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
+                )
+                self._strategy_keys[symbol] = key
+                run = self.stage_cache.get("strategy", key)
+                if run is not None:
+                    cached[symbol] = run
+
+        todo = {s: d for s, d in all_data.items() if s not in cached}
+        self.log_strategy.log(f"cache | hits={len(cached)} misses={len(todo)}")
+
+        computed = {}
+        if todo:
+            self._run_strategies(todo)
+            for run in self.strategy_runs:
+                self.stage_cache.put("strategy", self._strategy_keys[run.symbol], run)
+                computed[run.symbol] = run
+
+        self.strategy_runs = [
+            cached[s] if s in cached else computed[s]
+            for s in all_data
+        ]
+
+        with self.log_strategy.time("aggregate"):
+            self.signals_df = (
+                pd.concat([r.df_signals for r in self.strategy_runs])
+                .sort_values(["time", "symbol"])
+                .reset_index(drop=True)
+            )
+
+        return self.signals_df
+
     # ==================================================
     # 3️⃣ BACKTEST
     # ==================================================
 
     def run_backtests(self) -> pd.DataFrame:
+        if self.cfg.BACKTEST_MODE in ("split", "walk_forward"):
+            return self.run_backtests_windows()
+        if self.stage_cache is not None:
+            return self.run_backtests_cached()
+        return self._run_backtests()
+
+    def _run_backtests(self, runs=None) -> pd.DataFrame:
         if self.cfg.USE_MULTIPROCESSING_BACKTESTS:
-            return self.run_backtests_parallel()
+            return self.run_backtests_parallel(runs)
         else:
-            return self.run_backtests_single()
+            return self.run_backtests_single(runs)
 
-    def run_backtests_single(self) -> pd.DataFrame:
+    def run_backtests_single(self, runs=None) -> pd.DataFrame:
+        runs = self.strategy_runs if runs is None else runs
         self.log_backtest.log("start")
 
         self.trades_by_run = []
 
         with self.log_backtest.time("execution"):
-            for run in self.strategy_runs:
+            for run in runs:
                 backtester = Backtester()
                 trades = backtester.run(
                     signals_df=run.df_signals,
@@ -228,8 +324,9 @@ class BacktestRunner:
         )
         return self.trades_df
 
-    def run_backtests_parallel(self) -> pd.DataFrame:
-        if not self.strategy_runs:
+    def run_backtests_parallel(self, runs=None) -> pd.DataFrame:
+        runs = self.strategy_runs if runs is None else runs
+        if not runs:
             raise RuntimeError("No strategy runs to backtest")
 
         self.trades_by_run = []
@@ -237,29 +334,35 @@ class BacktestRunner:
         workers = max_workers or os.cpu_count()
 
         self.log_backtest.log(
-            f"start parallel | runs={len(self.strategy_runs)} workers={workers}"
+            f"start parallel | runs={len(runs)} workers={workers}"
         )
 
-        with self.log_backtest.time("parallel_execution"):
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                future_to_run = {
-                    executor.submit(
-                        run_backtest_worker,
-                        signals_df=run.df_signals,
-                        trade_plans=run.trade_plans,
-                    ): run
-                    for run in self.strategy_runs
-                }
+        tasks = [
+            ScheduledTask(
+                key=f"{i}:{run.symbol}",
+                symbol=run.symbol,
+                bars=len(run.df_signals),
+                kwargs=dict(
+                    signals_df=run.df_signals,
+                    trade_plans=run.trade_plans,
+                ),
+            )
+            for i, run in enumerate(runs)
+        ]
 
-                for future in as_completed(future_to_run):
-                    run = future_to_run[future]
-                    trades = future.result()
+        def on_result(task, trades):
+            self.log_backtest.log(
+                f"{task.symbol:<8} | trades={len(trades)}"
+            )
 
-                    self.trades_by_run.append(trades)
+        with self.log_backtest.time("parallel_execution"):
+            results, report = self._scheduler("backtest", max_workers).run(
+                run_backtest_worker, tasks, on_result=on_result
+            )
 
-                    self.log_backtest.log(
-                        f"{run.symbol:<8} | trades={len(trades)}"
-                    )
+        # runs order (reports zip runs with trades)
+        self.trades_by_run = [results[t.key] for t in tasks]
+        self._log_schedule(self.log_backtest, report)
 
         # -----------------------------
         # AGGREGATE
@@ -277,22 +380,404 @@ class BacktestRunner:
 
         return self.trades_df
 
+    def run_backtests_cached(self) -> pd.DataFrame:
+        """
+        Backtest stage through the stage cache: trades are reused when
+        the strategy output, engine code and cost config are unchanged.
+        """
+        keys = [
+            backtest_stage_key(strategy_key=self._strategy_keys[run.symbol], cfg=self.cfg)
+            for run in self.strategy_runs
+        ]
+        cached = [self.stage_cache.get("trades", key) for key in keys]
+        missing = [run for run, trades in zip(self.strategy_runs, cached) if trades is None]
+
+        self.log_backtest.log(
+            f"cache | hits={len(keys) - len(missing)} misses={len(missing)}"
+        )
+
+        computed = iter([])
+        if missing:
+            self._run_backtests(missing)
+            computed = iter(self.trades_by_run)
+
+        self.trades_by_run = []
+        for key, trades in zip(keys, cached):
+            if trades is None:
+                trades = next(computed)
+                self.stage_cache.put("trades", key, trades)
+            self.trades_by_run.append(trades)
+
+        self.trades_df = (
+            pd.concat(self.trades_by_run)
+            .sort_values("exit_time")
+            .reset_index(drop=True)
+        )
+
+        self.log_backtest.log(
+            f"summary | total_trades={len(self.trades_df)}"
+        )
+        return self.trades_df
+
+    def _windows(self):
+        if self.cfg.BACKTEST_MODE == "split":
+            return windows_from_config(
+                self.cfg.BACKTEST_WINDOWS,
+                roles=self.cfg.BACKTEST_WINDOW_ROLES,
+            )
+
+        wf = self.cfg.WALK_FORWARD
+        return rolling_windows(
+            start=self.cfg.TIMERANGE["start"],
+            end=pd.Timestamp(self.cfg.TIMERANGE["end"]) + pd.Timedelta(days=1),
+            train=wf["train"],
+            test=wf["test"],
+            step=wf.get("step"),
+        )
+
+    def run_backtests_windows(self) -> pd.DataFrame:
+        """
+        Split / walk-forward: strategy runs cover the full range, windows
+        are sliced from them and simulated in parallel.
+        """
+        if not self.strategy_runs:
+            raise RuntimeError("No strategy runs to backtest")
+
+        windows = self._windows()
+        self.log_backtest.log(
+            f"start {self.cfg.BACKTEST_MODE} | runs={len(self.strategy_runs)} "
+            f"windows={len(windows)}"
+        )
+
+        executor = WalkForwardExecutor(
+            windows=windows,
+            startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
+            max_workers=(
+                self.cfg.MAX_WORKERS_BACKTESTS
+                if self.cfg.USE_MULTIPROCESSING_BACKTESTS
+                else 1
+            ),
+            logger=self.log_backtest,
+        )
+
+        with self.log_backtest.time("window_execution"):
+            self.window_result = executor.run(self.strategy_runs)
+
+        stitched = self.window_result.stitched
+
+        self.trades_by_run = [
+            (
+                stitched[stitched["symbol"] == run.symbol].reset_index(drop=True)
+                if not stitched.empty
+                else stitched
+            )
+            for run in self.strategy_runs
+        ]
+        self.trades_df = stitched
+
+        for row in self.window_result.summary.itertuples():
+            self.log_backtest.log(
+                f"{row.window:<12} | {row.role:<5} | trades={row.trades} "
+                f"pnl_net={row.pnl_net_usd:,.2f}"
+            )
+
+        self.log_backtest.log(
+            f"summary | total_trades={len(self.trades_df)}"
+        )
+        return self.trades_df
+
+    # ==================================================
+    # 3️⃣b FUSED PIPELINE
+    # ==================================================
+
+    def run_pipeline_fused(self, run_path: Path) -> pd.DataFrame:
+        """
+        One worker per symbol: data -> strategy -> backtest -> report.
+        Only trades + a context projection come back to the parent.
+        """
+        if self.cfg.BACKTEST_MODE != "single":
+            raise ValueError("PIPELINE_MODE='fused' supports BACKTEST_MODE='single' only")
+
+        max_workers = self.cfg.MAX_WORKERS_BACKTESTS
+        self.log_backtest.log(
+            f"start fused | symbols={len(self.cfg.SYMBOLS)} "
+            f"workers={max_workers or os.cpu_count()}"
+        )
+
+        tasks = self._symbol_tasks(run_path, reports=self.cfg.FUSED_WORKER_REPORTS)
+
+        def on_result(task, r):
+            t = r.timing
+            self.log_backtest.log(
+                f"{task.key:<12} | trades={len(r.trades)} "
+                f"data={t.get('data', 0):.2f}s "
+                f"strategy={t.get('strategy', 0):.2f}s "
+                f"backtest={t.get('backtest', 0):.2f}s "
+                f"report={t.get('report', 0):.2f}s"
+            )
+
+        self._fused_chunks = {}
+        with self.log_backtest.time("fused_execution"):
+            by_key, report = self._scheduler("fused", max_workers).run(
+                run_symbol_pipeline_worker,
+                tasks,
+                split=self._split_fused if self.cfg.SCHEDULER_SPLIT_SYMBOLS else None,
+                on_result=on_result,
+            )
+        self._log_schedule(self.log_backtest, report)
+
+        # merge time chunks back into one result per symbol (config order)
+        results = [
+            merge_time_chunks(
+                self._fused_chunks[symbol],
+                by_key,
+                end=self._fused_chunks[symbol][-1].kwargs["data_spec"].end,
+                logger=self.log_backtest,
+            )
+            if symbol in self._fused_chunks
+            else by_key[symbol]
+            for symbol in self.cfg.SYMBOLS
+        ]
+
+        self.strategy_runs = results
+        self.trades_by_run = [r.trades for r in results]
+        self.trades_df = (
+            pd.concat(self.trades_by_run)
+            .sort_values("exit_time")
+            .reset_index(drop=True)
+        )
+
+        self.log_backtest.log(
+            f"summary | total_trades={len(self.trades_df)}"
+        )
+        return self.trades_df
+
+    # ==================================================
+    # 3️⃣c STREAMING PIPELINE
+    # ==================================================
+
+    def run_pipeline_streaming(self, run_path: Path) -> pd.DataFrame:
+        """
+        Fused per-symbol pipeline under STREAM_MEMORY_BUDGET_MB.
+
+        Symbols are admitted while the estimated memory of running
+        workers fits the budget; each runs in a fresh process and writes
+        its own report. Only trades (+ ids for the summary) are kept.
+        """
+        if self.cfg.BACKTEST_MODE != "single":
+            raise ValueError("PIPELINE_MODE='streaming' supports BACKTEST_MODE='single' only")
+
+        budget = MemoryBudget(
+            self.cfg.STREAM_MEMORY_BUDGET_MB,
+            base_mb=self.cfg.STREAM_BASE_MB,
+            mb_per_1k_bars=self.cfg.STREAM_MB_PER_1K_BARS,
+        )
+        max_workers = self.cfg.MAX_WORKERS_BACKTESTS or os.cpu_count()
+        self.log_backtest.log(
+            f"start streaming | symbols={len(self.cfg.SYMBOLS)} "
+            f"workers={max_workers} budget={budget.budget_mb:,.0f}MB"
+        )
+
+        tasks = self._symbol_tasks(run_path, reports=True)
+        by_symbol = {}
+
+        def on_result(task, out):
+            r = out.result
+            if r.report_written:
+                # per-symbol report is on disk: drop the context projection
+                r = replace(r, df_context=r.df_context.iloc[0:0])
+            by_symbol[task.symbol] = r
+
+            peak = f"{out.peak_rss_mb:,.0f}MB" if out.peak_rss_mb is not None else "n/a"
+            self.log_backtest.log(
+                f"{task.key:<12} | trades={len(r.trades)} peak_rss={peak} "
+                f"est/1k_bars={budget.mb_per_1k_bars:.2f}MB"
+            )
+
+        with self.log_backtest.time("streaming_execution"):
+            report = StreamingExecutor(
+                budget=budget,
+                max_workers=max_workers,
+                logger=self.log_backtest,
+            ).run(run_symbol_streaming_worker, tasks, on_result)
+
+        peak = report.max_worker_peak_mb
+        self.log_backtest.log(
+            f"stream | tasks={report.tasks} max_concurrent={report.max_concurrent} "
+            f"max_in_flight_est={report.max_in_flight_mb:,.0f}MB "
+            f"max_worker_peak={'n/a' if peak is None else f'{peak:,.0f}MB'} "
+            f"wall={report.wall_s:.2f}s"
+        )
+
+        self.strategy_runs = [by_symbol[symbol] for symbol in self.cfg.SYMBOLS]
+        self.trades_by_run = [r.trades for r in self.strategy_runs]
+        self.trades_df = (
+            pd.concat(self.trades_by_run)
+            .sort_values("exit_time")
+            .reset_index(drop=True)
+        )
+
+        self.log_backtest.log(
+            f"summary | total_trades={len(self.trades_df)}"
+        )
+        return self.trades_df
+
+    def _symbol_tasks(self, run_path: Path, *, reports: bool) -> list[ScheduledTask]:
+        """
+        One fused pipeline task per configured symbol.
+        """
+        strategy_cls = load_strategy_class(self.cfg.STRATEGY_CLASS)
+        data_spec = DataSpec.from_config(self.cfg, strategy_cls)
+
+        report_config = config_snapshot(self.cfg)
+        metadata = self._build_metadata()
+
+        return [
+            ScheduledTask(
+                key=symbol,
+                symbol=symbol,
+                bars=self._estimate_bars(data_spec),
+                kwargs=dict(
+                    symbol=symbol,
+                    strategy_cls=strategy_cls,
+                    startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
+                    data_spec=data_spec,
+                    report_job=(
+                        ReportJob(
+                            metadata=metadata,
+                            config=report_config,
+                            run_path=run_path / "per_symbol" / symbol,
+                        )
+                        if reports
+                        else None
+                    ),
+                ),
+            )
+            for symbol in self.cfg.SYMBOLS
+        ]
+
+    # ==================================================
+    # SCHEDULING
+    # ==================================================
+
+    def _scheduler(self, stage: str, max_workers: int | None) -> CostScheduler:
+        return CostScheduler(
+            stage=stage,
+            strategy=self.cfg.STRATEGY_CLASS,
+            max_workers=max_workers,
+            timing_store=TimingStore(self.cfg.SCHEDULER_TIMINGS_PATH),
+            max_chunks=self.cfg.SCHEDULER_MAX_CHUNKS,
+        )
+
+    @staticmethod
+    def _log_schedule(logger, report) -> None:
+        logger.log(
+            f"schedule | tasks={len(report.tasks)} workers={report.workers} "
+            f"wall={report.wall_s:.2f}s busy={report.busy_s:.2f}s "
+            f"bound={report.lower_bound_s:.2f}s "
+            f"utilization={report.utilization:.0%}"
+        )
+
+    @staticmethod
+    def _estimate_bars(data_spec: DataSpec) -> int:
+        return estimate_bars(data_spec)
+
+    def _split_fused(self, task: ScheduledTask, n: int) -> list[ScheduledTask]:
+        """
+        n time chunks of a symbol (see split_time_chunks); merged back
+        by merge_time_chunks.
+        """
+        chunks = split_time_chunks(task, n, tail=self.cfg.SCHEDULER_CHUNK_TAIL)
+        self._fused_chunks[task.key] = chunks
+        return chunks
+
     # ==================================================
     # 4️⃣ RESULT BUILDING
     # ==================================================
 
-    def _build_result(self) -> BacktestResult:
-        if self.trades_df is None:
-            raise RuntimeError("No trades to build result")
+    # ==================================================
+    # REPORTS
+    # ==================================================
+
+    def run_reports(self, run_path: Path, metadata) -> None:
+        """
+        Per-symbol reports and the portfolio summary on a process pool
+        (REPORT_WORKERS; 1 = serial in this process).
+
+        Each per-symbol task gets its trades and a context_projection of
+        the strategy frame (time + report_spec.contexts columns at entry
+        candles), never the full frame. The summary is submitted first and
+        runs alongside them. Symbols whose report a fused worker already
+        wrote are skipped.
+        """
+        config = config_snapshot(self.cfg)
+        summary_kwargs = dict(
+            runs=[
+                SimpleNamespace(symbol=run.symbol, strategy_id=run.strategy_id)
+                for run in self.strategy_runs
+            ],
+            trades_by_run=self.trades_by_run,
+            config=config,
+            run_path=run_path,
+        )
 
-        run_id = f"bt_{uuid4().hex[:8]}"
+        tasks = {}
+        for run, trades in zip(self.strategy_runs, self.trades_by_run):
+            if getattr(run, "report_written", False):
+                continue
+            contexts = run.report_spec.contexts if run.report_spec is not None else []
+            tasks[run.symbol] = dict(
+                trades=trades,
+                df_context=context_projection(
+                    run.df_context,
+                    contexts,
+                    entry_times=trades["entry_time"] if not trades.empty else None,
+                ),
+                report_spec=run.report_spec,
+                metadata=metadata,
+                config=config,
+                run_path=run_path / "per_symbol" / run.symbol,
+            )
 
-        metadata = BacktestMetadata.now(
-            run_id=run_id,
+        total = len(tasks)
+        done = 0
+
+        def on_done(symbol, seconds):
+            nonlocal done
+            if symbol is None:
+                self.log_report.log(f"{'summary':<12} | {seconds:6.3f}s")
+                return
+            done += 1
+            self.log_report.log(
+                f"{symbol:<12} | trades={len(tasks[symbol]['trades'])} "
+                f"{seconds:6.3f}s ({done}/{total})"
+            )
+
+        workers = min(self.cfg.REPORT_WORKERS or os.cpu_count() or 1, total + 1)
+        if workers <= 1:
+            for symbol, kwargs in tasks.items():
+                on_done(symbol, run_report_worker(**kwargs))
+            on_done(None, run_summary_worker(**summary_kwargs))
+            return
+
+        with process_pool(workers) as executor:
+            futures = {executor.submit(run_summary_worker, **summary_kwargs): None}
+            for symbol, kwargs in tasks.items():
+                futures[executor.submit(run_report_worker, **kwargs)] = symbol
+
+            for f in as_completed(futures):
+                on_done(futures[f], f.result())
+
+    def _build_metadata(self) -> BacktestMetadata:
+        return BacktestMetadata.now(
+            run_id=self.run_id,
             backtest_mode=self.cfg.BACKTEST_MODE,
             windows=(
-                self.cfg.BACKTEST_WINDOWS
-                if self.cfg.BACKTEST_MODE == "split"
+                {
+                    w.name: (w.start.isoformat(), w.end.isoformat())
+                    for w in self.window_result.windows
+                }
+                if self.window_result is not None
                 else None
             ),
             strategies=[s.get_strategy_id() for s in self.strategies],
@@ -307,6 +792,12 @@ class BacktestRunner:
             max_risk_per_trade=self.cfg.MAX_RISK_PER_TRADE,
         )
 
+    def _build_result(self) -> BacktestResult:
+        if self.trades_df is None:
+            raise RuntimeError("No trades to build result")
+
+        metadata = self._build_metadata()
+
         return BacktestResult(
             metadata=metadata,
             trades=self.trades_df,
@@ -328,43 +819,40 @@ class BacktestRunner:
         self.log_run.log(f"run_path={self.run_path}")
         self.log_run.log("start")
 
-        with self.log_run.time("data"):
-            all_data = self.load_data()
+        store = ResultStore()
+        mode = self.cfg.PIPELINE_MODE
 
-        with self.log_run.time("strategy"):
-            self.run_strategies(all_data)
+        if mode in ("fused", "streaming"):
+            run_pipeline = (
+                self.run_pipeline_streaming
+                if mode == "streaming"
+                else self.run_pipeline_fused
+            )
+            with profiling(self.cfg.PROFILING, self.run_path / "profile.prof"):
+                with self.log_run.time("pipeline"):
+                    run_pipeline(store.run_path(self.run_id))
+        else:
+            with self.log_run.time("data"):
+                all_data = self.load_data()
+
+            with self.log_run.time("strategy"):
+                self.run_strategies(all_data)
+            del all_data
 
-        with profiling(self.cfg.PROFILING, self.run_path / "profile.prof"):
-            with self.log_run.time("backtest"):
-                self.run_backtests()
+            with profiling(self.cfg.PROFILING, self.run_path / "profile.prof"):
+                with self.log_run.time("backtest"):
+                    self.run_backtests()
 
         with self.log_run.time("persist"):
             result = self._build_result()
-            run_path = ResultStore().save(result)
+            run_path = store.save(result)
+            if self.window_result is not None:
+                self.window_result.summary.to_parquet(
+                    run_path / "windows.parquet", index=False
+                )
 
-        for run, trades in zip(self.strategy_runs, self.trades_by_run):
-            with self.log_report.time(f"{run.symbol}"):
-                ReportRunner(
-                    trades=trades,
-                    df_context=run.df_context,
-                    report_spec=run.report_spec,
-                    metadata=result.metadata,
-                    config=self.cfg,
-                    report_config=ReportConfig(
-                        stdout_mode=StdoutMode.OFF,
-                        generate_dashboard=True,
-                        persist_report=True,
-                    ),
-                    run_path=run_path / "per_symbol" / run.symbol,
-                ).run()
-
-        with self.log_report.time("summary"):
-            SummaryReportRunner(
-                strategy_runs=self.strategy_runs,
-                trades_by_run=self.trades_by_run,
-                config=self.cfg,
-                run_path=run_path,
-            ).run()
+        with self.log_report.time("reports"):
+            self.run_reports(run_path, result.metadata)
 
         total = perf_counter() - t0
         self.log_run.log(f"TOTAL {total:,.3f}s")
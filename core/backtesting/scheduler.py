@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from core.backtesting.engine.pool import process_pool
+
+
+DEFAULT_SECONDS_PER_BAR = 1e-5
+
+
+@dataclass(frozen=True)
+class ScheduledTask:
+    """
+    One pool task. cost = estimated seconds (bars * seconds_per_bar).
+    parent is set on chunks produced by splitting.
+    """
+
+    key: str
+    symbol: str
+    bars: int
+    kwargs: dict = field(repr=False)
+    cost: float = 0.0
+    parent: str | None = None
+
+
+@dataclass(frozen=True)
+class ScheduleReport:
+    workers: int
+    wall_s: float
+    busy_s: float
+    tasks: pd.DataFrame     # key, parent, symbol, bars, est_cost_s, duration_s, start_s, end_s
+
+    @property
+    def utilization(self) -> float:
+        """
+        Busy worker time / available worker time.
+        """
+        if self.wall_s <= 0:
+            return 0.0
+        return self.busy_s / (self.wall_s * self.workers)
+
+    @property
+    def lower_bound_s(self) -> float:
+        """
+        Best achievable wall-clock: total work / cores, or the longest task.
+        """
+        if self.tasks.empty:
+            return 0.0
+        return max(self.busy_s / self.workers, float(self.tasks["duration_s"].max()))
+
+
+class TimingStore:
+    """
+    Seconds-per-bar of previous runs, per (stage, strategy, symbol).
+
+    <results>/scheduler/timings.json; updated as an EMA after each run.
+    """
+
+    def __init__(self, path: str | Path = "results/scheduler/timings.json", alpha: float = 0.5):
+        self.path = Path(path)
+        self.alpha = alpha
+        self._data: dict[str, float] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+
+    @staticmethod
+    def _key(stage: str, strategy: str, symbol: str) -> str:
+        return f"{stage}|{strategy}|{symbol}"
+
+    def seconds_per_bar(self, stage: str, strategy: str, symbol: str) -> float:
+        value = self._data.get(self._key(stage, strategy, symbol))
+        if value is not None:
+            return value
+
+        # unknown symbol: median of the stage's known rates
+        prefix = f"{stage}|{strategy}|"
+        known = [v for k, v in self._data.items() if k.startswith(prefix)]
+        return float(np.median(known)) if known else DEFAULT_SECONDS_PER_BAR
+
+    def update(self, stage: str, strategy: str, symbol: str, bars: int, seconds: float) -> None:
+        if bars <= 0:
+            return
+        key = self._key(stage, strategy, symbol)
+        rate = seconds / bars
+        old = self._data.get(key)
+        self._data[key] = rate if old is None else self.alpha * rate + (1 - self.alpha) * old
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, indent=2, sort_keys=True)
+
+
+def _timed_call(fn, kwargs):
+    # epoch time: comparable across worker processes
+    t0 = time.time()
+    result = fn(**kwargs)
+    return result, t0, time.time()
+
+
+class CostScheduler:
+    """
+    Longest-processing-time-first dispatch onto a process pool.
+
+    - cost = bars * seconds_per_bar (TimingStore, previous runs)
+    - tasks larger than the ideal per-worker share can be split via a
+      caller-provided `split(task, n) -> [tasks]` (e.g. time chunks)
+    - measured durations feed back into the TimingStore
+    """
+
+    def __init__(
+        self,
+        *,
+        stage: str,
+        strategy: str,
+        max_workers: int | None = None,
+        timing_store: TimingStore | None = None,
+        max_chunks: int = 8,
+    ):
+        self.stage = stage
+        self.strategy = strategy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timing_store = timing_store
+        self.max_chunks = max(int(max_chunks), 1)
+
+    # ==================================================
+    # Planning
+    # ==================================================
+
+    def estimate(self, task: ScheduledTask) -> ScheduledTask:
+        rate = (
+            self.timing_store.seconds_per_bar(self.stage, self.strategy, task.symbol)
+            if self.timing_store is not None
+            else DEFAULT_SECONDS_PER_BAR
+        )
+        return replace(task, cost=task.bars * rate)
+
+    def plan(
+        self,
+        tasks: list[ScheduledTask],
+        split: Callable[[ScheduledTask, int], list[ScheduledTask]] | None = None,
+    ) -> list[ScheduledTask]:
+        """
+        Estimated, optionally split, tasks in dispatch (longest-first) order.
+        """
+        tasks = [self.estimate(t) for t in tasks]
+
+        if split is not None and len(tasks) and self.max_workers > 1:
+            share = sum(t.cost for t in tasks) / self.max_workers
+            planned = []
+            for task in tasks:
+                n = min(self.max_chunks, math.ceil(task.cost / share)) if share > 0 else 1
+                if n > 1:
+                    planned.extend(
+                        replace(self.estimate(c), parent=task.key)
+                        for c in split(task, n)
+                    )
+                else:
+                    planned.append(task)
+            tasks = planned
+
+        # stable: equal costs keep submission order
+        return sorted(tasks, key=lambda t: -t.cost)
+
+    # ==================================================
+    # Execution
+    # ==================================================
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        tasks: list[ScheduledTask],
+        *,
+        split: Callable[[ScheduledTask, int], list[ScheduledTask]] | None = None,
+        on_result: Callable[[ScheduledTask, Any], None] | None = None,
+    ) -> tuple[dict[str, Any], ScheduleReport]:
+        """
+        Run fn(**task.kwargs) for every planned task.
+
+        Returns ({task key: result}, ScheduleReport). Chunk results are
+        keyed by chunk key; report.tasks maps them to their parent.
+        """
+        planned = self.plan(tasks, split)
+
+        results: dict[str, Any] = {}
+        timing: dict[str, tuple[float, float]] = {}
+
+        t0 = time.time()
+        if self.max_workers == 1:
+            for task in planned:
+                result, start, end = _timed_call(fn, task.kwargs)
+                results[task.key] = result
+                timing[task.key] = (start, end)
+                if on_result is not None:
+                    on_result(task, result)
+        else:
+            with process_pool(self.max_workers) as executor:
+                futures = {
+                    executor.submit(_timed_call, fn, task.kwargs): task
+                    for task in planned
+                }
+                for f in as_completed(futures):
+                    task = futures[f]
+                    result, start, end = f.result()
+                    results[task.key] = result
+                    timing[task.key] = (start, end)
+                    if on_result is not None:
+                        on_result(task, result)
+        wall = time.time() - t0
+
+        report = self._report(planned, timing, t0, wall)
+        self._record(planned, timing)
+        return results, report
+
+    def _report(self, planned, timing, t0, wall) -> ScheduleReport:
+        rows = []
+        for task in planned:
+            start, end = timing[task.key]
+            rows.append({
+                "key": task.key,
+                "parent": task.parent,
+                "symbol": task.symbol,
+                "bars": task.bars,
+                "est_cost_s": task.cost,
+                "duration_s": end - start,
+                "start_s": start - t0,
+                "end_s": end - t0,
+            })
+        tasks = pd.DataFrame(rows)
+        busy = float(tasks["duration_s"].sum()) if rows else 0.0
+        return ScheduleReport(
+            workers=min(self.max_workers, max(len(planned), 1)),
+            wall_s=wall,
+            busy_s=busy,
+            tasks=tasks,
+        )
+
+    def _record(self, planned, timing) -> None:
+        if self.timing_store is None:
+            return
+        for task in planned:
+            start, end = timing[task.key]
+            self.timing_store.update(self.stage, self.strategy, task.symbol, task.bars, end - start)
+        self.timing_store.save()
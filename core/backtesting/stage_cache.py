@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+
+CACHE_VERSION = 1
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# code each stage depends on (besides the strategy class itself)
+STRATEGY_CODE = (
+    "core/strategy",
+    "core/utils",
+    "core/backtesting/strategy_runner.py",
+    "FeatureEngineering",
+)
+ENGINE_CODE = (
+    "core/backtesting/engine",
+    "core/backtesting/exit",
+    "core/backtesting/execution_policy.py",
+    "core/domain",
+    "config/instrument_meta.py",
+)
+ENGINE_CONFIG = (
+    "INITIAL_BALANCE",
+    "MAX_RISK_PER_TRADE",
+    "SLIPPAGE",
+    "SLIPPAGE_ENTRY",
+    "SLIPPAGE_EXIT",
+)
+
+
+# ==================================================
+# Digests
+# ==================================================
+
+def digest(*parts) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """
+    Content hash of a frame (values, columns, dtypes; not the index).
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps([list(map(str, df.columns)), list(map(str, df.dtypes))]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def data_digest(data_by_tf: dict[str, pd.DataFrame]) -> str:
+    return digest(*[(tf, frame_digest(data_by_tf[tf])) for tf in sorted(data_by_tf)])
+
+
+@lru_cache(maxsize=None)
+def source_digest(paths: tuple[str, ...], root: Path = REPO_ROOT) -> str:
+    """
+    Hash of every .py file under paths (files or directories).
+    Memoized: code does not change within a process.
+    """
+    h = hashlib.sha256()
+    for rel in paths:
+        path = root / rel
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for f in files:
+            if "tests" in f.relative_to(root).parts or not f.exists():
+                continue
+            h.update(str(f.relative_to(root)).encode())
+            h.update(f.read_bytes())
+    return h.hexdigest()
+
+
+def class_source_digest(cls) -> str:
+    """
+    Hash of the modules defining cls and its bases.
+    """
+    h = hashlib.sha256()
+    for klass in cls.__mro__:
+        try:
+            path = inspect.getsourcefile(klass)
+        except TypeError:       # builtins
+            continue
+        if path is None:
+            continue
+        h.update(klass.__qualname__.encode())
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
+def _module_files(name: str, base: Path) -> list[Path]:
+    """
+    Files executed by importing dotted `name` from base: package
+    __init__ files along the way and the module itself.
+    """
+    files = []
+    path = base
+    for part in name.split("."):
+        path = path / part
+        init = path / "__init__.py"
+        if init.exists():
+            files.append(init)
+    module = path.with_suffix(".py")
+    if module.exists():
+        files.append(module)
+    return files
+
+
+def _imported_files(path: Path, root: Path) -> list[Path]:
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+
+    files = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                files += _module_files(alias.name, root)
+        elif isinstance(node, ast.ImportFrom):
+            base = root
+            if node.level:
+                base = path.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+            module = node.module or ""
+            if module:
+                files += _module_files(module, base)
+            # `from pkg import mod` imports a submodule
+            for alias in node.names:
+                files += _module_files(f"{module}.{alias.name}".lstrip("."), base)
+    return files
+
+
+@lru_cache(maxsize=None)
+def import_closure(path: Path, root: Path = REPO_ROOT) -> tuple[Path, ...]:
+    """
+    path and every first-party (.py under root) module it imports,
+    transitively. Memoized: imports do not change within a process.
+    """
+    root = root.resolve()
+    seen = {path.resolve()}
+    stack = [path.resolve()]
+    while stack:
+        for f in _imported_files(stack.pop(), root):
+            f = f.resolve()
+            if f in seen or not f.is_relative_to(root) or "tests" in f.relative_to(root).parts:
+                continue
+            seen.add(f)
+            stack.append(f)
+    return tuple(sorted(seen))
+
+
+def strategy_code_digest(strategy_cls, root: Path | None = None) -> str:
+    """
+    Hash of the strategy module and everything it imports from the
+    repo (indicators, market-structure engines, helpers).
+    """
+    root = (root or REPO_ROOT).resolve()
+    h = hashlib.sha256()
+    for f in import_closure(Path(inspect.getsourcefile(strategy_cls)), root):
+        h.update((str(f.relative_to(root)) if f.is_relative_to(root) else f.name).encode())
+        h.update(f.read_bytes())
+    return h.hexdigest()
+
+
+# ==================================================
+# Store
+# ==================================================
+
+class StageCache:
+    """
+    Content-addressed cache of stage outputs.
+
+    <root>/<stage>/<key[:2]>/<key>.pkl, one pickle per entry. File mtime
+    is the last use (touched on hit); when the cache grows past
+    max_bytes the least recently used entries are evicted. Entries that
+    no longer unpickle (corrupt, or stale against the code) are misses
+    and are deleted.
+    """
+
+    def __init__(self, root: str | Path = "results/cache", max_bytes: int | None = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / key[:2] / f"{key}.pkl"
+
+    def get(self, stage: str, key: str) -> Any | None:
+        path = self._path(stage, key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ModuleNotFoundError,
+            ImportError,
+        ):
+            # truncated file, or a class renamed / moved since it was
+            # pickled: unusable, drop the entry
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, stage: str, key: str, value: Any) -> None:
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # atomic: concurrent readers never see a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+        self.evict()
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until size <= max_bytes.
+        Returns the number of entries removed.
+        """
+        if self.max_bytes is None:
+            return 0
+
+        entries = [(p, p.stat()) for p in self._entries()]
+        total = sum(st.st_size for _, st in entries)
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            removed += 1
+        return removed
+
+    def _entries(self) -> list[Path]:
+        if not self.root.exists():
+            return []
+        return list(self.root.glob("*/*/*.pkl"))
+
+
+# ==================================================
+# Stage keys
+# ==================================================
+
+def strategy_stage_key(
+    *,
+    symbol: str,
+    data_by_tf: dict[str, pd.DataFrame],
+    strategy_cls,
+    startup_candle_count: int,
+    strategy_config: dict | None = None,
+) -> str:
+    """
+    Key of a StrategyRunResult: data slice, strategy code (with its
+    first-party imports) and config.
+    """
+    return digest(
+        "strategy",
+        CACHE_VERSION,
+        symbol,
+        data_digest(data_by_tf),
+        class_source_digest(strategy_cls),
+        strategy_code_digest(strategy_cls),
+        source_digest(STRATEGY_CODE),
+        startup_candle_count,
+        strategy_config,
+    )
+
+
+def backtest_stage_key(*, strategy_key: str, cfg) -> str:
+    """
+    Key of a trades frame: strategy key, engine code and cost config.
+    """
+    return digest(
+        "trades",
+        CACHE_VERSION,
+        strategy_key,
+        source_digest(ENGINE_CODE),
+        {name: getattr(cfg, name, None) for name in ENGINE_CONFIG},
+    )
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 import pandas as pd
@@ -7,6 +7,7 @@ from core.logging.null_logger import NullLogger
 from core.logging.run_logger import RunLogger
 from core.strategy.orchestration.informatives import apply_informatives
 from core.strategy.plan_builder import PlanBuildContext
+from core.strategy.signals import COLUMNAR_SIGNAL_COLUMNS, SIGNAL_DIRECTION
 from core.utils.timeframe import tf_to_minutes
 
 
@@ -35,6 +36,7 @@ def strategy_orchestration(
     strategy_cls,
     startup_candle_count: int,
     logger: RunLogger | None = None,
+    strategy_config: dict | None = None,
 ):
     """
     Run single strategy instance for one symbol.
@@ -47,6 +49,67 @@ def strategy_orchestration(
 
     logger = logger or NullLogger()
 
+    with logger.section("execute_strategy"):
+        df_features = compute_features(
+            symbol=symbol,
+            data_by_tf=data_by_tf,
+            strategy_cls=strategy_cls,
+            startup_candle_count=startup_candle_count,
+            logger=logger,
+            strategy_config=strategy_config,
+        )
+
+        result = run_on_features(
+            symbol=symbol,
+            df_features=df_features,
+            strategy_cls=strategy_cls,
+            startup_candle_count=startup_candle_count,
+            logger=logger,
+            strategy_config=strategy_config,
+        )
+
+    return replace(result, timing=logger.get_timings())
+
+
+def init_strategy(
+    strategy_cls,
+    *,
+    df: pd.DataFrame,
+    symbol: str,
+    startup_candle_count: int,
+    strategy_config: dict | None = None,
+):
+    kwargs = dict(
+        df=df,
+        symbol=symbol,
+        startup_candle_count=startup_candle_count,
+    )
+    if strategy_config is not None:
+        kwargs["strategy_config"] = strategy_config
+
+    strategy = strategy_cls(**kwargs)
+    strategy.validate()
+    return strategy
+
+
+def compute_features(
+    *,
+    symbol: str,
+    data_by_tf: dict[str, pd.DataFrame],
+    strategy_cls,
+    startup_candle_count: int,
+    logger: RunLogger | None = None,
+    strategy_config: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Feature stage: base TF + informatives + populate_indicators.
+
+    Depends on strategy_config only through strategy_cls.feature_params,
+    so the result can be shared by configs with the same feature key.
+    """
+
+    logger = logger or NullLogger()
+
     # ==================================================
     # 1️⃣ BASE TIMEFRAME
     # ==================================================
@@ -60,48 +123,90 @@ def strategy_orchestration(
     # ==================================================
 
     with logger.section("strategy_init"):
-        strategy = strategy_cls(
+        strategy = init_strategy(
+            strategy_cls,
             df=df_base,
             symbol=symbol,
             startup_candle_count=startup_candle_count,
+            strategy_config=strategy_config,
         )
-        strategy.validate()
 
     # ==================================================
-    # 3️⃣ EXECUTION PIPELINE
+    # 3️⃣ FEATURES
     # ==================================================
 
-    with logger.section("execute_strategy"):
-        df_context = apply_informatives(
-            df=df_base,
-            strategy=strategy,
-            data_by_tf=data_by_tf,
-        )
+    df_context = apply_informatives(
+        df=df_base,
+        strategy=strategy,
+        data_by_tf=data_by_tf,
+    )
+
+    strategy.df = df_context
+
+    with logger.section("execute.indicators"):
+        strategy.populate_indicators()
+
+    return strategy.df
+
 
-        strategy.df = df_context
+def run_on_features(
+    *,
+    symbol: str,
+    df_features: pd.DataFrame,
+    strategy_cls,
+    startup_candle_count: int,
+    logger: RunLogger | None = None,
+    strategy_config: dict | None = None,
+) -> StrategyRunResult:
+    """
+    Signal stage: entry/exit trends + trade plans on a precomputed
+    feature frame (see compute_features). df_features is not mutated.
+    """
 
-        with logger.section("execute.indicators"):
-            strategy.populate_indicators()
+    logger = logger or NullLogger()
+
+    strategy = init_strategy(
+        strategy_cls,
+        df=df_features.copy(),
+        symbol=symbol,
+        startup_candle_count=startup_candle_count,
+        strategy_config=strategy_config,
+    )
+
+    # ==================================================
+    # 4️⃣ SIGNALS
+    # ==================================================
 
-        with logger.section("execute.entry"):
-            strategy.populate_entry_trend()
+    with logger.section("execute.entry"):
+        strategy.populate_entry_trend()
 
-        with logger.section("signal_stats"):
-            entry_count = strategy.df["signal_entry"].notna().sum()
+    with logger.section("signal_stats"):
+        if SIGNAL_DIRECTION in strategy.df.columns:
+            entry_count = int((strategy.df[SIGNAL_DIRECTION] != 0).sum())
+        elif "signal_entry" in strategy.df.columns:
+            entry_count = int(strategy.df["signal_entry"].notna().sum())
+        else:
+            entry_count = 0
 
-            logger.log(
-                f"entry signals = {entry_count} ")
+        logger.log(
+            f"entry signals = {entry_count} ")
 
-        with logger.section("execute.exit"):
-            strategy.populate_exit_trend()
+    with logger.section("execute.exit"):
+        strategy.populate_exit_trend()
 
     df_context = strategy.df
     # ==================================================
-    # 4️⃣ BUILD df_signals (EXECUTION CONTRACT)
+    # 5️⃣ BUILD df_signals (EXECUTION CONTRACT)
     # ==================================================
 
     REQUIRED_COLUMNS = ["time", "open", "high", "low", "close"]
-    SIGNAL_COLUMNS = ["signal_entry", "signal_exit", "levels"]
+    SIGNAL_COLUMNS = [
+        "signal_entry",
+        "signal_exit",
+        "custom_stop_loss",
+        "levels",
+        *COLUMNAR_SIGNAL_COLUMNS,
+    ]
 
     missing = [c for c in REQUIRED_COLUMNS if c not in df_context.columns]
     if missing:
@@ -139,7 +244,7 @@ def strategy_orchestration(
         trade_plans = strategy.build_trade_plans_backtest(
             df=df_signals,
             ctx=ctx,
-            allow_managed_in_backtest=False,
+            allow_managed_in_backtest=True,
         )
 
     return StrategyRunResult(
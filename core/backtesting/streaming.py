@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from core.backtesting.engine.pool import process_pool
+from core.backtesting.pipeline import run_symbol_pipeline_worker
+from core.backtesting.scheduler import ScheduledTask
+from core.logging.null_logger import NullLogger
+
+
+DEFAULT_BASE_MB = 300.0           # fresh worker process (interpreter + imports)
+DEFAULT_MB_PER_1K_BARS = 1.5      # base-TF bars incl. informatives / features
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Peak resident memory of this process (None where unsupported).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass(frozen=True)
+class StreamedSymbol:
+    result: Any
+    peak_rss_mb: float | None
+
+
+def run_symbol_streaming_worker(**kwargs) -> StreamedSymbol:
+    """
+    run_symbol_pipeline_worker + the peak RSS of the (fresh) worker.
+    """
+    result = run_symbol_pipeline_worker(**kwargs)
+    return StreamedSymbol(result=result, peak_rss_mb=peak_rss_mb())
+
+
+@dataclass(frozen=True)
+class StreamReport:
+    tasks: int
+    budget_mb: float
+    max_concurrent: int
+    max_in_flight_mb: float          # estimated, at admission
+    max_worker_peak_mb: float | None  # measured
+    wall_s: float
+
+
+class MemoryBudget:
+    """
+    Worker memory model: base_mb + bars / 1000 * mb_per_1k_bars.
+
+    mb_per_1k_bars only grows: every measured worker peak above the
+    estimate raises it (conservative for the remaining symbols).
+    """
+
+    def __init__(
+        self,
+        budget_mb: float,
+        *,
+        base_mb: float = DEFAULT_BASE_MB,
+        mb_per_1k_bars: float = DEFAULT_MB_PER_1K_BARS,
+    ):
+        if budget_mb <= 0:
+            raise ValueError("budget_mb must be positive")
+        self.budget_mb = float(budget_mb)
+        self.base_mb = float(base_mb)
+        self.mb_per_1k_bars = float(mb_per_1k_bars)
+
+    def estimate_mb(self, bars: int) -> float:
+        return self.base_mb + bars / 1000 * self.mb_per_1k_bars
+
+    def observe(self, bars: int, peak_mb: float | None) -> None:
+        if peak_mb is None or bars <= 0:
+            return
+        rate = (peak_mb - self.base_mb) / (bars / 1000)
+        self.mb_per_1k_bars = max(self.mb_per_1k_bars, rate)
+
+    def admits(self, in_flight_mb: float, n_in_flight: int, bars: int) -> bool:
+        # an oversized task still runs, alone
+        return n_in_flight == 0 or in_flight_mb + self.estimate_mb(bars) <= self.budget_mb
+
+
+class StreamingExecutor:
+    """
+    Runs per-symbol tasks under a memory budget.
+
+    - a task is admitted only while the estimated memory of all running
+      tasks stays within the budget (and below max_workers)
+    - every task gets a fresh (spawned) worker process, max_tasks_per_child=1, so
+      its frames are returned to the OS when it finishes
+    - results are handed to on_result as they arrive; the caller keeps
+      only what it needs
+    """
+
+    def __init__(
+        self,
+        *,
+        budget: MemoryBudget,
+        max_workers: int = 1,
+        logger=None,
+    ):
+        self.budget = budget
+        self.max_workers = max(int(max_workers), 1)
+        self.logger = logger or NullLogger()
+
+    def run(
+        self,
+        fn: Callable[..., StreamedSymbol],
+        tasks: list[ScheduledTask],
+        on_result: Callable[[ScheduledTask, StreamedSymbol], None],
+    ) -> StreamReport:
+        # largest first: oversized symbols start while the pool is empty
+        pending = sorted(tasks, key=lambda t: -t.bars)
+
+        t0 = time.time()
+        max_concurrent = 0
+        max_in_flight = 0.0
+        max_peak: float | None = None
+
+        def done(task, out, per_task_peak=True):
+            nonlocal max_peak
+            if per_task_peak:
+                self.budget.observe(task.bars, out.peak_rss_mb)
+            if out.peak_rss_mb is not None:
+                max_peak = max(max_peak or 0.0, out.peak_rss_mb)
+            on_result(task, out)
+
+        if self.max_workers == 1:
+            for task in pending:
+                max_concurrent = 1
+                max_in_flight = max(max_in_flight, self.budget.estimate_mb(task.bars))
+                # in-process: peak RSS is the parent's, not the task's
+                done(task, fn(**task.kwargs), per_task_peak=False)
+        else:
+            in_flight: dict = {}
+            with process_pool(self.max_workers, max_tasks_per_child=1) as executor:
+                while pending or in_flight:
+                    used = sum(mb for _, mb in in_flight.values())
+                    while (
+                        pending
+                        and len(in_flight) < self.max_workers
+                        and self.budget.admits(used, len(in_flight), pending[0].bars)
+                    ):
+                        task = pending.pop(0)
+                        mb = self.budget.estimate_mb(task.bars)
+                        if mb > self.budget.budget_mb:
+                            self.logger.log(
+                                f"{task.key:<12} | estimate {mb:,.0f}MB exceeds budget, running alone"
+                            )
+                        in_flight[executor.submit(fn, **task.kwargs)] = (task, mb)
+                        used += mb
+
+                    max_concurrent = max(max_concurrent, len(in_flight))
+                    max_in_flight = max(max_in_flight, used)
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for f in finished:
+                        task, _ = in_flight.pop(f)
+                        done(task, f.result())
+
+        return StreamReport(
+            tasks=len(tasks),
+            budget_mb=self.budget.budget_mb,
+            max_concurrent=max_concurrent,
+            max_in_flight_mb=max_in_flight,
+            max_worker_peak_mb=max_peak,
+            wall_s=time.time() - t0,
+        )
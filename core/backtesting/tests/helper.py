@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from core.reporting.core.context import ContextSpec
+from core.strategy.base import BaseStrategy
+
+
+def random_market(n=600, seed=7):
+    """
+    Random-walk OHLC frame with ~15% fixed-exit plans (3 entry tags).
+    """
+    rng = np.random.default_rng(seed)
+
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0004, n))
+    high = close + rng.uniform(0, 0.0008, n)
+    low = close - rng.uniform(0, 0.0008, n)
+
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="15min", tz="UTC"),
+        "open": close,
+        "high": high,
+        "low": low,
+        "close": close,
+        "signal_entry": None,
+        "symbol": "EURUSD",
+    })
+
+    valid = rng.random(n) < 0.15
+    direction = np.where(rng.random(n) < 0.5, "long", "short")
+    sign = np.where(direction == "long", 1.0, -1.0)
+    risk = rng.uniform(0.0005, 0.003, n)
+
+    plans = pd.DataFrame({
+        "plan_valid": valid,
+        "plan_direction": direction,
+        "plan_entry_tag": rng.choice(["A", "B", "C"], n),
+        "plan_sl": close - sign * risk,
+        "plan_tp1": close + sign * risk,
+        "plan_tp2": close + sign * risk * 2,
+        "plan_sl_tag": "sl",
+        "plan_tp1_tag": "tp1",
+        "plan_tp2_tag": "tp2",
+    })
+    return df, plans
+
+
+class BreakoutStrategy(BaseStrategy):
+    strategy_config = {"WINDOW": 20, "TP_R": 1.0, "SL_PAD": 0.0}
+    feature_params = ("WINDOW",)
+
+    def populate_indicators(self):
+        w = self.strategy_config["WINDOW"]
+        self.df["hh"] = self.df["high"].rolling(w).max().shift(1)
+        self.df["ll"] = self.df["low"].rolling(w).min().shift(1)
+
+    def populate_entry_trend(self):
+        df = self.df
+        long = (df["close"] > df["hh"]).to_numpy()
+        short = (df["close"] < df["ll"]).to_numpy()
+        self.set_entry_signals(long, direction="long", tag="BO_L")
+        self.set_entry_signals(short, direction="short", tag="BO_S")
+
+        pad = self.strategy_config["SL_PAD"]
+        r = self.strategy_config["TP_R"]
+        close = df["close"].to_numpy()
+        sl_long = df["ll"].to_numpy() - pad
+        sl_short = df["hh"].to_numpy() + pad
+        self.set_levels(
+            long,
+            sl=sl_long,
+            tp1=close + (close - sl_long) * r,
+            tp2=close + (close - sl_long) * 2 * r,
+        )
+        self.set_levels(
+            short,
+            sl=sl_short,
+            tp1=close - (sl_short - close) * r,
+            tp2=close - (sl_short - close) * 2 * r,
+        )
+
+    def populate_exit_trend(self):
+        pass
+
+
+def market_data(symbol, n=1500, seed=0):
+    """
+    {"M1": frame}: geometric random walk around a symbol-like price.
+    """
+    rng = np.random.default_rng(seed)
+    close = (1.10 if symbol == "EURUSD" else 2000.0) * np.exp(np.cumsum(rng.normal(0, 4e-4, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 3e-4, n)) * close
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="1min", tz="UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": 1.0,
+    })
+    return {"M1": df}
+
+
+class ReportedBreakout(BreakoutStrategy):
+    def build_report_spec(self):
+        return (
+            super()
+            .build_report_spec()
+            .add_context(ContextSpec(name="breakout high", column="hh", source="entry_candle"))
+            .add_context(ContextSpec(name="breakout low", column="ll", source="entry_candle"))
+        )
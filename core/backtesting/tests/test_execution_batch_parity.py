@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.engine.execution_batch import run_execution_batch
+from core.backtesting.engine.execution_loop import run_execution_loop
+from core.backtesting.tests.helper import random_market
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_batch_matches_loop(seed, instrument_ctx):
+    df, plans = random_market(seed=seed)
+
+    ref = pd.DataFrame(
+        run_execution_loop(df=df, symbol="EURUSD", plans=plans, instrument_ctx=instrument_ctx)
+    )
+    out = run_execution_batch(df=df, symbol="EURUSD", plans=plans, instrument_ctx=instrument_ctx)
+
+    assert len(ref) == len(out) > 0
+    assert list(out.columns) == list(ref.columns)
+
+    for col in ("direction", "entry_tag", "exit_tag", "exit_level_tag"):
+        assert out[col].tolist() == ref[col].tolist(), col
+
+    for col in ("entry_time", "exit_time"):
+        assert (out[col].values == ref[col].values).all(), col
+    assert out["tp1_time"].isna().tolist() == ref["tp1_time"].isna().tolist()
+
+    for col in ("entry_price", "exit_price", "position_size", "pnl_usd", "returns", "tp1_pnl", "duration"):
+        np.testing.assert_allclose(
+            out[col].to_numpy(dtype=float),
+            ref[col].to_numpy(dtype=float),
+            rtol=1e-12,
+            atol=1e-12,
+            err_msg=col,
+        )
+
+
+def test_backtester_batch_and_loop_costs_match():
+    df, plans = random_market(seed=3)
+
+    batch = Backtester().run(signals_df=df, trade_plans=plans)
+    loop = Backtester(execution_mode="loop").run(signals_df=df, trade_plans=plans)
+
+    assert len(batch) == len(loop) > 0
+
+    for col in ("exec_type_entry", "exec_type_exit"):
+        assert batch[col].tolist() == loop[col].tolist(), col
+
+    for col in (
+        "traded_volume_usd_total",
+        "spread_usd_total",
+        "slippage_usd_total",
+        "financing_usd_total",
+        "costs_usd_total",
+        "pnl_net_usd",
+    ):
+        np.testing.assert_allclose(
+            batch[col].to_numpy(dtype=float),
+            loop[col].to_numpy(dtype=float),
+            rtol=1e-12,
+            atol=1e-12,
+            err_msg=col,
+        )
+
+
+def test_batch_no_valid_plans(base_df, long_plan, instrument_ctx):
+    plans = long_plan.copy()
+    plans["plan_valid"] = False
+
+    out = run_execution_batch(df=base_df, symbol="EURUSD", plans=plans, instrument_ctx=instrument_ctx)
+
+    assert out.empty
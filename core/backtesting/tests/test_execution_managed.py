@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.engine.execution_batch import run_execution_batch
+from core.strategy.signals import write_exit_signals, write_trailing_stops
+
+
+def _managed(plans, trail_from="entry", be_on_tp1=True):
+    plans = plans.copy()
+    plans["plan_exit_mode"] = np.where(plans["plan_valid"], "managed", None)
+    plans["plan_trail_from"] = np.where(plans["plan_valid"], trail_from, None)
+    plans["plan_be_on_tp1"] = be_on_tp1
+    plans["plan_tp2"] = np.nan
+    return plans
+
+
+def _run(df, plans, instrument_ctx):
+    return run_execution_batch(
+        df=df, symbol="EURUSD", plans=plans, instrument_ctx=instrument_ctx
+    ).iloc[0]
+
+
+def test_long_trailing_from_entry_exits_on_trailed_sl(base_df, long_plan, instrument_ctx):
+    df = base_df.copy()
+    df["high"] = 1.06
+    df["low"] = 1.0
+    df.loc[4, "low"] = 1.01
+
+    plans = _managed(long_plan)
+    plans["plan_tp1"] = 10.0
+    write_trailing_stops(df, long=np.array([np.nan, np.nan, 0.95, 1.02, np.nan, np.nan]))
+
+    trade = _run(df, plans, instrument_ctx)
+
+    assert trade["exit_tag"] == "TRAIL"
+    assert trade["exit_level_tag"] == "TRAIL"
+    assert trade["exit_time"] == df.loc[4, "time"]
+    assert trade["exit_price"] == pytest.approx(1.02 - instrument_ctx.slippage_abs)
+
+
+def test_trailing_from_tp1_waits_for_tp1(base_df, long_plan, instrument_ctx):
+    df = base_df.copy()
+    df["high"] = 1.06
+    df["low"] = 1.0
+    df.loc[3, "low"] = 0.95
+
+    plans = _managed(long_plan, trail_from="tp1")
+    plans["plan_tp1"] = 10.0
+    plans["plan_sl"] = 0.96
+    write_trailing_stops(df, long=1.02)
+
+    trade = _run(df, plans, instrument_ctx)
+
+    assert trade["exit_tag"] == "SL"
+    assert trade["exit_price"] == pytest.approx(0.96 - instrument_ctx.slippage_abs)
+
+
+def test_signal_exit_closes_at_bar_close(base_df, long_plan, instrument_ctx):
+    df = base_df.copy()
+    df["close"] = [1.0, 1.05, 1.05, 1.08, 1.05, 1.05]
+    df["low"] = 1.0
+
+    plans = _managed(long_plan, trail_from=None)
+    plans["plan_tp1"] = 10.0
+    write_exit_signals(df, np.arange(6) == 3, entry_tag="L1", exit_tag="ribbon flip")
+    write_exit_signals(df, np.arange(6) == 2, entry_tag="OTHER")
+
+    trade = _run(df, plans, instrument_ctx)
+
+    assert trade["exit_tag"] == "MANAGED_EXIT"
+    assert trade["exit_level_tag"] == "ribbon flip"
+    assert trade["exit_time"] == df.loc[3, "time"]
+    assert trade["exit_price"] == pytest.approx(1.08 - instrument_ctx.slippage_abs)
+
+
+def test_short_tp1_then_trailing(base_df, short_plan, instrument_ctx):
+    df = base_df.copy()
+    df["close"] = 1.02
+    df["high"] = 1.025
+    df["low"] = 1.015
+    df.loc[1, "close"] = 1.05    # entry
+    df.loc[2, "low"] = 0.99      # TP1 (1.0)
+    df.loc[4, "high"] = 1.035    # hits trailed SL
+
+    plans = _managed(short_plan, trail_from="tp1")
+    write_trailing_stops(df, short=1.03)
+
+    trade = _run(df, plans, instrument_ctx)
+
+    assert trade["tp1_price"] == pytest.approx(1.0)
+    assert trade["exit_tag"] == "TRAIL"
+    assert trade["exit_time"] == df.loc[4, "time"]
+    assert trade["exit_price"] == pytest.approx(1.03 + instrument_ctx.slippage_abs)
+
+
+def test_loop_mode_rejects_managed_plans(base_df, long_plan):
+    with pytest.raises(ValueError):
+        Backtester(execution_mode="loop").run(
+            signals_df=base_df,
+            trade_plans=_managed(long_plan),
+        )
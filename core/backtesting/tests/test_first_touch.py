@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from core.backtesting.exit.first_touch import (
+    FirstTouchIndex,
+    build_max_tree,
+    simulate_exit_indexed_numba,
+)
+from core.backtesting.exit.simulate_exit_numba import simulate_exit_pos_numba
+
+
+def _brute_first(mask, start):
+    hits = np.flatnonzero(mask[start:])
+    return int(hits[0]) + start if len(hits) else -1
+
+
+@pytest.mark.parametrize("n", [1, 7, 64, 333])
+def test_first_touch_matches_linear_scan(n):
+    rng = np.random.default_rng(n)
+    high = rng.normal(0, 1, n)
+    low = high - rng.uniform(0, 1, n)
+
+    idx = FirstTouchIndex(high, low)
+
+    for _ in range(200):
+        start = int(rng.integers(0, n + 2))
+        x = float(rng.normal(0, 1.5))
+
+        assert idx.first_high_ge(start, x) == _brute_first(high >= x, start)
+        assert idx.first_low_le(start, x) == _brute_first(low <= x, start)
+
+
+def test_first_touch_nan_level_never_hits():
+    idx = FirstTouchIndex(np.array([1.0, 2.0]), np.array([0.0, 1.0]))
+
+    assert idx.first_high_ge(0, np.nan) == -1
+    assert idx.first_low_le(0, np.nan) == -1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_indexed_exit_matches_linear_exit(seed):
+    rng = np.random.default_rng(seed)
+    n = 800
+
+    close = 1.0 + np.cumsum(rng.normal(0, 0.001, n))
+    high = close + rng.uniform(0, 0.002, n)
+    low = close - rng.uniform(0, 0.002, n)
+
+    high_tree = build_max_tree(high)
+    neg_low_tree = build_max_tree(-low)
+
+    for _ in range(300):
+        direction = 1 if rng.random() < 0.5 else -1
+        entry_pos = int(rng.integers(0, n))
+        entry = close[entry_pos]
+        risk = float(rng.uniform(0.0005, 0.02))
+
+        args = (
+            direction,
+            entry_pos,
+            entry,
+            entry - direction * risk,
+            entry + direction * risk,
+            entry + direction * risk * 2,
+            high,
+            low,
+            close,
+        )
+
+        expected = simulate_exit_pos_numba(*args, 0.0001)
+        got = simulate_exit_indexed_numba(*args, high_tree, neg_low_tree, 0.0001)
+
+        assert got == expected
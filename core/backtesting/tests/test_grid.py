@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.grid import ExitGrid, run_exit_grid
+from core.backtesting.tests.helper import random_market
+
+
+def test_identity_combo_matches_backtester():
+    df, plans = random_market(seed=9)
+
+    trades = Backtester().run(signals_df=df, trade_plans=plans)
+    table = run_exit_grid(signals_df=df, trade_plans=plans, grid=ExitGrid())
+
+    assert len(table) == 1
+    row = table.iloc[0]
+
+    assert row["trades"] == len(trades)
+    assert row["pnl_usd"] == pytest.approx(trades["pnl_usd"].sum(), rel=1e-9)
+    assert row["pnl_net_usd"] == pytest.approx(trades["pnl_net_usd"].sum(), rel=1e-9)
+    assert row["expectancy_r"] == pytest.approx(trades["returns"].mean(), rel=1e-9)
+    assert row["win_rate"] == pytest.approx((trades["pnl_usd"] > 0).mean())
+
+
+def test_identity_combo_includes_financing():
+    df, plans = random_market(seed=9)
+    df["symbol"] = "XAUUSD"
+
+    trades = Backtester().run(signals_df=df, trade_plans=plans)
+    table = run_exit_grid(signals_df=df, trade_plans=plans, grid=ExitGrid())
+
+    assert trades["financing_usd_total"].sum() > 0
+    assert table.iloc[0]["pnl_net_usd"] == pytest.approx(trades["pnl_net_usd"].sum(), rel=1e-9)
+
+
+def test_managed_plans_are_rejected():
+    df, plans = random_market(seed=9)
+    plans["plan_exit_mode"] = np.where(plans["plan_valid"], "fixed", None)
+    plans.loc[plans.index[plans["plan_valid"]][0], "plan_exit_mode"] = "managed"
+
+    with pytest.raises(ValueError, match="managed"):
+        run_exit_grid(signals_df=df, trade_plans=plans, grid=ExitGrid())
+
+
+def test_grid_evaluates_every_combination():
+    df, plans = random_market(seed=2)
+
+    grid = ExitGrid(
+        sl_mult=(0.5, 1.0, 2.0),
+        tp1_mult=(1.0, 1.5),
+        tp2_mult=(1.0, 3.0),
+        tp1_ratio=(0.3, 0.5),
+        slippage_abs=(0.0, 0.0001),
+    )
+    table = run_exit_grid(signals_df=df, trade_plans=plans, grid=grid)
+
+    assert len(table) == len(grid) == 48
+    assert (table["trades"] > 0).all()
+    assert table[["sl_mult", "tp1_mult", "tp2_mult", "tp1_ratio", "slippage_abs"]].drop_duplicates().shape[0] == 48
+    assert table["pnl_usd"].nunique() > 1
+    assert np.isfinite(table["max_drawdown_usd"]).all()
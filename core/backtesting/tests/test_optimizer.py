@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.optimize import worker
+from core.backtesting.optimize.optimizer import StrategyOptimizer
+from core.backtesting.optimize.space import ParamSpace
+from core.backtesting.optimize.store import OptimizationStore
+from core.backtesting.strategy_runner import strategy_orchestration
+from core.backtesting.tests.helper import BreakoutStrategy, market_data
+
+
+@pytest.fixture
+def data():
+    return {"EURUSD": market_data("EURUSD", seed=1), "XAUUSD": market_data("XAUUSD", seed=2)}
+
+
+@pytest.fixture
+def space():
+    return ParamSpace({"WINDOW": [10, 30], "TP_R": [0.5, 1.0, 2.0], "SL_PAD": [0.0]})
+
+
+def _optimizer(data, **kwargs):
+    return StrategyOptimizer(
+        strategy_cls=BreakoutStrategy,
+        data=data,
+        startup_candle_count=50,
+        max_workers=1,
+        **kwargs,
+    )
+
+
+def test_param_space_sample_is_distinct_subset(space):
+    grid = space.grid()
+    sample = space.sample(4, seed=3)
+
+    assert len(grid) == len(space) == 6
+    assert len(sample) == 4
+    assert all(c in grid for c in sample)
+    assert len({tuple(c.items()) for c in sample}) == 4
+    assert space.sample(100) == grid
+
+
+def test_grid_reuses_features_per_feature_key(data, space):
+    worker._FEATURE_CACHE.clear()
+    misses = worker._FEATURE_CACHE.misses
+
+    result = _optimizer(data).grid(space)
+
+    # 2 symbols x 2 WINDOW values, shared by the 3 TP_R values
+    assert worker._FEATURE_CACHE.misses - misses == 4
+    assert len(result.table) == 6
+    assert result.table["strategy_id"].is_unique
+    assert result.n_evaluations == 6
+    assert result.configs_per_minute > 0
+
+    metric = result.table["pnl_net_usd"].to_numpy()
+    assert (np.diff(metric) <= 0).all()
+
+
+def test_grid_row_matches_direct_backtest(data, space):
+    table = _optimizer(data).grid(space).table
+    config = {"WINDOW": 30, "TP_R": 2.0, "SL_PAD": 0.0}
+
+    trades = []
+    for symbol, data_by_tf in data.items():
+        run = strategy_orchestration(
+            symbol=symbol,
+            data_by_tf=data_by_tf,
+            strategy_cls=BreakoutStrategy,
+            startup_candle_count=50,
+            strategy_config=config,
+        )
+        trades.append(Backtester().run(signals_df=run.df_signals, trade_plans=run.trade_plans))
+        strategy_id = run.strategy_id
+
+    trades = pd.concat(trades)
+    row = table.set_index("strategy_id").loc[strategy_id]
+
+    assert row["trades"] == len(trades)
+    assert row["pnl_net_usd"] == pytest.approx(trades["pnl_net_usd"].sum())
+    assert row["TP_R"] == 2.0
+
+
+def test_process_pool_matches_inline(data, space):
+    inline = _optimizer(data).grid(space).table
+    pooled = StrategyOptimizer(
+        strategy_cls=BreakoutStrategy,
+        data=data,
+        startup_candle_count=50,
+        max_workers=2,
+    ).grid(space).table
+
+    cols = ["strategy_id", "trades", "pnl_net_usd"]
+    pd.testing.assert_frame_equal(
+        inline[cols].sort_values("strategy_id").reset_index(drop=True),
+        pooled[cols].sort_values("strategy_id").reset_index(drop=True),
+    )
+
+
+def test_pool_tasks_carry_only_the_data_key(data, space, monkeypatch):
+    from concurrent.futures import Future
+    from contextlib import contextmanager
+
+    from core.backtesting.optimize.features import data_token
+
+    submitted = []
+
+    class InlinePool:
+        def submit(self, fn, **task):
+            submitted.append(task)
+            future = Future()
+            future.set_result(fn(**task))
+            return future
+
+    @contextmanager
+    def executor():
+        worker.init_config_worker({(s, data_token(d)): d for s, d in data.items()})
+        try:
+            yield InlinePool()
+        finally:
+            worker.init_config_worker({})
+
+    opt = _optimizer(data)
+    monkeypatch.setattr(opt, "_executor", executor)
+    pooled = opt.grid(space).table
+    inline = _optimizer(data).grid(space).table
+
+    assert submitted
+    assert all("data_by_tf" not in task for task in submitted)
+    cols = ["strategy_id", "trades", "pnl_net_usd"]
+    pd.testing.assert_frame_equal(inline[cols], pooled[cols])
+
+
+def test_successive_halving_promotes_best(data, space):
+    result = _optimizer(data).successive_halving(space, eta=2, min_fraction=0.25)
+
+    table = result.table
+    assert len(table) == 6
+    # 6 -> 3 -> 2 configs at fractions 0.25, 0.5, 1.0
+    assert result.n_evaluations == 6 + 3 + 2
+    assert (table["budget_fraction"] == 1.0).sum() == 2
+    assert table.iloc[0]["budget_fraction"] == 1.0
+
+
+def test_store_roundtrip_and_query(tmp_path, data, space):
+    result = _optimizer(data, metric="expectancy_r").random(space, n=4, seed=0)
+
+    store = OptimizationStore(tmp_path)
+    store.save(result)
+
+    loaded = store.load(result.run_id)
+    assert store.list_runs() == [result.run_id]
+    assert loaded.metric == "expectancy_r"
+    assert loaded.table["strategy_id"].tolist() == result.table["strategy_id"].tolist()
+
+    q = store.query(result.run_id, "WINDOW == 10")
+    assert set(q["WINDOW"]) <= {10}
+
+
+def test_config_without_trades_scores_zero(data):
+    # breakout window longer than the data -> no signals
+    space = ParamSpace({"WINDOW": [5000], "TP_R": [1.0], "SL_PAD": [0.0]})
+
+    row = _optimizer(data).grid(space).table.iloc[0]
+
+    assert row["trades"] == 0
+    assert row["pnl_net_usd"] == 0.0
+
+
+def test_successive_halving_never_ranks_eliminated_config_first(data, monkeypatch):
+    space = ParamSpace({"WINDOW": [10], "TP_R": [0.5, 1.0, 2.0, 3.0], "SL_PAD": [0.0]})
+    # TP_R 0.5 has the best score of any row but is dropped after round 1
+    scores = {
+        0.25: {0.5: 100.0, 1.0: 200.0, 2.0: 150.0, 3.0: 50.0},
+        0.5: {1.0: 20.0, 2.0: 30.0},
+        1.0: {2.0: 10.0},
+    }
+    opt = _optimizer(data)
+
+    def fake_evaluate(configs, fraction, executor):
+        return pd.DataFrame([
+            {
+                "strategy_id": opt._probe(c).get_strategy_id(),
+                **c,
+                "budget_fraction": fraction,
+                "pnl_net_usd": scores[fraction][c["TP_R"]],
+            }
+            for c in configs
+        ])
+
+    monkeypatch.setattr(opt, "_evaluate", fake_evaluate)
+    result = opt.successive_halving(space, eta=2, min_fraction=0.25)
+
+    assert result.best(1).iloc[0]["TP_R"] == 2.0
+    assert result.table["TP_R"].tolist() == [2.0, 1.0, 0.5, 3.0]
@@ -0,0 +1,195 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.pipeline import (
+    DataSpec,
+    estimate_bars,
+    merge_symbol_results,
+    merge_time_chunks,
+    run_symbol_pipeline_worker,
+    split_time_chunks,
+)
+from core.backtesting.scheduler import ScheduledTask
+from core.backtesting.strategy_runner import strategy_orchestration
+from core.backtesting.tests.helper import BreakoutStrategy, ReportedBreakout, market_data
+from core.reporting.core.contex_enricher import TradeContextEnricher, context_projection
+from core.reporting.core.context import ContextSpec
+
+
+def test_fused_worker_matches_staged_run():
+    data_by_tf = market_data("EURUSD", seed=5)
+
+    staged = strategy_orchestration(
+        symbol="EURUSD",
+        data_by_tf=data_by_tf,
+        strategy_cls=ReportedBreakout,
+        startup_candle_count=50,
+    )
+    expected = Backtester().run(signals_df=staged.df_signals, trade_plans=staged.trade_plans)
+
+    fused = run_symbol_pipeline_worker(
+        symbol="EURUSD",
+        strategy_cls=ReportedBreakout,
+        startup_candle_count=50,
+        data_by_tf=data_by_tf,
+    )
+
+    assert fused.strategy_id == staged.strategy_id
+    assert not fused.report_written
+    pd.testing.assert_frame_equal(fused.trades, expected)
+
+    # projection: only the columns/rows reporting needs ...
+    assert list(fused.df_context.columns) == ["time", "hh", "ll"]
+    assert len(fused.df_context) <= len(expected)
+
+    # ... and the same enrichment as the full context frame
+    contexts = staged.report_spec.contexts
+    pd.testing.assert_frame_equal(
+        TradeContextEnricher(fused.df_context).enrich(expected, contexts),
+        TradeContextEnricher(staged.df_context).enrich(expected, contexts),
+    )
+
+
+def test_context_projection_without_entries_keeps_all_rows():
+    df = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=4, freq="1h", tz="UTC"),
+        "a": [1, 2, 3, 4],
+        "b": [0, 0, 0, 0],
+    })
+    spec = [ContextSpec(name="A", column="a", source="entry_candle")]
+
+    out = context_projection(df, spec)
+
+    assert list(out.columns) == ["time", "a"]
+    assert len(out) == 4
+
+
+def test_worker_needs_exactly_one_data_source():
+    with pytest.raises(ValueError):
+        run_symbol_pipeline_worker(
+            symbol="EURUSD",
+            strategy_cls=ReportedBreakout,
+            startup_candle_count=0,
+        )
+
+
+def test_report_worker_on_projection_matches_full_context(tmp_path):
+    import json
+
+    import config.backtest as cfg
+    from core.backtesting.engine.worker import run_report_worker, run_summary_worker
+    from core.backtesting.pipeline import config_snapshot
+    from core.backtesting.results_logic.metadata import BacktestMetadata
+
+    run = strategy_orchestration(
+        symbol="EURUSD",
+        data_by_tf=market_data("EURUSD", seed=5),
+        strategy_cls=ReportedBreakout,
+        startup_candle_count=50,
+    )
+    trades = Backtester().run(signals_df=run.df_signals, trade_plans=run.trade_plans)
+    assert not trades.empty
+
+    config = config_snapshot(cfg)
+    metadata = BacktestMetadata.now(
+        run_id="test",
+        backtest_mode="single",
+        windows=None,
+        strategies=[run.strategy_id],
+        strategy_names={run.strategy_id: run.strategy_name},
+        symbols=["EURUSD"],
+        timeframe="M5",
+        initial_balance=cfg.INITIAL_BALANCE,
+        slippage=cfg.SLIPPAGE,
+        max_risk_per_trade=cfg.MAX_RISK_PER_TRADE,
+    )
+
+    reports = {}
+    for name, df_context in {
+        "full": run.df_context,
+        "projection": context_projection(
+            run.df_context, run.report_spec.contexts, entry_times=trades["entry_time"]
+        ),
+    }.items():
+        seconds = run_report_worker(
+            trades=trades,
+            df_context=df_context,
+            report_spec=run.report_spec,
+            metadata=metadata,
+            config=config,
+            run_path=tmp_path / name,
+        )
+        assert seconds > 0
+        path = tmp_path / name / "report" / "test" / "report.json"
+        reports[name] = json.loads(path.read_text())
+
+    assert reports["projection"] == reports["full"]
+
+    run_summary_worker(
+        runs=[SimpleNamespace(symbol="EURUSD", strategy_id=run.strategy_id)],
+        trades_by_run=[trades],
+        config=config,
+        run_path=tmp_path,
+    )
+    assert (tmp_path / "summary" / "report.json").exists()
+
+
+class LongBreakout(BreakoutStrategy):
+    # far targets: trades run across chunk boundaries
+    strategy_config = {"WINDOW": 20, "TP_R": 4.0, "SL_PAD": 0.0}
+
+
+class _SliceProvider:
+    def __init__(self, spec, df):
+        self.spec = spec
+        self.df = df
+
+    def fetch(self, symbol):
+        start = self.spec.start - pd.Timedelta(minutes=self.spec.startup_candle_count)
+        time = self.df["time"]
+        return {"M1": self.df[(time >= start) & (time <= self.spec.end)].reset_index(drop=True)}
+
+
+def _by_entry(trades):
+    return trades.sort_values(["entry_time", "direction"], kind="mergesort").reset_index(drop=True)
+
+
+def test_time_chunks_merge_to_the_unsplit_run(monkeypatch):
+    df = market_data("EURUSD", n=3000, seed=5)["M1"]
+    monkeypatch.setattr(DataSpec, "provider", lambda self, logger: _SliceProvider(self, df))
+
+    spec = DataSpec(
+        backend="dukascopy",
+        market_data_path="",
+        start=df["time"].iloc[50],
+        end=df["time"].iloc[-1],
+        timeframes=("M1",),
+        startup_candle_count=50,
+    )
+    kwargs = dict(
+        symbol="EURUSD",
+        strategy_cls=LongBreakout,
+        startup_candle_count=50,
+        data_spec=spec,
+        report_job=None,
+    )
+    unsplit = _by_entry(run_symbol_pipeline_worker(**kwargs).trades)
+
+    task = ScheduledTask(key="EURUSD", symbol="EURUSD", bars=estimate_bars(spec), kwargs=kwargs)
+    chunks = split_time_chunks(task, 4, tail="30min")
+    results = {c.key: run_symbol_pipeline_worker(**c.kwargs) for c in chunks}
+
+    # the fixture has trades open across a chunk boundary ...
+    bounds = [c.kwargs["entry_start"].tz_localize(None) for c in chunks[1:]]
+    assert any(((unsplit["entry_time"] < b) & (unsplit["exit_time"] > b)).any() for b in bounds)
+
+    # ... so plain concatenation diverges ...
+    naive = _by_entry(merge_symbol_results(list(results.values())).trades)
+    assert not naive[["entry_time", "exit_time"]].equals(unsplit[["entry_time", "exit_time"]])
+
+    # ... and carrying the state across chunks does not
+    merged = _by_entry(merge_time_chunks(chunks, results, end=spec.end).trades)
+    pd.testing.assert_frame_equal(merged, unsplit)
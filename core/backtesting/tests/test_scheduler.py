@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+from core.backtesting.scheduler import (
+    DEFAULT_SECONDS_PER_BAR,
+    CostScheduler,
+    ScheduledTask,
+    TimingStore,
+)
+
+
+def _work(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _task(key, bars, seconds=0.0):
+    return ScheduledTask(key=key, symbol=key, bars=bars, kwargs=dict(seconds=seconds, value=key))
+
+
+def _halves(task, n):
+    return [
+        ScheduledTask(
+            key=f"{task.key}#{i}",
+            symbol=task.symbol,
+            bars=task.bars // n,
+            kwargs=dict(task.kwargs, value=f"{task.key}#{i}"),
+        )
+        for i in range(n)
+    ]
+
+
+def test_timing_store_ema_and_fallback(tmp_path):
+    path = tmp_path / "timings.json"
+    store = TimingStore(path, alpha=0.5)
+
+    assert store.seconds_per_bar("fused", "S", "XAUUSD") == DEFAULT_SECONDS_PER_BAR
+
+    store.update("fused", "S", "XAUUSD", bars=1000, seconds=2.0)
+    store.update("fused", "S", "XAUUSD", bars=1000, seconds=4.0)
+    store.update("fused", "S", "EURUSD", bars=1000, seconds=1.0)
+    store.save()
+
+    reloaded = TimingStore(path)
+    assert reloaded.seconds_per_bar("fused", "S", "XAUUSD") == pytest.approx(0.003)
+    # unknown symbol -> median of known rates of the stage
+    assert reloaded.seconds_per_bar("fused", "S", "GBPJPY") == pytest.approx(0.002)
+    assert reloaded.seconds_per_bar("backtest", "S", "XAUUSD") == DEFAULT_SECONDS_PER_BAR
+
+
+def test_plan_is_longest_first_using_history(tmp_path):
+    store = TimingStore(tmp_path / "t.json")
+    store.update("fused", "S", "SLOW", bars=100, seconds=10.0)
+    store.update("fused", "S", "FAST", bars=100, seconds=0.1)
+
+    scheduler = CostScheduler(stage="fused", strategy="S", max_workers=2, timing_store=store)
+    planned = scheduler.plan([_task("FAST", 10_000), _task("SLOW", 1_000), _task("MID", 500)])
+
+    # SLOW: 1000 * 0.1 s/bar, MID (unknown): 500 * median 0.0505, FAST: 10000 * 0.001
+    assert [t.key for t in planned] == ["SLOW", "MID", "FAST"]
+    assert planned[0].cost == pytest.approx(100.0)
+
+
+def test_oversized_task_is_split_into_chunks():
+    scheduler = CostScheduler(stage="x", strategy="S", max_workers=4, max_chunks=3)
+
+    planned = scheduler.plan(
+        [_task("BIG", 10_000), _task("A", 1_000), _task("B", 1_000)],
+        split=_halves,
+    )
+
+    chunks = [t for t in planned if t.parent == "BIG"]
+    # share = 12000/4 = 3000 bars -> ceil(10000/3000)=4, capped at 3
+    assert len(chunks) == 3
+    assert all(t.parent is None for t in planned if t.symbol != "BIG")
+    assert [t.cost for t in planned] == sorted((t.cost for t in planned), reverse=True)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_returns_every_result_and_reports_utilization(tmp_path, workers):
+    store = TimingStore(tmp_path / "t.json")
+    scheduler = CostScheduler(stage="x", strategy="S", max_workers=workers, timing_store=store)
+
+    tasks = [_task("A", 300, 0.15), _task("B", 100, 0.05), _task("C", 100, 0.05)]
+    seen = []
+    results, report = scheduler.run(_work, tasks, on_result=lambda t, r: seen.append(t.key))
+
+    assert results == {"A": "A", "B": "B", "C": "C"}
+    assert sorted(seen) == ["A", "B", "C"]
+    assert list(report.tasks["key"]) == ["A", "B", "C"]
+    assert report.busy_s >= 0.25
+    assert 0 < report.utilization <= 1.0 + 1e-6
+    assert report.lower_bound_s <= report.wall_s + 1e-6
+    assert (tmp_path / "t.json").exists()
@@ -0,0 +1,157 @@
+import importlib
+import os
+
+import pandas as pd
+
+from core.backtesting.stage_cache import (
+    StageCache,
+    backtest_stage_key,
+    class_source_digest,
+    data_digest,
+    frame_digest,
+    source_digest,
+    strategy_stage_key,
+)
+
+
+def _frame(close=1.0):
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=3, freq="1min", tz="UTC"),
+        "close": [close, 2.0, 3.0],
+    })
+
+
+def test_put_get_roundtrip_and_counters(tmp_path):
+    cache = StageCache(tmp_path)
+
+    assert cache.get("trades", "ab" * 32) is None
+
+    cache.put("trades", "ab" * 32, _frame())
+    pd.testing.assert_frame_equal(cache.get("trades", "ab" * 32), _frame())
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (tmp_path / "trades" / "ab" / f"{'ab' * 32}.pkl").exists()
+
+
+def test_unloadable_entries_are_misses_and_deleted(tmp_path):
+    cache = StageCache(tmp_path)
+
+    truncated = cache._path("s", "aa" * 32)
+    truncated.parent.mkdir(parents=True)
+    truncated.write_bytes(b"\x80")
+
+    # pickle of a class whose module no longer exists
+    stale = cache._path("s", "bb" * 32)
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"cgone_module\nOld\n.")
+
+    # module exists, class was renamed
+    renamed = cache._path("s", "cc" * 32)
+    renamed.parent.mkdir(parents=True)
+    renamed.write_bytes(b"cos\nNoSuchClass\n.")
+
+    for path, key in ((truncated, "aa"), (stale, "bb"), (renamed, "cc")):
+        assert cache.get("s", key * 32) is None
+        assert not path.exists()
+
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_evicts_least_recently_used_by_size(tmp_path):
+    cache = StageCache(tmp_path)
+    for i, key in enumerate(("aa", "bb", "cc")):
+        cache.put("s", key * 32, _frame(float(i)))
+        path = cache._path("s", key * 32)
+        os.utime(path, (1_000 + i, 1_000 + i))
+
+    # "aa" used most recently
+    cache.get("s", "aa" * 32)
+
+    one = cache._path("s", "bb" * 32).stat().st_size
+    cache.max_bytes = 2 * one
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get("s", "bb" * 32) is None
+    assert cache.get("s", "aa" * 32) is not None
+    assert cache.get("s", "cc" * 32) is not None
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_digests_follow_content():
+    assert frame_digest(_frame()) == frame_digest(_frame())
+    assert frame_digest(_frame()) != frame_digest(_frame(close=1.5))
+
+    # index is not content
+    shifted = _frame()
+    shifted.index += 10
+    assert frame_digest(shifted) == frame_digest(_frame())
+
+    assert data_digest({"M1": _frame(), "H1": _frame()}) != data_digest({"M1": _frame()})
+
+
+def test_source_digest_tracks_file_changes(tmp_path):
+    pkg = tmp_path / "pkg"
+    (pkg / "tests").mkdir(parents=True)
+    (pkg / "a.py").write_text("X = 1\n")
+    (pkg / "tests" / "test_a.py").write_text("pass\n")
+
+    before = source_digest(("pkg",), tmp_path)
+
+    (pkg / "tests" / "test_a.py").write_text("assert True\n")
+    source_digest.cache_clear()
+    assert source_digest(("pkg",), tmp_path) == before
+
+    (pkg / "a.py").write_text("X = 2\n")
+    source_digest.cache_clear()
+    assert source_digest(("pkg",), tmp_path) != before
+
+
+def test_stage_keys_depend_on_code_and_cost_config():
+    class A:
+        pass
+
+    assert class_source_digest(A) == class_source_digest(A)
+
+    class Cfg:
+        INITIAL_BALANCE = 10_000
+        MAX_RISK_PER_TRADE = 0.005
+        SLIPPAGE = 0.1
+
+    key = backtest_stage_key(strategy_key="s", cfg=Cfg)
+    assert key == backtest_stage_key(strategy_key="s", cfg=Cfg)
+    assert key != backtest_stage_key(strategy_key="t", cfg=Cfg)
+
+    Cfg.SLIPPAGE = 0.2
+    assert key != backtest_stage_key(strategy_key="s", cfg=Cfg)
+
+
+def test_strategy_key_follows_imported_modules(tmp_path, monkeypatch):
+    from core.backtesting import stage_cache
+
+    (tmp_path / "feats").mkdir()
+    (tmp_path / "feats" / "__init__.py").write_text("")
+    (tmp_path / "feats" / "ind.py").write_text("def sma(x):\n    return x\n")
+    (tmp_path / "feats" / "unused.py").write_text("Y = 1\n")
+    (tmp_path / "strat_mod.py").write_text(
+        "from feats.ind import sma\n\n\nclass Strat:\n    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(stage_cache, "REPO_ROOT", tmp_path)
+    strategy_cls = importlib.import_module("strat_mod").Strat
+
+    def key():
+        return strategy_stage_key(
+            symbol="EURUSD",
+            data_by_tf={"M1": _frame()},
+            strategy_cls=strategy_cls,
+            startup_candle_count=10,
+        )
+
+    before = key()
+
+    (tmp_path / "feats" / "unused.py").write_text("Y = 2\n")
+    assert key() == before
+
+    (tmp_path / "feats" / "ind.py").write_text("def sma(x):\n    return x * 2\n")
+    assert key() != before
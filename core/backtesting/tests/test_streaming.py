@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from core.backtesting.scheduler import ScheduledTask
+from core.backtesting.streaming import (
+    MemoryBudget,
+    StreamedSymbol,
+    StreamingExecutor,
+    run_symbol_streaming_worker,
+)
+from core.backtesting.tests.helper import ReportedBreakout, market_data
+
+
+def _work(value, peak_mb=None):
+    time.sleep(0.05)
+    return StreamedSymbol(result=value, peak_rss_mb=peak_mb)
+
+
+def _task(key, bars, **kwargs):
+    return ScheduledTask(key=key, symbol=key, bars=bars, kwargs=dict(value=key, **kwargs))
+
+
+def test_memory_budget_estimate_and_admission():
+    budget = MemoryBudget(1000, base_mb=100, mb_per_1k_bars=1.0)
+
+    assert budget.estimate_mb(200_000) == pytest.approx(300)
+
+    assert budget.admits(0, 0, 10_000_000)          # oversized runs alone
+    assert budget.admits(600, 2, 300_000)           # 600 + 400 fits
+    assert not budget.admits(700, 2, 300_000)
+
+    # measured peaks only ever raise the per-bar rate
+    budget.observe(100_000, peak_mb=400)
+    assert budget.mb_per_1k_bars == pytest.approx(3.0)
+    budget.observe(100_000, peak_mb=150)
+    assert budget.mb_per_1k_bars == pytest.approx(3.0)
+
+    with pytest.raises(ValueError):
+        MemoryBudget(0)
+
+
+def test_budget_limits_concurrency_not_results():
+    tasks = [_task(f"S{i}", 100_000) for i in range(5)]
+    seen = []
+
+    # 2 workers' worth of budget on a 4-worker pool
+    budget = MemoryBudget(450, base_mb=100, mb_per_1k_bars=1.0)
+    report = StreamingExecutor(budget=budget, max_workers=4).run(
+        _work, tasks, lambda task, out: seen.append(out.result)
+    )
+
+    assert sorted(seen) == [t.key for t in tasks]
+    assert report.max_concurrent == 2
+    assert report.max_in_flight_mb <= 450
+
+
+def test_streaming_worker_reports_peak_and_result():
+    out = run_symbol_streaming_worker(
+        symbol="EURUSD",
+        strategy_cls=ReportedBreakout,
+        startup_candle_count=50,
+        data_by_tf=market_data("EURUSD", seed=5),
+    )
+
+    assert out.result.symbol == "EURUSD"
+    assert not out.result.trades.empty
+    assert out.peak_rss_mb is None or out.peak_rss_mb > 0
@@ -0,0 +1,119 @@
+import pandas as pd
+import pytest
+
+from core.backtesting.engine.backtester import Backtester
+from core.backtesting.strategy_runner import StrategyRunResult
+from core.backtesting.tests.helper import random_market
+from core.backtesting.walk_forward import (
+    WalkForwardExecutor,
+    rolling_windows,
+    slice_window,
+    windows_from_config,
+)
+
+
+def _runs():
+    runs = []
+    for symbol, seed, scale in (("EURUSD", 3, 1.0), ("XAUUSD", 4, 1800.0)):
+        df, plans = random_market(n=2000, seed=seed)
+        df[["open", "high", "low", "close"]] *= scale
+        plans[["plan_sl", "plan_tp1", "plan_tp2"]] *= scale
+        df["symbol"] = symbol
+        runs.append(StrategyRunResult(
+            symbol=symbol,
+            strategy_id="abcd1234",
+            strategy_name="Random",
+            df_signals=df,
+            df_context=df,
+            trade_plans=plans,
+            report_spec=None,
+            timing={},
+        ))
+    return runs
+
+
+def test_windows_from_config_end_is_inclusive_day():
+    (w,) = windows_from_config({"OPT": ("2025-12-01", "2025-12-15")})
+
+    assert w.start == pd.Timestamp("2025-12-01", tz="UTC")
+    assert w.end == pd.Timestamp("2025-12-16", tz="UTC")
+
+
+def test_config_train_window_is_left_out_of_stitched_curve():
+    windows = windows_from_config(
+        {
+            "OPT": ("2024-01-01", "2024-01-08"),
+            "VAL": ("2024-01-09", "2024-01-14"),
+            "FINAL": ("2024-01-15", "2024-01-21"),
+        },
+        roles={"OPT": "train"},
+    )
+    assert [w.role for w in windows] == ["train", "test", "test"]
+
+    result = WalkForwardExecutor(windows=windows, max_workers=1).run(_runs())
+
+    assert set(result.trades["window"]) == {"OPT", "VAL", "FINAL"}
+    assert set(result.stitched["window"]) == {"VAL", "FINAL"}
+    with pytest.raises(ValueError):
+        windows_from_config({"OPT": ("2024-01-01", "2024-01-08")}, roles={"OPT": "in_sample"})
+
+
+def test_rolling_windows_are_contiguous_folds():
+    windows = rolling_windows(start="2024-01-01", end="2024-01-21", train="5D", test="2D")
+
+    train = [w for w in windows if w.role == "train"]
+    test = [w for w in windows if w.role == "test"]
+
+    assert len(train) == len(test) == 7
+    for tr, te in zip(train, test):
+        assert tr.end == te.start
+        assert tr.fold == te.fold
+    assert all(a.end == b.start for a, b in zip(test, test[1:]))
+    assert test[-1].end <= pd.Timestamp("2024-01-21", tz="UTC")
+
+
+def test_window_slice_matches_direct_backtest():
+    run = _runs()[0]
+    (window,) = windows_from_config({"W": ("2024-01-05", "2024-01-10")})
+
+    result = WalkForwardExecutor(windows=[window], max_workers=1).run([run])
+
+    mask = (run.df_signals["time"] >= window.start) & (run.df_signals["time"] < window.end)
+    expected = Backtester().run(
+        signals_df=run.df_signals[mask].reset_index(drop=True),
+        trade_plans=run.trade_plans[mask].reset_index(drop=True),
+    )
+
+    trades = result.window_trades("W")
+    assert len(trades) == len(expected) > 0
+    assert trades["pnl_net_usd"].sum() == pytest.approx(expected["pnl_net_usd"].sum())
+    # trade times are naive UTC
+    assert (trades["entry_time"] >= window.start.tz_localize(None)).all()
+    assert (trades["exit_time"] < window.end.tz_localize(None)).all()
+
+
+def test_warmup_bars_are_never_traded():
+    run = _runs()[0]
+    (window,) = windows_from_config({"ALL": ("2023-12-01", "2024-12-31")})
+
+    signals, plans = slice_window(run.df_signals, run.trade_plans, window, warmup_bars=100)
+
+    assert len(signals) == len(plans) == 1900
+    assert signals["time"].iloc[0] == run.df_signals["time"].iloc[100]
+
+
+def test_parallel_walk_forward_matches_inline_and_stitches_tests():
+    runs = _runs()
+    windows = rolling_windows(start="2024-01-01", end="2024-01-21", train="5D", test="3D")
+
+    inline = WalkForwardExecutor(windows=windows, startup_candle_count=50, max_workers=1).run(runs)
+    pooled = WalkForwardExecutor(windows=windows, startup_candle_count=50, max_workers=2).run(runs)
+
+    pd.testing.assert_frame_equal(inline.summary, pooled.summary)
+
+    assert len(inline.summary) == len(windows)
+    stitched = inline.stitched
+    assert set(stitched["role"]) == {"test"}
+    assert stitched["exit_time"].is_monotonic_increasing
+    assert set(stitched["symbol"]) == {"EURUSD", "XAUUSD"}
+    assert len(stitched) == inline.summary.loc[inline.summary["role"] == "test", "trades"].sum()
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Iterable
+
+import pandas as pd
+
+from core.backtesting.engine.pool import process_pool
+from core.backtesting.engine.worker import run_backtest_worker
+from core.backtesting.optimize.metrics import summarize_trades
+from core.logging.null_logger import NullLogger
+
+
+@dataclass(frozen=True)
+class Window:
+    """
+    Half-open time window [start, end).
+    """
+
+    name: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    role: str = "test"          # "train" | "test"
+    fold: int | None = None
+
+
+def _utc(ts) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def windows_from_config(
+    windows: dict[str, tuple[str, str]],
+    roles: dict[str, str] | None = None,
+) -> list[Window]:
+    """
+    BACKTEST_WINDOWS -> Windows. Config end dates are inclusive days.
+    roles (BACKTEST_WINDOW_ROLES) maps names to "train"; others are "test".
+    """
+    roles = roles or {}
+    for name, role in roles.items():
+        if role not in ("train", "test"):
+            raise ValueError(f"Unknown window role for {name}: {role}")
+
+    return [
+        Window(
+            name=name,
+            start=_utc(start),
+            end=_utc(end) + pd.Timedelta(days=1),
+            role=roles.get(name, "test"),
+        )
+        for name, (start, end) in windows.items()
+    ]
+
+
+def rolling_windows(
+    *,
+    start,
+    end,
+    train,
+    test,
+    step=None,
+) -> list[Window]:
+    """
+    Rolling walk-forward folds: train [s, s+train), test [s+train, s+train+test),
+    s advancing by step (default: test). Only complete test windows.
+    """
+    start, end = _utc(start), _utc(end)
+    train, test = pd.Timedelta(train), pd.Timedelta(test)
+    step = pd.Timedelta(step) if step is not None else test
+
+    if train <= pd.Timedelta(0) or test <= pd.Timedelta(0) or step <= pd.Timedelta(0):
+        raise ValueError("train, test and step must be positive")
+
+    out = []
+    fold = 0
+    s = start
+    while s + train + test <= end:
+        out.append(Window(f"WF{fold:02d}_TRAIN", s, s + train, role="train", fold=fold))
+        out.append(Window(f"WF{fold:02d}_TEST", s + train, s + train + test, role="test", fold=fold))
+        fold += 1
+        s += step
+    return out
+
+
+def slice_window(
+    df_signals: pd.DataFrame,
+    trade_plans: pd.DataFrame,
+    window: Window,
+    *,
+    warmup_bars: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Rows of a full-range strategy run that fall in window.
+
+    Features/signals were computed over the full range, so indicator
+    history before the window is already in the columns; the first
+    warmup_bars of the data are never traded. Trades still open at
+    window end close there (TIMEOUT).
+    """
+    time = df_signals["time"]
+    start, end = window.start, window.end
+    if time.dt.tz is None:
+        start, end = start.tz_localize(None), end.tz_localize(None)
+
+    mask = ((time >= start) & (time < end)).to_numpy()
+    mask[:warmup_bars] = False
+
+    return (
+        df_signals.loc[mask].reset_index(drop=True),
+        trade_plans.loc[mask].reset_index(drop=True),
+    )
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    trades: pd.DataFrame        # every window, columns window / role / fold
+    summary: pd.DataFrame       # one row per window (symbols pooled)
+    windows: tuple[Window, ...]
+
+    @property
+    def stitched(self) -> pd.DataFrame:
+        """
+        Test-window trades in exit order (out-of-sample equity curve).
+        """
+        if self.trades.empty:
+            return self.trades
+        out = self.trades[self.trades["role"] == "test"]
+        return out.sort_values("exit_time", kind="mergesort").reset_index(drop=True)
+
+    def window_trades(self, name: str) -> pd.DataFrame:
+        if self.trades.empty:
+            return self.trades
+        return self.trades[self.trades["window"] == name].reset_index(drop=True)
+
+
+class WalkForwardExecutor:
+    """
+    Backtests full-range strategy runs over time windows.
+
+    Strategy runs (features + signals + plans) are computed once per
+    symbol; each (run, window) slice is simulated independently, in a
+    process pool when max_workers != 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        windows: Iterable[Window],
+        startup_candle_count: int = 0,
+        max_workers: int | None = None,
+        logger=None,
+    ):
+        self.windows = tuple(windows)
+        if not self.windows:
+            raise ValueError("WalkForwardExecutor needs at least one window")
+
+        self.startup_candle_count = startup_candle_count
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.logger = logger or NullLogger()
+
+    def run(self, strategy_runs) -> WalkForwardResult:
+        tasks = []
+        for run in strategy_runs:
+            for window in self.windows:
+                signals, plans = slice_window(
+                    run.df_signals,
+                    run.trade_plans,
+                    window,
+                    warmup_bars=self.startup_candle_count,
+                )
+                if signals.empty:
+                    continue
+                tasks.append((run, window, signals, plans))
+
+        if self.max_workers == 1 or len(tasks) <= 1:
+            results = [
+                run_backtest_worker(signals_df=signals, trade_plans=plans)
+                for _, _, signals, plans in tasks
+            ]
+        else:
+            with process_pool(self.max_workers) as executor:
+                futures = [
+                    executor.submit(run_backtest_worker, signals_df=signals, trade_plans=plans)
+                    for _, _, signals, plans in tasks
+                ]
+                results = [f.result() for f in futures]
+
+        frames = []
+        for (run, window, _, _), trades in zip(tasks, results):
+            self.logger.log(f"{run.symbol:<8} | {window.name:<12} | trades={len(trades)}")
+            if trades.empty:
+                continue
+            trades = trades.copy()
+            trades["window"] = window.name
+            trades["role"] = window.role
+            trades["fold"] = window.fold
+            trades["strategy_id"] = run.strategy_id
+            frames.append(trades)
+
+        trades = (
+            pd.concat(frames, ignore_index=True)
+            if frames
+            else pd.DataFrame()
+        )
+
+        return WalkForwardResult(
+            trades=trades,
+            summary=self._summary(trades),
+            windows=self.windows,
+        )
+
+    def _summary(self, trades: pd.DataFrame) -> pd.DataFrame:
+        rows = []
+        for window in self.windows:
+            in_window = (
+                trades[trades["window"] == window.name]
+                if not trades.empty
+                else trades
+            )
+            rows.append({
+                "window": window.name,
+                "role": window.role,
+                "fold": window.fold,
+                "start": window.start,
+                "end": window.end,
+                **summarize_trades(in_window),
+            })
+        return pd.DataFrame(rows)
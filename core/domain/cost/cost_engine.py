@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from core.domain.cost.execution_cost import attach_execution_costs
-from core.domain.cost.financing import attach_financing_costs
+from core.domain.cost.execution_cost import attach_execution_costs, attach_execution_costs_frame
+from core.domain.cost.financing import attach_financing_costs, attach_financing_costs_frame
 from core.domain.cost.instrument_ctx import InstrumentCtx
-from core.domain.cost.pricing import attach_net_pnl
-from core.domain.cost.traded_volume import attach_traded_volume
-from core.domain.execution.execution_types import attach_execution_types
+from core.domain.cost.pricing import attach_net_pnl, attach_net_pnl_frame
+from core.domain.cost.traded_volume import attach_traded_volume, attach_traded_volume_frame
+from core.domain.execution.execution_types import attach_execution_types, attach_execution_types_frame
 
 
 class TradeCostEngine:
@@ -32,6 +32,16 @@ class TradeCostEngine:
         attach_financing_costs(trade_dict, ctx)
         attach_net_pnl(trade_dict)
 
-
-
-
+    def apply_frame(self, trades, *, df, ctx: InstrumentCtx) -> None:
+        """
+        Columnar variant of apply(): enriches a trades DataFrame in place.
+        """
+        attach_execution_types_frame(
+            trades,
+            df=df,
+            execution_policy=self.execution_policy,
+        )
+        attach_traded_volume_frame(trades, ctx)
+        attach_execution_costs_frame(trades, ctx)
+        attach_financing_costs_frame(trades, ctx)
+        attach_net_pnl_frame(trades)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from core.backtesting.execution_policy import EXEC_MARKET, EXEC_LIMIT
 from core.domain.cost.pricing import price_abs_to_usd
 from core.domain.cost.instrument_ctx import InstrumentCtx
@@ -23,4 +25,43 @@ def attach_execution_costs(trade: dict, ctx: InstrumentCtx) -> None:
 
     trade["spread_usd_total"] = spread_entry + spread_tp1 + spread_exit
     trade["slippage_usd_total"] = slip_entry + slip_exit
-    trade["costs_usd_total"] = trade["spread_usd_total"] + trade["slippage_usd_total"]
\ No newline at end of file
+    trade["costs_usd_total"] = trade["spread_usd_total"] + trade["slippage_usd_total"]
+
+
+def _price_abs_to_usd_vec(price_abs: float, ctx: InstrumentCtx, size, fraction):
+    return np.where(
+        fraction > 0.0,
+        price_abs / ctx.point_size * ctx.pip_value * size * fraction,
+        0.0,
+    )
+
+
+def attach_execution_costs_frame(trades, ctx: InstrumentCtx) -> None:
+    size = trades["position_size"].to_numpy(dtype=np.float64)
+    tp1_exec = trades["tp1_time"].notna().to_numpy()
+
+    entry_frac = np.ones(len(trades))
+    tp1_frac = np.where(tp1_exec, 0.5, 0.0)
+    exit_frac = np.where(tp1_exec, 0.5, 1.0)
+
+    exec_entry = trades["exec_type_entry"].fillna(EXEC_MARKET).to_numpy(dtype=object)
+    exec_exit = trades["exec_type_exit"].fillna(EXEC_LIMIT).to_numpy(dtype=object)
+
+    spread_entry = _price_abs_to_usd_vec(ctx.half_spread, ctx, size, entry_frac)
+    spread_tp1 = _price_abs_to_usd_vec(ctx.half_spread, ctx, size, tp1_frac)
+    spread_exit = _price_abs_to_usd_vec(ctx.half_spread, ctx, size, exit_frac)
+
+    slip_entry = np.where(
+        exec_entry == EXEC_MARKET,
+        _price_abs_to_usd_vec(ctx.slippage_abs, ctx, size, entry_frac),
+        0.0,
+    )
+    slip_exit = np.where(
+        exec_exit == EXEC_MARKET,
+        _price_abs_to_usd_vec(ctx.slippage_abs, ctx, size, exit_frac),
+        0.0,
+    )
+
+    trades["spread_usd_total"] = spread_entry + spread_tp1 + spread_exit
+    trades["slippage_usd_total"] = slip_entry + slip_exit
+    trades["costs_usd_total"] = trades["spread_usd_total"] + trades["slippage_usd_total"]
@@ -1,7 +1,9 @@
+import numpy as np
+
 from config.instrument_meta import FINANCING_RATES_PER_DAY, FINANCING_MODEL, FINANCING_USD_PER_LOT_DAY, \
     FX_TRIPLE_MULTIPLIER, FX_TRIPLE_ROLLOVER_WEEKDAY, FX_ROLLOVER_HOUR_UTC, FX_ROLLOVER_MINUTE_UTC, FINANCING_ENABLED
 from core.domain.cost.instrument_ctx import InstrumentCtx
-from core.domain.cost.time_utils import count_rollovers, to_dt
+from core.domain.cost.time_utils import count_rollovers, count_rollovers_vec, to_dt, to_ns
 
 
 def attach_financing_costs(trade: dict, ctx: InstrumentCtx) -> None:
@@ -82,4 +84,83 @@ def attach_financing_costs(trade: dict, ctx: InstrumentCtx) -> None:
     trade["financing_usd_weekend"] = float(weekend)
     trade["financing_usd_total"] = float(total)
 
-    trade["costs_usd_total"] = float(trade.get("costs_usd_total", 0.0)) + float(total)
\ No newline at end of file
+    trade["costs_usd_total"] = float(trade.get("costs_usd_total", 0.0)) + float(total)
+
+
+def attach_financing_costs_frame(trades, ctx: InstrumentCtx) -> None:
+    """
+    Columnar attach_financing_costs.
+    Rollovers are counted in closed form (count_rollovers_vec).
+    """
+    n = len(trades)
+    overnight = np.zeros(n, dtype=np.float64)
+    weekend = np.zeros(n, dtype=np.float64)
+
+    unit = _unit_cost_per_rollover(trades, ctx) if (FINANCING_ENABLED and n) else None
+
+    if unit is not None:
+        n_roll, n_triple = count_rollovers_vec(
+            to_ns(trades["entry_time"]),
+            to_ns(trades["exit_time"]),
+            FX_ROLLOVER_HOUR_UTC,
+            FX_ROLLOVER_MINUTE_UTC,
+            FX_TRIPLE_ROLLOVER_WEEKDAY,
+        )
+
+        overnight = unit * n_roll
+        if FX_TRIPLE_MULTIPLIER > 1:
+            weekend = unit * (FX_TRIPLE_MULTIPLIER - 1) * n_triple
+
+    total = overnight + weekend
+
+    trades["financing_usd_overnight"] = overnight
+    trades["financing_usd_weekend"] = weekend
+    trades["financing_usd_total"] = total
+
+    costs = trades["costs_usd_total"].fillna(0.0) if "costs_usd_total" in trades.columns else 0.0
+    trades["costs_usd_total"] = costs + total
+
+
+def _unit_cost_per_rollover(trades, ctx: InstrumentCtx) -> np.ndarray | None:
+    """
+    USD cost of one (single) rollover per trade, or None when the
+    symbol has no financing configured.
+    """
+    direction = trades["direction"].to_numpy(dtype=object)
+    is_long = direction == "long"
+    is_short = direction == "short"
+
+    if FINANCING_MODEL == "usd_per_lot_day":
+        rates = FINANCING_USD_PER_LOT_DAY.get(ctx.symbol, {})
+        if not rates:
+            return None
+        per_lot = np.where(
+            is_long,
+            float(rates.get("long", 0.0)),
+            np.where(is_short, float(rates.get("short", 0.0)), 0.0),
+        )
+        return trades["position_size"].to_numpy(dtype=np.float64) * per_lot
+
+    if FINANCING_MODEL == "notional_rate":
+        rates = FINANCING_RATES_PER_DAY.get(ctx.symbol)
+        if not rates:
+            return None
+        rate = np.where(
+            is_long,
+            float(rates.get("long", 0.0)),
+            np.where(is_short, float(rates.get("short", 0.0)), 0.0),
+        )
+
+        if "traded_volume_usd_entry" in trades.columns:
+            notional = trades["traded_volume_usd_entry"].fillna(0.0).to_numpy(dtype=np.float64)
+        else:
+            notional = np.zeros(len(trades), dtype=np.float64)
+        fallback = (
+            trades["entry_price"].to_numpy(dtype=np.float64)
+            * trades["position_size"].to_numpy(dtype=np.float64)
+            * float(ctx.contract_size)
+        )
+        notional = np.where(notional <= 0.0, fallback, notional)
+        return notional * rate
+
+    return None
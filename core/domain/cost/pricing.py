@@ -14,4 +14,10 @@ def price_abs_to_usd(
 def attach_net_pnl(trade: dict) -> None:
     gross = float(trade.get("pnl_usd", 0.0))
     costs = float(trade.get("costs_usd_total", 0.0))
-    trade["pnl_net_usd"] = float(gross - costs)
\ No newline at end of file
+    trade["pnl_net_usd"] = float(gross - costs)
+
+
+def attach_net_pnl_frame(trades) -> None:
+    gross = trades["pnl_usd"].fillna(0.0).astype(float)
+    costs = trades["costs_usd_total"].fillna(0.0).astype(float)
+    trades["pnl_net_usd"] = gross - costs
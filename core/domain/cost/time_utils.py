@@ -1,5 +1,12 @@
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
+
+NS_PER_DAY = 86_400 * 10**9
+EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday
+
 
 def to_dt(x) -> datetime:
     if hasattr(x, "to_pydatetime"):
@@ -25,4 +32,58 @@ def count_rollovers(entry_time: datetime, exit_time: datetime, hour: int, minute
     while t <= exit_time:
         out.append(t)
         t += timedelta(days=1)
-    return out
\ No newline at end of file
+    return out
+
+
+def to_ns(values) -> np.ndarray:
+    """
+    Datetime-like column -> int64 wall-clock ns (tz dropped, same as
+    to_dt + rollover_anchor on the local time). NaT -> INT64 min.
+    """
+    idx = pd.DatetimeIndex(pd.to_datetime(values))
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    return idx.asi8
+
+
+def count_rollovers_vec(
+    entry_ns: np.ndarray,
+    exit_ns: np.ndarray,
+    hour: int,
+    minute: int,
+    triple_weekday: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form count_rollovers over arrays.
+
+    Rollover k happens at k * day + (hour:minute); the rollovers in
+    (entry, exit] are k in (k(entry), k(exit)] with
+        k(t) = floor((t - offset) / day)
+    Triple rollovers are those k whose weekday == triple_weekday.
+
+    Returns (n_rollovers, n_triple) as int64 arrays.
+    """
+    entry_ns = np.asarray(entry_ns, dtype=np.int64)
+    exit_ns = np.asarray(exit_ns, dtype=np.int64)
+
+    offset = (hour * 3600 + minute * 60) * 10**9
+
+    k_entry = np.floor_divide(entry_ns - offset, NS_PER_DAY)
+    k_exit = np.floor_divide(exit_ns - offset, NS_PER_DAY)
+
+    valid = (
+        (exit_ns > entry_ns)
+        & (entry_ns != np.iinfo(np.int64).min)
+        & (exit_ns != np.iinfo(np.int64).min)
+    )
+
+    n_rollovers = np.where(valid, k_exit - k_entry, 0)
+
+    r = (triple_weekday - EPOCH_WEEKDAY) % 7
+    n_triple = np.where(
+        valid,
+        np.floor_divide(k_exit - r, 7) - np.floor_divide(k_entry - r, 7),
+        0,
+    )
+
+    return n_rollovers.astype(np.int64), n_triple.astype(np.int64)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from core.domain.cost.instrument_ctx import InstrumentCtx
 
 
@@ -17,4 +19,22 @@ def attach_traded_volume(trade: dict, ctx: InstrumentCtx) -> None:
     trade["traded_volume_usd_entry"] = entry
     trade["traded_volume_usd_tp1"] = tp1_notional
     trade["traded_volume_usd_exit"] = exit_notional
-    trade["traded_volume_usd_total"] = entry + tp1_notional + exit_notional
\ No newline at end of file
+    trade["traded_volume_usd_total"] = entry + tp1_notional + exit_notional
+
+
+def attach_traded_volume_frame(trades, ctx: InstrumentCtx) -> None:
+    size = trades["position_size"].to_numpy(dtype=np.float64)
+    tp1_exec = trades["tp1_time"].notna().to_numpy()
+    exit_frac = np.where(tp1_exec, 0.5, 1.0)
+
+    entry = trades["entry_price"].to_numpy(dtype=np.float64) * size * ctx.contract_size
+    exit_notional = trades["exit_price"].to_numpy(dtype=np.float64) * size * ctx.contract_size * exit_frac
+
+    tp1_price = trades["tp1_price"].to_numpy(dtype=np.float64, na_value=np.nan)
+    tp1_ok = tp1_exec & ~np.isnan(tp1_price)
+    tp1_notional = np.where(tp1_ok, tp1_price * size * ctx.contract_size * 0.5, 0.0)
+
+    trades["traded_volume_usd_entry"] = entry
+    trades["traded_volume_usd_tp1"] = tp1_notional
+    trades["traded_volume_usd_exit"] = exit_notional
+    trades["traded_volume_usd_total"] = entry + tp1_notional + exit_notional
@@ -4,6 +4,8 @@ EXIT_NONE = 0
 EXIT_SL = 1
 EXIT_TP1_BE = 2
 EXIT_TP2 = 3
+EXIT_TRAIL = 4
+EXIT_MANAGED = 5
 EXIT_EOD = 9
 
 
@@ -30,6 +32,12 @@ def map_exit_code_to_reason(
     if exit_code == EXIT_TP2:
         return TradeExitReason.TP2
 
+    if exit_code == EXIT_TRAIL:
+        return TradeExitReason.TRAIL
+
+    if exit_code == EXIT_MANAGED:
+        return TradeExitReason.MANAGED_EXIT
+
     if exit_code == EXIT_EOD:
         return TradeExitReason.TIMEOUT
 
@@ -1,3 +1,5 @@
+import numpy as np
+
 from core.backtesting.execution_policy import EXEC_MARKET, EXEC_LIMIT
 from core.backtesting.execution_policy import ExecutionPolicy
 
@@ -34,4 +36,52 @@ def attach_execution_types(
         exit_reason=exit_reason,
         has_exit_signal=has_exit_signal,
         exit_signal_value=exit_signal_value,
-    )
\ No newline at end of file
+    )
+
+
+def attach_execution_types_frame(
+    trades,
+    *,
+    df,
+    execution_policy: ExecutionPolicy,
+) -> None:
+    """
+    Columnar attach_execution_types over a trades DataFrame.
+    Exit classification is evaluated once per distinct exit reason.
+    """
+    exit_signal_col = getattr(execution_policy, "exit_signal_column", "exit_signal")
+    has_exit_signal = bool(df is not None and exit_signal_col in df.columns)
+
+    tp1_exec = trades["tp1_time"].notna().to_numpy()
+
+    exit_by_signal = (
+        trades["exit_by_signal"].fillna(False).astype(bool)
+        if "exit_by_signal" in trades.columns
+        else None
+    )
+
+    trades["exec_type_entry"] = execution_policy.entry_type
+    trades["exec_type_tp1"] = np.where(tp1_exec, execution_policy.tp_type, None).astype(object)
+
+    reasons = trades["exit_tag"].astype(object).where(trades["exit_tag"].notna(), None)
+
+    if exit_by_signal is None:
+        lookup = {
+            r: execution_policy.classify_exit_type(
+                exit_reason=r,
+                has_exit_signal=has_exit_signal,
+                exit_signal_value=False,
+            )
+            for r in reasons.unique()
+        }
+        trades["exec_type_exit"] = reasons.map(lookup).to_numpy(dtype=object)
+        return
+
+    trades["exec_type_exit"] = [
+        execution_policy.classify_exit_type(
+            exit_reason=r,
+            has_exit_signal=has_exit_signal,
+            exit_signal_value=bool(s),
+        )
+        for r, s in zip(reasons, exit_by_signal)
+    ]
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from core.domain.trade.trade import Trade
+from core.domain.trade.trade_buffer import TRADE_COLUMNS, TradeBuffer
+from core.domain.trade.trade_exit import TradeExitReason, TradeExitResult
+
+
+def _trade_dict(i, *, tp1=False):
+    trade = Trade(
+        symbol="EURUSD",
+        direction="long" if i % 2 == 0 else "short",
+        entry_time=datetime(2024, 1, 1, i % 24),
+        entry_price=1.1,
+        position_size=0.5,
+        sl=1.09 if i % 2 == 0 else 1.11,
+        tp1=1.11,
+        tp2=1.12,
+        entry_tag=f"tag_{i % 3}",
+        point_size=0.0001,
+        pip_value=10.0,
+    )
+    trade.close_trade(
+        TradeExitResult(
+            exit_price=1.105,
+            exit_time=datetime(2024, 1, 2, i % 24),
+            reason=TradeExitReason.TP2 if tp1 else TradeExitReason.SL,
+            tp1_executed=tp1,
+            tp1_price=1.11 if tp1 else None,
+            tp1_time=datetime(2024, 1, 1, 23) if tp1 else None,
+        )
+    )
+    return trade.to_dict()
+
+
+def test_buffer_grows_and_matches_dict_frame():
+    rows = [_trade_dict(i, tp1=i % 4 == 0) for i in range(50)]
+
+    buffer = TradeBuffer(capacity=4)
+    for row in rows:
+        buffer.append(row)
+
+    out = buffer.to_frame()
+    ref = pd.DataFrame(rows)
+
+    assert len(buffer) == 50
+    assert list(out.columns) == list(TRADE_COLUMNS)
+
+    for col in ("symbol", "direction", "entry_tag", "exit_tag", "exit_level_tag", "tp1_exit_reason"):
+        assert out[col].tolist() == ref[col].tolist(), col
+    for col in ("entry_time", "exit_time"):
+        assert (out[col].values == ref[col].values).all()
+    assert out["tp1_time"].isna().tolist() == [r["tp1_time"] is None for r in rows]
+
+    for col in ("entry_price", "exit_price", "pnl_usd", "returns", "tp1_pnl", "duration"):
+        np.testing.assert_array_equal(out[col].to_numpy(dtype=float), ref[col].to_numpy(dtype=float))
+
+
+def test_extend_batch_and_parquet_roundtrip(tmp_path):
+    buffer = TradeBuffer()
+    n = 1000
+
+    buffer.extend(
+        symbol="XAUUSD",
+        direction=np.where(np.arange(n) % 2 == 0, 1, -1),
+        entry_time=pd.date_range("2024-01-01", periods=n, freq="1min").values,
+        exit_time=pd.date_range("2024-01-01 00:05", periods=n, freq="1min").values,
+        pnl_usd=np.arange(n, dtype=float),
+        entry_tag=np.array(["A", "B"] * (n // 2), dtype=object),
+    )
+
+    frame = buffer.to_frame(categorical=True)
+    assert isinstance(frame["entry_tag"].dtype, pd.CategoricalDtype)
+    assert frame["direction"].tolist()[:2] == ["long", "short"]
+    assert frame["exit_tag"].isna().all()
+
+    path = tmp_path / "trades.parquet"
+    buffer.to_parquet(path)
+    loaded = pd.read_parquet(path)
+
+    assert len(loaded) == n
+    assert loaded["entry_tag"].astype(str).tolist() == frame["entry_tag"].astype(str).tolist()
+    np.testing.assert_array_equal(loaded["pnl_usd"].values, np.arange(n, dtype=float))
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtesting.execution_policy import ExecutionPolicy
+from core.domain.cost.cost_engine import InstrumentCtx, TradeCostEngine
+from core.domain.cost.time_utils import count_rollovers, count_rollovers_vec, to_ns
+
+
+COST_COLUMNS = (
+    "traded_volume_usd_total",
+    "spread_usd_total",
+    "slippage_usd_total",
+    "financing_usd_overnight",
+    "financing_usd_weekend",
+    "financing_usd_total",
+    "costs_usd_total",
+    "pnl_net_usd",
+)
+
+
+def _ctx(symbol="XAUUSD"):
+    return InstrumentCtx(
+        symbol=symbol,
+        point_size=0.01,
+        pip_value=1.0,
+        contract_size=100.0,
+        spread_abs=0.2,
+        half_spread=0.1,
+        slippage_abs=0.05,
+    )
+
+
+def _random_trades(n=300, seed=11):
+    rng = np.random.default_rng(seed)
+
+    entry = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 60 * 24 * 90, n), unit="min")
+    hold = pd.to_timedelta(rng.integers(0, 60 * 24 * 12, n), unit="min")
+    tp1_hit = rng.random(n) < 0.4
+
+    trades = pd.DataFrame({
+        "direction": rng.choice(["long", "short"], n),
+        "entry_time": entry,
+        "exit_time": entry + hold,
+        "entry_price": rng.uniform(1800, 2100, n),
+        "exit_price": rng.uniform(1800, 2100, n),
+        "position_size": np.round(rng.uniform(0.01, 3, n), 3),
+        "pnl_usd": rng.normal(0, 100, n),
+        "exit_tag": rng.choice(["SL", "BE", "TP2", "TIMEOUT"], n),
+        "tp1_price": np.where(tp1_hit, rng.uniform(1800, 2100, n), np.nan),
+        "tp1_time": pd.Series(entry + hold / 2).where(tp1_hit),
+    })
+    return trades
+
+
+def _dict_engine(trades, ctx):
+    engine = TradeCostEngine(ExecutionPolicy())
+    rows = []
+    for rec in trades.to_dict("records"):
+        rec["tp1_time"] = None if pd.isna(rec["tp1_time"]) else rec["tp1_time"]
+        rec["tp1_price"] = None if pd.isna(rec["tp1_price"]) else rec["tp1_price"]
+        engine.apply(rec, df=None, ctx=ctx)
+        rows.append(rec)
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("model", ["usd_per_lot_day", "notional_rate"])
+@pytest.mark.parametrize("symbol", ["XAUUSD", "EURUSD"])
+def test_apply_frame_matches_dict_engine(monkeypatch, model, symbol):
+    monkeypatch.setattr("core.domain.cost.financing.FINANCING_MODEL", model)
+
+    trades = _random_trades()
+    ctx = _ctx(symbol)
+
+    expected = _dict_engine(trades, ctx)
+
+    out = trades.copy()
+    TradeCostEngine(ExecutionPolicy()).apply_frame(out, df=None, ctx=ctx)
+
+    for col in ("exec_type_entry", "exec_type_exit"):
+        assert out[col].tolist() == expected[col].tolist(), col
+    assert out["exec_type_tp1"].isna().tolist() == expected["exec_type_tp1"].isna().tolist()
+
+    for col in COST_COLUMNS:
+        np.testing.assert_allclose(
+            out[col].to_numpy(dtype=float),
+            expected[col].to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+            err_msg=col,
+        )
+
+
+def test_count_rollovers_vec_matches_loop():
+    rng = np.random.default_rng(5)
+    base = datetime(2024, 1, 1)
+
+    entries, exits = [], []
+    for _ in range(500):
+        entry = base + timedelta(minutes=int(rng.integers(0, 60 * 24 * 60)))
+        exit_ = entry + timedelta(minutes=int(rng.integers(-60, 60 * 24 * 20)))
+        entries.append(entry)
+        exits.append(exit_)
+
+    # exact rollover boundaries
+    entries += [datetime(2024, 1, 3, 22), datetime(2024, 1, 3, 21, 59)]
+    exits += [datetime(2024, 1, 10, 22), datetime(2024, 1, 3, 22)]
+
+    n_roll, n_triple = count_rollovers_vec(to_ns(entries), to_ns(exits), 22, 0, 2)
+
+    for i, (entry, exit_) in enumerate(zip(entries, exits)):
+        ref = count_rollovers(entry, exit_, 22, 0)
+        assert n_roll[i] == len(ref)
+        assert n_triple[i] == sum(1 for t in ref if t.weekday() == 2)
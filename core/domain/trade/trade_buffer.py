@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+NAT_NS = np.iinfo(np.int64).min
+
+# Trade.to_dict() layout
+TRADE_COLUMNS = (
+    "symbol",
+    "direction",
+    "entry_time",
+    "exit_time",
+    "entry_price",
+    "exit_price",
+    "position_size",
+    "pnl_usd",
+    "returns",
+    "entry_tag",
+    "exit_tag",
+    "exit_level_tag",
+    "tp1_price",
+    "tp1_time",
+    "tp1_pnl",
+    "tp1_exit_reason",
+    "duration",
+)
+
+TIME_COLUMNS = ("entry_time", "exit_time", "tp1_time")
+FLOAT_COLUMNS = (
+    "entry_price",
+    "exit_price",
+    "position_size",
+    "pnl_usd",
+    "returns",
+    "tp1_price",
+    "tp1_pnl",
+    "duration",
+)
+STR_COLUMNS = (
+    "symbol",
+    "entry_tag",
+    "exit_tag",
+    "exit_level_tag",
+    "tp1_exit_reason",
+)
+
+DIRECTION_CODES = {"long": 1, "short": -1}
+
+
+class _Vocabulary:
+    """
+    str <-> int32 code mapping, -1 = None.
+    """
+
+    def __init__(self):
+        self._codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def code(self, value: Any) -> int:
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return -1
+        value = str(value)
+        c = self._codes.get(value)
+        if c is None:
+            c = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def encode(self, values) -> np.ndarray:
+        """
+        Vectorized: one Python step per distinct value, not per row.
+        """
+        if np.isscalar(values) or values is None:
+            return np.int32(self.code(values))
+
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+        lookup = np.array([self.code(u) for u in uniques] + [-1], dtype=np.int32)
+        return lookup[codes]
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        lookup = np.array(self.values + [None], dtype=object)
+        return lookup[codes]
+
+    def categorical(self, codes: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes, categories=pd.Index(self.values, dtype=object))
+
+
+class TradeBuffer:
+    """
+    Columnar, append-only trade store.
+
+    Columns are preallocated typed numpy arrays (int64 ns times, float64
+    prices, int8 direction, int32 codes for strings) that grow
+    geometrically. Conversion to DataFrame / Parquet is whole-column.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._n = 0
+        self._capacity = max(int(capacity), 1)
+
+        self._times = {c: np.full(self._capacity, NAT_NS, dtype=np.int64) for c in TIME_COLUMNS}
+        self._floats = {c: np.full(self._capacity, np.nan, dtype=np.float64) for c in FLOAT_COLUMNS}
+        self._strs = {c: np.full(self._capacity, -1, dtype=np.int32) for c in STR_COLUMNS}
+        self._direction = np.zeros(self._capacity, dtype=np.int8)
+
+        self._vocab = {c: _Vocabulary() for c in STR_COLUMNS}
+
+    def __len__(self) -> int:
+        return self._n
+
+    # ==================================================
+    # Growth
+    # ==================================================
+
+    def _reserve(self, extra: int) -> None:
+        need = self._n + extra
+        if need <= self._capacity:
+            return
+
+        cap = self._capacity
+        while cap < need:
+            cap *= 2
+
+        def grow(arr, fill):
+            out = np.full(cap, fill, dtype=arr.dtype)
+            out[:self._n] = arr[:self._n]
+            return out
+
+        self._times = {c: grow(a, NAT_NS) for c, a in self._times.items()}
+        self._floats = {c: grow(a, np.nan) for c, a in self._floats.items()}
+        self._strs = {c: grow(a, -1) for c, a in self._strs.items()}
+        self._direction = grow(self._direction, 0)
+        self._capacity = cap
+
+    # ==================================================
+    # Writes
+    # ==================================================
+
+    @staticmethod
+    def _time_ns(values) -> np.ndarray:
+        arr = np.asarray(values)
+        if arr.dtype.kind == "i":
+            return arr.astype(np.int64)
+        idx = pd.DatetimeIndex(pd.to_datetime(arr.ravel()))
+        if idx.tz is not None:
+            idx = idx.tz_localize(None)
+        return idx.asi8.reshape(arr.shape)
+
+    def extend(self, **columns) -> None:
+        """
+        Append a batch. Arrays must share one length; scalars broadcast.
+        Missing columns stay NaN / NaT / None.
+        """
+        n = None
+        for v in columns.values():
+            if v is not None and not np.isscalar(v):
+                n = len(v)
+                break
+        if n is None:
+            n = 1
+        if n == 0:
+            return
+
+        self._reserve(n)
+        sl = slice(self._n, self._n + n)
+
+        for c, v in columns.items():
+            if v is None:
+                continue
+            if c in TIME_COLUMNS:
+                self._times[c][sl] = self._time_ns(v)
+            elif c in FLOAT_COLUMNS:
+                self._floats[c][sl] = np.asarray(v, dtype=np.float64)
+            elif c in STR_COLUMNS:
+                self._strs[c][sl] = self._vocab[c].encode(v)
+            elif c == "direction":
+                self._direction[sl] = self._encode_direction(v)
+            else:
+                raise KeyError(f"Unknown trade column: {c}")
+
+        self._n += n
+
+    def append(self, trade: dict) -> None:
+        """
+        Append one trade (Trade.to_dict() layout). Prefer extend() in loops.
+        """
+        self.extend(**{c: [trade.get(c)] for c in TRADE_COLUMNS if c in trade})
+
+    @staticmethod
+    def _encode_direction(values) -> np.ndarray:
+        arr = np.asarray(values)
+        if arr.dtype.kind in "iu":
+            return arr.astype(np.int8)
+        arr = arr.astype(object)
+        out = np.zeros(arr.shape, dtype=np.int8)
+        for name, code in DIRECTION_CODES.items():
+            out[arr == name] = code
+        return out
+
+    # ==================================================
+    # Reads
+    # ==================================================
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Raw typed view (codes for string columns).
+        """
+        if name in TIME_COLUMNS:
+            return self._times[name][:self._n]
+        if name in FLOAT_COLUMNS:
+            return self._floats[name][:self._n]
+        if name in STR_COLUMNS:
+            return self._strs[name][:self._n]
+        if name == "direction":
+            return self._direction[:self._n]
+        raise KeyError(name)
+
+    def to_frame(
+        self,
+        *,
+        categorical: bool = False,
+        columns: Iterable[str] = TRADE_COLUMNS,
+    ) -> pd.DataFrame:
+        """
+        DataFrame in Trade.to_dict() column order.
+
+        categorical=False -> str columns as object (same as the dict path)
+        categorical=True  -> pandas Categorical built from codes (no decode)
+        """
+        n = self._n
+        data = {}
+
+        for c in columns:
+            if c in TIME_COLUMNS:
+                data[c] = self._times[c][:n].view("datetime64[ns]")
+            elif c in FLOAT_COLUMNS:
+                data[c] = self._floats[c][:n]
+            elif c in STR_COLUMNS:
+                codes = self._strs[c][:n]
+                vocab = self._vocab[c]
+                data[c] = vocab.categorical(codes) if categorical else vocab.decode(codes)
+            elif c == "direction":
+                direction = np.full(n, None, dtype=object)
+                direction[self._direction[:n] == 1] = "long"
+                direction[self._direction[:n] == -1] = "short"
+                data[c] = pd.Categorical(direction) if categorical else direction
+            else:
+                raise KeyError(c)
+
+        return pd.DataFrame(data, columns=list(columns))
+
+    def to_parquet(self, path, **kwargs) -> None:
+        self.to_frame(categorical=True).to_parquet(path, index=False, **kwargs)
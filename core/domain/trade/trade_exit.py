@@ -9,6 +9,8 @@ class TradeExitReason(Enum):
     TP1 = "TP1"
     TP2 = "TP2"
     BE = "BE"
+    TRAIL = "TRAIL"
+    MANAGED_EXIT = "MANAGED_EXIT"
     TIMEOUT = "TIMEOUT"
     UNKNOWN = "UNKNOWN"
 
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+
+from core.live_trading.latency import NullLatencyRecorder
+
+
+class AsyncLiveEngine:
+    """
+    Event-driven live engine (asyncio).
+
+    Three tasks connected by bounded queues:
+    - poll:     market_state_provider.poll() at a fixed rate (no drift)
+    - exits:    position_manager.on_tick() on every price update
+    - strategy: on candle close, fetch data and evaluate the strategy,
+                then hand the plan to position_manager.on_trade_plan()
+
+    Broker calls (poll, exits, data fetch, entries) share ONE thread,
+    so the MT5 session is never used concurrently. Strategy evaluation
+    runs in its own executor: a slow populate_indicators never delays
+    exit handling.
+
+    Backpressure:
+    - prices: size 1, latest wins (exits only need the current price)
+    - candles: size max_pending_candles, oldest dropped when full
+
+    latency: LatencyRecorder; candle_to_plan / candle_to_order are
+    measured from the poll that saw the candle close (queueing included).
+    """
+
+    def __init__(
+        self,
+        *,
+        position_manager,
+        market_state_provider,
+        strategy_runner,
+        tick_interval_sec: float = 1.0,
+        max_pending_candles: int = 1,
+        strategy_executor: Executor | None = None,
+        latency=None,
+    ):
+        self.position_manager = position_manager
+        self.market_state_provider = market_state_provider
+        self.strategy_runner = strategy_runner
+        self.tick_interval_sec = tick_interval_sec
+        self.max_pending_candles = max(int(max_pending_candles), 1)
+        self.latency = latency or NullLatencyRecorder()
+
+        self._broker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="broker")
+        self._strategy = strategy_executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="strategy"
+        )
+
+        self._last_strategy_state = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop: asyncio.Event | None = None
+        self._stop_requested = False
+
+        self.dropped_prices = 0
+        self.dropped_candles = 0
+
+    # ==================================================
+    # Lifecycle
+    # ==================================================
+
+    def start(self):
+        print("🟢 AsyncLiveEngine started")
+        try:
+            asyncio.run(self.run())
+        finally:
+            self._broker.shutdown(wait=True)
+            self._strategy.shutdown(wait=False)
+
+    def stop(self):
+        """
+        Thread-safe: may be called from any thread.
+        """
+        self._stop_requested = True
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        print("🔴 AsyncLiveEngine stopped")
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        if self._stop_requested:
+            return
+
+        tasks = [
+            asyncio.create_task(coro, name=name)
+            for name, coro in self._tasks().items()
+        ]
+
+        await self._stop.wait()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ==================================================
+    # Tasks
+    # ==================================================
+
+    def _tasks(self) -> dict:
+        prices: asyncio.Queue = asyncio.Queue(maxsize=1)
+        candles: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_candles)
+
+        return {
+            "poll": self._poll_loop(prices, candles),
+            "exits": self._exit_loop(prices),
+            "strategy": self._strategy_loop(candles),
+        }
+
+    async def _poll_loop(self, prices: asyncio.Queue, candles: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+
+        while True:
+            self.latency.maybe_export()
+            polled_at = loop.time()
+            try:
+                market_state = await self._on_broker(self.market_state_provider.poll)
+            except Exception as e:
+                print(f"❌ Poll error: {type(e).__name__}: {e}")
+                market_state = None
+            self.latency.record("poll", loop.time() - polled_at, symbol=self._symbol())
+
+            if market_state is not None:
+                if self._offer(prices, market_state):
+                    self.dropped_prices += 1
+                if market_state.get("candle_time") is not None:
+                    if self._offer(candles, (market_state, polled_at)):
+                        self.dropped_candles += 1
+                        print("⚠️ Strategy busy – dropped oldest pending candle")
+
+            next_at = await self._sleep_until_next(next_at)
+
+    async def _exit_loop(self, prices: asyncio.Queue):
+        while True:
+            market_state = await prices.get()
+            try:
+                await self._on_broker(partial(
+                    self._timed_exits,
+                    partial(self.position_manager.on_tick, market_state=market_state),
+                ))
+            except Exception as e:
+                print(f"❌ Exit handling error: {type(e).__name__}: {e}")
+
+    async def _strategy_loop(self, candles: asyncio.Queue):
+        while True:
+            market_state, polled_at = await candles.get()
+            try:
+                result = await self._run_strategy(
+                    self.strategy_runner, market_state, polled_at, self._symbol()
+                )
+                self._last_strategy_state = result.last_row
+            except Exception as e:
+                print(f"❌ Strategy error: {type(e).__name__}: {e}")
+
+    async def _run_strategy(self, runner, market_state: dict, polled_at: float, symbol):
+        """
+        fetch (broker thread) -> evaluate (strategy executor) -> entry (broker thread).
+        Returns the StrategyCandleResult.
+        """
+        loop = asyncio.get_running_loop()
+
+        data_by_tf = await self._on_broker(runner.fetch)
+        result = await loop.run_in_executor(self._strategy, runner.evaluate, data_by_tf)
+        self.latency.record("candle_to_plan", loop.time() - polled_at, symbol=symbol)
+
+        if result.plan is not None:
+            placed = await self._on_broker(partial(
+                self.position_manager.on_trade_plan,
+                plan=result.plan,
+                market_state=market_state,
+            ))
+            if placed:
+                self.latency.record("candle_to_order", loop.time() - polled_at, symbol=symbol)
+        return result
+
+    # ==================================================
+    # Helpers
+    # ==================================================
+
+    async def _sleep_until_next(self, next_at: float) -> float:
+        # fixed rate: schedule from the previous slot, not from now
+        loop = asyncio.get_running_loop()
+        next_at += self.tick_interval_sec
+        now = loop.time()
+        if next_at < now:
+            next_at = now
+        await asyncio.sleep(next_at - now)
+        return next_at
+
+    def _symbol(self):
+        return getattr(self.strategy_runner, "symbol", None)
+
+    def _timed_exits(self, fn, symbol=None):
+        with self.latency.span("exits", symbol or self._symbol()):
+            return fn()
+
+    async def _on_broker(self, fn):
+        return await asyncio.get_running_loop().run_in_executor(self._broker, fn)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item) -> bool:
+        """
+        put_nowait; when full drop the oldest item. True if one was dropped.
+        """
+        dropped = False
+        if queue.full():
+            queue.get_nowait()
+            dropped = True
+        queue.put_nowait(item)
+        return dropped
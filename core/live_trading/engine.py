@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import time
 
+from core.live_trading.latency import NullLatencyRecorder
 from core.live_trading.strategy_runner import LiveStrategyRunner
 
 
@@ -18,11 +19,13 @@ class LiveEngine:
         market_state_provider,
         strategy_runner,
         tick_interval_sec: float = 1.0,
+        latency=None,
     ):
         self.position_manager = position_manager
         self.market_state_provider = market_state_provider
         self.strategy_runner = strategy_runner
         self.tick_interval_sec = tick_interval_sec
+        self.latency = latency or NullLatencyRecorder()
 
         self._running = False
         self._last_strategy_state = None
@@ -44,14 +47,20 @@ class LiveEngine:
         print("🔴 LiveEngine stopped")
 
     def _tick(self):
-        market_state = self.market_state_provider.poll()
+        self.latency.maybe_export()
+        symbol = getattr(self.strategy_runner, "symbol", None)
+
+        polled_at = time.perf_counter()
+        with self.latency.span("poll", symbol):
+            market_state = self.market_state_provider.poll()
         if market_state is None:
             return
 
         # ---------------------------
         # EXIT LOGIC (tick-based)
         # ---------------------------
-        self.position_manager.on_tick(market_state=market_state)
+        with self.latency.span("exits", symbol):
+            self.position_manager.on_tick(market_state=market_state)
 
         # ---------------------------
         # ENTRY LOGIC (candle-based)
@@ -61,9 +70,14 @@ class LiveEngine:
 
         result = self.strategy_runner.run()
         self._last_strategy_state = result.last_row
+        self.latency.record("candle_to_plan", time.perf_counter() - polled_at, symbol=symbol)
 
         if result.plan is not None:
-            self.position_manager.on_trade_plan(
+            placed = self.position_manager.on_trade_plan(
                 plan=result.plan,
                 market_state=market_state,
-            )
\ No newline at end of file
+            )
+            if placed:
+                self.latency.record(
+                    "candle_to_order", time.perf_counter() - polled_at, symbol=symbol
+                )
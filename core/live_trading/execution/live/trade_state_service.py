@@ -8,18 +8,81 @@ from core.live_trading.trade_repo import TradeRepo
 
 
 class TradeStateService:
+    """
+    Active-trade state for PositionManager.
+
+    Inside a tick (begin_tick() ... commit()) the active dict loaded for
+    the tick is authoritative: mutations (update_sl, set_flag,
+    mark_tp1_executed) change it in place, so later handlers see them
+    through the same trade dicts, and commit() writes them in ONE
+    save_active(). Outside a tick every mutation is saved immediately.
+
+    Entries and exits are durable at once (repo call); pending changes
+    of the trade involved are written first so the repo never receives
+    an older version of it.
+    """
+
     def __init__(self, repo: TradeRepo, adapter: MT5Adapter):
         self.repo = repo
         self.adapter = adapter
 
+        self._active: dict[str, dict] | None = None   # set during a tick
+        self._dirty: set[str] = set()
+
+    # ==================================================
+    # Tick
+    # ==================================================
+
+    def begin_tick(self, active: dict[str, dict]) -> None:
+        self._active = active
+        self._dirty.clear()
+
+    def commit(self) -> None:
+        """
+        End of tick: one durable write when anything changed.
+        """
+        try:
+            self._flush()
+        finally:
+            self._active = None
+
+    def _flush(self) -> None:
+        if self._active is not None and self._dirty:
+            self.repo.save_active(self._active)
+            self._dirty.clear()
+
+    def _load(self) -> dict[str, dict]:
+        return self._active if self._active is not None else self.repo.load_active()
+
+    def _changed(self, trade_id: str, active: dict[str, dict]) -> None:
+        if self._active is None:
+            self.repo.save_active(active)
+        else:
+            self._dirty.add(trade_id)
+
+    # ==================================================
+    # Queries
+    # ==================================================
+
     def has_active_position(self, symbol: str) -> bool:
-        active = self.repo.load_active()
+        active = self._load()
         return any(trade["symbol"] == symbol for trade in active.values())
 
+    # ==================================================
+    # Entry / exit (durable at once)
+    # ==================================================
+
     def record_entry(self, *, plan, exec_result: dict, entry_time: datetime) -> None:
+        self._flush()
         self.repo.record_entry_from_plan(plan=plan, exec_result=exec_result, entry_time=entry_time)
+        if self._active is not None:
+            # save_active() replaces the set: keep the new trade in it
+            self._active.update(self.repo.load_active())
 
     def record_exit(self, *, trade_id: str, price: float, time: datetime, reason: str, exit_level_tag: str | None) -> None:
+        if trade_id in self._dirty:
+            self._flush()
+
         self.repo.record_exit(
             trade_id=trade_id,
             exit_price=price,
@@ -27,9 +90,16 @@ class TradeStateService:
             exit_reason=reason,
             exit_level_tag=exit_level_tag,
         )
+        if self._active is not None:
+            self._active.pop(trade_id, None)
+            self._dirty.discard(trade_id)
+
+    # ==================================================
+    # Mutations (batched inside a tick)
+    # ==================================================
 
     def mark_tp1_executed(self, *, trade_id: str, price: float, now: datetime, remain_volume: float) -> None:
-        active = self.repo.load_active()
+        active = self._load()
         trade = active.get(trade_id)
         if not trade:
             return
@@ -38,23 +108,23 @@ class TradeStateService:
         trade["tp1_time"] = now
         trade["volume"] = remain_volume
         active[trade_id] = trade
-        self.repo.save_active(active)
+        self._changed(trade_id, active)
 
     def update_sl(self, *, trade_id: str, new_sl: float) -> None:
-        active = self.repo.load_active()
+        active = self._load()
         trade = active.get(trade_id)
         if not trade:
             return
         self.adapter.modify_sl(ticket=trade["ticket"], new_sl=new_sl)
         trade["sl"] = new_sl
         active[trade_id] = trade
-        self.repo.save_active(active)
+        self._changed(trade_id, active)
 
     def set_flag(self, *, trade_id: str, key: str, value: Any) -> None:
-        active = self.repo.load_active()
+        active = self._load()
         trade = active.get(trade_id)
         if not trade:
             return
         trade[key] = value
         active[trade_id] = trade
-        self.repo.save_active(active)
\ No newline at end of file
+        self._changed(trade_id, active)
@@ -2,6 +2,15 @@ from typing import Dict, Any
 
 import MetaTrader5 as mt5
 
+from core.live_trading.execution.position_snapshot import PositionSnapshot
+from core.live_trading.execution.risk.metadata_cache import (
+    METADATA_CACHE,
+    BrokerMetadataCache,
+)
+
+
+MAGIC_NUMBER = 100001
+
 
 class MT5Adapter:
     """
@@ -14,9 +23,14 @@ class MT5Adapter:
             *,
             dry_run: bool = False,
             log,
+            metadata: BrokerMetadataCache | None = None,
     ):
         self.dry_run = dry_run
         self.log = log
+        self.metadata = metadata or METADATA_CACHE
+
+        # tickets of the last snapshot: a change means a deal (balance moved)
+        self._last_tickets: frozenset[int] | None = None
 
         if self.dry_run:
             self.log.warning("MT5Adapter running in DRY-RUN mode")
@@ -38,7 +52,12 @@ class MT5Adapter:
             volume: float,
             sl: float,
             tp: float | None = None,
+            snapshot: PositionSnapshot | None = None,
     ) -> Dict[str, Any]:
+        """
+        snapshot: this tick's positions; reused by the netting guard
+        instead of another positions_get() round-trip.
+        """
 
         if self.dry_run:
             self.log.debug(
@@ -50,7 +69,7 @@ class MT5Adapter:
         # --------------------------------------------------
         # SYMBOL INFO / MODE
         # --------------------------------------------------
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = self.metadata.symbol_info(symbol)
         if symbol_info is None:
             raise RuntimeError(f"Symbol not found: {symbol}")
 
@@ -60,7 +79,11 @@ class MT5Adapter:
         # --------------------------------------------------
         # NETTING GUARD
         # --------------------------------------------------
-        positions = mt5.positions_get(symbol=symbol)
+        positions = (
+            snapshot.for_symbol(symbol)
+            if snapshot is not None
+            else mt5.positions_get(symbol=symbol)
+        )
         if positions:
             raise RuntimeError(f"Position already open for {symbol}")
 
@@ -115,7 +138,7 @@ class MT5Adapter:
             "sl": sl,
             "tp": tp,
             "deviation": 10,
-            "magic": 100001,
+            "magic": MAGIC_NUMBER,
             "comment": "live_engine",
             "type_time": mt5.ORDER_TIME_GTC,
             "type_filling": mt5.ORDER_FILLING_IOC,
@@ -124,13 +147,38 @@ class MT5Adapter:
         result = mt5.order_send(request)
 
         if result.retcode != mt5.TRADE_RETCODE_DONE:
+            # specs may have changed (trade mode, stops level): refetch next time
+            self.metadata.invalidate_symbol(symbol)
             raise RuntimeError(f"MT5 order_send failed: {result}")
+        self.metadata.on_fill()
 
         return {
             "ticket": result.order,
             "price": market_price,
         }
 
+    def positions_snapshot(self) -> PositionSnapshot | None:
+        """
+        All open positions in ONE positions_get() call.
+        None when the call failed: unknown is not "no positions".
+        """
+        if self.dry_run:
+            return PositionSnapshot()
+
+        positions = mt5.positions_get()
+        if positions is None:
+            self.log.warning(f"positions_get failed: {mt5.last_error()}")
+            return None
+
+        snapshot = PositionSnapshot.from_positions(positions)
+
+        # positions opened / closed outside our order_send (broker SL/TP)
+        tickets = frozenset(snapshot.positions)
+        if self._last_tickets is not None and tickets != self._last_tickets:
+            self.metadata.on_fill()
+        self._last_tickets = tickets
+        return snapshot
+
     def close_position(
         self,
         *,
@@ -164,13 +212,14 @@ class MT5Adapter:
             if order_type == mt5.ORDER_TYPE_SELL
             else mt5.symbol_info_tick(pos.symbol).ask,
             "deviation": 10,
-            "magic": 100001,
+            "magic": MAGIC_NUMBER,
             "comment": "live_engine_close",
         }
 
         result = mt5.order_send(request)
         if result.retcode != mt5.TRADE_RETCODE_DONE:
             raise RuntimeError(f"MT5 close failed: {result}")
+        self.metadata.on_fill()
 
     def close_partial(self, *, ticket: str, volume: float, price: float):
         if self.dry_run:
@@ -190,6 +239,7 @@ class MT5Adapter:
         result = mt5.order_send(request)
         if result.retcode != mt5.TRADE_RETCODE_DONE:
             raise RuntimeError(f"Partial close failed: {result}")
+        self.metadata.on_fill()
 
     def modify_sl(self, *, ticket: str, new_sl: float):
         if self.dry_run:
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from datetime import datetime
 
-import MetaTrader5 as mt5
-
 from config.live import MAX_RISK_PER_TRADE
 from core.live_trading.execution.live.exit_rules import LiveExitRules
 from core.live_trading.execution.live.trade_state_service import TradeStateService
@@ -11,7 +9,9 @@ from core.live_trading.execution.mapping.mt5_order_mapper import trade_plan_to_m
 from core.live_trading.execution.policy.exit_execution import ExitExecution
 from core.live_trading.execution.risk.mt5_risk_params import Mt5RiskParams
 from core.live_trading.execution.risk.sizing import LiveSizer
-from core.live_trading.execution.mt5_adapter import MT5Adapter
+from core.live_trading.execution.mt5_adapter import MAGIC_NUMBER, MT5Adapter
+from core.live_trading.execution.position_snapshot import PositionSnapshot, reconcile
+from core.live_trading.latency import NullLatencyRecorder
 from core.live_trading.trade_repo import TradeRepo
 from core.strategy.trade_plan import TradePlan
 
@@ -26,11 +26,16 @@ class PositionManager:
     - keep repo in sync with broker
     """
 
-    def __init__(self, repo: TradeRepo, adapter: MT5Adapter):
+    def __init__(self, repo: TradeRepo, adapter: MT5Adapter, latency=None):
         self.repo = repo
         self.adapter = adapter
+        self.latency = latency or NullLatencyRecorder()
         self.state = TradeStateService(repo=repo, adapter=adapter)
 
+        # broker positions of the current tick (None: not taken / stale)
+        self._snapshot: PositionSnapshot | None = None
+        self._reported_orphans: set[int] = set()
+
     # ==================================================
     # Helpers
     # ==================================================
@@ -38,18 +43,26 @@ class PositionManager:
     def _is_dry_run(self) -> bool:
         return bool(getattr(self.adapter, "dry_run", False))
 
+    def _invalidate_snapshot(self) -> None:
+        # we changed broker state: positions of this tick are stale
+        self._snapshot = None
+
     # ==================================================
     # ENTRY
     # ==================================================
 
-    def on_trade_plan(self, *, plan: TradePlan, market_state: dict) -> None:
+    def on_trade_plan(self, *, plan: TradePlan, market_state: dict) -> bool:
+        """
+        True when an order was placed and recorded.
+        """
         if self.state.has_active_position(plan.symbol):
             print("⚠️ Position already active – skipping TradePlan")
-            return
+            return False
 
         execution = ExitExecution.from_config(plan.strategy_config)
 
-        volume = self._compute_volume(plan=plan)
+        with self.latency.span("sizing", plan.symbol):
+            volume = self._compute_volume(plan=plan)
         params = trade_plan_to_mt5_order(
             plan=plan,
             volume=volume,
@@ -61,24 +74,29 @@ class PositionManager:
             f"raw_vol={volume:.6f} norm_vol={params.volume}"
         )
 
-        result = self.adapter.open_position(
-            symbol=params.symbol,
-            direction=params.direction,
-            volume=params.volume,
-            sl=params.sl,
-            tp=params.tp,
-        )
+        with self.latency.span("order_send", plan.symbol):
+            result = self.adapter.open_position(
+                symbol=params.symbol,
+                direction=params.direction,
+                volume=params.volume,
+                sl=params.sl,
+                tp=params.tp,
+                snapshot=self._snapshot,
+            )
+        self._invalidate_snapshot()
 
         # ENTRY may be skipped (CLOSE-ONLY, DRY_RUN guard etc.)
         if result is None:
             print(f"⚠ ENTRY skipped for {plan.symbol}")
-            return
+            return False
 
-        self.state.record_entry(
-            plan=plan,
-            exec_result=result,
-            entry_time=market_state["time"],
-        )
+        with self.latency.span("repo_write", plan.symbol):
+            self.state.record_entry(
+                plan=plan,
+                exec_result=result,
+                entry_time=market_state["time"],
+            )
+        return True
 
     def _compute_volume(self, *, plan: TradePlan) -> float:
         cfg = plan.strategy_config or {}
@@ -97,61 +115,113 @@ class PositionManager:
     # ==================================================
 
     def on_tick(self, *, market_state: dict) -> None:
+        """
+        One market state for every active trade (single-symbol engines).
+        """
+        self.on_ticks(market_states={None: market_state})
+
+    def on_ticks(self, *, market_states: dict[str | None, dict]) -> None:
+        """
+        Market states keyed by symbol (key None: any symbol). Trades of
+        symbols without a state this tick are left for the next one.
+        """
         active = self.repo.load_active()
+
+        # one positions_get() per tick, shared by every handler
+        self._snapshot = None if self._is_dry_run() else self.adapter.positions_snapshot()
+        if self._snapshot is not None:
+            self._log_orphans(active, self._snapshot)
+
         if not active:
             return
 
-        price = market_state["price"]
+        fallback = market_states.get(None)
+
+        # handlers mutate `active` in place; one save at the end of the tick
+        self.state.begin_tick(active)
+        try:
+            for trade_id, trade in list(active.items()):
+                market_state = market_states.get(trade.get("symbol"), fallback)
+                if market_state is None:
+                    continue
+                self._on_trade_tick(trade_id=trade_id, trade=trade, market_state=market_state)
+        finally:
+            self.state.commit()
+
+    def _on_trade_tick(self, *, trade_id: str, trade: dict, market_state: dict) -> None:
+        price = self._exit_price(trade, market_state)
         now: datetime = market_state["time"]
 
-        for trade_id, trade in list(active.items()):
-            if self._handle_broker_sync(trade_id=trade_id, trade=trade, now=now):
-                continue
+        if self._handle_broker_sync(
+            trade_id=trade_id,
+            trade=trade,
+            now=now,
+            snapshot=self._snapshot,
+        ):
+            return
 
-            execution = self._get_execution(trade)
+        execution = self._get_execution(trade)
 
-            if self._handle_managed_exit_signal(
-                trade_id=trade_id,
-                trade=trade,
-                market_state=market_state,
-                price=price,
-                now=now,
-            ):
-                continue
+        if self._handle_managed_exit_signal(
+            trade_id=trade_id,
+            trade=trade,
+            market_state=market_state,
+            price=price,
+            now=now,
+        ):
+            return
 
-            if self._handle_tp1_and_be(
-                trade_id=trade_id,
-                trade=trade,
-                execution=execution,
-                price=price,
-                now=now,
-            ):
-                continue
+        if self._handle_tp1_and_be(
+            trade_id=trade_id,
+            trade=trade,
+            execution=execution,
+            price=price,
+            now=now,
+        ):
+            return
 
-            self._handle_trailing_sl(
-                trade_id=trade_id,
-                trade=trade,
-                market_state=market_state,
-            )
+        self._handle_trailing_sl(
+            trade_id=trade_id,
+            trade=trade,
+            market_state=market_state,
+        )
 
-            self._handle_engine_exit(
-                trade_id=trade_id,
-                trade=trade,
-                execution=execution,
-                price=price,
-                now=now,
-            )
+        self._handle_engine_exit(
+            trade_id=trade_id,
+            trade=trade,
+            execution=execution,
+            price=price,
+            now=now,
+        )
 
     # ==================================================
     # Tick handlers
     # ==================================================
 
-    def _handle_broker_sync(self, *, trade_id: str, trade: dict, now: datetime) -> bool:
-        if self._is_dry_run():
+    def _log_orphans(self, active: dict, snapshot: PositionSnapshot) -> None:
+        result = reconcile(active, snapshot, magic=MAGIC_NUMBER)
+        for ticket in result.orphans:
+            if ticket in self._reported_orphans:
+                continue
+            self._reported_orphans.add(ticket)
+            position = snapshot.get(ticket)
+            print(
+                f"⚠️ Orphan broker position {ticket} "
+                f"({getattr(position, 'symbol', '?')}) not in repo"
+            )
+
+    def _handle_broker_sync(
+        self,
+        *,
+        trade_id: str,
+        trade: dict,
+        now: datetime,
+        snapshot: PositionSnapshot | None,
+    ) -> bool:
+        if self._is_dry_run() or snapshot is None:
             return False
 
-        positions = mt5.positions_get(ticket=int(trade["ticket"]))
-        if positions:
+        if snapshot.has(trade["ticket"]):
             return False
 
         print(f"🧹 Broker closed position {trade_id}, syncing repo")
@@ -188,6 +258,7 @@ class PositionManager:
                     ticket=trade["ticket"],
                     price=price,
                 )
+                self._invalidate_snapshot()
 
             self.state.record_exit(
                 trade_id=trade_id,
@@ -256,6 +327,7 @@ class PositionManager:
                 volume=close_vol,
                 price=price,
             )
+            self._invalidate_snapshot()
 
         self.state.mark_tp1_executed(
             trade_id=trade_id,
@@ -335,6 +407,7 @@ class PositionManager:
                 ticket=trade["ticket"],
                 price=exit_res.exit_price,
             )
+            self._invalidate_snapshot()
 
         self.state.record_exit(
             trade_id=trade_id,
@@ -345,6 +418,15 @@ class PositionManager:
         )
         return True
 
+    @staticmethod
+    def _exit_price(trade: dict, market_state: dict) -> float:
+        """
+        Price the trade would close at: bid for longs, ask for shorts
+        when the state carries a tick, else the state price.
+        """
+        side = {"long": "bid", "short": "ask"}.get(trade.get("direction"))
+        return market_state.get(side, market_state["price"])
+
     def _get_execution(self, trade: dict) -> ExitExecution:
         raw = trade.get("exit_execution")
         if isinstance(raw, dict):
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class PositionSnapshot:
+    """
+    Broker positions at one moment (one positions_get() call).
+    Keyed by ticket.
+    """
+
+    positions: dict[int, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Any] | None) -> "PositionSnapshot":
+        return cls({int(p.ticket): p for p in positions or ()})
+
+    def has(self, ticket) -> bool:
+        try:
+            return int(ticket) in self.positions
+        except (TypeError, ValueError):
+            return False
+
+    def get(self, ticket) -> Any | None:
+        try:
+            return self.positions.get(int(ticket))
+        except (TypeError, ValueError):
+            return None
+
+    def for_symbol(self, symbol: str) -> list[Any]:
+        return [p for p in self.positions.values() if p.symbol == symbol]
+
+
+@dataclass(frozen=True)
+class Reconciliation:
+    """
+    Repo vs broker differences.
+
+    - missing: repo trade_ids whose ticket has no broker position
+      (closed at the broker)
+    - orphans: broker tickets opened by us (magic) with no repo entry
+    """
+
+    missing: tuple[str, ...]
+    orphans: tuple[int, ...]
+
+    @property
+    def in_sync(self) -> bool:
+        return not self.missing and not self.orphans
+
+
+def reconcile(
+    active: dict[str, dict],
+    snapshot: PositionSnapshot,
+    *,
+    magic: int | None = None,
+) -> Reconciliation:
+    repo_tickets = set()
+    missing = []
+    for trade_id, trade in active.items():
+        ticket = trade.get("ticket")
+        if snapshot.has(ticket):
+            repo_tickets.add(int(ticket))
+        else:
+            missing.append(trade_id)
+
+    orphans = [
+        ticket
+        for ticket, position in snapshot.positions.items()
+        if ticket not in repo_tickets
+        and (magic is None or getattr(position, "magic", None) == magic)
+    ]
+
+    return Reconciliation(missing=tuple(missing), orphans=tuple(sorted(orphans)))
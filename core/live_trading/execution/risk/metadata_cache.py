@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+import MetaTrader5 as mt5
+
+
+class BrokerMetadataCache:
+    """
+    TTL cache of account_info() and symbol_info(symbol).
+
+    Shared by sizing, volume normalization and order validation, so an
+    entry queries the broker only for the tick and the order itself.
+
+    Refresh:
+    - TTL: account_ttl_sec / symbol_ttl_sec
+    - events: on_fill() (balance/margin changed) drops the account;
+      invalidate_symbol() drops symbol specs (e.g. trade mode change)
+
+    Failed queries (None) are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        account_ttl_sec: float = 60.0,
+        symbol_ttl_sec: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.account_ttl_sec = account_ttl_sec
+        self.symbol_ttl_sec = symbol_ttl_sec
+        self.clock = clock
+
+        self._account: tuple[float, Any] | None = None
+        self._symbols: dict[str, tuple[float, Any]] = {}
+
+        self.queries = 0
+
+    # ==================================================
+    # Reads
+    # ==================================================
+
+    def account_info(self):
+        now = self.clock()
+        if self._account is not None and now - self._account[0] < self.account_ttl_sec:
+            return self._account[1]
+
+        self.queries += 1
+        info = mt5.account_info()
+        self._account = None if info is None else (now, info)
+        return info
+
+    def symbol_info(self, symbol: str):
+        now = self.clock()
+        cached = self._symbols.get(symbol)
+        if cached is not None and now - cached[0] < self.symbol_ttl_sec:
+            return cached[1]
+
+        self.queries += 1
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            self._symbols.pop(symbol, None)
+        else:
+            self._symbols[symbol] = (now, info)
+        return info
+
+    # ==================================================
+    # Invalidation
+    # ==================================================
+
+    def on_fill(self) -> None:
+        """
+        A deal changed balance / margin (our order or a broker-side close).
+        """
+        self._account = None
+
+    def invalidate_symbol(self, symbol: str | None = None) -> None:
+        if symbol is None:
+            self._symbols.clear()
+        else:
+            self._symbols.pop(symbol, None)
+
+    def clear(self) -> None:
+        self.on_fill()
+        self.invalidate_symbol()
+
+
+# one cache per process: the terminal (and its account) is process-wide
+METADATA_CACHE = BrokerMetadataCache()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import MetaTrader5 as mt5
+from core.live_trading.execution.risk.metadata_cache import METADATA_CACHE
 
 
 class Mt5RiskParams:
@@ -9,7 +9,7 @@ class Mt5RiskParams:
         """
         Returns (point_size, pip_value) for 1 lot.
         """
-        info = mt5.symbol_info(symbol)
+        info = METADATA_CACHE.symbol_info(symbol)
         if info is None:
             raise RuntimeError(f"Symbol not found: {symbol}")
 
@@ -26,7 +26,7 @@ class Mt5RiskParams:
 
     @staticmethod
     def normalize_volume(symbol: str, volume: float) -> float:
-        info = mt5.symbol_info(symbol)
+        info = METADATA_CACHE.symbol_info(symbol)
         if info is None:
             raise RuntimeError(f"Symbol not found: {symbol}")
 
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import MetaTrader5 as mt5
-
 from core.domain.risk.sizing import position_size
+from core.live_trading.execution.risk.metadata_cache import METADATA_CACHE
 from core.live_trading.execution.risk.mt5_risk_params import Mt5RiskParams
 
 
 class LiveSizer:
     @staticmethod
     def get_account_size() -> float:
-        account = mt5.account_info()
+        account = METADATA_CACHE.account_info()
         if account is None:
             raise RuntimeError("MT5 account info unavailable")
         return float(account.balance)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+
+# ==================================================
+# Histogram
+# ==================================================
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of durations (microsecond resolution).
+
+    Values below 2**SUB_BITS us are exact; above, every power of two is
+    split into 2**(SUB_BITS - 1) buckets, so any recorded value is off by
+    less than 1% (2 significant digits) with constant memory and O(1)
+    record. Sparse: only touched buckets are stored.
+    """
+
+    SUB_BITS = 8
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    # ---------------------------
+    # Buckets
+    # ---------------------------
+
+    @classmethod
+    def _index(cls, us: int) -> int:
+        sub = 1 << cls.SUB_BITS
+        if us < sub:
+            return us
+        shift = us.bit_length() - cls.SUB_BITS
+        half = sub >> 1
+        return sub + (shift - 1) * half + ((us >> shift) - half)
+
+    @classmethod
+    def _value(cls, index: int) -> int:
+        """
+        Highest value of the bucket (percentiles never under-report).
+        """
+        sub = 1 << cls.SUB_BITS
+        if index < sub:
+            return index
+        half = sub >> 1
+        shift = (index - sub) // half + 1
+        mantissa = (index - sub) % half + half
+        return ((mantissa + 1) << shift) - 1
+
+    # ---------------------------
+    # API
+    # ---------------------------
+
+    def record(self, seconds: float) -> None:
+        us = max(int(seconds * 1e6), 0)
+        idx = self._index(us)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.total_us += us
+        self.min_us = us if self.min_us is None else min(self.min_us, us)
+        self.max_us = max(self.max_us, us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, q: float) -> float:
+        """
+        q in [0, 100] -> seconds.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(int(round(q / 100.0 * self.count)), 1)
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._value(idx), self.max_us) / 1e6
+        return self.max_us / 1e6
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1e6 if self.count else 0.0
+
+    def summary_ms(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1e3, 3),
+            "p50_ms": round(self.percentile(50) * 1e3, 3),
+            "p90_ms": round(self.percentile(90) * 1e3, 3),
+            "p99_ms": round(self.percentile(99) * 1e3, 3),
+            "max_ms": round(self.max_us / 1e3, 3),
+        }
+
+
+# ==================================================
+# Recorder
+# ==================================================
+
+class LatencyRecorder:
+    """
+    Per (symbol, stage) latency histograms for the live stack.
+
+    span()/record() are thread-safe (async engines time stages on the
+    broker and strategy threads). maybe_export() appends one JSON line
+    per (symbol, stage) to `path` every export_interval_sec and starts a
+    new window; a stage whose p99 exceeds alert_fractions[stage] *
+    bar_seconds is flagged in the line and reported.
+
+    Stages: poll, exits, fetch, informatives, indicators, entry, plan,
+    sizing, order_send, repo_write, candle_to_plan, candle_to_order,
+    shadow.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | Path | None = None,
+        export_interval_sec: float = 60.0,
+        bar_seconds: float | None = None,
+        alert_fractions: dict[str, float] | None = None,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.export_interval_sec = export_interval_sec
+        self.bar_seconds = bar_seconds
+        self.alert_fractions = dict(alert_fractions or {})
+
+        self._lock = threading.Lock()
+        self._window: dict[tuple[str | None, str], LatencyHistogram] = {}
+        self._total: dict[tuple[str | None, str], LatencyHistogram] = {}
+        self._last_export = perf_counter()
+
+    @contextmanager
+    def span(self, stage: str, symbol: str | None = None):
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, perf_counter() - t0, symbol=symbol)
+
+    def record(self, stage: str, seconds: float, *, symbol: str | None = None) -> None:
+        key = (symbol, stage)
+        with self._lock:
+            hist = self._window.get(key)
+            if hist is None:
+                hist = self._window[key] = LatencyHistogram()
+            hist.record(seconds)
+
+    def histogram(self, stage: str, symbol: str | None = None) -> LatencyHistogram:
+        """
+        Everything recorded so far (exported windows + current one).
+        """
+        with self._lock:
+            merged = LatencyHistogram()
+            for source in (self._total, self._window):
+                if (symbol, stage) in source:
+                    merged.merge(source[(symbol, stage)])
+            return merged
+
+    # ---------------------------
+    # Export
+    # ---------------------------
+
+    def maybe_export(self) -> list[dict]:
+        if perf_counter() - self._last_export < self.export_interval_sec:
+            return []
+        return self.export()
+
+    def export(self) -> list[dict]:
+        with self._lock:
+            window, self._window = self._window, {}
+            for key, hist in window.items():
+                self._total.setdefault(key, LatencyHistogram()).merge(hist)
+        self._last_export = perf_counter()
+
+        ts = datetime.now(timezone.utc).isoformat()
+        lines = []
+        for (symbol, stage), hist in sorted(window.items(), key=lambda kv: (str(kv[0][0]), kv[0][1])):
+            line = {"time": ts, "symbol": symbol, "stage": stage, **hist.summary_ms()}
+            line["alert"] = self._is_alert(stage, hist)
+            if line["alert"]:
+                print(
+                    f"⚠️ Latency {symbol or '-'} {stage}: p99 {line['p99_ms']:.1f}ms "
+                    f"> {self.alert_fractions[stage]:.0%} of {self.bar_seconds:.0f}s bar"
+                )
+            lines.append(line)
+
+        if self.path is not None and lines:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for line in lines:
+                    f.write(json.dumps(line) + "\n")
+        return lines
+
+    def _is_alert(self, stage: str, hist: LatencyHistogram) -> bool:
+        fraction = self.alert_fractions.get(stage)
+        if fraction is None or not self.bar_seconds:
+            return False
+        return hist.percentile(99) > fraction * self.bar_seconds
+
+
+class NullLatencyRecorder:
+    """
+    Recorder that records nothing (default when latency is not configured).
+    """
+
+    @contextmanager
+    def span(self, stage: str, symbol: str | None = None):
+        yield
+
+    def record(self, stage: str, seconds: float, *, symbol: str | None = None) -> None:
+        pass
+
+    def maybe_export(self) -> list[dict]:
+        return []
+
+    def export(self) -> list[dict]:
+        return []
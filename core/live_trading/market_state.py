@@ -14,7 +14,9 @@ class MarketStateProvider(ABC):
             {
               "price": float,
               "time": datetime,
-              "candle_time": datetime | None
+              "candle_time": datetime | None,
+              "bid": float, "ask": float     # optional (tick providers)
             }
+            or None when there is nothing new.
         """
         ...
\ No newline at end of file
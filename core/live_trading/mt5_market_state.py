@@ -1,9 +1,11 @@
+import time
+
 import MetaTrader5 as mt5
 import pandas as pd
 from datetime import datetime
 
 from core.live_trading.market_state import MarketStateProvider
-from core.utils.timeframe import MT5_TIMEFRAME_MAP
+from core.utils.timeframe import MT5_TIMEFRAME_MAP, tf_to_minutes
 
 
 class MT5MarketStateProvider(MarketStateProvider):
@@ -35,4 +37,119 @@ class MT5MarketStateProvider(MarketStateProvider):
             "price": float(last_closed["close"]),
             "time": candle_time,
             "candle_time": candle_time if is_new_candle else None,
-        }
\ No newline at end of file
+        }
+
+
+class MT5TickMarketStateProvider(MarketStateProvider):
+    """
+    Polls MT5 for the current bid/ask tick (symbol_info_tick).
+
+    - exits see every new tick: "bid" / "ask" (+ "price" = bid), "time"
+      is the tick time
+    - unchanged ticks (same time_msc, bid, ask) return None, so a quiet
+      market costs one cheap call per poll and no exit handling; every
+      heartbeat_sec an unchanged tick is still emitted (time-based exits,
+      broker sync)
+    - candle close stays a separate event: checked against the last
+      closed candle (copy_rates_from_pos) only when the tick enters a new
+      bar period, or on every new tick for W1/MN1
+    """
+
+    def __init__(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        heartbeat_sec: float | None = 60.0,
+        clock=time.monotonic,
+    ):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.heartbeat_sec = heartbeat_sec
+        self.clock = clock
+
+        try:
+            bar_seconds = tf_to_minutes(timeframe) * 60
+        except ValueError:
+            bar_seconds = None
+        # weeks / months do not align to epoch multiples
+        self._bar_seconds = bar_seconds if bar_seconds and bar_seconds <= 86400 else None
+
+        self._candles = MT5MarketStateProvider(symbol=symbol, timeframe=timeframe)
+        self._last_key = None
+        self._last_bucket = None
+        self._last_emit = None
+
+        self.ticks = 0
+        self.duplicates = 0
+
+    def poll(self):
+        tick = mt5.symbol_info_tick(self.symbol)
+        if tick is None:
+            return None
+
+        key = (tick.time_msc, tick.bid, tick.ask)
+        now = self.clock()
+        if key == self._last_key:
+            self.duplicates += 1
+            if self.heartbeat_sec is None or now - self._last_emit < self.heartbeat_sec:
+                return None
+        else:
+            self.ticks += 1
+        self._last_key = key
+        self._last_emit = now
+
+        return {
+            "price": float(tick.bid),
+            "bid": float(tick.bid),
+            "ask": float(tick.ask),
+            "time": pd.to_datetime(tick.time_msc, unit="ms", utc=True),
+            "candle_time": self._closed_candle(int(tick.time)),
+        }
+
+    def _closed_candle(self, tick_time: int):
+        bucket = None
+        if self._bar_seconds is not None:
+            bucket = tick_time // self._bar_seconds
+            if bucket == self._last_bucket:
+                return None
+
+        state = self._candles.poll()
+        candle_time = None if state is None else state["candle_time"]
+        # the terminal may publish the bar after its first tick: retry until it does
+        if candle_time is not None:
+            self._last_bucket = bucket
+        return candle_time
+
+
+class MT5MultiMarketStateProvider(MarketStateProvider):
+    """
+    Polls every symbol in one pass (provider_cls per symbol: closed
+    candles or ticks). Candle close is detected per symbol.
+    """
+
+    def __init__(
+        self,
+        *,
+        symbols: list[str],
+        timeframe: str,
+        provider_cls=MT5MarketStateProvider,
+    ):
+        self.providers = {
+            symbol: provider_cls(symbol=symbol, timeframe=timeframe)
+            for symbol in symbols
+        }
+
+    def poll(self):
+        """
+        Returns:
+            {symbol: market_state (with "symbol")} for symbols with data
+        """
+        states = {}
+        for symbol, provider in self.providers.items():
+            state = provider.poll()
+            if state is None:
+                continue
+            state["symbol"] = symbol
+            states[symbol] = state
+        return states
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+
+from core.live_trading.async_engine import AsyncLiveEngine
+
+
+class MultiSymbolLiveEngine(AsyncLiveEngine):
+    """
+    One asyncio engine for N symbols.
+
+    - poll: one broker job per tick polls every symbol;
+      market_state_provider.poll() -> {symbol: market_state}, candle
+      close detected per symbol
+    - exits: latest state per symbol, handled by ONE
+      position_manager.on_ticks() call (one positions snapshot)
+    - strategy: symbols whose candle closed are fetched on the broker
+      thread and evaluated in parallel on the strategy pool; plans go to
+      the shared position manager
+
+    latency (LatencyRecorder), per symbol: tick_to_exit and
+    strategy_cycle, seconds from the poll that saw the update until it
+    was handled. A candle cycle slower than bar_seconds (the whole
+    universe not served within one bar) is reported.
+    """
+
+    def __init__(
+        self,
+        *,
+        position_manager,
+        market_state_provider,
+        strategy_runners: dict,
+        tick_interval_sec: float = 1.0,
+        bar_seconds: float | None = None,
+        strategy_workers: int | None = None,
+        strategy_executor: Executor | None = None,
+        latency=None,
+    ):
+        workers = strategy_workers or min(len(strategy_runners), os.cpu_count() or 1)
+        super().__init__(
+            position_manager=position_manager,
+            market_state_provider=market_state_provider,
+            strategy_runner=None,
+            tick_interval_sec=tick_interval_sec,
+            strategy_executor=strategy_executor or ThreadPoolExecutor(
+                max_workers=max(workers, 1), thread_name_prefix="strategy"
+            ),
+            latency=latency,
+        )
+        self.strategy_runners = strategy_runners
+        self.bar_seconds = bar_seconds
+
+        self._last_strategy_state = {}
+        self.last_cycle_s = 0.0
+        self.slow_cycles = 0
+
+    # ==================================================
+    # Tasks
+    # ==================================================
+
+    def _tasks(self) -> dict:
+        # mailboxes: latest (state, polled_at) per symbol, bounded by the universe
+        self._prices: dict = {}
+        self._candles: dict = {}
+        self._price_ready = asyncio.Event()
+        self._candle_ready = asyncio.Event()
+
+        return {
+            "poll": self._poll_all_loop(),
+            "exits": self._exits_loop(),
+            "strategy": self._candles_loop(),
+        }
+
+    async def _poll_all_loop(self):
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+
+        while True:
+            self.latency.maybe_export()
+            polled_at = loop.time()
+            try:
+                states = await self._on_broker(self.market_state_provider.poll) or {}
+            except Exception as e:
+                print(f"❌ Poll error: {type(e).__name__}: {e}")
+                states = {}
+            self.latency.record("poll", loop.time() - polled_at)
+
+            for symbol, market_state in states.items():
+                if symbol in self._prices:
+                    self.dropped_prices += 1
+                self._prices[symbol] = (market_state, polled_at)
+
+                if market_state.get("candle_time") is not None:
+                    if symbol in self._candles:
+                        self.dropped_candles += 1
+                        print(f"⚠️ {symbol}: strategy busy – replaced pending candle")
+                    self._candles[symbol] = (market_state, polled_at)
+
+            if self._prices:
+                self._price_ready.set()
+            if self._candles:
+                self._candle_ready.set()
+
+            next_at = await self._sleep_until_next(next_at)
+
+    async def _exits_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._price_ready.wait()
+            self._price_ready.clear()
+            batch, self._prices = self._prices, {}
+
+            try:
+                await self._on_broker(partial(
+                    self._timed_exits,
+                    partial(
+                        self.position_manager.on_ticks,
+                        market_states={s: state for s, (state, _) in batch.items()},
+                    ),
+                ))
+            except Exception as e:
+                print(f"❌ Exit handling error: {type(e).__name__}: {e}")
+
+            done = loop.time()
+            for symbol, (_, polled_at) in batch.items():
+                self.latency.record("tick_to_exit", done - polled_at, symbol=symbol)
+
+    async def _candles_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._candle_ready.wait()
+            self._candle_ready.clear()
+            batch, self._candles = self._candles, {}
+
+            started = min(polled_at for _, polled_at in batch.values())
+            await asyncio.gather(*(
+                self._run_symbol(symbol, market_state, polled_at)
+                for symbol, (market_state, polled_at) in batch.items()
+            ))
+
+            self.last_cycle_s = loop.time() - started
+            if self.bar_seconds and self.last_cycle_s > self.bar_seconds:
+                self.slow_cycles += 1
+                print(
+                    f"⚠️ Candle cycle {self.last_cycle_s:.2f}s exceeds bar "
+                    f"budget {self.bar_seconds:.0f}s ({len(batch)} symbols)"
+                )
+
+    async def _run_symbol(self, symbol: str, market_state: dict, polled_at: float):
+        runner = self.strategy_runners.get(symbol)
+        if runner is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await self._run_strategy(runner, market_state, polled_at, symbol)
+            self._last_strategy_state[symbol] = result.last_row
+        except Exception as e:
+            print(f"❌ {symbol} strategy error: {type(e).__name__}: {e}")
+        finally:
+            self.latency.record("strategy_cycle", loop.time() - polled_at, symbol=symbol)
@@ -1,3 +1,5 @@
+from functools import partial
+
 import MetaTrader5 as mt5
 import pandas as pd
 
@@ -6,19 +8,29 @@ from core.data_provider.clients.mt5_client import (
     MT5Client,
 )
 from core.data_provider.providers.live_provider import LiveStrategyDataProvider
+from core.live_trading.async_engine import AsyncLiveEngine
 from core.live_trading.engine import LiveEngine
 from core.live_trading.execution.mt5_adapter import MT5Adapter
 from core.live_trading.execution.position_manager import PositionManager
+from core.live_trading.execution.risk.metadata_cache import METADATA_CACHE
+from core.live_trading.latency import LatencyRecorder, NullLatencyRecorder
 from core.live_trading.logging import create_live_logger
-from core.live_trading.mt5_market_state import MT5MarketStateProvider
+from core.live_trading.multi_engine import MultiSymbolLiveEngine
+from core.live_trading.shadow import ShadowComparator
+from core.live_trading.mt5_market_state import (
+    MT5MarketStateProvider,
+    MT5MultiMarketStateProvider,
+    MT5TickMarketStateProvider,
+)
 from core.live_trading.strategy_runner  import LiveStrategyRunner
 
-from core.live_trading.trade_repo import TradeRepo
+from core.live_trading.trade_repo import create_trade_repo
 from core.live_trading.strategy_loader import  load_strategy_class
 from core.logging.config import LoggerConfig
 from core.logging.prefix import LOG_PREFIX
 from core.logging.run_logger import RunLogger
 from core.utils.lookback import LOOKBACK_CONFIG
+from core.utils.timeframe import tf_to_minutes
 
 
 class LiveTradingRunner:
@@ -28,7 +40,10 @@ class LiveTradingRunner:
 
     def __init__(self, cfg):
         self.cfg = cfg
-        self.log = create_live_logger(cfg.SYMBOLS)
+        self.symbols = (
+            [cfg.SYMBOLS] if isinstance(cfg.SYMBOLS, str) else list(cfg.SYMBOLS)
+        )
+        self.log = create_live_logger(",".join(self.symbols))
 
     def run(self):
         self.log.info("starting live trading runner")
@@ -37,7 +52,8 @@ class LiveTradingRunner:
             self.log.error("MT5 init failed")
             raise RuntimeError("MT5 init failed")
 
-        mt5.symbol_select(self.cfg.SYMBOLS, True)
+        for symbol in self.symbols:
+            mt5.symbol_select(symbol, True)
         self.log.info(
             "MT5 initialized",
         )
@@ -60,40 +76,99 @@ class LiveTradingRunner:
             bars_per_tf=bars_per_tf,
         )
 
-        strategy = StrategyClass(
-            df=None,
-            symbol=self.cfg.SYMBOLS,
-            startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
-        )
-
-        strategy_runner = LiveStrategyRunner(
-            strategy=strategy,
-            data_provider=data_provider,
-            symbol=self.cfg.SYMBOLS,
-        )
-
-        market_state_provider = MT5MarketStateProvider(
-            symbol=self.cfg.SYMBOLS,
-            timeframe=self.cfg.TIMEFRAME,
-        )
+        latency = self._build_latency()
+        shadow = self._build_shadow(latency)
+
+        strategy_runners = {
+            symbol: LiveStrategyRunner(
+                strategy=StrategyClass(
+                    df=None,
+                    symbol=symbol,
+                    startup_candle_count=self.cfg.STARTUP_CANDLE_COUNT,
+                ),
+                data_provider=data_provider,
+                symbol=symbol,
+                latency=latency,
+                shadow=shadow,
+            )
+            for symbol in self.symbols
+        }
+
+        METADATA_CACHE.account_ttl_sec = self.cfg.METADATA_ACCOUNT_TTL_SEC
+        METADATA_CACHE.symbol_ttl_sec = self.cfg.METADATA_SYMBOL_TTL_SEC
 
         adapter = MT5Adapter(
             dry_run=self.cfg.DRY_RUN,
             log=self.log.with_context(component="adapter"),
         )
-        repo = TradeRepo()
-        pm = PositionManager(repo=repo, adapter=adapter)
+        repo = create_trade_repo(self.cfg.TRADE_REPO_BACKEND)
+        pm = PositionManager(repo=repo, adapter=adapter, latency=latency)
 
-        engine = LiveEngine(
-            position_manager=pm,
-            market_state_provider=market_state_provider,
-            strategy_runner=strategy_runner,
-            tick_interval_sec=self.cfg.TICK_INTERVAL_SEC,
-        )
+        engine = self._build_engine(pm, strategy_runners, latency)
 
         self.log.with_context(
+            symbols=len(self.symbols),
+            engine=type(engine).__name__,
             timeframe=self.cfg.TIMEFRAME,
             dry_run=self.cfg.DRY_RUN,
         ).info("LIVE STARTED")
 
-        engine.start()
\ No newline at end of file
+        engine.start()
+
+    def _build_latency(self):
+        if not self.cfg.LATENCY_TRACKING:
+            return NullLatencyRecorder()
+        return LatencyRecorder(
+            path=self.cfg.LATENCY_LOG_PATH,
+            export_interval_sec=self.cfg.LATENCY_EXPORT_INTERVAL_SEC,
+            bar_seconds=tf_to_minutes(self.cfg.TIMEFRAME) * 60,
+            alert_fractions=self.cfg.LATENCY_ALERT_BAR_FRACTION,
+        )
+
+    def _build_shadow(self, latency):
+        if not self.cfg.SHADOW_COMPARE:
+            return None
+        return ShadowComparator(
+            window=self.cfg.SHADOW_WINDOW,
+            settle_bars=self.cfg.SHADOW_SETTLE_BARS,
+            path=self.cfg.SHADOW_LOG_PATH,
+            latency=latency,
+        )
+
+    def _build_engine(self, pm, strategy_runners, latency):
+        # several symbols: one multi-symbol engine, one MT5 session
+        if len(self.symbols) > 1:
+            return MultiSymbolLiveEngine(
+                position_manager=pm,
+                market_state_provider=MT5MultiMarketStateProvider(
+                    symbols=self.symbols,
+                    timeframe=self.cfg.TIMEFRAME,
+                    provider_cls=self._market_state_cls(),
+                ),
+                strategy_runners=strategy_runners,
+                tick_interval_sec=self.cfg.TICK_INTERVAL_SEC,
+                bar_seconds=tf_to_minutes(self.cfg.TIMEFRAME) * 60,
+                strategy_workers=self.cfg.LIVE_STRATEGY_WORKERS,
+                latency=latency,
+            )
+
+        symbol = self.symbols[0]
+        engine_cls = AsyncLiveEngine if self.cfg.LIVE_ENGINE == "async" else LiveEngine
+        return engine_cls(
+            position_manager=pm,
+            market_state_provider=self._market_state_cls()(
+                symbol=symbol,
+                timeframe=self.cfg.TIMEFRAME,
+            ),
+            strategy_runner=strategy_runners[symbol],
+            tick_interval_sec=self.cfg.TICK_INTERVAL_SEC,
+            latency=latency,
+        )
+
+    def _market_state_cls(self):
+        if self.cfg.MARKET_STATE_SOURCE == "candles":
+            return MT5MarketStateProvider
+        return partial(
+            MT5TickMarketStateProvider,
+            heartbeat_sec=self.cfg.TICK_HEARTBEAT_SEC,
+        )
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import math
+import queue
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+
+import pandas as pd
+
+from core.live_trading.latency import NullLatencyRecorder
+from core.strategy.trade_plan import ManagedExitPlan
+
+
+PLAN_FIELDS = ("direction", "entry_tag", "exit_mode", "sl", "tp1", "tp2")
+
+
+@dataclass
+class ShadowMismatch:
+    symbol: str
+    bar_time: str
+    lag: int                 # bars between the live decision and the check
+    field: str
+    live: object
+    backtest: object
+    live_plan_ms: float
+    shadow_ms: float
+
+
+class ShadowComparator:
+    """
+    Live vs backtest plan check on every candle.
+
+    The live runner hands over the frame it has just computed (informatives,
+    indicators, signals) with the TradePlan it emitted. The comparator runs
+    the vectorized backtest plan path (build_trade_plans_backtest) on the
+    last `window` rows of that frame - the features are reused, only the
+    plan stage is re-run - and compares bar by bar:
+
+    - lag 0: live plan vs the plan frame row of the same bar
+      (row builder vs vectorized builder)
+    - lag settle_bars: the live plan of an older bar vs its row in the
+      current frame (repainting / lookahead: the backtest sees later data)
+
+    Mismatches are printed and appended to `path` as JSON lines with the
+    live plan time and the shadow run time; the shadow run is also timed
+    as the "shadow" latency stage.
+
+    The live path calls submit(): candles are queued (at most max_pending,
+    newer ones dropped when full) and observed on a background thread, so
+    the comparison never delays the order.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 64,
+        settle_bars: int = 2,
+        rel_tol: float = 1e-6,
+        path: str | Path | None = None,
+        latency=None,
+        max_pending: int = 256,
+    ):
+        if settle_bars >= window:
+            raise ValueError("settle_bars must be smaller than window")
+
+        self.window = window
+        self.settle_bars = settle_bars
+        self.rel_tol = rel_tol
+        self.path = Path(path) if path is not None else None
+        self.latency = latency or NullLatencyRecorder()
+
+        self._lock = threading.Lock()
+        self._last_bar: dict[str, object] = {}
+        self._pending: dict[str, deque] = {}
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._worker: threading.Thread | None = None
+
+        self.bars = 0
+        self.dropped = 0
+        self.mismatches: list[ShadowMismatch] = []
+
+    # ==================================================
+    # API
+    # ==================================================
+
+    def submit(self, **candle) -> None:
+        """
+        Non-blocking observe(): same arguments, checked on the shadow thread.
+        """
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="shadow", daemon=True)
+                self._worker.start()
+        try:
+            self._queue.put_nowait(candle)
+        except queue.Full:
+            self.dropped += 1
+
+    def join(self) -> None:
+        """
+        Wait until every submitted candle has been checked.
+        """
+        self._queue.join()
+
+    def observe(
+        self,
+        *,
+        strategy,
+        ctx,
+        df: pd.DataFrame,
+        plan,
+        live_plan_s: float = 0.0,
+    ) -> list[ShadowMismatch]:
+        """
+        One live candle: df is the runner's computed frame, plan the
+        TradePlan (or None) built from its last row.
+        """
+        symbol = ctx.symbol
+        tail = df.iloc[-self.window:]
+        tail_times = pd.Index(_bar_times(tail))
+        bar_time = tail_times[-1]
+        if self._last_bar.get(symbol) == bar_time:
+            return []
+        self._last_bar[symbol] = bar_time
+
+        t0 = perf_counter()
+        plans = strategy.build_trade_plans_backtest(
+            df=tail,
+            ctx=ctx,
+            allow_managed_in_backtest=True,
+        )
+        shadow_s = perf_counter() - t0
+        self.latency.record("shadow", shadow_s, symbol=symbol)
+
+        live_view = _plan_view(plan)
+
+        def check(view, when, lag, plan_s):
+            pos = tail_times.get_indexer([when])[0]
+            if pos < 0:
+                return []
+            return self._compare(
+                symbol=symbol,
+                bar_time=when,
+                lag=lag,
+                live=view,
+                backtest=_frame_view(plans.iloc[pos]),
+                live_plan_ms=plan_s * 1e3,
+                shadow_ms=shadow_s * 1e3,
+            )
+
+        found = check(live_view, bar_time, 0, live_plan_s)
+
+        pending = self._pending.setdefault(symbol, deque())
+        pending.append((bar_time, live_view, live_plan_s))
+        if len(pending) > self.settle_bars:
+            old_time, old_view, old_plan_s = pending.popleft()
+            found += check(old_view, old_time, self.settle_bars, old_plan_s)
+
+        self.bars += 1
+        if found:
+            self._report(found)
+        return found
+
+    # ==================================================
+    # Internals
+    # ==================================================
+
+    def _run(self) -> None:
+        while True:
+            candle = self._queue.get()
+            try:
+                self.observe(**candle)
+            except Exception as e:
+                print(f"❌ Shadow error: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _compare(self, *, symbol, bar_time, lag, live, backtest, live_plan_ms, shadow_ms):
+        if live is None and backtest is None:
+            return []
+
+        if live is None or backtest is None:
+            fields = [("plan", live is not None, backtest is not None)]
+        else:
+            fields = [
+                (name, live[name], backtest[name])
+                for name in PLAN_FIELDS
+                if not self._same(live[name], backtest[name])
+            ]
+
+        return [
+            ShadowMismatch(
+                symbol=symbol,
+                bar_time=str(bar_time),
+                lag=lag,
+                field=name,
+                live=live_value,
+                backtest=bt_value,
+                live_plan_ms=round(live_plan_ms, 3),
+                shadow_ms=round(shadow_ms, 3),
+            )
+            for name, live_value, bt_value in fields
+        ]
+
+    def _same(self, a, b) -> bool:
+        if isinstance(a, float) and isinstance(b, float):
+            return math.isclose(a, b, rel_tol=self.rel_tol)
+        return a == b
+
+    def _report(self, found: list[ShadowMismatch]) -> None:
+        with self._lock:
+            self.mismatches.extend(found)
+            for m in found:
+                print(
+                    f"⚠️ Shadow {m.symbol} {m.bar_time} lag={m.lag} {m.field}: "
+                    f"live={m.live} backtest={m.backtest}"
+                )
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    for m in found:
+                        f.write(json.dumps(asdict(m), default=str) + "\n")
+
+
+# ==================================================
+# Plan views
+# ==================================================
+
+def _bar_times(df: pd.DataFrame) -> list:
+    if "time" in df.columns:
+        return list(df["time"])
+    return list(df.index)
+
+
+def _level(value) -> float | None:
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _plan_view(plan) -> dict | None:
+    if plan is None:
+        return None
+    exit_plan = plan.exit_plan
+    managed = isinstance(exit_plan, ManagedExitPlan)
+    return {
+        "direction": plan.direction,
+        "entry_tag": plan.entry_tag,
+        "exit_mode": "managed" if managed else "fixed",
+        "sl": _level(exit_plan.sl),
+        "tp1": _level(exit_plan.tp1),
+        "tp2": None if managed else _level(exit_plan.tp2),
+    }
+
+
+def _frame_view(row: pd.Series) -> dict | None:
+    if not bool(row["plan_valid"]):
+        return None
+    managed = row["plan_exit_mode"] == "managed"
+    return {
+        "direction": row["plan_direction"],
+        "entry_tag": row["plan_entry_tag"],
+        "exit_mode": row["plan_exit_mode"],
+        "sl": _level(row["plan_sl"]),
+        "tp1": _level(row["plan_tp1"]),
+        "tp2": None if managed else _level(row["plan_tp2"]),
+    }
@@ -0,0 +1,626 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config.instrument_meta import INSTRUMENT_META, get_spread_abs
+
+
+# ==================================================
+# MT5 records
+# ==================================================
+
+RATES_DTYPE = np.dtype([
+    ("time", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("tick_volume", "<u8"),
+    ("spread", "<i4"),
+    ("real_volume", "<u8"),
+])
+
+Tick = namedtuple("Tick", "time bid ask last volume time_msc")
+TerminalInfo = namedtuple("TerminalInfo", "connected trade_allowed name")
+AccountInfo = namedtuple(
+    "AccountInfo", "login balance equity profit margin_free leverage currency server"
+)
+SymbolInfo = namedtuple(
+    "SymbolInfo",
+    "name visible trade_mode point digits spread trade_stops_level "
+    "trade_tick_value trade_tick_size trade_contract_size "
+    "volume_min volume_max volume_step",
+)
+Position = namedtuple(
+    "Position",
+    "ticket time symbol type volume price_open sl tp price_current profit magic comment",
+)
+OrderSendResult = namedtuple(
+    "OrderSendResult", "retcode deal order volume price bid ask comment request"
+)
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    """
+    Broker-side contract of one symbol (MT5 units: point, tick value per lot).
+    """
+
+    point: float = 0.01
+    digits: int = 2
+    tick_value: float = 0.01
+    tick_size: float = 0.01
+    contract_size: float = 1.0
+    spread_points: int = 0
+    stops_level: int = 0
+    volume_min: float = 0.01
+    volume_max: float = 100.0
+    volume_step: float = 0.01
+
+    @classmethod
+    def from_meta(cls, symbol: str) -> "SymbolSpec":
+        """
+        From config.instrument_meta (pip-based) to MT5 points:
+        FX quotes one digit finer than the pip.
+        """
+        meta = INSTRUMENT_META.get(symbol)
+        if meta is None:
+            return cls()
+
+        pip = float(meta["point"])
+        pip_value = float(meta["pip_value"])
+        fx = pip < 0.01
+        point = pip / 10 if fx else pip
+        tick_value = pip_value / 10 if fx else pip_value
+
+        return cls(
+            point=point,
+            digits=int(round(-np.log10(point))),
+            tick_value=tick_value,
+            tick_size=point,
+            contract_size=float(meta.get("contract_size", 1.0)),
+            spread_points=int(round(get_spread_abs(symbol, pip) / point)),
+        )
+
+
+# ==================================================
+# Simulated terminal
+# ==================================================
+
+class SimulatedMT5:
+    """
+    Stand-in for the MetaTrader5 module over historical bars.
+
+    Implements the MT5 surface used by core/live_trading (rates, ticks,
+    symbol/account info, positions, order_send) with the real MT5
+    constant values, so MT5_TIMEFRAME_MAP and the adapter work unchanged.
+
+    Clock: the current time is the open of the forming base bar. Rates
+    show every completed bar plus the forming bar flat at its open (no
+    look-ahead); bid = that open, ask = bid + spread. advance() moves to
+    the next bar: positions' SL/TP are checked against the bars that
+    completed (SL first when both are touched), gaps fill at the open.
+
+    Fills: market orders fill at bid/ask worsened by slippage_points;
+    every order_send() blocks for fill_latency_sec (wall time).
+    """
+
+    TIMEFRAME_M1 = 1
+    TIMEFRAME_M5 = 5
+    TIMEFRAME_M15 = 15
+    TIMEFRAME_M30 = 30
+    TIMEFRAME_H1 = 0x4000 | 1
+    TIMEFRAME_H4 = 0x4000 | 4
+    TIMEFRAME_D1 = 0x4000 | 24
+    TIMEFRAME_W1 = 0x8000 | 1
+    TIMEFRAME_MN1 = 0xC000 | 1
+
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    POSITION_TYPE_BUY = 0
+    POSITION_TYPE_SELL = 1
+
+    TRADE_ACTION_DEAL = 1
+    TRADE_ACTION_SLTP = 6
+    ORDER_TIME_GTC = 0
+    ORDER_FILLING_FOK = 0
+    ORDER_FILLING_IOC = 1
+
+    TRADE_RETCODE_DONE = 10009
+    TRADE_RETCODE_INVALID = 10013
+    TRADE_RETCODE_INVALID_VOLUME = 10014
+    TRADE_RETCODE_INVALID_STOPS = 10016
+    TRADE_RETCODE_MARKET_CLOSED = 10018
+    TRADE_RETCODE_POSITION_CLOSED = 10036
+
+    SYMBOL_TRADE_MODE_DISABLED = 0
+    SYMBOL_TRADE_MODE_CLOSEONLY = 3
+    SYMBOL_TRADE_MODE_FULL = 4
+
+    def __init__(
+        self,
+        *,
+        bars: dict[str, pd.DataFrame],
+        timeframe: str = "M1",
+        specs: dict[str, SymbolSpec] | None = None,
+        balance: float = 10_000.0,
+        start: datetime | pd.Timestamp | None = None,
+        fill_latency_sec: float = 0.0,
+        slippage_points: float = 0.0,
+    ):
+        self.timeframe = timeframe
+        self.bar_seconds = self._tf_seconds(getattr(self, f"TIMEFRAME_{timeframe}"))
+        self.fill_latency_sec = float(fill_latency_sec)
+        self.slippage_points = float(slippage_points)
+
+        self._bars = {symbol: self._to_arrays(df) for symbol, df in bars.items()}
+        self._specs = {
+            symbol: (specs or {}).get(symbol) or SymbolSpec.from_meta(symbol)
+            for symbol in self._bars
+        }
+        self._aggregated: dict[tuple[str, int], dict[str, np.ndarray]] = {}
+
+        clock = np.unique(np.concatenate([b["time"] for b in self._bars.values()]))
+        self._clock = clock
+        self._step = 0
+        if start is not None:
+            ts = int(pd.Timestamp(start).timestamp())
+            self._step = min(int(np.searchsorted(clock, ts)), len(clock) - 1)
+
+        self._balance = float(balance)
+        self._positions: dict[int, dict] = {}
+        self._next_ticket = 1
+        self._last_error = (1, "Success")
+
+        # closed positions (broker side), in close order
+        self.deals: list[dict] = []
+        self.orders_sent = 0
+
+    # ==================================================
+    # Clock
+    # ==================================================
+
+    @property
+    def now(self) -> pd.Timestamp:
+        return pd.Timestamp(int(self._clock[self._step]), unit="s", tz="UTC")
+
+    def advance(self) -> bool:
+        """
+        Move to the next bar; settle SL/TP on the bars that completed.
+        False at the end of the data.
+        """
+        if self._step + 1 >= len(self._clock):
+            return False
+
+        before = {s: self._index(s) for s in self._bars}
+        self._step += 1
+
+        for symbol, old in before.items():
+            new = self._index(symbol)
+            bars = self._bars[symbol]
+            for i in range(max(old, 0), new):
+                self._settle_stops(symbol, bars["high"][i], bars["low"][i], bars["time"][i])
+            if new > old and new >= 0:
+                price = bars["open"][new]
+                self._settle_stops(symbol, price, price, bars["time"][new])
+        return True
+
+    def _index(self, symbol: str) -> int:
+        # forming bar: last bar opened at or before now (-1: none yet)
+        times = self._bars[symbol]["time"]
+        return int(np.searchsorted(times, self._clock[self._step], side="right")) - 1
+
+    # ==================================================
+    # Session
+    # ==================================================
+
+    def initialize(self, *args, **kwargs) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        return None
+
+    def last_error(self):
+        return self._last_error
+
+    def terminal_info(self):
+        return TerminalInfo(connected=True, trade_allowed=True, name="SimulatedMT5")
+
+    def symbol_select(self, symbol: str, enable: bool = True) -> bool:
+        return symbol in self._bars
+
+    def account_info(self):
+        profit = sum(self._floating(p) for p in self._positions.values())
+        return AccountInfo(
+            login=0,
+            balance=self._balance,
+            equity=self._balance + profit,
+            profit=profit,
+            margin_free=self._balance + profit,
+            leverage=100,
+            currency="USD",
+            server="SimulatedMT5",
+        )
+
+    # ==================================================
+    # Market data
+    # ==================================================
+
+    def symbol_info(self, symbol: str):
+        spec = self._specs.get(symbol)
+        if spec is None:
+            return self._fail(f"unknown symbol {symbol}")
+
+        return SymbolInfo(
+            name=symbol,
+            visible=True,
+            trade_mode=self.SYMBOL_TRADE_MODE_FULL,
+            point=spec.point,
+            digits=spec.digits,
+            spread=spec.spread_points,
+            trade_stops_level=spec.stops_level,
+            trade_tick_value=spec.tick_value,
+            trade_tick_size=spec.tick_size,
+            trade_contract_size=spec.contract_size,
+            volume_min=spec.volume_min,
+            volume_max=spec.volume_max,
+            volume_step=spec.volume_step,
+        )
+
+    def symbol_info_tick(self, symbol: str):
+        if symbol not in self._bars:
+            return self._fail(f"unknown symbol {symbol}")
+        i = self._index(symbol)
+        if i < 0:
+            return self._fail(f"no data yet for {symbol}")
+
+        bid = float(self._bars[symbol]["open"][i])
+        ts = int(self._clock[self._step])
+        return Tick(
+            time=ts, bid=bid, ask=self._ask(symbol, bid), last=bid,
+            volume=0, time_msc=ts * 1000,
+        )
+
+    def copy_rates_from_pos(self, symbol: str, timeframe: int, start_pos: int, count: int):
+        if symbol not in self._bars:
+            return self._fail(f"unknown symbol {symbol}")
+        i = self._index(symbol)
+        if i < 0:
+            return self._fail(f"no data yet for {symbol}")
+
+        agg = self._aggregate(symbol, self._tf_seconds(timeframe))
+        base = self._bars[symbol]
+
+        # forming bar of the requested timeframe: completed base bars of
+        # its bucket plus the forming base bar (open only)
+        k = int(np.searchsorted(agg["bucket"], agg["key"][i], side="right")) - 1
+        first = int(agg["first"][k])
+        forming = np.zeros(1, dtype=RATES_DTYPE)[0]
+        forming["time"] = agg["bucket"][k]
+        forming["open"] = base["open"][first]
+        forming["high"] = max(base["high"][first:i].max(initial=-np.inf), base["open"][i])
+        forming["low"] = min(base["low"][first:i].min(initial=np.inf), base["open"][i])
+        forming["close"] = base["open"][i]
+        forming["tick_volume"] = base["tick_volume"][first:i].sum()
+        forming["spread"] = base["spread"][i]
+
+        end = k + 1 - int(start_pos)
+        if end <= 0:
+            return self._fail("start_pos beyond history")
+        begin = max(end - int(count), 0)
+
+        out = agg["rates"][begin:end].copy()
+        if end == k + 1:
+            out[-1] = forming
+        return out
+
+    # ==================================================
+    # Positions / orders
+    # ==================================================
+
+    def positions_get(self, *, symbol: str | None = None, ticket: int | None = None, **_):
+        positions = self._positions.values()
+        if symbol is not None:
+            positions = [p for p in positions if p["symbol"] == symbol]
+        if ticket is not None:
+            positions = [p for p in positions if p["ticket"] == int(ticket)]
+        return tuple(self._position_record(p) for p in positions)
+
+    def order_send(self, request: dict):
+        self.orders_sent += 1
+        if self.fill_latency_sec > 0:
+            time.sleep(self.fill_latency_sec)
+
+        action = request.get("action")
+        if action == self.TRADE_ACTION_SLTP:
+            return self._modify(request)
+        if action != self.TRADE_ACTION_DEAL:
+            return self._result(self.TRADE_RETCODE_INVALID, request, comment="unsupported action")
+        if request.get("position"):
+            return self._close(request)
+        return self._open(request)
+
+    def _open(self, request: dict):
+        symbol = request["symbol"]
+        tick = self.symbol_info_tick(symbol)
+        if tick is None:
+            return self._result(self.TRADE_RETCODE_MARKET_CLOSED, request)
+
+        spec = self._specs[symbol]
+        volume = float(request["volume"])
+        if not spec.volume_min <= volume <= spec.volume_max:
+            return self._result(self.TRADE_RETCODE_INVALID_VOLUME, request)
+
+        is_buy = request["type"] == self.ORDER_TYPE_BUY
+        price = self._slipped(symbol, tick.ask if is_buy else tick.bid, is_buy)
+        sl = request.get("sl") or None
+        tp = request.get("tp") or None
+        if (sl is not None and (sl >= price if is_buy else sl <= price)) or (
+            tp is not None and (tp <= price if is_buy else tp >= price)
+        ):
+            return self._result(self.TRADE_RETCODE_INVALID_STOPS, request)
+
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._positions[ticket] = {
+            "ticket": ticket,
+            "time": tick.time,
+            "symbol": symbol,
+            "type": self.POSITION_TYPE_BUY if is_buy else self.POSITION_TYPE_SELL,
+            "volume": volume,
+            "price_open": price,
+            "sl": sl,
+            "tp": tp,
+            "magic": request.get("magic", 0),
+            "comment": request.get("comment", ""),
+        }
+        return self._result(
+            self.TRADE_RETCODE_DONE, request, order=ticket, volume=volume, price=price
+        )
+
+    def _close(self, request: dict):
+        position = self._positions.get(int(request["position"]))
+        if position is None:
+            return self._result(self.TRADE_RETCODE_POSITION_CLOSED, request)
+
+        volume = min(float(request.get("volume") or position["volume"]), position["volume"])
+        tick = self.symbol_info_tick(position["symbol"])
+        is_buy = position["type"] == self.POSITION_TYPE_BUY
+        # closing a long sells at bid, closing a short buys at ask
+        price = self._slipped(position["symbol"], tick.bid if is_buy else tick.ask, not is_buy)
+
+        self._realize(position, price, volume, tick.time, reason="CLOSE")
+        return self._result(
+            self.TRADE_RETCODE_DONE, request,
+            order=position["ticket"], volume=volume, price=price,
+        )
+
+    def _modify(self, request: dict):
+        position = self._positions.get(int(request["position"]))
+        if position is None:
+            return self._result(self.TRADE_RETCODE_POSITION_CLOSED, request)
+
+        # as in MT5: 0.0 removes the level
+        position["sl"] = request.get("sl") or None
+        position["tp"] = request.get("tp") or None
+        return self._result(self.TRADE_RETCODE_DONE, request, order=position["ticket"])
+
+    # ==================================================
+    # Settlement
+    # ==================================================
+
+    def _settle_stops(self, symbol: str, high: float, low: float, ts: int) -> None:
+        spread = self._specs[symbol].spread_points * self._specs[symbol].point
+
+        for position in [p for p in self._positions.values() if p["symbol"] == symbol]:
+            sl, tp = position["sl"], position["tp"]
+            if position["type"] == self.POSITION_TYPE_BUY:
+                # long closes on bid
+                if sl is not None and low <= sl:
+                    self._realize(position, self._slipped(symbol, min(sl, high), False), None, ts, "SL")
+                elif tp is not None and high >= tp:
+                    self._realize(position, max(tp, low), None, ts, "TP")
+            else:
+                # short closes on ask
+                if sl is not None and high + spread >= sl:
+                    self._realize(position, self._slipped(symbol, max(sl, low + spread), True), None, ts, "SL")
+                elif tp is not None and low + spread <= tp:
+                    self._realize(position, min(tp, high + spread), None, ts, "TP")
+
+    def _realize(self, position: dict, price: float, volume: float | None, ts: int, reason: str) -> None:
+        volume = position["volume"] if volume is None else volume
+        profit = self._profit(position, price, volume)
+        self._balance += profit
+
+        self.deals.append({
+            "ticket": position["ticket"],
+            "symbol": position["symbol"],
+            "type": position["type"],
+            "volume": volume,
+            "price_open": position["price_open"],
+            "price_close": price,
+            "time_open": pd.Timestamp(position["time"], unit="s", tz="UTC"),
+            "time_close": pd.Timestamp(int(ts), unit="s", tz="UTC"),
+            "profit": profit,
+            "reason": reason,
+        })
+
+        remaining = round(position["volume"] - volume, 8)
+        if remaining > 0:
+            position["volume"] = remaining
+        else:
+            self._positions.pop(position["ticket"], None)
+
+    # ==================================================
+    # Helpers
+    # ==================================================
+
+    def _profit(self, position: dict, price: float, volume: float) -> float:
+        spec = self._specs[position["symbol"]]
+        sign = 1.0 if position["type"] == self.POSITION_TYPE_BUY else -1.0
+        ticks = (price - position["price_open"]) * sign / spec.tick_size
+        return ticks * spec.tick_value * volume
+
+    def _floating(self, position: dict) -> float:
+        tick = self.symbol_info_tick(position["symbol"])
+        if tick is None:
+            return 0.0
+        is_buy = position["type"] == self.POSITION_TYPE_BUY
+        return self._profit(position, tick.bid if is_buy else tick.ask, position["volume"])
+
+    def _position_record(self, p: dict) -> Position:
+        tick = self.symbol_info_tick(p["symbol"])
+        is_buy = p["type"] == self.POSITION_TYPE_BUY
+        current = (tick.bid if is_buy else tick.ask) if tick is not None else p["price_open"]
+        return Position(
+            ticket=p["ticket"], time=p["time"], symbol=p["symbol"], type=p["type"],
+            volume=p["volume"], price_open=p["price_open"], sl=p["sl"] or 0.0,
+            tp=p["tp"] or 0.0, price_current=current,
+            profit=self._profit(p, current, p["volume"]),
+            magic=p["magic"], comment=p["comment"],
+        )
+
+    def _ask(self, symbol: str, bid: float) -> float:
+        spec = self._specs[symbol]
+        return bid + spec.spread_points * spec.point
+
+    def _slipped(self, symbol: str, price: float, is_buy: bool) -> float:
+        # always against the trader
+        slip = self.slippage_points * self._specs[symbol].point
+        return float(price + slip if is_buy else price - slip)
+
+    def _result(self, retcode: int, request: dict, *, order: int = 0, volume: float = 0.0, price: float = 0.0):
+        if retcode != self.TRADE_RETCODE_DONE:
+            self._last_error = (retcode, "order rejected")
+        return OrderSendResult(
+            retcode=retcode, deal=order, order=order, volume=volume, price=price,
+            bid=price, ask=price, comment="", request=request,
+        )
+
+    def _fail(self, message: str):
+        self._last_error = (-1, message)
+        return None
+
+    def _tf_seconds(self, timeframe: int) -> int:
+        if timeframe == self.TIMEFRAME_W1:
+            return 7 * 86_400
+        if timeframe & 0xC000 == 0x4000:
+            return (timeframe & 0x3FFF) * 3_600
+        if 0 < timeframe < 0x4000:
+            return timeframe * 60
+        raise ValueError(f"Unsupported timeframe for simulation: {timeframe}")
+
+    def _aggregate(self, symbol: str, seconds: int) -> dict[str, np.ndarray]:
+        """
+        Base bars resampled to `seconds` (MT5 alignment), cached per timeframe.
+        """
+        cached = self._aggregated.get((symbol, seconds))
+        if cached is not None:
+            return cached
+
+        base = self._bars[symbol]
+        # MT5 weeks start on Sunday; the epoch was a Thursday
+        offset = 3 * 86_400 if seconds == 7 * 86_400 else 0
+        key = (base["time"] - offset) // seconds * seconds + offset
+
+        bucket, first = np.unique(key, return_index=True)
+        rates = np.zeros(len(bucket), dtype=RATES_DTYPE)
+        rates["time"] = bucket
+        rates["open"] = base["open"][first]
+        rates["high"] = np.maximum.reduceat(base["high"], first)
+        rates["low"] = np.minimum.reduceat(base["low"], first)
+        rates["close"] = base["close"][np.r_[first[1:] - 1, len(key) - 1]]
+        rates["tick_volume"] = np.add.reduceat(base["tick_volume"], first)
+        rates["spread"] = base["spread"][first]
+        rates["real_volume"] = np.add.reduceat(base["real_volume"], first)
+
+        cached = {"key": key, "bucket": bucket, "first": first, "rates": rates}
+        self._aggregated[(symbol, seconds)] = cached
+        return cached
+
+    @staticmethod
+    def _to_arrays(df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """
+        OHLCV frame (repo schema: volume) -> MT5 rate columns.
+        """
+        df = df.sort_values("time")
+        times = pd.to_datetime(df["time"], utc=True)
+        epoch = pd.Timestamp(0, tz="UTC")
+
+        def column(name, dtype):
+            if name not in df:
+                return np.zeros(len(df), dtype=dtype)
+            return df[name].fillna(0).to_numpy().astype(dtype)
+
+        volume = "tick_volume" if "tick_volume" in df else "volume"
+        return {
+            "time": ((times - epoch) // pd.Timedelta(seconds=1)).to_numpy(dtype="int64"),
+            "open": column("open", "float64"),
+            "high": column("high", "float64"),
+            "low": column("low", "float64"),
+            "close": column("close", "float64"),
+            "tick_volume": column(volume, "uint64"),
+            "spread": column("spread", "int32"),
+            "real_volume": column("real_volume", "uint64"),
+        }
+
+
+# ==================================================
+# Install
+# ==================================================
+
+# modules that bind `import MetaTrader5 as mt5` at import time
+MT5_MODULES = (
+    "core.utils.timeframe",
+    "core.data_provider.clients.mt5_client",
+    "core.live_trading.mt5_market_state",
+    "core.live_trading.execution.mt5_adapter",
+    "core.live_trading.execution.risk.metadata_cache",
+)
+
+
+@contextmanager
+def installed(broker: SimulatedMT5):
+    """
+    Route the live stack's MT5 calls to broker for the duration of the block.
+    Works with or without the real MetaTrader5 package installed.
+    """
+    previous = sys.modules.get("MetaTrader5")
+    sys.modules["MetaTrader5"] = broker
+
+    rebound = []
+    tf_map, tf_codes = None, None
+    try:
+        for name in MT5_MODULES:
+            module = importlib.import_module(name)
+            rebound.append((module, module.mt5))
+            module.mt5 = broker
+
+        # metadata cached from another terminal is not this broker's
+        metadata = importlib.import_module("core.live_trading.execution.risk.metadata_cache")
+        metadata.METADATA_CACHE.clear()
+
+        # shared dict, imported by name elsewhere: update in place
+        tf_map = importlib.import_module("core.utils.timeframe").MT5_TIMEFRAME_MAP
+        tf_codes = dict(tf_map)
+        tf_map.update({tf: getattr(broker, f"TIMEFRAME_{tf}") for tf in tf_map})
+        yield broker
+    finally:
+        if tf_map is not None:
+            tf_map.update(tf_codes)
+            metadata.METADATA_CACHE.clear()
+        for module, original in rebound:
+            module.mt5 = original
+        if previous is None:
+            sys.modules.pop("MetaTrader5", None)
+        else:
+            sys.modules["MetaTrader5"] = previous
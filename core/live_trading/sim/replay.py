@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.live_trading.sim.broker import SimulatedMT5, installed
+
+
+@dataclass
+class ReplayReport:
+    ticks: int
+    errors: int
+    wall_s: float
+    sim_s: float
+    tick_latency_s: np.ndarray = field(repr=False)
+    trades: pd.DataFrame = field(repr=False)
+    deals: pd.DataFrame = field(repr=False)
+    final_balance: float = 0.0
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.wall_s if self.wall_s > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.sim_s / self.wall_s if self.wall_s > 0 else 0.0
+
+    def latency_ms(self) -> dict[str, float]:
+        lat = self.tick_latency_s * 1e3
+        if lat.size == 0:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "mean": float(lat.mean()),
+            "p50": float(np.percentile(lat, 50)),
+            "p95": float(np.percentile(lat, 95)),
+            "p99": float(np.percentile(lat, 99)),
+            "max": float(lat.max()),
+        }
+
+    def summary(self) -> str:
+        lat = self.latency_ms()
+        return (
+            f"ticks={self.ticks} errors={self.errors} | "
+            f"wall={self.wall_s:.2f}s x{self.speedup:.0f} "
+            f"({self.ticks_per_sec:.0f} ticks/s) | "
+            f"tick ms mean={lat['mean']:.2f} p95={lat['p95']:.2f} max={lat['max']:.2f} | "
+            f"trades={len(self.trades)} deals={len(self.deals)} "
+            f"balance={self.final_balance:.2f}"
+        )
+
+
+class ReplayDriver:
+    """
+    Pushes a historical session through a LiveEngine, one engine tick per
+    simulated bar.
+
+    speed: simulated seconds per wall second (60 on M1 = one bar per
+    second); None runs as fast as the stack allows (throughput benchmark).
+    The broker must be installed (see sim.broker.installed) while the
+    engine runs.
+    """
+
+    def __init__(self, *, broker: SimulatedMT5, engine, repo=None, speed: float | None = None):
+        self.broker = broker
+        self.engine = engine
+        self.repo = repo
+        self.speed = speed
+
+    def run(self, *, max_ticks: int | None = None) -> ReplayReport:
+        latencies = []
+        errors = 0
+
+        sim_start = self.broker.now
+        wall_start = time.perf_counter()
+
+        while max_ticks is None or len(latencies) < max_ticks:
+            if not self.broker.advance():
+                break
+
+            t0 = time.perf_counter()
+            try:
+                self.engine._tick()
+            except Exception as e:
+                errors += 1
+                print(f"❌ Replay tick error at {self.broker.now}: {type(e).__name__}: {e}")
+            latencies.append(time.perf_counter() - t0)
+
+            if self.speed:
+                due = (self.broker.now - sim_start).total_seconds() / self.speed
+                lag = due - (time.perf_counter() - wall_start)
+                if lag > 0:
+                    time.sleep(lag)
+
+        return ReplayReport(
+            ticks=len(latencies),
+            errors=errors,
+            wall_s=time.perf_counter() - wall_start,
+            sim_s=(self.broker.now - sim_start).total_seconds(),
+            tick_latency_s=np.asarray(latencies),
+            trades=self._closed_trades(),
+            deals=pd.DataFrame(self.broker.deals),
+            final_balance=self.broker.account_info().balance,
+        )
+
+    def _closed_trades(self) -> pd.DataFrame:
+        if self.repo is None:
+            return pd.DataFrame()
+        return pd.DataFrame(list(self.repo.load_closed().values()))
+
+
+def build_replay_engine(
+    *,
+    broker: SimulatedMT5,
+    strategy_cls,
+    symbol: str,
+    timeframe: str,
+    startup_candle_count: int,
+    repo,
+    log,
+    latency=None,
+    shadow=None,
+):
+    """
+    The live stack of run_trading (MT5 adapter, PositionManager,
+    LiveStrategyRunner, MT5MarketStateProvider) on top of the broker.
+    Call inside installed(broker).
+    """
+    # imported here: these modules bind MetaTrader5 at import time
+    from core.data_provider.clients.mt5_client import MT5Client, lookback_to_bars
+    from core.data_provider.providers.live_provider import LiveStrategyDataProvider
+    from core.live_trading.engine import LiveEngine
+    from core.live_trading.execution.mt5_adapter import MT5Adapter
+    from core.live_trading.execution.position_manager import PositionManager
+    from core.live_trading.mt5_market_state import MT5MarketStateProvider
+    from core.live_trading.strategy_runner import LiveStrategyRunner
+    from core.utils.lookback import LOOKBACK_CONFIG
+
+    bars_per_tf = {
+        tf: lookback_to_bars(tf, LOOKBACK_CONFIG[tf])
+        for tf in [timeframe] + strategy_cls.get_required_informatives()
+    }
+
+    strategy_runner = LiveStrategyRunner(
+        strategy=strategy_cls(
+            df=None,
+            symbol=symbol,
+            startup_candle_count=startup_candle_count,
+        ),
+        data_provider=LiveStrategyDataProvider(client=MT5Client(), bars_per_tf=bars_per_tf),
+        symbol=symbol,
+        latency=latency,
+        shadow=shadow,
+    )
+
+    pm = PositionManager(repo=repo, adapter=MT5Adapter(dry_run=False, log=log), latency=latency)
+
+    return LiveEngine(
+        position_manager=pm,
+        market_state_provider=MT5MarketStateProvider(symbol=symbol, timeframe=timeframe),
+        strategy_runner=strategy_runner,
+        tick_interval_sec=0,
+        latency=latency,
+    )
+
+
+def load_session_bars(
+    *,
+    symbol: str,
+    timeframe: str,
+    start,
+    end,
+    market_data_path: str | Path,
+) -> pd.DataFrame:
+    """
+    Cached historical bars (the backtest CSV cache) for one symbol.
+    """
+    from core.data_provider import CsvMarketDataCache
+
+    cache = CsvMarketDataCache(Path(market_data_path))
+    return cache.load_range(
+        symbol=symbol,
+        timeframe=timeframe,
+        start=pd.Timestamp(start),
+        end=pd.Timestamp(end),
+    )
+
+
+def replay_session(
+    *,
+    bars: pd.DataFrame,
+    strategy_cls,
+    symbol: str,
+    timeframe: str,
+    replay_start,
+    startup_candle_count: int,
+    repo,
+    log,
+    speed: float | None = None,
+    fill_latency_sec: float = 0.0,
+    slippage_points: float = 0.0,
+    balance: float = 10_000.0,
+    max_ticks: int | None = None,
+    latency=None,
+    shadow=None,
+) -> ReplayReport:
+    """
+    bars before replay_start are history only (indicator warmup);
+    the session starts at replay_start.
+    """
+    broker = SimulatedMT5(
+        bars={symbol: bars},
+        timeframe=timeframe,
+        balance=balance,
+        start=replay_start,
+        fill_latency_sec=fill_latency_sec,
+        slippage_points=slippage_points,
+    )
+
+    with installed(broker):
+        engine = build_replay_engine(
+            broker=broker,
+            strategy_cls=strategy_cls,
+            symbol=symbol,
+            timeframe=timeframe,
+            startup_candle_count=startup_candle_count,
+            repo=repo,
+            log=log,
+            latency=latency,
+            shadow=shadow,
+        )
+        return ReplayDriver(broker=broker, engine=engine, repo=repo, speed=speed).run(
+            max_ticks=max_ticks
+        )
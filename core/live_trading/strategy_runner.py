@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from time import perf_counter
 from typing import  Optional
 
 import pandas as pd
 
+from core.live_trading.latency import NullLatencyRecorder
 from core.strategy.orchestration.informatives import apply_informatives
 from core.strategy.plan_builder import PlanBuildContext
 from core.utils.timeframe import tf_to_minutes
@@ -28,28 +30,49 @@ class LiveStrategyRunner:
         strategy,
         data_provider,
         symbol: str,
+        latency=None,
+        shadow=None,
     ):
         self.strategy = strategy
         self.data_provider = data_provider
         self.symbol = symbol
+        self.latency = latency or NullLatencyRecorder()
+        self.shadow = shadow    # ShadowComparator (live vs backtest plans)
         self._last_df: Optional[pd.DataFrame] = None
 
     def run(self) -> StrategyCandleResult:
-        data_by_tf = self.data_provider.fetch(self.symbol)
-
+        return self.evaluate(self.fetch())
+
+    def fetch(self) -> dict[str, pd.DataFrame]:
+        """
+        Broker I/O part of run().
+        """
+        with self.latency.span("fetch", self.symbol):
+            return self.data_provider.fetch(self.symbol)
+
+    def evaluate(self, data_by_tf: dict[str, pd.DataFrame]) -> StrategyCandleResult:
+        """
+        CPU part of run(): indicators, signals and the trade plan.
+        """
         base_tf = min(data_by_tf.keys(), key=tf_to_minutes)
         df_base = data_by_tf[base_tf]
 
-        df_context = apply_informatives(
-            df=df_base,
-            strategy=self.strategy,
-            data_by_tf=data_by_tf,
-        )
+        span = self.latency.span
+
+        with span("informatives", self.symbol):
+            df_context = apply_informatives(
+                df=df_base,
+                strategy=self.strategy,
+                data_by_tf=data_by_tf,
+            )
 
         self.strategy.df = df_context
-        self.strategy.populate_indicators()
-        self.strategy.populate_entry_trend()
-        self.strategy.populate_exit_trend()
+        with span("indicators", self.symbol):
+            self.strategy.populate_indicators()
+        with span("entry", self.symbol):
+            self.strategy.populate_entry_trend()
+        with span("exit_signals", self.symbol):
+            self.strategy.populate_exit_trend()
 
         last_row = df_context.iloc[-1]
 
@@ -59,13 +82,26 @@ class LiveStrategyRunner:
             strategy_config=self.strategy.strategy_config,
         )
 
-        plan = self.strategy.build_trade_plan_live(
-            row=last_row,
-            ctx=ctx,
-        )
+        t0 = perf_counter()
+        with span("plan", self.symbol):
+            plan = self.strategy.build_trade_plan_live(
+                row=last_row,
+                ctx=ctx,
+            )
+        plan_s = perf_counter() - t0
 
         self._last_df = df_context
 
+        if self.shadow is not None:
+            # queued: checked off the order path
+            self.shadow.submit(
+                strategy=self.strategy,
+                ctx=ctx,
+                df=df_context,
+                plan=plan,
+                live_plan_s=plan_s,
+            )
+
         return StrategyCandleResult(
             last_row=last_row,
             plan=plan,
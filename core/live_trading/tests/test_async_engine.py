@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+from core.live_trading.async_engine import AsyncLiveEngine
+
+
+class _Market:
+    def __init__(self, fixed_now):
+        self.fixed_now = fixed_now
+
+    def poll(self):
+        # every poll closes a candle
+        return {"price": 100.0, "time": self.fixed_now, "candle_time": self.fixed_now}
+
+
+class _Runner:
+    def __init__(self, mocker, seconds, plan=None):
+        self.seconds = seconds
+        self.plan = plan
+        self.fetch = mocker.Mock(return_value={})
+        self.evaluations = 0
+
+    def evaluate(self, data_by_tf):
+        self.evaluations += 1
+        time.sleep(self.seconds)
+        return type("Result", (), {"plan": self.plan, "last_row": {}})()
+
+
+def _run_for(engine, seconds):
+    async def main():
+        task = asyncio.create_task(engine.run())
+        await asyncio.sleep(seconds)
+        engine.stop()
+        await task
+
+    asyncio.run(main())
+
+
+def test_slow_strategy_does_not_block_exits(mocker, fixed_now):
+    pm = mocker.Mock()
+    runner = _Runner(mocker, seconds=0.5)
+
+    engine = AsyncLiveEngine(
+        position_manager=pm,
+        market_state_provider=_Market(fixed_now),
+        strategy_runner=runner,
+        tick_interval_sec=0.01,
+    )
+    _run_for(engine, 0.3)
+
+    # exits kept up with the 10ms ticks while one evaluation was running
+    assert pm.on_tick.call_count >= 10
+    assert runner.evaluations == 1
+    assert engine.dropped_candles > 0
+
+
+def test_plan_is_forwarded_to_position_manager(mocker, fixed_now):
+    pm = mocker.Mock()
+    plan = object()
+    runner = _Runner(mocker, seconds=0.0, plan=plan)
+
+    engine = AsyncLiveEngine(
+        position_manager=pm,
+        market_state_provider=_Market(fixed_now),
+        strategy_runner=runner,
+        tick_interval_sec=0.05,
+    )
+    _run_for(engine, 0.12)
+
+    runner.fetch.assert_called()
+    assert pm.on_trade_plan.call_args.kwargs["plan"] is plan
+
+
+def test_offer_keeps_latest_when_full():
+    async def main():
+        queue = asyncio.Queue(maxsize=1)
+        assert not AsyncLiveEngine._offer(queue, 1)
+        assert AsyncLiveEngine._offer(queue, 2)
+        return queue.get_nowait()
+
+    assert asyncio.run(main()) == 2
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from core.live_trading.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_histogram_percentiles_within_one_percent():
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.record(ms / 1e3)
+
+    assert hist.count == 1000
+    assert hist.percentile(50) == pytest.approx(0.500, rel=0.01)
+    assert hist.percentile(99) == pytest.approx(0.990, rel=0.01)
+    assert hist.percentile(100) == pytest.approx(1.000)
+    assert hist.mean == pytest.approx(0.5005, rel=1e-3)
+
+    other = LatencyHistogram()
+    other.record(5.0)
+    hist.merge(other)
+    assert hist.count == 1001
+    assert hist.percentile(100) == pytest.approx(5.0)
+
+
+def test_export_writes_window_and_flags_slow_stage(tmp_path, capsys):
+    path = tmp_path / "latency.jsonl"
+    recorder = LatencyRecorder(
+        path=path,
+        bar_seconds=60,
+        alert_fractions={"candle_to_order": 0.01},
+    )
+    for _ in range(10):
+        recorder.record("candle_to_order", 1.0, symbol="EURUSD")
+        recorder.record("poll", 0.002, symbol="EURUSD")
+
+    lines = recorder.export()
+
+    assert [(l["stage"], l["alert"]) for l in lines] == [("candle_to_order", True), ("poll", False)]
+    assert "candle_to_order" in capsys.readouterr().out
+
+    written = [json.loads(l) for l in path.read_text().splitlines()]
+    assert written[0]["symbol"] == "EURUSD" and written[0]["count"] == 10
+
+    # new window; totals kept
+    assert recorder.export() == []
+    assert recorder.histogram("poll", "EURUSD").count == 10
@@ -1,4 +1,5 @@
 from core.live_trading.engine import LiveEngine
+from core.live_trading.latency import LatencyRecorder
 
 
 def test_live_engine_calls_on_tick_every_loop(mocker, fixed_now):
@@ -64,4 +65,31 @@ def test_engine_skips_when_market_state_none(mocker):
     engine._tick()
 
     pm.on_tick.assert_not_called()
-    runner.run.assert_not_called()
\ No newline at end of file
+    runner.run.assert_not_called()
+
+
+def test_live_engine_records_candle_to_order(mocker, fixed_now):
+    market = mocker.Mock()
+    market.poll.return_value = {"price": 100.0, "time": fixed_now, "candle_time": fixed_now}
+    runner = mocker.Mock(symbol="EURUSD")
+    runner.run.return_value = mocker.Mock(plan="PLAN", last_row={})
+    pm = mocker.Mock()
+    pm.on_trade_plan.return_value = True
+
+    recorder = LatencyRecorder()
+    engine = LiveEngine(
+        position_manager=pm,
+        market_state_provider=market,
+        strategy_runner=runner,
+        tick_interval_sec=0,
+        latency=recorder,
+    )
+    engine._tick()
+
+    for stage in ("poll", "exits", "candle_to_plan", "candle_to_order"):
+        assert recorder.histogram(stage, "EURUSD").count == 1
+
+    # entry skipped: no order latency
+    pm.on_trade_plan.return_value = False
+    engine._tick()
+    assert recorder.histogram("candle_to_order", "EURUSD").count == 1
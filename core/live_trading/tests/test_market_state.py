@@ -0,0 +1,76 @@
+import pandas as pd
+
+from core.live_trading.sim.broker import SimulatedMT5, SymbolSpec, installed
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _broker(n=12):
+    opens = [100.0 + i for i in range(n)]
+    bars = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq="1min", tz="UTC"),
+        "open": opens, "high": opens, "low": opens, "close": opens,
+    })
+    return SimulatedMT5(
+        bars={"XAUUSD": bars},
+        specs={"XAUUSD": SymbolSpec(point=0.01, tick_value=1.0, tick_size=0.01)},
+    )
+
+
+def test_tick_provider_streams_new_ticks_and_separates_candle_close():
+    broker = _broker()
+    clock = _Clock()
+
+    with installed(broker):
+        from core.live_trading.mt5_market_state import MT5TickMarketStateProvider
+
+        provider = MT5TickMarketStateProvider(
+            symbol="XAUUSD", timeframe="M5", heartbeat_sec=30.0, clock=clock,
+        )
+
+        states = []
+        while True:
+            state = provider.poll()
+            # same tick again: nothing to do
+            assert provider.poll() is None
+            states.append(state)
+            if not broker.advance():
+                break
+
+    assert provider.ticks == 12
+    assert provider.duplicates == 12
+    assert [s["bid"] for s in states] == [100.0 + i for i in range(12)]
+    assert all(s["ask"] >= s["bid"] for s in states)
+
+    # an M5 candle closes once per five M1 ticks (none closed before 00:05)
+    closes = [s["time"].minute for s in states if s["candle_time"] is not None]
+    assert closes == [5, 10]
+
+
+def test_tick_provider_heartbeat_on_quiet_market():
+    broker = _broker()
+    clock = _Clock()
+
+    with installed(broker):
+        from core.live_trading.mt5_market_state import MT5TickMarketStateProvider
+
+        provider = MT5TickMarketStateProvider(
+            symbol="XAUUSD", timeframe="M1", heartbeat_sec=30.0, clock=clock,
+        )
+        assert provider.poll() is not None
+
+        clock.now = 29.0
+        assert provider.poll() is None
+
+        clock.now = 31.0
+        state = provider.poll()
+
+    assert state is not None
+    assert state["candle_time"] is None
+    assert provider.ticks == 1
@@ -0,0 +1,131 @@
+import pandas as pd
+
+from core.live_trading.sim.broker import SimulatedMT5, SymbolSpec, installed
+
+
+class _CountingMT5(SimulatedMT5):
+    """
+    Counts metadata queries made by the live code (not the broker's own).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = {"account_info": 0, "symbol_info": 0, "symbol_info_tick": 0}
+        self._internal = False
+
+    def _count(self, name):
+        if not self._internal:
+            self.calls[name] += 1
+
+    def account_info(self):
+        self._count("account_info")
+        return super().account_info()
+
+    def symbol_info(self, symbol):
+        self._count("symbol_info")
+        return super().symbol_info(symbol)
+
+    def symbol_info_tick(self, symbol):
+        self._count("symbol_info_tick")
+        return super().symbol_info_tick(symbol)
+
+    def order_send(self, request):
+        self._internal = True
+        try:
+            return super().order_send(request)
+        finally:
+            self._internal = False
+
+
+def _broker():
+    opens = [100.0] * 5
+    bars = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=5, freq="1min", tz="UTC"),
+        "open": opens, "high": opens, "low": opens, "close": opens,
+    })
+    return _CountingMT5(
+        bars={"XAUUSD": bars},
+        specs={"XAUUSD": SymbolSpec(point=0.01, tick_value=1.0, tick_size=0.01)},
+    )
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_refresh_and_fill_invalidation():
+    broker = _broker()
+    with installed(broker):
+        from core.live_trading.execution.risk.metadata_cache import BrokerMetadataCache
+
+        clock = _Clock()
+        cache = BrokerMetadataCache(account_ttl_sec=10, symbol_ttl_sec=100, clock=clock)
+
+        cache.account_info()
+        cache.symbol_info("XAUUSD")
+        clock.now = 9
+        cache.account_info()
+        cache.symbol_info("XAUUSD")
+        assert broker.calls["account_info"] == 1
+        assert broker.calls["symbol_info"] == 1
+
+        clock.now = 11
+        cache.account_info()
+        cache.on_fill()
+        cache.account_info()
+        cache.symbol_info("XAUUSD")
+        assert broker.calls["account_info"] == 3
+        assert broker.calls["symbol_info"] == 1
+
+        # failures are not cached
+        assert cache.symbol_info("UNKNOWN") is None
+        assert cache.symbol_info("UNKNOWN") is None
+        assert broker.calls["symbol_info"] == 3
+
+
+def test_entry_path_queries_only_the_tick_when_warm(mocker):
+    broker = _broker()
+    with installed(broker):
+        from core.live_trading.execution.mt5_adapter import MT5Adapter
+        from core.live_trading.execution.risk.mt5_risk_params import Mt5RiskParams
+        from core.live_trading.execution.risk.sizing import LiveSizer
+
+        adapter = MT5Adapter(dry_run=False, log=mocker.Mock())
+
+        def entry():
+            raw = LiveSizer.calculate_volume(symbol="XAUUSD", entry_price=100.0, sl=99.0, max_risk=0.005)
+            volume = Mt5RiskParams.normalize_volume("XAUUSD", raw)
+            return adapter.open_position(symbol="XAUUSD", direction="long", volume=volume, sl=99.0)
+
+        ticket = entry()["ticket"]
+        adapter.close_position(ticket=ticket)
+
+        before = dict(broker.calls)
+        entry()
+        used = {k: broker.calls[k] - before[k] for k in before}
+
+    # account refreshed once (fills moved the balance), specs from cache
+    assert used == {"account_info": 1, "symbol_info": 0, "symbol_info_tick": 1}
+
+
+def test_broker_side_close_invalidates_account(mocker):
+    broker = _broker()
+    with installed(broker):
+        from core.live_trading.execution.mt5_adapter import MT5Adapter
+        from core.live_trading.execution.risk.metadata_cache import METADATA_CACHE
+
+        adapter = MT5Adapter(dry_run=False, log=mocker.Mock())
+        ticket = adapter.open_position(symbol="XAUUSD", direction="long", volume=1.0, sl=99.0)["ticket"]
+        adapter.positions_snapshot()
+
+        METADATA_CACHE.account_info()
+        broker.order_send({"action": broker.TRADE_ACTION_DEAL, "position": ticket})
+        adapter.positions_snapshot()
+
+        calls = broker.calls["account_info"]
+        METADATA_CACHE.account_info()
+        assert broker.calls["account_info"] == calls + 1
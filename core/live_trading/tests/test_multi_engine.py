@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+from core.live_trading.latency import LatencyRecorder
+from core.live_trading.multi_engine import MultiSymbolLiveEngine
+
+
+SYMBOLS = ("EURUSD", "GBPUSD", "USDJPY")
+
+
+class _MultiMarket:
+    def __init__(self, fixed_now, symbols=SYMBOLS):
+        self.fixed_now = fixed_now
+        self.symbols = symbols
+        self.polls = 0
+
+    def poll(self):
+        # every poll closes a candle on every symbol
+        self.polls += 1
+        return {
+            s: {"symbol": s, "price": 1.0 + i, "time": self.fixed_now,
+                "candle_time": self.fixed_now}
+            for i, s in enumerate(self.symbols)
+        }
+
+
+class _Runner:
+    def __init__(self, mocker, seconds, plan=None):
+        self.seconds = seconds
+        self.plan = plan
+        self.fetch = mocker.Mock(return_value={})
+        self.threads = set()
+        self.evaluations = 0
+
+    def evaluate(self, data_by_tf):
+        self.evaluations += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(self.seconds)
+        return type("Result", (), {"plan": self.plan, "last_row": {}})()
+
+
+def _run_for(engine, seconds):
+    async def main():
+        task = asyncio.create_task(engine.run())
+        await asyncio.sleep(seconds)
+        engine.stop()
+        await task
+
+    asyncio.run(main())
+
+
+def test_one_exit_pass_per_poll_with_per_symbol_states(mocker, fixed_now):
+    pm = mocker.Mock()
+    runners = {s: _Runner(mocker, seconds=0.0) for s in SYMBOLS}
+
+    engine = MultiSymbolLiveEngine(
+        position_manager=pm,
+        market_state_provider=_MultiMarket(fixed_now),
+        strategy_runners=runners,
+        tick_interval_sec=0.05,
+        latency=LatencyRecorder(),
+    )
+    _run_for(engine, 0.12)
+
+    assert pm.on_ticks.call_count >= 1
+    states = pm.on_ticks.call_args.kwargs["market_states"]
+    assert set(states) == set(SYMBOLS)
+    assert states["GBPUSD"]["price"] == 2.0
+    pm.on_tick.assert_not_called()
+
+    for symbol in SYMBOLS:
+        assert engine.latency.histogram("tick_to_exit", symbol).count >= 1
+
+
+def test_symbols_are_evaluated_in_parallel(mocker, fixed_now):
+    pm = mocker.Mock()
+    plan = object()
+    runners = {s: _Runner(mocker, seconds=0.2, plan=plan) for s in SYMBOLS}
+
+    engine = MultiSymbolLiveEngine(
+        position_manager=pm,
+        market_state_provider=_MultiMarket(fixed_now),
+        strategy_runners=runners,
+        tick_interval_sec=1.0,
+        strategy_workers=len(SYMBOLS),
+        latency=LatencyRecorder(),
+    )
+    _run_for(engine, 0.3)
+
+    # one poll; three 200ms evaluations finished inside one ~200ms cycle
+    assert all(r.evaluations == 1 for r in runners.values())
+    assert len(set().union(*(r.threads for r in runners.values()))) == len(SYMBOLS)
+    assert 0.2 <= engine.last_cycle_s < 0.35
+    assert pm.on_trade_plan.call_count == len(SYMBOLS)
+
+    stats = engine.latency.histogram("strategy_cycle", "EURUSD")
+    assert stats.count == 1 and stats.percentile(100) >= 0.2
+
+
+def test_cycle_slower_than_bar_is_counted(mocker, fixed_now):
+    pm = mocker.Mock()
+    runners = {"EURUSD": _Runner(mocker, seconds=0.1)}
+
+    engine = MultiSymbolLiveEngine(
+        position_manager=pm,
+        market_state_provider=_MultiMarket(fixed_now, symbols=("EURUSD",)),
+        strategy_runners=runners,
+        tick_interval_sec=0.02,
+        bar_seconds=0.05,
+    )
+    _run_for(engine, 0.25)
+
+    assert engine.slow_cycles >= 1
+    assert engine.dropped_candles > 0
@@ -68,4 +68,144 @@ def test_tp1_partial_and_be(mocker, fixed_now):
         }
     )
 
-    pm.state.mark_tp1_executed.assert_called_once()
\ No newline at end of file
+    pm.state.mark_tp1_executed.assert_called_once()
+
+def test_broker_sync_uses_one_snapshot_per_tick(mocker, fixed_now):
+    from types import SimpleNamespace
+
+    from core.live_trading.execution.position_snapshot import PositionSnapshot
+
+    repo = mocker.Mock()
+    repo.load_active.return_value = {
+        "1": {"trade_id": "1", "ticket": "1", "sl": 90, "tp2": 120},
+        "2": {"trade_id": "2", "ticket": "2", "sl": 90, "tp2": 120},
+    }
+
+    adapter = mocker.Mock(dry_run=False)
+    adapter.positions_snapshot.return_value = PositionSnapshot.from_positions([
+        SimpleNamespace(ticket=1, symbol="EURUSD", magic=0),
+    ])
+    pm = PositionManager(repo=repo, adapter=adapter)
+    pm.state = mocker.Mock()
+    mocker.patch.object(pm, "_handle_managed_exit_signal", return_value=True)
+
+    pm.on_tick(market_state={"price": 100, "time": fixed_now})
+
+    adapter.positions_snapshot.assert_called_once()
+    pm.state.record_exit.assert_called_once()
+    assert pm.state.record_exit.call_args.kwargs["trade_id"] == "2"
+
+
+def test_on_ticks_routes_prices_by_symbol(mocker, fixed_now):
+    repo = mocker.Mock()
+    repo.load_active.return_value = {
+        "1": {"trade_id": "1", "symbol": "EURUSD", "direction": "long",
+              "sl": 1.0, "tp2": None, "ticket": "1", "entry_time": fixed_now},
+        "2": {"trade_id": "2", "symbol": "BTCUSD", "direction": "long",
+              "sl": 90.0, "tp2": None, "ticket": "2", "entry_time": fixed_now},
+    }
+
+    adapter = mocker.Mock(dry_run=True)
+    pm = PositionManager(repo=repo, adapter=adapter)
+
+    # only BTCUSD trades below its SL; a shared price would stop out both
+    pm.on_ticks(market_states={
+        "EURUSD": {"price": 1.1, "time": fixed_now},
+        "BTCUSD": {"price": 89.0, "time": fixed_now},
+    })
+
+    repo.load_active.assert_called_once()
+    repo.record_exit.assert_called_once()
+    assert repo.record_exit.call_args.kwargs["trade_id"] == "2"
+
+
+def test_tp1_and_be_in_one_tick_write_active_once(mocker, tmp_path, fixed_now):
+    from core.live_trading.trade_repo import TradeRepo
+
+    repo = TradeRepo(data_dir=tmp_path)
+    repo.save_active({
+        "1": {
+            "trade_id": "1",
+            "symbol": "EURUSD",
+            "direction": "long",
+            "entry_price": 100,
+            "sl": 95,
+            "tp1": 105,
+            "tp1_executed": False,
+            "volume": 1.0,
+            "ticket": "1",
+            "entry_time": fixed_now.isoformat(),
+            "strategy_config": {"TP1_CLOSE_RATIO": 0.5},
+        }
+    })
+    save = mocker.spy(repo, "save_active")
+
+    pm = PositionManager(repo=repo, adapter=mocker.Mock(dry_run=True))
+    pm.on_tick(market_state={"price": 106, "time": fixed_now})
+
+    # TP1 partial + SL to BE + flag: three mutations, one write
+    save.assert_called_once()
+    trade = repo.load_active()["1"]
+    assert trade["tp1_executed"] is True
+    assert trade["volume"] == 0.5
+    assert trade["sl"] == 100
+    assert trade["be_moved"] is True
+
+
+def test_tick_exits_use_side_of_book(mocker, fixed_now):
+    repo = mocker.Mock()
+    repo.load_active.return_value = {
+        "1": {"trade_id": "1", "symbol": "EURUSD", "direction": "short",
+              "sl": 101.0, "tp2": None, "ticket": "1", "entry_time": fixed_now},
+    }
+
+    adapter = mocker.Mock(dry_run=True)
+    pm = PositionManager(repo=repo, adapter=adapter)
+
+    # bid below SL, but a short closes at the ask
+    pm.on_tick(market_state={"price": 100.9, "bid": 100.9, "ask": 101.1, "time": fixed_now})
+
+    repo.record_exit.assert_called_once()
+    assert repo.record_exit.call_args.kwargs["exit_price"] == 101.1
+
+
+def test_failed_positions_get_does_not_close_trades(mocker, fixed_now):
+    import pandas as pd
+
+    from core.live_trading.sim.broker import SimulatedMT5, SymbolSpec, installed
+
+    opens = [100.0] * 5
+    broker = SimulatedMT5(
+        bars={"XAUUSD": pd.DataFrame({
+            "time": pd.date_range("2024-01-01", periods=5, freq="1min", tz="UTC"),
+            "open": opens, "high": opens, "low": opens, "close": opens,
+        })},
+        specs={"XAUUSD": SymbolSpec(point=0.01, tick_value=1.0, tick_size=0.01)},
+    )
+
+    with installed(broker):
+        from core.live_trading.execution.mt5_adapter import MT5Adapter
+
+        adapter = MT5Adapter(dry_run=False, log=mocker.Mock())
+        ticket = adapter.open_position(symbol="XAUUSD", direction="long", volume=1.0, sl=90.0)["ticket"]
+
+        repo = mocker.Mock()
+        repo.load_active.return_value = {
+            "1": {"trade_id": "1", "symbol": "XAUUSD", "direction": "long", "ticket": str(ticket),
+                  "sl": 90.0, "tp2": None, "entry_time": fixed_now},
+        }
+        pm = PositionManager(repo=repo, adapter=adapter)
+        state = {"price": 100.0, "time": fixed_now}
+
+        # terminal hiccup: unknown positions, not "all closed"
+        mocker.patch.object(broker, "positions_get", return_value=None)
+        assert adapter.positions_snapshot() is None
+        pm.on_tick(market_state=state)
+        repo.record_exit.assert_not_called()
+
+        # an actual empty result is a broker-side close
+        broker.positions_get.return_value = ()
+        pm.on_tick(market_state=state)
+
+    repo.record_exit.assert_called_once()
+    assert repo.record_exit.call_args.kwargs["exit_reason"] == "BROKER_CLOSED"
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from core.live_trading.execution.position_snapshot import PositionSnapshot, reconcile
+
+
+def _pos(ticket, symbol="EURUSD", magic=100001):
+    return SimpleNamespace(ticket=ticket, symbol=symbol, magic=magic)
+
+
+def test_snapshot_lookup_by_ticket_and_symbol():
+    snap = PositionSnapshot.from_positions([_pos(1), _pos(2, "XAUUSD")])
+
+    assert snap.has("1") and snap.has(2)
+    assert not snap.has(3)
+    assert not snap.has("MOCK_EURUSD")
+    assert snap.get(2).symbol == "XAUUSD"
+    assert [p.ticket for p in snap.for_symbol("EURUSD")] == [1]
+
+    assert PositionSnapshot.from_positions(None).positions == {}
+
+
+def test_reconcile_finds_missing_and_orphans():
+    snap = PositionSnapshot.from_positions([
+        _pos(1),
+        _pos(7),                    # ours, not in repo
+        _pos(9, magic=42),          # manual trade: ignored
+    ])
+    active = {
+        "1": {"ticket": "1"},
+        "2": {"ticket": "2"},       # closed at broker
+    }
+
+    result = reconcile(active, snap, magic=100001)
+
+    assert result.missing == ("2",)
+    assert result.orphans == (7,)
+    assert not result.in_sync
+
+    assert reconcile({"1": {"ticket": 1}}, PositionSnapshot.from_positions([_pos(1)])).in_sync
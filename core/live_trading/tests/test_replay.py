@@ -0,0 +1,76 @@
+import pandas as pd
+
+from core.live_trading.sim.broker import SimulatedMT5, SymbolSpec, installed
+from core.live_trading.sim.replay import ReplayDriver
+from core.live_trading.trade_repo import SqliteTradeRepo
+from core.strategy.trade_plan import FixedExitPlan, TradePlan
+
+
+class _OneShotRunner:
+    """
+    Strategy stand-in: one long plan on the first candle.
+    """
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+        price = self.broker.symbol_info_tick("XAUUSD").ask
+        plan = None
+        if self.runs == 1:
+            plan = TradePlan(
+                symbol="XAUUSD",
+                direction="long",
+                entry_price=price,
+                entry_tag="test",
+                volume=0.0,
+                exit_plan=FixedExitPlan(sl=price - 2.0, tp1=price + 1.0, tp2=price + 3.0),
+                strategy_name="test",
+                strategy_config={"EXIT_EXECUTION": {"TP1": "DISABLED", "TP2": "BROKER"}},
+            )
+        return type("Result", (), {"plan": plan, "last_row": {}})()
+
+
+def test_replay_trade_closed_by_broker_take_profit(tmp_path, mocker):
+    opens = [100.0] * 5 + [100.0 + i for i in range(6)]
+    bars = pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=len(opens), freq="1min", tz="UTC"),
+        "open": opens,
+        "high": [o + 0.5 for o in opens],
+        "low": [o - 0.5 for o in opens],
+        "close": opens,
+    })
+    broker = SimulatedMT5(
+        bars={"XAUUSD": bars},
+        specs={"XAUUSD": SymbolSpec(point=0.01, tick_value=1.0, tick_size=0.01)},
+        start=bars["time"][3],
+    )
+    repo = SqliteTradeRepo(data_dir=tmp_path)
+
+    with installed(broker):
+        from core.live_trading.engine import LiveEngine
+        from core.live_trading.execution.mt5_adapter import MT5Adapter
+        from core.live_trading.execution.position_manager import PositionManager
+        from core.live_trading.mt5_market_state import MT5MarketStateProvider
+
+        engine = LiveEngine(
+            position_manager=PositionManager(
+                repo=repo, adapter=MT5Adapter(dry_run=False, log=mocker.Mock())
+            ),
+            market_state_provider=MT5MarketStateProvider(symbol="XAUUSD", timeframe="M1"),
+            strategy_runner=_OneShotRunner(broker),
+            tick_interval_sec=0,
+        )
+        report = ReplayDriver(broker=broker, engine=engine, repo=repo).run()
+
+    assert report.ticks == len(opens) - 4
+    assert report.errors == 0
+    assert report.tick_latency_s.shape == (report.ticks,)
+
+    assert list(report.deals["reason"]) == ["TP"]
+    assert len(report.trades) == 1
+    assert report.trades.iloc[0]["exit_reason"] == "BROKER_CLOSED"
+    assert report.final_balance > 10_000
+    repo.close()
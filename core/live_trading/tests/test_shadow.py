@@ -0,0 +1,133 @@
+import pandas as pd
+
+from core.live_trading.latency import LatencyRecorder
+from core.live_trading.shadow import ShadowComparator
+from core.strategy.base import BaseStrategy
+from core.strategy.plan_builder import PlanBuildContext
+from core.strategy.trade_plan import FixedExitPlan, TradePlan
+
+
+class UpBarStrategy(BaseStrategy):
+    lookahead = False
+
+    def populate_indicators(self):
+        pass
+
+    def populate_entry_trend(self):
+        df = self.df
+        nxt = df["close"].shift(-1)
+        mask = (nxt > df["close"]) if self.lookahead else (df["close"] > df["open"])
+        mask = mask.to_numpy()
+        self.set_entry_signals(mask, direction="long", tag="up")
+        self.set_levels(mask, sl=df["close"] - 1.0, tp1=df["close"] + 1.0, tp2=df["close"] + 2.0)
+
+    def populate_exit_trend(self):
+        pass
+
+
+def _bars(n: int) -> pd.DataFrame:
+    closes = [100.0 + (i % 3) for i in range(n)]
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2025-01-01", periods=n, freq="1min", tz="UTC"),
+            "open": 101.0,
+            "high": 103.0,
+            "low": 99.0,
+            "close": closes,
+        }
+    )
+
+
+def _live_step(strategy, bars, upto):
+    """What LiveStrategyRunner.evaluate does for the candle at `upto`."""
+    strategy.df = bars.iloc[: upto + 1].copy()
+    strategy.populate_indicators()
+    strategy.populate_entry_trend()
+    strategy.populate_exit_trend()
+    ctx = PlanBuildContext(symbol="EURUSD", strategy_name="up", strategy_config={})
+    plan = strategy.build_trade_plan_live(row=strategy.df.iloc[-1], ctx=ctx)
+    return strategy.df, ctx, plan
+
+
+def _run(strategy, shadow, n=20):
+    bars = _bars(n)
+    for upto in range(5, n):
+        df, ctx, plan = _live_step(strategy, bars, upto)
+        shadow.observe(strategy=strategy, ctx=ctx, df=df, plan=plan, live_plan_s=0.001)
+
+
+def test_consistent_strategy_has_no_mismatches():
+    recorder = LatencyRecorder()
+    shadow = ShadowComparator(window=8, settle_bars=2, latency=recorder)
+
+    _run(UpBarStrategy(df=None, symbol="EURUSD"), shadow)
+
+    assert shadow.bars == 15
+    assert shadow.mismatches == []
+    assert recorder.histogram("shadow", "EURUSD").count == 15
+
+
+def test_live_level_mismatch_is_reported_at_lag_zero(tmp_path):
+    strategy = UpBarStrategy(df=None, symbol="EURUSD")
+    df, ctx, plan = _live_step(strategy, _bars(10), 8)   # close 102 > open: long
+    assert plan is not None
+
+    live = TradePlan(
+        symbol=plan.symbol,
+        direction=plan.direction,
+        entry_price=plan.entry_price,
+        entry_tag=plan.entry_tag,
+        volume=0.0,
+        exit_plan=FixedExitPlan(sl=plan.exit_plan.sl - 0.5, tp1=plan.exit_plan.tp1, tp2=plan.exit_plan.tp2),
+        strategy_name=plan.strategy_name,
+    )
+
+    path = tmp_path / "shadow.jsonl"
+    shadow = ShadowComparator(window=8, path=path)
+    found = shadow.observe(strategy=strategy, ctx=ctx, df=df, plan=live)
+
+    assert [(m.field, m.lag) for m in found] == [("sl", 0)]
+    assert found[0].live == 100.5 and found[0].backtest == 101.0
+    assert len(path.read_text().splitlines()) == 1
+
+    # same candle again (engine re-run): not checked twice
+    assert shadow.observe(strategy=strategy, ctx=ctx, df=df, plan=live) == []
+
+
+def test_lookahead_signal_shows_up_after_settling():
+    strategy = UpBarStrategy(df=None, symbol="EURUSD")
+    strategy.lookahead = True
+    shadow = ShadowComparator(window=8, settle_bars=2)
+
+    _run(strategy, shadow)
+
+    # live never sees the next close; the later frame does
+    assert shadow.mismatches
+    assert {(m.field, m.lag) for m in shadow.mismatches} == {("plan", 2)}
+    assert all(m.live is False and m.backtest is True for m in shadow.mismatches)
+
+
+def test_submit_checks_on_background_thread():
+    import threading
+
+    strategy = UpBarStrategy(df=None, symbol="EURUSD")
+    strategy.lookahead = True
+    shadow = ShadowComparator(window=8, settle_bars=2)
+
+    seen = []
+    observe = shadow.observe
+
+    def spy(**kwargs):
+        seen.append(threading.current_thread().name)
+        return observe(**kwargs)
+
+    shadow.observe = spy
+    bars = _bars(20)
+    for upto in range(5, 20):
+        df, ctx, plan = _live_step(strategy, bars, upto)
+        shadow.submit(strategy=strategy, ctx=ctx, df=df, plan=plan)
+    shadow.join()
+
+    assert set(seen) == {"shadow"}
+    assert shadow.bars == 15 and shadow.dropped == 0
+    assert {(m.field, m.lag) for m in shadow.mismatches} == {("plan", 2)}
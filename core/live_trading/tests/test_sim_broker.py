@@ -0,0 +1,106 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from core.live_trading.sim.broker import SimulatedMT5, SymbolSpec, installed
+
+
+SPEC = SymbolSpec(point=0.01, digits=2, tick_value=1.0, tick_size=0.01, spread_points=10)
+
+
+def _bars(opens, *, freq="1min"):
+    n = len(opens)
+    return pd.DataFrame({
+        "time": pd.date_range("2024-01-01", periods=n, freq=freq, tz="UTC"),
+        "open": opens,
+        "high": [o + 1.0 for o in opens],
+        "low": [o - 1.0 for o in opens],
+        "close": [o + 0.5 for o in opens],
+        "volume": [10] * n,
+    })
+
+
+def _broker(opens, **kwargs):
+    return SimulatedMT5(bars={"XAUUSD": _bars(opens)}, specs={"XAUUSD": SPEC}, **kwargs)
+
+
+def test_rates_show_forming_bar_without_lookahead():
+    broker = _broker([100.0, 101.0, 102.0, 103.0], start=pd.Timestamp("2024-01-01 00:02", tz="UTC"))
+
+    rates = broker.copy_rates_from_pos("XAUUSD", broker.TIMEFRAME_M1, 0, 10)
+
+    assert len(rates) == 3
+    # completed bar as recorded, forming bar flat at its open
+    assert (rates[-2]["open"], rates[-2]["high"], rates[-2]["close"]) == (101.0, 102.0, 101.5)
+    assert (rates[-1]["open"], rates[-1]["high"], rates[-1]["close"]) == (102.0, 102.0, 102.0)
+
+    tick = broker.symbol_info_tick("XAUUSD")
+    assert tick.bid == 102.0
+    assert tick.ask == pytest.approx(102.1)
+
+
+def test_higher_timeframe_is_aggregated_up_to_now():
+    broker = _broker([100.0 + i for i in range(8)], start=pd.Timestamp("2024-01-01 00:07", tz="UTC"))
+
+    rates = broker.copy_rates_from_pos("XAUUSD", broker.TIMEFRAME_M5, 0, 10)
+
+    assert len(rates) == 2
+    assert (rates[0]["open"], rates[0]["high"], rates[0]["low"], rates[0]["close"]) == (
+        100.0, 105.0, 99.0, 104.5,
+    )
+    # 00:05 bucket: bars 00:05, 00:06 completed + 00:07 open
+    assert (rates[1]["open"], rates[1]["high"], rates[1]["close"]) == (105.0, 107.0, 107.0)
+
+
+def test_stop_loss_settles_on_completed_bar_with_slippage():
+    broker = _broker([100.0, 100.0, 98.0, 97.0], slippage_points=5)
+
+    result = broker.order_send({
+        "action": broker.TRADE_ACTION_DEAL, "symbol": "XAUUSD", "volume": 1.0,
+        "type": broker.ORDER_TYPE_BUY, "sl": 99.5, "tp": None, "magic": 7,
+    })
+    assert result.retcode == broker.TRADE_RETCODE_DONE
+    # ask 100.10 + 5 points
+    assert result.price == pytest.approx(100.15)
+    assert broker.positions_get(ticket=result.order)[0].magic == 7
+
+    # bar 0 (low 99.0) completes: SL at 99.50 - 5 points
+    assert broker.advance()
+    assert broker.positions_get() == ()
+
+    deal = broker.deals[0]
+    assert deal["reason"] == "SL"
+    assert deal["price_close"] == pytest.approx(99.45)
+    assert broker.account_info().balance == pytest.approx(10_000 - 70.0)
+
+
+def test_partial_close_and_modify():
+    broker = _broker([100.0, 100.0, 100.0])
+    ticket = broker.order_send({
+        "action": broker.TRADE_ACTION_DEAL, "symbol": "XAUUSD", "volume": 1.0,
+        "type": broker.ORDER_TYPE_SELL, "sl": 105.0, "tp": 90.0,
+    }).order
+
+    broker.order_send({"action": broker.TRADE_ACTION_DEAL, "position": ticket, "volume": 0.4})
+    broker.order_send({"action": broker.TRADE_ACTION_SLTP, "position": ticket, "sl": 101.0, "tp": 0.0})
+
+    position = broker.positions_get(ticket=ticket)[0]
+    assert position.volume == pytest.approx(0.6)
+    assert (position.sl, position.tp) == (101.0, 0.0)
+
+    closed = broker.order_send({"action": broker.TRADE_ACTION_DEAL, "position": 999})
+    assert closed.retcode == broker.TRADE_RETCODE_POSITION_CLOSED
+
+
+def test_installed_routes_and_restores_module():
+    broker = _broker([100.0, 101.0])
+    previous = sys.modules.get("MetaTrader5")
+
+    with installed(broker):
+        import core.live_trading.mt5_market_state as market_state
+
+        assert sys.modules["MetaTrader5"] is broker
+        assert market_state.mt5 is broker
+
+    assert sys.modules.get("MetaTrader5") is previous
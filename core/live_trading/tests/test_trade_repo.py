@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from core.live_trading.trade_repo import TradeRepo
+import pytest
+
+from core.live_trading.trade_repo import SqliteTradeRepo, TradeRepo, create_trade_repo
 
 
 def test_trade_repo_is_restart_safe(tmp_path):
@@ -22,4 +24,93 @@ def test_trade_repo_is_restart_safe(tmp_path):
     repo2 = TradeRepo(data_dir=tmp_path)
 
     active = repo2.load_active()
-    assert "1" in active
\ No newline at end of file
+    assert "1" in active
+
+def _entry(repo, trade_id, symbol="EURUSD"):
+    repo.record_entry(
+        trade_id=trade_id,
+        symbol=symbol,
+        direction="long",
+        entry_price=100,
+        volume=1,
+        sl=95,
+        tp1=105,
+        tp2=110,
+        entry_time=datetime(2025, 1, 1, 12, 0),
+        entry_tag="test",
+    )
+
+
+def test_sqlite_repo_matches_json_repo(tmp_path):
+    json_repo = TradeRepo(data_dir=tmp_path / "json")
+    sqlite_repo = SqliteTradeRepo(data_dir=tmp_path / "sqlite")
+
+    for repo in (json_repo, sqlite_repo):
+        _entry(repo, "1")
+        _entry(repo, "2", symbol="XAUUSD")
+        repo.mark_tp1_executed(
+            trade_id="1",
+            tp1_price=105,
+            tp1_time=datetime(2025, 1, 1, 13, 0),
+            remaining_volume=0.5,
+        )
+        active = repo.load_active()
+        active["2"]["sl"] = 99
+        repo.save_active(active)
+        repo.record_exit(
+            trade_id="1",
+            exit_price=110,
+            exit_time=datetime(2025, 1, 1, 14, 0),
+            exit_reason="TP2",
+        )
+
+    assert sqlite_repo.load_active() == json_repo.load_active()
+    assert sqlite_repo.load_closed() == json_repo.load_closed()
+
+
+def test_sqlite_repo_is_restart_safe_and_imports_json(tmp_path):
+    legacy = TradeRepo(data_dir=tmp_path)
+    _entry(legacy, "1")
+    _entry(legacy, "2")
+    legacy.record_exit(
+        trade_id="2",
+        exit_price=95,
+        exit_time=datetime(2025, 1, 1, 14, 0),
+        exit_reason="SL",
+    )
+
+    repo = SqliteTradeRepo(data_dir=tmp_path)
+    assert set(repo.load_active()) == {"1"}
+    assert set(repo.load_closed()) == {"2"}
+
+    # imported files are retired: a JSON repo no longer sees trade 1 as open
+    assert not (tmp_path / "active_trades.json").exists()
+    assert (tmp_path / "active_trades.json.imported").exists()
+    assert TradeRepo(data_dir=tmp_path).load_active() == {}
+
+    _entry(repo, "3")
+    repo.close()
+
+    reopened = SqliteTradeRepo(data_dir=tmp_path)
+    assert set(reopened.load_active()) == {"1", "3"}
+
+
+def test_sqlite_repo_load_active_returns_copies(tmp_path):
+    repo = SqliteTradeRepo(data_dir=tmp_path, checkpoint_every=1)
+    _entry(repo, "1")
+
+    active = repo.load_active()
+    active["1"]["sl"] = 0
+    assert repo.load_active()["1"]["sl"] == 95
+
+    repo.save_active({})
+    assert repo.load_active() == {}
+    assert SqliteTradeRepo(data_dir=tmp_path).load_active() == {}
+
+
+def test_create_trade_repo_backends(tmp_path):
+    assert type(create_trade_repo("json", tmp_path / "a")) is TradeRepo
+    assert type(create_trade_repo("SQLite", tmp_path / "b")) is SqliteTradeRepo
+
+    with pytest.raises(ValueError):
+        create_trade_repo("redis", tmp_path)
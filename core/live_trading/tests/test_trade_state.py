@@ -24,4 +24,52 @@ def test_update_sl_updates_repo_and_calls_adapter(mocker):
     svc.update_sl(trade_id="1", new_sl=100)
 
     adapter.modify_sl.assert_called_once()
-    repo.save_active.assert_called_once()
\ No newline at end of file
+    repo.save_active.assert_called_once()
+
+def test_tick_mutations_are_written_once_at_commit(mocker):
+    repo = mocker.Mock()
+    active = {"1": {"ticket": "1", "sl": 95, "volume": 1.0}}
+    svc = TradeStateService(repo=repo, adapter=mocker.Mock())
+
+    svc.begin_tick(active)
+    svc.mark_tp1_executed(trade_id="1", price=105, now=None, remain_volume=0.5)
+    svc.update_sl(trade_id="1", new_sl=100)
+    svc.set_flag(trade_id="1", key="be_moved", value=True)
+
+    # handlers share the tick's dicts: no reload, no write yet
+    assert active["1"]["sl"] == 100 and active["1"]["volume"] == 0.5
+    repo.load_active.assert_not_called()
+    repo.save_active.assert_not_called()
+
+    svc.commit()
+    repo.save_active.assert_called_once_with(active)
+
+    # outside a tick: immediate write again
+    svc.commit()
+    repo.load_active.return_value = {"1": {"ticket": "1", "sl": 100}}
+    svc.set_flag(trade_id="1", key="x", value=1)
+    assert repo.save_active.call_count == 2
+
+
+def test_exit_flushes_pending_changes_of_that_trade_first(mocker):
+    repo = mocker.Mock()
+    active = {
+        "1": {"ticket": "1", "sl": 95},
+        "2": {"ticket": "2", "sl": 95},
+    }
+    svc = TradeStateService(repo=repo, adapter=mocker.Mock())
+
+    svc.begin_tick(active)
+    svc.set_flag(trade_id="2", key="be_moved", value=True)
+    svc.record_exit(trade_id="1", price=90, time=None, reason="SL", exit_level_tag=None)
+    repo.save_active.assert_not_called()
+
+    svc.update_sl(trade_id="2", new_sl=99)
+    svc.record_exit(trade_id="2", price=99, time=None, reason="SL", exit_level_tag=None)
+
+    calls = [c[0] for c in repo.mock_calls if c[0] in ("save_active", "record_exit")]
+    assert calls == ["record_exit", "save_active", "record_exit"]
+
+    svc.commit()
+    assert repo.save_active.call_count == 1
+    assert active == {}
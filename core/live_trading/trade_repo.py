@@ -1,7 +1,9 @@
 
 import json
 import os
+import sqlite3
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
@@ -209,3 +211,209 @@ class TradeRepo:
         trade["volume"] = remaining_volume
 
         self.save_active(active)
+
+
+class SqliteTradeRepo(TradeRepo):
+    """
+    TradeRepo on SQLite (WAL), same public API.
+
+    - one row per trade (status active / closed); a mutation writes only
+      the rows it changed, in one transaction
+    - active trades are served from an in-memory index; load_active()
+      never touches disk
+    - synchronous=FULL: a returned write survives a crash, as with the
+      JSON tmp-file + rename
+    - the WAL is truncated every `checkpoint_every` writes (compact())
+    - existing active/closed JSON files are imported into a new database
+      and renamed to *.json.imported (never read again by either backend)
+    """
+
+    def __init__(
+        self,
+        data_dir: str | Path = "live_state",
+        *,
+        checkpoint_every: int = 500,
+    ):
+        # no JSON files: storage is <data_dir>/trades.db
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        self.active_path = self.data_dir / "active_trades.json"
+        self.closed_path = self.data_dir / "closed_trades.json"
+        self.db_path = self.data_dir / "trades.db"
+
+        self.checkpoint_every = checkpoint_every
+        self._writes = 0
+        self._lock = threading.RLock()
+
+        is_new = not self.db_path.exists()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,       # explicit BEGIN / COMMIT
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS trades ("
+            " trade_id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " symbol TEXT,"
+            " data TEXT NOT NULL)"
+        )
+
+        if is_new:
+            self._import_json()
+
+        self._active: Dict[str, dict] = {
+            trade_id: json.loads(data)
+            for trade_id, data in self._conn.execute(
+                "SELECT trade_id, data FROM trades WHERE status = 'active'"
+            )
+        }
+
+    # ==================================================
+    # Internal helpers
+    # ==================================================
+
+    @staticmethod
+    def _encode(trade: dict) -> str:
+        return json.dumps(trade, default=str)
+
+    def _write(self, statements: list[tuple[str, tuple]]) -> None:
+        if not statements:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+            self._writes += 1
+            if self.checkpoint_every and self._writes % self.checkpoint_every == 0:
+                self.compact()
+
+    @staticmethod
+    def _upsert(trade_id: str, status: str, trade: dict, data: str) -> tuple[str, tuple]:
+        return (
+            "INSERT INTO trades (trade_id, status, symbol, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(trade_id) DO UPDATE SET "
+            "status = excluded.status, symbol = excluded.symbol, data = excluded.data",
+            (str(trade_id), status, trade.get("symbol"), data),
+        )
+
+    def _import_json(self) -> None:
+        statements = []
+        for path, status in ((self.closed_path, "closed"), (self.active_path, "active")):
+            for trade_id, trade in self._load_json(path).items():
+                statements.append(self._upsert(trade_id, status, trade, self._encode(trade)))
+        self._write(statements)
+
+        # the database is the state now: a JSON repo must not reload these
+        for path in (self.closed_path, self.active_path):
+            if path.exists():
+                imported = path.with_name(path.name + ".imported")
+                path.replace(imported)
+                print(f"📦 Imported {path.name} into {self.db_path.name} (kept as {imported.name})")
+
+    # ==================================================
+    # Public API
+    # ==================================================
+
+    def load_active(self) -> Dict[str, dict]:
+        """
+        Active trades from the in-memory index (copies: callers mutate
+        and hand them back to save_active).
+        """
+        with self._lock:
+            return {trade_id: dict(trade) for trade_id, trade in self._active.items()}
+
+    def save_active(self, trades: Dict[str, dict]) -> None:
+        """
+        Replace the active set; only added / changed / removed rows are written.
+        """
+        with self._lock:
+            statements = []
+            index = {}
+            for trade_id, trade in trades.items():
+                trade_id = str(trade_id)
+                data = self._encode(trade)
+                # index holds what a reload would return (JSON round trip)
+                index[trade_id] = json.loads(data)
+                if index[trade_id] != self._active.get(trade_id):
+                    statements.append(self._upsert(trade_id, "active", trade, data))
+
+            for trade_id in self._active.keys() - index.keys():
+                statements.append((
+                    "DELETE FROM trades WHERE trade_id = ? AND status = 'active'",
+                    (trade_id,),
+                ))
+
+            self._write(statements)
+            self._active = index
+
+    def load_closed(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                trade_id: json.loads(data)
+                for trade_id, data in self._conn.execute(
+                    "SELECT trade_id, data FROM trades WHERE status = 'closed'"
+                )
+            }
+
+    def record_exit(
+        self,
+        *,
+        trade_id: str,
+        exit_price: float,
+        exit_time: datetime,
+        exit_reason: str,
+        exit_level_tag: str | None = None,
+    ) -> None:
+        """
+        Move trade from active -> closed (one row update).
+        """
+        with self._lock:
+            trade = self._active.get(str(trade_id))
+            if trade is None:
+                # already closed or unknown
+                return
+
+            trade = dict(trade)
+            trade.update({
+                "exit_price": exit_price,
+                "exit_time": exit_time,
+                "exit_reason": exit_reason,
+                "exit_level_tag": exit_level_tag,
+            })
+
+            self._write([self._upsert(trade_id, "closed", trade, self._encode(trade))])
+            del self._active[str(trade_id)]
+
+    def compact(self) -> None:
+        """
+        Fold the WAL into the database file and truncate it.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self._lock:
+            self.compact()
+            self._conn.close()
+
+
+def create_trade_repo(backend: str = "json", data_dir: str | Path = "live_state") -> TradeRepo:
+    backend = backend.lower()
+
+    if backend == "json":
+        return TradeRepo(data_dir=data_dir)
+    if backend == "sqlite":
+        return SqliteTradeRepo(data_dir=data_dir)
+
+    raise ValueError(
+        f"Unsupported trade repo backend: {backend}. Allowed: json, sqlite")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -38,4 +39,33 @@ class TradeContextEnricher:
 
             df[ctx.name] = merged[ctx.column].values
 
-        return df
\ No newline at end of file
+        return df
+
+def context_projection(
+    df_candles: pd.DataFrame,
+    contexts: list,
+    entry_times=None,
+) -> pd.DataFrame:
+    """
+    Minimal candle frame TradeContextEnricher needs: time + entry_candle
+    context columns, and (given entry_times) only the last candle <= each
+    entry. Enriching with the projection gives the same trade context.
+    """
+    columns = ["time"]
+    for ctx in contexts:
+        if ctx.source == "entry_candle" and ctx.column in df_candles.columns:
+            if ctx.column not in columns:
+                columns.append(ctx.column)
+
+    df = df_candles[columns]
+
+    if entry_times is not None and len(df):
+        time = pd.to_datetime(df["time"], utc=True)
+        order = np.argsort(time.to_numpy(), kind="mergesort")
+        entries = pd.to_datetime(pd.Series(entry_times), utc=True).to_numpy()
+
+        pos = time.to_numpy()[order].searchsorted(entries, side="right") - 1
+        pos = np.unique(pos[pos >= 0])
+        df = df.iloc[order[pos]]
+
+    return df.reset_index(drop=True)
@@ -5,11 +5,20 @@ import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from core.reporting.config.report_spec import StrategyReportSpec
 from core.reporting.core.metrics import ExpectancyMetric, MaxDrawdownMetric
+from core.strategy.levels import LevelArrays, mask_levels
 from core.strategy.plan_builder import PlanBuildContext, build_trade_plan_from_row, build_plans_frame
+from core.strategy.signals import (
+    SIGNAL_DIRECTION,
+    write_entry_signals,
+    write_exit_signals,
+    write_levels,
+    write_trailing_stops,
+)
 from core.strategy.trade_plan import TradePlan, TradeAction
 
 
@@ -20,7 +29,8 @@ class BaseStrategy(ABC):
 
     Responsibilities:
     - populate features/indicators on self.df (vectorized)
-    - produce signals in df (e.g. signal_entry / signal_exit / levels)
+    - produce signals in df (columnar via set_entry_signals / set_levels,
+      or legacy dicts in signal_entry / signal_exit / levels)
     - optionally: map last-row decisions into TradePlan (live) or plan frame (backtest)
 
     Strategy does NOT:
@@ -28,6 +38,10 @@ class BaseStrategy(ABC):
     - manage lifecycle/execution (runner/engine does)
     """
 
+    # strategy_config keys read by informatives / populate_indicators.
+    # None = unknown -> every key counts as a feature input (no reuse).
+    feature_params: tuple[str, ...] | None = None
+
     def __init__(
         self,
         *,
@@ -39,7 +53,11 @@ class BaseStrategy(ABC):
     ):
         self.df = df
         self.symbol = symbol
-        self.strategy_config = strategy_config or {}
+        # class-level strategy_config holds defaults, ctor arg overrides
+        self.strategy_config = {
+            **(getattr(type(self), "strategy_config", None) or {}),
+            **(strategy_config or {}),
+        }
         self.startup_candle_count = startup_candle_count
         self.strategy_name = strategy_name
 
@@ -61,6 +79,24 @@ class BaseStrategy(ABC):
         payload = json.dumps(raw, sort_keys=True)
         return hashlib.md5(payload.encode()).hexdigest()[:8]
 
+    def get_feature_key(self) -> str:
+        """
+        Identifier of the feature stage (informatives + indicators).
+        Configs differing only outside feature_params share it.
+        """
+        params = self.feature_params
+        config = (
+            self.strategy_config
+            if params is None
+            else {k: self.strategy_config.get(k) for k in params}
+        )
+        raw = {
+            "class": type(self).__name__,
+            "features": config,
+        }
+        payload = json.dumps(raw, sort_keys=True)
+        return hashlib.md5(payload.encode()).hexdigest()[:8]
+
     @classmethod
     def get_required_informatives(cls) -> List[str]:
         tfs = set()
@@ -87,6 +123,116 @@ class BaseStrategy(ABC):
         raise NotImplementedError
 
 
+    # ==================================================
+    # Columnar signals
+    # ==================================================
+
+    def set_entry_signals(
+        self,
+        mask,
+        *,
+        direction: str,
+        tag: str,
+    ) -> None:
+        """
+        Mark entry signals on self.df (int8 direction + categorical tag).
+        Later calls override earlier ones on overlapping rows.
+        """
+        write_entry_signals(self.df, mask, direction=direction, tag=tag)
+
+    def set_levels(
+        self,
+        mask,
+        *,
+        sl,
+        tp1=None,
+        tp2=None,
+        sl_tag=None,
+        tp1_tag=None,
+        tp2_tag=None,
+    ) -> None:
+        """
+        Write SL/TP1/TP2 levels and their tags on self.df.
+        Scalars or arrays aligned to self.df.
+        """
+        write_levels(
+            self.df,
+            mask,
+            sl=sl,
+            tp1=tp1,
+            tp2=tp2,
+            sl_tag=sl_tag,
+            tp1_tag=tp1_tag,
+            tp2_tag=tp2_tag,
+        )
+
+    def set_trailing_stops(
+        self,
+        *,
+        long=None,
+        short=None,
+        mask=None,
+    ) -> None:
+        """
+        Per-bar trailing SL candidates (columnar custom_stop_loss).
+        Used by managed exits when USE_TRAILING is enabled.
+        """
+        write_trailing_stops(self.df, long=long, short=short, mask=mask)
+
+    def set_exit_signals(
+        self,
+        mask,
+        *,
+        entry_tag: str,
+        exit_tag: str | None = None,
+    ) -> None:
+        """
+        Close open trades with `entry_tag` at the close of mask bars
+        (columnar signal_exit).
+        """
+        write_exit_signals(self.df, mask, entry_tag=entry_tag, exit_tag=exit_tag)
+
+    def compute_levels_vectorized(
+        self,
+        df: pd.DataFrame,
+        mask,
+    ) -> LevelArrays | None:
+        """
+        Optional vectorized SL/TP hook.
+
+        Receives the full df and a boolean mask of signal rows; returns
+        LevelArrays aligned to df (values outside mask are ignored).
+        Default: None -> strategy writes levels itself.
+        """
+        return None
+
+    def apply_levels(self, mask=None) -> LevelArrays | None:
+        """
+        Run compute_levels_vectorized over signal rows and store the result
+        in the columnar level columns of self.df.
+        """
+        if mask is None:
+            if SIGNAL_DIRECTION not in self.df.columns:
+                return None
+            mask = self.df[SIGNAL_DIRECTION].to_numpy() != 0
+
+        mask = np.asarray(mask, dtype=bool)
+        levels = self.compute_levels_vectorized(self.df, mask)
+        if levels is None:
+            return None
+
+        levels = mask_levels(levels, mask)
+        self.set_levels(
+            mask,
+            sl=levels.sl,
+            tp1=levels.tp1,
+            tp2=levels.tp2,
+            sl_tag=levels.sl_tag,
+            tp1_tag=levels.tp1_tag,
+            tp2_tag=levels.tp2_tag,
+        )
+        return levels
+
     def build_trade_plan_live(self, *, row: pd.Series, ctx: PlanBuildContext) -> TradePlan | None:
         """
         Default live plan builder from last row.
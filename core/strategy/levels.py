@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from core.strategy.signals import DIRECTION_LONG, DIRECTION_SHORT
+
+
+@dataclass(frozen=True)
+class LevelArrays:
+    """
+    Vectorized SL/TP levels aligned to the strategy DataFrame.
+
+    Prices are float arrays (NaN = no level on that row).
+    Tags are either one str for every row or an object array.
+    """
+
+    sl: np.ndarray
+    tp1: np.ndarray | None = None
+    tp2: np.ndarray | None = None
+
+    sl_tag: np.ndarray | str | None = None
+    tp1_tag: np.ndarray | str | None = None
+    tp2_tag: np.ndarray | str | None = None
+
+
+# ==========================================================
+# Stop loss helpers
+# ==========================================================
+
+def _is_long(direction) -> np.ndarray:
+    return np.asarray(direction) == DIRECTION_LONG
+
+
+def structural_sl(
+        direction,
+        *,
+        swing_low,
+        swing_high,
+        atr,
+        atr_buffer: float = 0.5,
+) -> np.ndarray:
+    """
+    SL beyond the recent structure:
+      long  -> swing_low  - atr * atr_buffer
+      short -> swing_high + atr * atr_buffer
+    """
+    atr = np.asarray(atr, dtype=np.float64)
+    return np.where(
+        _is_long(direction),
+        np.asarray(swing_low, dtype=np.float64) - atr * atr_buffer,
+        np.asarray(swing_high, dtype=np.float64) + atr * atr_buffer,
+    )
+
+
+def min_distance_sl(
+        direction,
+        *,
+        close,
+        atr,
+        min_atr_mult: float = 0.5,
+        min_pct: float = 0.001,
+) -> np.ndarray:
+    """
+    Closest allowed SL: max(atr * min_atr_mult, close * min_pct) away from close.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    distance = np.maximum(
+        np.asarray(atr, dtype=np.float64) * min_atr_mult,
+        close * min_pct,
+    )
+    return np.where(_is_long(direction), close - distance, close + distance)
+
+
+def wider_sl(
+        direction,
+        primary,
+        fallback,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pick the SL further from price.
+
+    Returns:
+        sl           - chosen level
+        use_primary  - True where primary was strictly wider
+    """
+    primary = np.asarray(primary, dtype=np.float64)
+    fallback = np.asarray(fallback, dtype=np.float64)
+
+    use_primary = np.where(
+        _is_long(direction),
+        primary < fallback,
+        primary > fallback,
+    )
+    return np.where(use_primary, primary, fallback), use_primary
+
+
+# ==========================================================
+# Take profit helpers
+# ==========================================================
+
+def r_multiple_tp(
+        direction,
+        *,
+        entry,
+        sl,
+        multiple: float,
+) -> np.ndarray:
+    """
+    TP at `multiple` x initial risk (|entry - sl|) in trade direction.
+    """
+    entry = np.asarray(entry, dtype=np.float64)
+    risk = np.abs(entry - np.asarray(sl, dtype=np.float64))
+    sign = np.where(_is_long(direction), 1.0, -1.0)
+    return entry + sign * risk * multiple
+
+
+# ==========================================================
+# Trailing stop helpers
+# ==========================================================
+
+def _rolling(values, window: int, fn) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan, dtype=np.float64)
+    if window <= 0 or len(values) < window:
+        return out
+    view = np.lib.stride_tricks.sliding_window_view(values, window)
+    out[window - 1:] = fn(view, axis=1)
+    return out
+
+
+def swing_trail(
+        *,
+        low,
+        high,
+        lookback: int = 5,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Swing trailing stop candidates:
+      long  -> lowest low of the last `lookback` bars
+      short -> highest high of the last `lookback` bars
+    """
+    return _rolling(low, lookback, np.min), _rolling(high, lookback, np.max)
+
+
+def mask_levels(levels: LevelArrays, mask) -> LevelArrays:
+    """
+    NaN-out prices outside mask (rows without a signal).
+    """
+    mask = np.asarray(mask, dtype=bool)
+
+    def _mask(a):
+        if a is None:
+            return None
+        return np.where(mask, np.asarray(a, dtype=np.float64), np.nan)
+
+    return LevelArrays(
+        sl=_mask(levels.sl),
+        tp1=_mask(levels.tp1),
+        tp2=_mask(levels.tp2),
+        sl_tag=levels.sl_tag,
+        tp1_tag=levels.tp1_tag,
+        tp2_tag=levels.tp2_tag,
+    )
+
+
+def signal_mask(direction) -> np.ndarray:
+    direction = np.asarray(direction)
+    return (direction == DIRECTION_LONG) | (direction == DIRECTION_SHORT)
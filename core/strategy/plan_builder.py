@@ -6,6 +6,28 @@ from typing import Any, Dict, Optional, Literal, Tuple
 import numpy as np
 import pandas as pd
 
+from core.strategy.signals import (
+    DIRECTION_LONG,
+    DIRECTION_SHORT,
+    EXIT_SIGNAL_TAG,
+    LEVEL_SL,
+    LEVEL_SL_TAG,
+    LEVEL_TP1,
+    LEVEL_TP1_TAG,
+    LEVEL_TP2,
+    LEVEL_TP2_TAG,
+    SIGNAL_DIRECTION,
+    SIGNAL_TAG,
+    TRAIL_SL_LONG,
+    TRAIL_SL_SHORT,
+    _extract_direction_tag,
+    _extract_level,
+    categorical_to_str,
+    dict_mask,
+    direction_to_str,
+    ensure_columnar_signals,
+    ensure_management_columns,
+)
 from core.strategy.trade_plan import TradePlan, FixedExitPlan, ManagedExitPlan
 
 
@@ -22,59 +44,119 @@ class PlanBuildContext:
 # Helpers
 # ==========================================================
 
-def _extract_direction_tag(
-        signal: Any
-) -> Tuple[Optional[Literal["long", "short"]], str]:
-    if not isinstance(signal, dict):
-        return None, ""
-    d = signal.get("direction")
-    if d not in ("long", "short"):
-        return None, ""
-    return d, str(signal.get("tag", ""))
+def _has_dict(x: Any) -> bool:
+    return isinstance(x, dict)
 
 
-def _extract_level(levels: Any, key: Any) -> Optional[float]:
-    if not isinstance(levels, dict):
+def _row_float(row: pd.Series, key: str) -> Optional[float]:
+    v = row.get(key)
+    if v is None or pd.isna(v):
         return None
+    return float(v)
 
-    item = levels.get(key)
-    if item is None and isinstance(key, str):
-        fallback = {"SL": 0, "TP1": 1, "TP2": 2}.get(key)
-        if fallback is not None:
-            item = levels.get(fallback)
-
-    if not isinstance(item, dict):
-        return None
 
-    v = item.get("level")
-    if v is None:
-        return None
+def _row_str(row: pd.Series, key: str) -> str:
+    v = row.get(key)
+    if v is None or (not isinstance(v, str) and pd.isna(v)):
+        return ""
+    return str(v)
 
-    try:
-        return float(v)
-    except Exception:
-        return None
 
+def _row_signal(
+        row: pd.Series
+) -> Tuple[Optional[Literal["long", "short"]], str, Optional[float], Optional[float], Optional[float]]:
+    """
+    Direction, tag and SL/TP1/TP2 for one row.
+    Columnar signal columns win over the dict form.
+    """
+    if SIGNAL_DIRECTION in row.index:
+        code = row.get(SIGNAL_DIRECTION)
+        if code == DIRECTION_LONG:
+            direction = "long"
+        elif code == DIRECTION_SHORT:
+            direction = "short"
+        else:
+            return None, "", None, None, None
+
+        if LEVEL_SL in row.index:
+            return (
+                direction,
+                _row_str(row, SIGNAL_TAG),
+                _row_float(row, LEVEL_SL),
+                _row_float(row, LEVEL_TP1),
+                _row_float(row, LEVEL_TP2),
+            )
+        entry_tag = _row_str(row, SIGNAL_TAG)
+    else:
+        direction, entry_tag = _extract_direction_tag(row.get("signal_entry"))
+        if direction is None:
+            return None, "", None, None, None
 
-def _extract_level_tag(levels: Any, key: Any) -> str:
+    levels = row.get("levels")
     if not isinstance(levels, dict):
-        return ""
+        return None, "", None, None, None
+
+    return (
+        direction,
+        entry_tag,
+        _extract_level(levels, "SL"),
+        _extract_level(levels, "TP1"),
+        _extract_level(levels, "TP2"),
+    )
 
-    item = levels.get(key)
-    if item is None and isinstance(key, str):
-        fallback = {"SL": 0, "TP1": 1, "TP2": 2}.get(key)
-        if fallback is not None:
-            item = levels.get(fallback)
 
-    if not isinstance(item, dict):
-        return ""
+def _row_managed(row: pd.Series, direction: str) -> bool:
+    """
+    Row carries management signals (dict or columnar form).
+    """
+    if _has_dict(row.get("signal_exit")) or _has_dict(row.get("custom_stop_loss")):
+        return True
 
-    tag = item.get("tag")
-    return "" if tag is None else str(tag)
+    trail_col = TRAIL_SL_LONG if direction == "long" else TRAIL_SL_SHORT
+    return _row_float(row, trail_col) is not None or bool(_row_str(row, EXIT_SIGNAL_TAG))
 
 
-def _has_dict(x: Any) -> bool:
-    return isinstance(x, dict)
+def _managed_mask(df: pd.DataFrame, direction_code: np.ndarray) -> np.ndarray:
+    n = len(df)
+    is_managed = np.zeros(n, dtype=bool)
+
+    for col in ("signal_exit", "custom_stop_loss"):
+        values = df.get(col)
+        if values is not None:
+            is_managed |= dict_mask(values.to_numpy())
+
+    if TRAIL_SL_LONG in df.columns or TRAIL_SL_SHORT in df.columns or EXIT_SIGNAL_TAG in df.columns:
+        mgmt = ensure_management_columns(df)
+        trail = np.where(
+            direction_code == DIRECTION_SHORT,
+            mgmt[TRAIL_SL_SHORT].to_numpy(dtype=np.float64),
+            mgmt[TRAIL_SL_LONG].to_numpy(dtype=np.float64),
+        )
+        is_managed |= ~np.isnan(trail)
+        is_managed |= mgmt[EXIT_SIGNAL_TAG].notna().to_numpy()
+
+    return is_managed
+
+
+def managed_exit_settings(strategy_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Managed-exit knobs from strategy config (live PositionManager semantics):
+      - trail_from: "entry" | "tp1" | None (USE_TRAILING off)
+      - use_tp1:    TP1 partial enabled (USE_TP1, EXIT_EXECUTION.TP1 != DISABLED)
+      - use_tp2:    TP2 kept on managed trades (ALLOW_TP2_WITH_TRAILING)
+      - be_on_tp1:  move SL to BE after TP1 (EXIT_EXECUTION.BE_ON_TP1)
+    """
+    cfg = strategy_config or {}
+    execution = cfg.get("EXIT_EXECUTION", {}) or {}
+
+    use_trailing = bool(cfg.get("USE_TRAILING", False))
+
+    return {
+        "trail_from": cfg.get("TRAIL_FROM", "tp1") if use_trailing else None,
+        "use_tp1": bool(cfg.get("USE_TP1", True)) and execution.get("TP1", "ENGINE") != "DISABLED",
+        "use_tp2": bool(cfg.get("ALLOW_TP2_WITH_TRAILING", False)),
+        "be_on_tp1": bool(execution.get("BE_ON_TP1", True)),
+    }
 
 
 def build_trade_plan_from_row(
@@ -82,24 +164,15 @@ def build_trade_plan_from_row(
         row: pd.Series,
         ctx: PlanBuildContext
 ) -> TradePlan | None:
-    signal = row.get("signal_entry")
-    levels = row.get("levels")
-
-    direction, entry_tag = _extract_direction_tag(signal)
-    if direction is None or not isinstance(levels, dict):
+    direction, entry_tag, sl, tp1, tp2 = _row_signal(row)
+    if direction is None:
         return None
 
-    sl = _extract_level(levels, "SL")
-    tp1 = _extract_level(levels, "TP1")
-    tp2 = _extract_level(levels, "TP2")
-
     if sl is None:
         return None
 
     use_trailing = bool(ctx.strategy_config.get("USE_TRAILING", False))
-    has_signal_exit = _has_dict(row.get("signal_exit"))
-    has_custom_sl = _has_dict(row.get("custom_stop_loss"))
-    is_managed = use_trailing or has_signal_exit or has_custom_sl
+    is_managed = use_trailing or _row_managed(row, direction)
 
     entry_price = float(row["close"])
 
@@ -134,86 +207,72 @@ def build_plans_frame(
       - plan_entry_tag
       - plan_entry_price
       - plan_sl, plan_tp1, plan_tp2
-      - plan_sl_tag, plan_tp1_tag, plan_tp2_tag   <-- NEW
+      - plan_sl_tag, plan_tp1_tag, plan_tp2_tag
       - plan_exit_mode (fixed/managed/None)
+      - plan_trail_from ("entry"/"tp1"/None), plan_be_on_tp1 (managed only)
+
+    Reads the columnar signal contract (see core.strategy.signals).
+    Dict-form signal_entry / levels are converted once up front.
     """
     n = len(df)
     plans = pd.DataFrame(index=df.index)
 
-    sig_vals = df.get("signal_entry", pd.Series(index=df.index, dtype=object)).values
-    lvl_vals = df.get("levels", pd.Series(index=df.index, dtype=object)).values
-
-    direction = np.empty(n, dtype=object)
-    entry_tag = np.empty(n, dtype=object)
-
-    sl = np.full(n, np.nan, dtype=float)
-    tp1 = np.full(n, np.nan, dtype=float)
-    tp2 = np.full(n, np.nan, dtype=float)
+    signals = ensure_columnar_signals(df)
 
-    sl_tag = np.empty(n, dtype=object); sl_tag[:] = ""
-    tp1_tag = np.empty(n, dtype=object); tp1_tag[:] = ""
-    tp2_tag = np.empty(n, dtype=object); tp2_tag[:] = ""
+    direction_code = signals[SIGNAL_DIRECTION].to_numpy(dtype=np.int8)
 
-    for i in range(n):
-        d, t = _extract_direction_tag(sig_vals[i])
-        direction[i] = d
-        entry_tag[i] = t
+    sl = signals[LEVEL_SL].to_numpy(dtype=np.float64)
+    tp1 = signals[LEVEL_TP1].to_numpy(dtype=np.float64)
+    tp2 = signals[LEVEL_TP2].to_numpy(dtype=np.float64)
 
-        lv = lvl_vals[i]
-        if not isinstance(lv, dict):
-            continue
+    has_dir = (direction_code == DIRECTION_LONG) | (direction_code == DIRECTION_SHORT)
 
-        v_sl = _extract_level(lv, "SL")
-        v_tp1 = _extract_level(lv, "TP1")
-        v_tp2 = _extract_level(lv, "TP2")
-
-        if v_sl is not None:
-            sl[i] = v_sl
-        if v_tp1 is not None:
-            tp1[i] = v_tp1
-        if v_tp2 is not None:
-            tp2[i] = v_tp2
-
-        sl_tag[i] = _extract_level_tag(lv, "SL")
-        tp1_tag[i] = _extract_level_tag(lv, "TP1")
-        tp2_tag[i] = _extract_level_tag(lv, "TP2")
+    entry_tag = categorical_to_str(signals[SIGNAL_TAG])
+    entry_tag[~has_dir] = ""
 
     use_trailing = bool(ctx.strategy_config.get("USE_TRAILING", False))
     if use_trailing:
         is_managed = np.ones(n, dtype=bool)
     else:
-        se = df.get("signal_exit")
-        csl = df.get("custom_stop_loss")
-        se_mask = se.apply(_has_dict).values if se is not None else np.zeros(n, dtype=bool)
-        csl_mask = csl.apply(_has_dict).values if csl is not None else np.zeros(n, dtype=bool)
-        is_managed = se_mask | csl_mask
+        is_managed = _managed_mask(df, direction_code)
 
-    has_dir = pd.Series(direction).isin(["long", "short"]).values
     has_sl = ~np.isnan(sl)
 
     fixed_ok = has_dir & has_sl & (~np.isnan(tp1)) & (~np.isnan(tp2))
-    managed_ok = has_dir & has_sl
+    managed_ok = has_dir & has_sl & is_managed
+
+    settings = managed_exit_settings(ctx.strategy_config)
 
     if not allow_managed_in_backtest:
         valid = fixed_ok
         exit_mode = np.where(valid, "fixed", None).astype(object)
+        managed = np.zeros(n, dtype=bool)
     else:
-        valid = fixed_ok | managed_ok
-        exit_mode = np.where(is_managed, "managed", "fixed").astype(object)
+        managed = managed_ok
+        valid = fixed_ok | managed
+        exit_mode = np.where(managed, "managed", np.where(valid, "fixed", None)).astype(object)
+
+        # ManagedExitPlan: TP1 optional, TP2 left to strategy logic
+        if not settings["use_tp1"]:
+            tp1 = np.where(managed, np.nan, tp1)
+        if not settings["use_tp2"]:
+            tp2 = np.where(managed, np.nan, tp2)
 
     plans["plan_valid"] = valid
-    plans["plan_direction"] = direction
+    plans["plan_direction"] = direction_to_str(direction_code)
     plans["plan_entry_tag"] = entry_tag
-    plans["plan_entry_price"] = df["close"].astype(float).values
+    plans["plan_entry_price"] = df["close"].to_numpy(dtype=np.float64)
 
     plans["plan_sl"] = sl
     plans["plan_tp1"] = tp1
     plans["plan_tp2"] = tp2
 
-    plans["plan_sl_tag"] = sl_tag
-    plans["plan_tp1_tag"] = tp1_tag
-    plans["plan_tp2_tag"] = tp2_tag
+    plans["plan_sl_tag"] = categorical_to_str(signals[LEVEL_SL_TAG])
+    plans["plan_tp1_tag"] = categorical_to_str(signals[LEVEL_TP1_TAG])
+    plans["plan_tp2_tag"] = categorical_to_str(signals[LEVEL_TP2_TAG])
 
     plans["plan_exit_mode"] = exit_mode
+    plans["plan_trail_from"] = np.where(managed, settings["trail_from"], None).astype(object)
+    plans["plan_be_on_tp1"] = managed & settings["be_on_tp1"]
 
     return plans
@@ -0,0 +1,492 @@
+from __future__ import annotations
+
+from typing import Any, Literal, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# ==========================================================
+# Columnar signal contract
+# ==========================================================
+
+DIRECTION_NONE = 0
+DIRECTION_LONG = 1
+DIRECTION_SHORT = -1
+
+SIGNAL_DIRECTION = "signal_direction"   # int8: 1 long / -1 short / 0 none
+SIGNAL_TAG = "signal_tag"               # categorical entry tag
+
+LEVEL_SL = "level_sl"                   # float64, NaN = missing
+LEVEL_TP1 = "level_tp1"
+LEVEL_TP2 = "level_tp2"
+
+LEVEL_SL_TAG = "level_sl_tag"           # categorical level tags
+LEVEL_TP1_TAG = "level_tp1_tag"
+LEVEL_TP2_TAG = "level_tp2_tag"
+
+LEVEL_COLUMNS = (LEVEL_SL, LEVEL_TP1, LEVEL_TP2)
+LEVEL_TAG_COLUMNS = (LEVEL_SL_TAG, LEVEL_TP1_TAG, LEVEL_TP2_TAG)
+
+TRAIL_SL_LONG = "trail_sl_long"         # float64 per-bar trailing stop candidate
+TRAIL_SL_SHORT = "trail_sl_short"
+EXIT_SIGNAL_TAG = "signal_exit_tag"     # categorical: entry tag to close
+EXIT_SIGNAL_LABEL = "signal_exit_label"  # categorical: exit level tag
+
+TRAIL_COLUMNS = (TRAIL_SL_LONG, TRAIL_SL_SHORT)
+MANAGEMENT_COLUMNS = TRAIL_COLUMNS + (EXIT_SIGNAL_TAG, EXIT_SIGNAL_LABEL)
+
+ENTRY_SIGNAL_COLUMNS = (SIGNAL_DIRECTION, SIGNAL_TAG)
+COLUMNAR_SIGNAL_COLUMNS = (
+    ENTRY_SIGNAL_COLUMNS + LEVEL_COLUMNS + LEVEL_TAG_COLUMNS + MANAGEMENT_COLUMNS
+)
+
+_DIRECTION_CODES = {"long": DIRECTION_LONG, "short": DIRECTION_SHORT}
+
+
+# ==========================================================
+# Dict form helpers (legacy signal_entry / levels)
+# ==========================================================
+
+def _extract_direction_tag(
+        signal: Any
+) -> Tuple[Optional[Literal["long", "short"]], str]:
+    if not isinstance(signal, dict):
+        return None, ""
+    d = signal.get("direction")
+    if d not in ("long", "short"):
+        return None, ""
+    return d, str(signal.get("tag", ""))
+
+
+def _level_item(levels: Any, key: Any) -> Any:
+    if not isinstance(levels, dict):
+        return None
+
+    item = levels.get(key)
+    if item is None and isinstance(key, str):
+        fallback = {"SL": 0, "TP1": 1, "TP2": 2}.get(key)
+        if fallback is not None:
+            item = levels.get(fallback)
+
+    return item if isinstance(item, dict) else None
+
+
+def _extract_level(levels: Any, key: Any) -> Optional[float]:
+    item = _level_item(levels, key)
+    if item is None:
+        return None
+
+    v = item.get("level")
+    if v is None:
+        return None
+
+    try:
+        return float(v)
+    except Exception:
+        return None
+
+
+def _extract_level_tag(levels: Any, key: Any) -> str:
+    item = _level_item(levels, key)
+    if item is None:
+        return ""
+
+    tag = item.get("tag")
+    return "" if tag is None else str(tag)
+
+
+def dict_mask(values) -> np.ndarray:
+    """
+    Boolean mask of cells holding a dict (object column scan, no pandas apply).
+    """
+    values = np.asarray(values, dtype=object)
+    return np.fromiter(
+        (isinstance(v, dict) for v in values),
+        dtype=bool,
+        count=len(values),
+    )
+
+
+# ==========================================================
+# Categorical helpers
+# ==========================================================
+
+def _empty_categorical(n: int) -> pd.Categorical:
+    return pd.Categorical.from_codes(
+        np.full(n, -1, dtype=np.int8),
+        categories=pd.Index([], dtype=object),
+    )
+
+
+def _assign_categorical(
+        df: pd.DataFrame,
+        column: str,
+        mask: np.ndarray,
+        values,
+) -> None:
+    """
+    Write scalar/array values into a categorical column on mask rows.
+    Works on codes only; categories are extended when needed.
+    """
+    current = df[column]
+    if not isinstance(current.dtype, pd.CategoricalDtype):
+        current = current.astype("category")
+
+    categories = current.cat.categories
+    codes = current.cat.codes.to_numpy().astype(np.int32, copy=True)
+
+    if np.isscalar(values) or values is None:
+        if values is None:
+            new_codes = -1
+        else:
+            values = str(values)
+            if values not in categories:
+                categories = categories.append(pd.Index([values], dtype=object))
+            new_codes = categories.get_loc(values)
+    else:
+        values = pd.Categorical(np.asarray(values, dtype=object)[mask])
+        missing = values.categories.difference(categories)
+        if len(missing):
+            categories = categories.append(pd.Index(missing, dtype=object))
+        new_codes = pd.Categorical(values, categories=categories).codes
+
+    codes[mask] = new_codes
+    df[column] = pd.Categorical.from_codes(codes, categories=categories)
+
+
+def categorical_to_str(values, *, fill: str = "") -> np.ndarray:
+    """
+    Categorical (or any) column -> object array of str, missing -> fill.
+    Vectorized via category lookup.
+    """
+    if isinstance(values, pd.Series):
+        values = values.array
+
+    if isinstance(values, pd.Categorical):
+        lookup = np.append(
+            np.asarray(values.categories, dtype=object).astype(str).astype(object),
+            fill,
+        )
+        return lookup[values.codes]
+
+    out = np.asarray(values, dtype=object)
+    missing = pd.isna(out)
+    if missing.any():
+        out = out.copy()
+        out[missing] = fill
+    return out.astype(str).astype(object)
+
+
+# ==========================================================
+# Writers (used by strategies)
+# ==========================================================
+
+def init_signal_columns(df: pd.DataFrame) -> None:
+    """
+    Ensure every columnar signal column exists with its canonical dtype.
+    """
+    n = len(df)
+
+    if SIGNAL_DIRECTION not in df.columns:
+        df[SIGNAL_DIRECTION] = np.zeros(n, dtype=np.int8)
+
+    for col in LEVEL_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.full(n, np.nan, dtype=np.float64)
+
+    for col in (SIGNAL_TAG,) + LEVEL_TAG_COLUMNS:
+        if col not in df.columns:
+            df[col] = _empty_categorical(n)
+
+
+def init_management_columns(df: pd.DataFrame) -> None:
+    """
+    Ensure trailing-stop / exit-signal columns exist (NaN / missing).
+    """
+    n = len(df)
+
+    for col in TRAIL_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.full(n, np.nan, dtype=np.float64)
+
+    for col in (EXIT_SIGNAL_TAG, EXIT_SIGNAL_LABEL):
+        if col not in df.columns:
+            df[col] = _empty_categorical(n)
+
+
+def _as_mask(df: pd.DataFrame, mask) -> np.ndarray:
+    if isinstance(mask, pd.Series):
+        return mask.reindex(df.index, fill_value=False).to_numpy(dtype=bool)
+    return np.asarray(mask, dtype=bool)
+
+
+def write_entry_signals(
+        df: pd.DataFrame,
+        mask,
+        *,
+        direction: Literal["long", "short"],
+        tag: str,
+) -> None:
+    """
+    Columnar equivalent of
+        df.loc[mask, "signal_entry"] = [{"direction": ..., "tag": ...}] * n
+    Later writes override earlier ones (same as the dict form).
+    """
+    if direction not in _DIRECTION_CODES:
+        raise ValueError(f"Invalid signal direction: {direction}")
+
+    init_signal_columns(df)
+    m = _as_mask(df, mask)
+
+    codes = df[SIGNAL_DIRECTION].to_numpy(dtype=np.int8, copy=True)
+    codes[m] = _DIRECTION_CODES[direction]
+    df[SIGNAL_DIRECTION] = codes
+
+    _assign_categorical(df, SIGNAL_TAG, m, tag)
+
+
+def write_levels(
+        df: pd.DataFrame,
+        mask,
+        *,
+        sl,
+        tp1=None,
+        tp2=None,
+        sl_tag=None,
+        tp1_tag=None,
+        tp2_tag=None,
+) -> None:
+    """
+    Columnar equivalent of the nested `levels` dict.
+
+    Values may be scalars or arrays aligned to the full df.
+    """
+    init_signal_columns(df)
+    m = _as_mask(df, mask)
+
+    for col, values in zip(LEVEL_COLUMNS, (sl, tp1, tp2)):
+        if values is None:
+            continue
+        arr = df[col].to_numpy(dtype=np.float64, copy=True)
+        if np.isscalar(values):
+            arr[m] = float(values)
+        else:
+            arr[m] = np.asarray(values, dtype=np.float64)[m]
+        df[col] = arr
+
+    for col, values in zip(LEVEL_TAG_COLUMNS, (sl_tag, tp1_tag, tp2_tag)):
+        if values is None:
+            continue
+        _assign_categorical(df, col, m, values)
+
+
+def write_trailing_stops(
+        df: pd.DataFrame,
+        *,
+        long=None,
+        short=None,
+        mask=None,
+) -> None:
+    """
+    Columnar equivalent of `custom_stop_loss` ({"level": x}).
+
+    long / short: per-bar SL candidates (scalar or array aligned to df).
+    The engine only ever moves SL in the trade's favour.
+    """
+    init_management_columns(df)
+    m = np.ones(len(df), dtype=bool) if mask is None else _as_mask(df, mask)
+
+    for col, values in ((TRAIL_SL_LONG, long), (TRAIL_SL_SHORT, short)):
+        if values is None:
+            continue
+        arr = df[col].to_numpy(dtype=np.float64, copy=True)
+        if np.isscalar(values):
+            arr[m] = float(values)
+        else:
+            arr[m] = np.asarray(values, dtype=np.float64)[m]
+        df[col] = arr
+
+
+def write_exit_signals(
+        df: pd.DataFrame,
+        mask,
+        *,
+        entry_tag: str,
+        exit_tag: str | None = None,
+) -> None:
+    """
+    Columnar equivalent of
+        signal_exit = {"direction": "close", "entry_tag_to_close": ..., "exit_tag": ...}
+    Open trades with `entry_tag` are closed at the close of mask bars.
+    """
+    init_management_columns(df)
+    m = _as_mask(df, mask)
+
+    _assign_categorical(df, EXIT_SIGNAL_TAG, m, entry_tag)
+    _assign_categorical(df, EXIT_SIGNAL_LABEL, m, exit_tag)
+
+
+# ==========================================================
+# One-time converter (dict form -> columnar)
+# ==========================================================
+
+def signals_from_dicts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert legacy dict signals (`signal_entry`, `levels`) into the columnar
+    contract. Scans the object columns once; rows without a dict are skipped
+    without any per-row Python work beyond the isinstance check.
+
+    Returns a frame aligned to df.index with the entry and level columns
+    (management columns: see management_from_dicts).
+    """
+    n = len(df)
+
+    direction = np.zeros(n, dtype=np.int8)
+    entry_tag = np.full(n, None, dtype=object)
+
+    levels = {col: np.full(n, np.nan, dtype=np.float64) for col in LEVEL_COLUMNS}
+    level_tags = {col: np.full(n, "", dtype=object) for col in LEVEL_TAG_COLUMNS}
+
+    if "signal_entry" in df.columns:
+        sig_vals = df["signal_entry"].to_numpy(dtype=object)
+        parsed: dict[int, Tuple[Optional[str], str]] = {}
+
+        for i in np.flatnonzero(dict_mask(sig_vals)):
+            sig = sig_vals[i]
+            # strategies commonly broadcast ONE dict object over many rows
+            key = id(sig)
+            res = parsed.get(key)
+            if res is None:
+                res = parsed[key] = _extract_direction_tag(sig)
+            d, t = res
+            if d is None:
+                continue
+            direction[i] = _DIRECTION_CODES[d]
+            entry_tag[i] = t
+
+    if "levels" in df.columns:
+        lvl_vals = df["levels"].to_numpy(dtype=object)
+
+        for i in np.flatnonzero(dict_mask(lvl_vals)):
+            lv = lvl_vals[i]
+            for key, col, tag_col in zip(("SL", "TP1", "TP2"), LEVEL_COLUMNS, LEVEL_TAG_COLUMNS):
+                v = _extract_level(lv, key)
+                if v is not None:
+                    levels[col][i] = v
+                level_tags[tag_col][i] = _extract_level_tag(lv, key)
+
+    out = pd.DataFrame(index=df.index)
+    out[SIGNAL_DIRECTION] = direction
+    out[SIGNAL_TAG] = pd.Categorical(entry_tag)
+    for col in LEVEL_COLUMNS:
+        out[col] = levels[col]
+    for col in LEVEL_TAG_COLUMNS:
+        out[col] = pd.Categorical(level_tags[col])
+
+    return out
+
+
+def management_from_dicts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert legacy `custom_stop_loss` / `signal_exit` dicts into
+    MANAGEMENT_COLUMNS. A custom_stop_loss level applies to both sides
+    (same as live, where the candidate is not direction-aware).
+    """
+    n = len(df)
+
+    trail = np.full(n, np.nan, dtype=np.float64)
+    exit_tag = np.full(n, None, dtype=object)
+    exit_label = np.full(n, None, dtype=object)
+
+    if "custom_stop_loss" in df.columns:
+        vals = df["custom_stop_loss"].to_numpy(dtype=object)
+        for i in np.flatnonzero(dict_mask(vals)):
+            level = vals[i].get("level")
+            if level is None:
+                continue
+            try:
+                trail[i] = float(level)
+            except Exception:
+                continue
+
+    if "signal_exit" in df.columns:
+        vals = df["signal_exit"].to_numpy(dtype=object)
+        for i in np.flatnonzero(dict_mask(vals)):
+            sig = vals[i]
+            if sig.get("direction") != "close":
+                continue
+            tag = sig.get("entry_tag_to_close")
+            if tag is None:
+                continue
+            exit_tag[i] = str(tag)
+            label = sig.get("exit_tag")
+            exit_label[i] = None if label is None else str(label)
+
+    out = pd.DataFrame(index=df.index)
+    out[TRAIL_SL_LONG] = trail
+    out[TRAIL_SL_SHORT] = trail.copy()
+    out[EXIT_SIGNAL_TAG] = pd.Categorical(exit_tag)
+    out[EXIT_SIGNAL_LABEL] = pd.Categorical(exit_label)
+
+    return out
+
+
+def ensure_management_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Management view of df: columnar columns win, missing ones come
+    from legacy dicts (or stay empty).
+    """
+    converted = management_from_dicts(df)
+
+    for col in MANAGEMENT_COLUMNS:
+        if col in df.columns:
+            converted[col] = df[col].to_numpy()
+
+    return converted
+
+
+def has_columnar_signals(df: pd.DataFrame) -> bool:
+    return SIGNAL_DIRECTION in df.columns
+
+
+def ensure_columnar_signals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Columnar signal view of df.
+
+    - columnar columns present -> used as-is
+    - dict form only           -> converted once via signals_from_dicts
+    - mixed (columnar entries, dict levels) -> missing parts are converted
+    """
+    has_entries = has_columnar_signals(df)
+    has_levels = LEVEL_SL in df.columns
+
+    if has_entries and has_levels:
+        cols = ENTRY_SIGNAL_COLUMNS + LEVEL_COLUMNS + LEVEL_TAG_COLUMNS
+        out = df.loc[:, [c for c in cols if c in df.columns]].copy()
+        init_signal_columns(out)
+        return out
+
+    converted = signals_from_dicts(df)
+
+    if has_entries:
+        converted[SIGNAL_DIRECTION] = df[SIGNAL_DIRECTION].to_numpy(dtype=np.int8)
+        if SIGNAL_TAG in df.columns:
+            converted[SIGNAL_TAG] = df[SIGNAL_TAG].to_numpy()
+    if has_levels:
+        for col in LEVEL_COLUMNS + LEVEL_TAG_COLUMNS:
+            if col in df.columns:
+                converted[col] = df[col].to_numpy()
+
+    return converted
+
+
+def direction_to_str(codes: np.ndarray) -> np.ndarray:
+    """
+    int8 direction codes -> object array of "long" / "short" / None.
+    """
+    codes = np.asarray(codes)
+    out = np.full(len(codes), None, dtype=object)
+    out[codes == DIRECTION_LONG] = "long"
+    out[codes == DIRECTION_SHORT] = "short"
+    return out
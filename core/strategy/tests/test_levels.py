@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from core.strategy.levels import (
+    LevelArrays,
+    min_distance_sl,
+    r_multiple_tp,
+    structural_sl,
+    wider_sl,
+)
+from core.strategy.plan_builder import PlanBuildContext, build_plans_frame
+from core.strategy.tests.helper import DummyStrategy
+
+
+LONG_SHORT = np.array([1, -1], dtype=np.int8)
+
+
+def test_structural_and_min_distance_sl():
+    sl_struct = structural_sl(
+        LONG_SHORT,
+        swing_low=np.array([95.0, 95.0]),
+        swing_high=np.array([105.0, 105.0]),
+        atr=np.array([2.0, 2.0]),
+        atr_buffer=0.5,
+    )
+    np.testing.assert_allclose(sl_struct, [94.0, 106.0])
+
+    sl_min = min_distance_sl(
+        LONG_SHORT,
+        close=np.array([100.0, 100.0]),
+        atr=np.array([2.0, 2.0]),
+        min_atr_mult=1.0,
+        min_pct=0.05,
+    )
+    np.testing.assert_allclose(sl_min, [95.0, 105.0])
+
+
+def test_wider_sl_picks_level_further_from_price():
+    sl, use_primary = wider_sl(
+        LONG_SHORT,
+        np.array([94.0, 104.0]),
+        np.array([95.0, 105.0]),
+    )
+
+    np.testing.assert_allclose(sl, [94.0, 105.0])
+    assert use_primary.tolist() == [True, False]
+
+
+def test_r_multiple_tp():
+    tp = r_multiple_tp(
+        LONG_SHORT,
+        entry=np.array([100.0, 100.0]),
+        sl=np.array([95.0, 105.0]),
+        multiple=2,
+    )
+    np.testing.assert_allclose(tp, [110.0, 90.0])
+
+
+class LevelsStrategy(DummyStrategy):
+    def compute_levels_vectorized(self, df, mask):
+        close = df["close"].to_numpy()
+        direction = df["signal_direction"].to_numpy()
+        sl = close - np.where(direction == 1, 1.0, -1.0)
+        return LevelArrays(
+            sl=sl,
+            tp1=r_multiple_tp(direction, entry=close, sl=sl, multiple=1),
+            tp2=r_multiple_tp(direction, entry=close, sl=sl, multiple=2),
+            sl_tag="atr",
+        )
+
+
+def test_apply_levels_feeds_plan_builder():
+    df = pd.DataFrame({"close": [10.0, 11.0, 12.0]})
+    strat = LevelsStrategy(df=df, symbol="EURUSD", startup_candle_count=0)
+
+    strat.set_entry_signals(np.array([True, False, False]), direction="long", tag="L")
+    strat.set_entry_signals(np.array([False, False, True]), direction="short", tag="S")
+    levels = strat.apply_levels()
+
+    assert levels is not None
+    assert np.isnan(strat.df["level_sl"].iloc[1])
+
+    plans = build_plans_frame(
+        df=strat.df,
+        ctx=PlanBuildContext(symbol="EURUSD", strategy_name="x", strategy_config={}),
+    )
+
+    assert plans["plan_valid"].tolist() == [True, False, True]
+    assert plans["plan_sl"].iloc[0] == 9.0
+    assert plans["plan_tp2"].iloc[2] == 10.0
+    assert plans["plan_sl_tag"].tolist() == ["atr", "", "atr"]
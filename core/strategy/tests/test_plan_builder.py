@@ -276,4 +276,27 @@ def test_build_plans_frame_handles_missing_levels_tags_gracefully():
     plans = build_plans_frame(df=df, ctx=ctx, allow_managed_in_backtest=False)
     assert plans.loc[0, "plan_sl_tag"] == ""
     assert plans.loc[0, "plan_tp1_tag"] == ""
-    assert plans.loc[0, "plan_tp2_tag"] == ""
\ No newline at end of file
+    assert plans.loc[0, "plan_tp2_tag"] == ""
+
+def test_build_plans_frame_managed_settings_from_config():
+    ctx = _ctx(USE_TRAILING=True, TRAIL_FROM="entry", ALLOW_TP2_WITH_TRAILING=False)
+
+    df = pd.DataFrame(
+        {
+            "close": [1.0, 2.0],
+            "signal_entry": [{"direction": "long", "tag": "A"}, None],
+            "levels": [_levels_fixed(sl=0.9, tp1=1.1, tp2=1.2), None],
+        }
+    )
+
+    plans = build_plans_frame(df=df, ctx=ctx, allow_managed_in_backtest=True)
+
+    assert plans.loc[0, "plan_exit_mode"] == "managed"
+    assert plans.loc[0, "plan_trail_from"] == "entry"
+    assert plans.loc[0, "plan_be_on_tp1"] == True
+    assert plans.loc[0, "plan_tp1"] == 1.1
+    assert pd.isna(plans.loc[0, "plan_tp2"])
+
+    assert plans.loc[1, "plan_valid"] == False
+    assert plans.loc[1, "plan_exit_mode"] is None
+    assert plans.loc[1, "plan_trail_from"] is None
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+
+from core.strategy.plan_builder import (
+    PlanBuildContext,
+    build_plans_frame,
+    build_trade_plan_from_row,
+)
+from core.strategy.signals import (
+    LEVEL_SL,
+    LEVEL_TP2_TAG,
+    SIGNAL_DIRECTION,
+    SIGNAL_TAG,
+    EXIT_SIGNAL_LABEL,
+    EXIT_SIGNAL_TAG,
+    TRAIL_SL_LONG,
+    TRAIL_SL_SHORT,
+    management_from_dicts,
+    signals_from_dicts,
+    write_entry_signals,
+    write_exit_signals,
+    write_levels,
+    write_trailing_stops,
+)
+from core.strategy.trade_plan import FixedExitPlan
+
+
+def _ctx(**cfg):
+    return PlanBuildContext(
+        symbol="EURUSD",
+        strategy_name="DummyStrategy",
+        strategy_config=cfg,
+    )
+
+
+def _levels(sl, tp1, tp2):
+    return {
+        "SL": {"level": sl, "tag": "sl_tag"},
+        "TP1": {"level": tp1, "tag": "tp1_tag"},
+        "TP2": {"level": tp2, "tag": "tp2_tag"},
+    }
+
+
+def _dict_df():
+    long_sig = {"direction": "long", "tag": "A"}
+    return pd.DataFrame(
+        {
+            "close": [1.0, 2.0, 3.0, 4.0],
+            "signal_entry": [long_sig, None, {"direction": "short", "tag": "B"}, long_sig],
+            "levels": [
+                _levels(0.9, 1.1, 1.2),
+                None,
+                _levels(3.2, 2.9, 2.8),
+                {"SL": {"level": 3.5}},
+            ],
+        }
+    )
+
+
+def _columnar_df():
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0, 4.0]})
+
+    write_entry_signals(df, np.array([True, False, False, True]), direction="long", tag="A")
+    write_entry_signals(df, np.array([False, False, True, False]), direction="short", tag="B")
+
+    write_levels(
+        df,
+        np.array([True, False, True, False]),
+        sl=np.array([0.9, np.nan, 3.2, np.nan]),
+        tp1=np.array([1.1, np.nan, 2.9, np.nan]),
+        tp2=np.array([1.2, np.nan, 2.8, np.nan]),
+        sl_tag="sl_tag",
+        tp1_tag="tp1_tag",
+        tp2_tag="tp2_tag",
+    )
+    write_levels(df, np.array([False, False, False, True]), sl=3.5)
+    return df
+
+
+def test_write_entry_signals_uses_typed_columns():
+    df = _columnar_df()
+
+    assert df[SIGNAL_DIRECTION].dtype == np.int8
+    assert isinstance(df[SIGNAL_TAG].dtype, pd.CategoricalDtype)
+    assert df[SIGNAL_DIRECTION].tolist() == [1, 0, -1, 1]
+    assert df[LEVEL_SL].dtype == np.float64
+
+
+def test_signals_from_dicts_matches_columnar_writers():
+    converted = signals_from_dicts(_dict_df())
+    columnar = _columnar_df()
+
+    assert converted[SIGNAL_DIRECTION].tolist() == columnar[SIGNAL_DIRECTION].tolist()
+    assert converted[SIGNAL_TAG].astype(object).fillna("-").tolist() == ["A", "-", "B", "A"]
+    np.testing.assert_array_equal(converted[LEVEL_SL].values, columnar[LEVEL_SL].values)
+    assert converted[LEVEL_TP2_TAG].tolist() == ["tp2_tag", "", "tp2_tag", ""]
+
+
+def test_build_plans_frame_columnar_matches_dict_form():
+    ctx = _ctx(USE_TRAILING=False)
+
+    from_dicts = build_plans_frame(df=_dict_df(), ctx=ctx)
+    from_columns = build_plans_frame(df=_columnar_df(), ctx=ctx)
+
+    assert from_dicts["plan_valid"].tolist() == [True, False, True, False]
+    for col in ("plan_valid", "plan_direction", "plan_entry_tag", "plan_exit_mode"):
+        assert from_dicts[col].tolist() == from_columns[col].tolist()
+    for col in ("plan_sl", "plan_tp1", "plan_tp2"):
+        np.testing.assert_array_equal(from_dicts[col].values, from_columns[col].values)
+    assert from_columns["plan_sl_tag"].tolist() == ["sl_tag", "", "sl_tag", ""]
+
+
+def test_build_trade_plan_from_columnar_row():
+    df = _columnar_df()
+
+    plan = build_trade_plan_from_row(row=df.iloc[2], ctx=_ctx(USE_TRAILING=False))
+
+    assert plan is not None
+    assert plan.direction == "short"
+    assert plan.entry_tag == "B"
+    assert isinstance(plan.exit_plan, FixedExitPlan)
+    assert plan.exit_plan.sl == 3.2
+    assert build_trade_plan_from_row(row=df.iloc[1], ctx=_ctx()) is None
+
+
+def test_management_from_dicts_matches_columnar_writers():
+    legacy = pd.DataFrame(
+        {
+            "close": [1.0, 2.0, 3.0],
+            "custom_stop_loss": [None, {"level": 1.5}, None],
+            "signal_exit": [
+                None,
+                None,
+                {"direction": "close", "entry_tag_to_close": "A", "exit_tag": "flip"},
+            ],
+        }
+    )
+    converted = management_from_dicts(legacy)
+
+    columnar = pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+    mask = np.array([False, True, False])
+    write_trailing_stops(columnar, long=1.5, short=1.5, mask=mask)
+    write_exit_signals(columnar, np.array([False, False, True]), entry_tag="A", exit_tag="flip")
+
+    for col in (TRAIL_SL_LONG, TRAIL_SL_SHORT):
+        np.testing.assert_array_equal(converted[col].values, columnar[col].values)
+    for col in (EXIT_SIGNAL_TAG, EXIT_SIGNAL_LABEL):
+        assert converted[col].tolist() == columnar[col].tolist()
@@ -41,6 +41,7 @@ def test_strategy_does_not_generate_entries_when_conditions_not_met():
     entries = strategy.df["signal_entry"].dropna()
 
     assert len(entries) == 0
+    assert (strategy.df["signal_direction"] == 0).all()
 
 
 def test_base_strategy_validate_requires_time_column():
@@ -0,0 +1,75 @@
+from pathlib import Path
+from datetime import datetime
+
+import pandas as pd
+
+import config.live as cfg
+from core.live_trading.latency import LatencyRecorder
+from core.live_trading.logging import create_live_logger
+from core.live_trading.shadow import ShadowComparator
+from core.live_trading.sim.broker import SimulatedMT5, installed
+from core.live_trading.sim.replay import load_session_bars, replay_session
+from core.live_trading.trade_repo import create_trade_repo
+
+
+if __name__ == "__main__":
+    symbol = cfg.SYMBOLS if isinstance(cfg.SYMBOLS, str) else cfg.SYMBOLS[0]
+    start = pd.Timestamp(cfg.REPLAY_START, tz="UTC")
+
+    bars = load_session_bars(
+        symbol=symbol,
+        timeframe=cfg.TIMEFRAME,
+        start=start - pd.Timedelta(days=cfg.REPLAY_WARMUP_DAYS),
+        end=pd.Timestamp(cfg.REPLAY_END, tz="UTC"),
+        market_data_path=cfg.REPLAY_MARKET_DATA_PATH,
+    )
+
+    # strategy modules may import the live stack: load them with the broker in place
+    from core.live_trading.strategy_loader import load_strategy_class
+    broker = SimulatedMT5(bars={symbol: bars}, timeframe=cfg.TIMEFRAME)
+    with installed(broker):
+        StrategyClass = load_strategy_class(cfg.STRATEGY_CLASS)
+
+    run_path = Path(f"results/replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    run_path.mkdir(parents=True, exist_ok=True)
+    repo = create_trade_repo(cfg.TRADE_REPO_BACKEND, run_path)
+    latency = LatencyRecorder(
+        path=run_path / "latency.jsonl",
+        export_interval_sec=float("inf"),
+        bar_seconds=broker.bar_seconds,
+        alert_fractions=cfg.LATENCY_ALERT_BAR_FRACTION,
+    )
+
+    shadow = ShadowComparator(
+        window=cfg.SHADOW_WINDOW,
+        settle_bars=cfg.SHADOW_SETTLE_BARS,
+        path=run_path / "shadow_mismatches.jsonl",
+        latency=latency,
+    ) if cfg.SHADOW_COMPARE else None
+
+    report = replay_session(
+        bars=bars,
+        strategy_cls=StrategyClass,
+        symbol=symbol,
+        timeframe=cfg.TIMEFRAME,
+        replay_start=start,
+        startup_candle_count=cfg.STARTUP_CANDLE_COUNT,
+        repo=repo,
+        log=create_live_logger(symbol),
+        speed=cfg.REPLAY_SPEED,
+        fill_latency_sec=cfg.REPLAY_FILL_LATENCY_SEC,
+        slippage_points=cfg.REPLAY_SLIPPAGE_POINTS,
+        latency=latency,
+        shadow=shadow,
+    )
+
+    print(report.summary())
+    if shadow is not None:
+        shadow.join()
+        print(
+            f"shadow: {shadow.bars} bars checked, {len(shadow.mismatches)} mismatches, "
+            f"{shadow.dropped} dropped"
+        )
+    latency.export()
+    report.trades.to_csv(run_path / "trades.csv", index=False)
+    report.deals.to_csv(run_path / "deals.csv", index=False)
@@ -0,0 +1,35 @@
+import config.backtest as cfg
+from core.backtesting.optimize.optimizer import StrategyOptimizer
+from core.backtesting.optimize.space import ParamSpace
+from core.backtesting.optimize.store import OptimizationStore
+from core.backtesting.runner import BacktestRunner
+from core.live_trading.strategy_loader import load_strategy_class
+
+
+SPACE = ParamSpace({
+    "SL_ATR_BUFFER": [0.25, 0.5, 1.0],
+    "SL_MIN_ATR": [0.5, 1, 1.5],
+    "TP1_R": [0.75, 1, 1.5],
+    "TRAIL_MODE": ["ribbon", "swing"],
+    "SWING_LOOKBACK": [3, 5, 10],
+})
+
+
+if __name__ == "__main__":
+    runner = BacktestRunner(cfg)
+    data = runner.load_data()
+
+    optimizer = StrategyOptimizer(
+        strategy_cls=load_strategy_class(cfg.STRATEGY_CLASS),
+        data=data,
+        startup_candle_count=cfg.STARTUP_CANDLE_COUNT,
+        metric="pnl_net_usd",
+        max_workers=cfg.MAX_WORKERS_OPTIMIZE,
+        logger=runner.log_run,
+    )
+
+    result = optimizer.successive_halving(SPACE, n=60, eta=3, seed=0)
+    path = OptimizationStore().save(result)
+
+    print(result.best(10).to_string(index=False))
+    print(f"[OPTIMIZE] {result.configs_per_minute:,.1f} configs/min -> {path}")